@@ -0,0 +1,253 @@
+"""
+Headless benchmarks for the recorder's hot paths
+
+Runs against synthetic audio, word lists, manifest and audio folder in a
+temporary dataset directory - no GUI, microphone or real dataset needed.
+Results are written as JSON so runs from different commits can be compared:
+
+    python benchmark_recorder.py --output before.json
+    python benchmark_recorder.py --output after.json --compare before.json
+    python benchmark_recorder.py --only add_words next_word --sizes 10000 100000
+"""
+
+import io
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import tempfile
+import contextlib
+import statistics
+import subprocess
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from kurmanji_core import Config, AudioManager, WordManager
+
+AUDIO_SECONDS = [1, 25, 45]  # Kelime, uzun cümle, paragraf kaydı
+LIST_SIZES = [10_000, 100_000, 1_000_000]
+MANIFEST_LINES = 100_000
+AUDIO_FILES = 50_000
+ADD_BATCH = 100  # add_words: dolu listeye eklenen yeni öğe sayısı
+SYLLABLES = ["ber", "dar", "av", "mal", "çav", "kur", "jin", "roj", "şev", "xwe", "nan", "ba", "ser", "dil", "gul", "zar"]
+
+
+def log(message):
+    sys.stderr.write(message + "\n")
+    sys.stderr.flush()
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=Path(__file__).parent, check=True).stdout.strip()
+    except Exception:
+        return None
+
+
+def quiet():
+    """Uygulamanın print çıktısını ölçüm sırasında yut"""
+    return contextlib.redirect_stdout(io.StringIO())
+
+
+def measure(function, repeat, setup=None):
+    """Time function(setup()) `repeat` times; setup and the app's prints are not timed"""
+    times = []
+    for _ in range(repeat):
+        argument = setup() if setup else None
+        with quiet():
+            start = time.perf_counter()
+            function(argument)
+            times.append(time.perf_counter() - start)
+    return {
+        "runs": repeat,
+        "min_s": min(times),
+        "median_s": statistics.median(times),
+        "mean_s": statistics.fmean(times),
+    }
+
+
+def synthetic_speech(seconds, rng):
+    """Syllable-rate amplitude bursts over a few harmonics plus room noise"""
+    t = np.arange(int(seconds * Config.SAMPLE_RATE), dtype=np.float32) / Config.SAMPLE_RATE
+    voice = sum(np.sin(2 * np.pi * f * t) / (k + 1) for k, f in enumerate([140, 280, 420, 560]))
+    envelope = np.clip(np.sin(2 * np.pi * 4 * t), 0, None) * (t < seconds * 0.8)
+    noise = rng.normal(0, 0.005, t.size)
+    return (0.3 * voice * envelope + noise).astype(np.float32)
+
+
+def unique_suffix(i):
+    letters = ""
+    while True:
+        i, rest = divmod(i, 26)
+        letters += chr(ord("a") + rest)
+        if not i:
+            return letters
+
+
+def synthetic_items(count, rng, offset=0):
+    """Unique words with ~10% multi-word sentences mixed in"""
+    items = []
+    for i in range(offset, offset + count):
+        word = rng.choice(SYLLABLES) + rng.choice(SYLLABLES) + unique_suffix(i)
+        if rng.random() < 0.1:
+            word = " ".join([word] + rng.sample(SYLLABLES, 3)) + "."
+        items.append(word)
+    return items
+
+
+def bench_audio(repeat, rng):
+    with quiet():
+        manager = AudioManager()
+    for seconds in AUDIO_SECONDS:
+        signal = synthetic_speech(seconds, rng)
+        for name in ("_process_audio", "_normalize_audio_levels"):
+            method = getattr(manager, name)
+            yield name, {"seconds": seconds}, lambda: measure(method, repeat, setup=signal.copy)
+
+
+def bench_lists(repeat, rng, sizes):
+    with quiet():
+        manager = WordManager()
+    for size in sizes:
+        items = synthetic_items(size, rng)
+        words = [item for item in items if not manager.is_sentence(item)]
+        sentences = [item for item in items if manager.is_sentence(item)]
+        recorded = set(words[:len(words) // 2])
+        new_items = synthetic_items(ADD_BATCH, rng, offset=size)
+
+        def load_state():
+            manager.words = list(words)
+            manager.sentences = list(sentences)
+            manager.recorded_words = set(recorded)
+            manager.recorded_speeds = {word: {"slow": False, "normal": True, "fast": False} for word in recorded}
+            manager.current_content_type = "word"
+            manager.is_sentence_mode = False
+            manager.schedule_mode = "sequential"
+            manager.current_index = 0
+
+        load_state()
+        params = {"items": size}
+        yield "is_sentence", params, lambda: measure(lambda _: [manager.is_sentence(item) for item in items], repeat)
+        yield "add_words", dict(params, batch=ADD_BATCH), lambda: measure(lambda _: manager.add_words(new_items), repeat, setup=load_state)
+        # İlk yarı kayıtlı: bir sonraki kaydedilmemiş öğe listenin ortasında
+        yield "next_word", params, lambda: measure(lambda _: manager.next_word(), repeat, setup=load_state)
+        yield "get_progress", params, lambda: measure(lambda _: manager.get_progress(), repeat, setup=load_state)
+        yield "save_data", params, lambda: measure(lambda _: manager.save_data(), repeat, setup=load_state)
+
+
+def bench_manifest(repeat, rng):
+    with quiet():
+        manager = WordManager()
+    with open(Config.WHISPER_MANIFEST, "w", encoding="utf-8") as f:
+        for i, item in enumerate(synthetic_items(MANIFEST_LINES, rng)):
+            entry = {"audio_filepath": f"audio/{i:06d}_{item}.wav", "text": item, "language": "ku",
+                     "duration": 2.0, "speaker_id": "default"}
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    params = {"lines": MANIFEST_LINES}
+    counter = iter(range(MANIFEST_LINES + 1, sys.maxsize))
+
+    def append_line(_):
+        manager.update_whisper_files("berdar", f"{next(counter):06d}_berdar_normal.wav")
+
+    def append_then_name():
+        filename = f"{next(counter):06d}_berdar_normal.wav"
+        with quiet():
+            manager.update_whisper_files("berdar", filename)
+        return filename
+
+    yield "manifest_append", params, lambda: measure(append_line, repeat)
+    yield "update_manifest_duration", params, lambda: measure(lambda filename: manager.update_manifest_duration(filename, 1.23), repeat, setup=append_then_name)
+
+
+def bench_filenames(repeat, rng):
+    with quiet():
+        manager = WordManager()
+    for i, item in enumerate(synthetic_items(AUDIO_FILES, rng), start=1):
+        (Config.AUDIO_DIR / f"{i:06d}_{item.replace(' ', '_')}_normal.wav").touch()
+    yield "generate_speed_filename", {"files": AUDIO_FILES}, lambda: measure(lambda _: manager.generate_speed_filename("berdar", "slow"), repeat)
+
+
+def run(args):
+    rng = random.Random(args.seed)
+    np_rng = np.random.default_rng(args.seed)
+    results = []
+    with tempfile.TemporaryDirectory(prefix="kurmanji_bench_") as tmp:
+        Config.use_base_dir(Path(tmp) / "kurmanji_dataset")
+        Config.ensure_dirs()
+        groups = [
+            (["_process_audio", "_normalize_audio_levels"], lambda: bench_audio(args.repeat, np_rng)),
+            (["is_sentence", "add_words", "next_word", "get_progress", "save_data"], lambda: bench_lists(args.repeat, rng, args.sizes)),
+            (["manifest_append", "update_manifest_duration"], lambda: bench_manifest(args.repeat, rng)),
+            (["generate_speed_filename"], lambda: bench_filenames(args.repeat, rng)),
+        ]
+        for names, cases in groups:
+            # Seçilmeyen grubun sentetik verisini hiç hazırlama
+            if args.only and not set(names) & set(args.only):
+                continue
+            for name, params, run_case in cases():
+                if args.only and name not in args.only:
+                    continue
+                case_id = name + "[" + ",".join(f"{key}={value}" for key, value in params.items()) + "]"
+                timing = run_case()
+                log(f"⏱️ {case_id:<55} median {timing['median_s'] * 1000:10.2f} ms")
+                results.append(dict({"id": case_id, "name": name, "params": params}, **timing))
+    return results
+
+
+def compare(results, baseline_path, tolerance):
+    """Median oranlarını yazdır; tolerans üstü yavaşlama sayısını döndür"""
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = {row["id"]: row for row in json.load(f)["results"]}
+    regressions = 0
+    log(f"\n📊 {baseline_path} ile karşılaştırma (median):")
+    for row in results:
+        old = baseline.get(row["id"])
+        if not old or not old["median_s"]:
+            log(f"   {row['id']:<55} yeni")
+            continue
+        ratio = row["median_s"] / old["median_s"]
+        marker = "⚠️" if ratio > 1 + tolerance else ("🚀" if ratio < 1 - tolerance else "  ")
+        regressions += ratio > 1 + tolerance
+        log(f"{marker} {row['id']:<55} {ratio:6.2f}x")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kayıt uygulaması sıcak yolları için headless kıyaslama")
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--sizes", type=int, nargs="+", default=LIST_SIZES, help="Liste boyutları")
+    parser.add_argument("--only", nargs="+", help="Sadece bu ölçümler (ör. add_words save_data)")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--compare", help="Önceki sonuç JSON'u")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Bu orandan fazla yavaşlama gerileme sayılır")
+    args = parser.parse_args(argv)
+
+    results = run(args)
+    report = {
+        "created": datetime.now().isoformat(),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "seed": args.seed,
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    log(f"💾 {len(results)} ölçüm yazıldı: {args.output}")
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.tolerance)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,27 @@
+"""
+Kurmanji dataset core - recording, word lists, import, analysis and export
+without any GUI dependency. Used by the recorder app and by the command line:
+
+    python -m kurmanji_core --help
+"""
+
+from .config import Config, LazyModule
+from .audio import AudioManager
+from .analysis import AudioMetadataCache, QualityAnalyzer, analyze_audio_file
+from .augmentation import AugmentationEngine, apply_augmentation
+from .verification import TakeVerifier, character_error_rate, edit_distance, load_cpu_model
+from .words import WordManager
+from .documents import CorpusTokenCounter, UrlFetcher, KurmanjiSentenceSegmenter, DocumentProcessor
+from .datasets import IncrementalExporter, ShardedTarExporter, DatasetMerger
+from .tasks import Task, TaskCancelled, TaskRunner
+
+__all__ = [
+    "Config", "LazyModule", "AudioManager",
+    "AudioMetadataCache", "QualityAnalyzer", "analyze_audio_file",
+    "AugmentationEngine", "apply_augmentation",
+    "TakeVerifier", "character_error_rate", "edit_distance", "load_cpu_model",
+    "WordManager",
+    "CorpusTokenCounter", "UrlFetcher", "KurmanjiSentenceSegmenter", "DocumentProcessor",
+    "IncrementalExporter", "ShardedTarExporter", "DatasetMerger",
+    "Task", "TaskCancelled", "TaskRunner",
+]
@@ -0,0 +1,267 @@
+"""
+Audio metadata cache and full-corpus quality analysis
+"""
+
+import os
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import soundfile as sf
+
+from .config import Config
+
+
+class AudioMetadataCache:
+    """Persistent per-file WAV metadata, filled with header-only reads
+    
+    Entries are keyed by file name and refreshed only when a file's size or
+    mtime changed, so corpus-wide totals are exact without decoding audio.
+    """
+    
+    FIELDS = ('frames', 'samplerate', 'channels', 'size', 'mtime')
+    
+    def __init__(self, audio_dir=None, cache_file=None):
+        self.audio_dir = Path(audio_dir) if audio_dir else Config.AUDIO_DIR
+        self.cache_file = Path(cache_file) if cache_file else Config.AUDIO_METADATA_CACHE
+        self.entries = {}
+        self._lock = threading.Lock()
+        self.load()
+    
+    def load(self):
+        try:
+            if self.cache_file.exists():
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f).get('files', {})
+        except Exception as e:
+            print(f"⚠️ Ses meta önbelleği okunamadı: {e}")
+            self.entries = {}
+    
+    def save(self):
+        try:
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump({'files': self.entries, 'last_updated': datetime.now().isoformat()}, f)
+        except Exception as e:
+            print(f"⚠️ Ses meta önbelleği kaydedilemedi: {e}")
+    
+    @staticmethod
+    def read_header(path, stat):
+        """Metadata from the WAV header only (no sample decoding)"""
+        info = sf.info(str(path))
+        return {
+            'frames': info.frames,
+            'samplerate': info.samplerate,
+            'channels': info.channels,
+            'size': stat.st_size,
+            'mtime': stat.st_mtime
+        }
+    
+    def refresh(self):
+        """Sync with the audio folder; return number of files (re)read"""
+        if not self.audio_dir.exists():
+            return 0
+        with self._lock:
+            present = set()
+            updated = 0
+            for entry in os.scandir(self.audio_dir):
+                if not entry.name.lower().endswith('.wav') or not entry.is_file():
+                    continue
+                present.add(entry.name)
+                stat = entry.stat()
+                cached = self.entries.get(entry.name)
+                if cached and cached['size'] == stat.st_size and cached['mtime'] == stat.st_mtime:
+                    continue
+                try:
+                    self.entries[entry.name] = self.read_header(entry.path, stat)
+                except Exception as e:
+                    print(f"⚠️ Başlık okunamadı: {entry.name} - {e}")
+                    self.entries.pop(entry.name, None)
+                    present.discard(entry.name)
+                    continue
+                updated += 1
+            
+            stale = [name for name in self.entries if name not in present]
+            for name in stale:
+                del self.entries[name]
+            
+            if updated or stale:
+                self.save()
+            return updated
+    
+    def duration(self, name):
+        entry = self.entries.get(name)
+        if not entry or not entry['samplerate']:
+            return None
+        return entry['frames'] / entry['samplerate']
+    
+    def durations(self):
+        """{file name: seconds} for every cached file"""
+        return {
+            name: entry['frames'] / entry['samplerate']
+            for name, entry in self.entries.items()
+            if entry['samplerate']
+        }
+    
+    def totals(self):
+        """Exact corpus-wide totals from cached headers"""
+        durations = list(self.durations().values())
+        return {
+            'files': len(durations),
+            'total_duration': sum(durations),
+            'min_duration': min(durations) if durations else 0.0,
+            'max_duration': max(durations) if durations else 0.0,
+            'avg_duration': sum(durations) / len(durations) if durations else 0.0,
+            'total_bytes': sum(entry['size'] for entry in self.entries.values())
+        }
+
+
+def analyze_audio_file(path, frame_seconds=0.02):
+    """Quality metrics for one WAV, fully vectorized
+    
+    Module-level so it can run in a ProcessPoolExecutor worker. Frames are
+    classified as speech when their level is 10 dB above the noise floor
+    (10th percentile frame level) and within 40 dB of the loudest frame.
+    """
+    audio, sample_rate = sf.read(str(path), dtype='float32', always_2d=True)
+    audio = audio.mean(axis=1)
+    if audio.size == 0:
+        raise ValueError("empty audio")
+    
+    abs_audio = np.abs(audio)
+    peak = float(abs_audio.max())
+    rms = float(np.sqrt(np.mean(audio * audio)))
+    clipping_ratio = float(np.mean(abs_audio >= 0.999))
+    dc_offset = float(audio.mean())
+    
+    frame_length = max(1, int(sample_rate * frame_seconds))
+    n_frames = max(1, audio.size // frame_length)
+    frames = np.resize(audio, n_frames * frame_length).reshape(n_frames, frame_length)
+    frame_power = np.mean(frames * frames, axis=1) + 1e-12
+    frame_db = 10.0 * np.log10(frame_power)
+    
+    noise_floor_db = float(np.percentile(frame_db, 10))
+    threshold_db = max(noise_floor_db + 10.0, float(frame_db.max()) - 40.0)
+    speech = frame_db > threshold_db
+    speech_frames = np.flatnonzero(speech)
+    
+    if speech_frames.size:
+        leading_silence = speech_frames[0] * frame_seconds
+        trailing_silence = (n_frames - speech_frames[-1] - 1) * frame_seconds
+        noise_power = frame_power[~speech].mean() if (~speech).any() else frame_power.min()
+        snr_db = float(10.0 * np.log10(frame_power[speech].mean() / noise_power))
+    else:
+        leading_silence = trailing_silence = n_frames * frame_seconds
+        snr_db = 0.0
+    
+    return {
+        'duration': audio.size / sample_rate,
+        'peak': peak,
+        'rms': rms,
+        'clipping_ratio': clipping_ratio,
+        'dc_offset': dc_offset,
+        'leading_silence': float(leading_silence),
+        'trailing_silence': float(trailing_silence),
+        'snr_db': snr_db,
+        'speech_ratio': float(speech.mean())
+    }
+
+
+class QualityAnalyzer:
+    """Full-corpus quality analysis with a persisted columnar report
+    
+    Results are stored column-wise in a NumPy .npz keyed by file name and
+    mtime; reruns only analyze new or modified files, in a process pool.
+    A cancelled run saves the rows finished so far, so the next run resumes.
+    """
+    
+    METRICS = ('duration', 'peak', 'rms', 'clipping_ratio', 'dc_offset',
+               'leading_silence', 'trailing_silence', 'snr_db', 'speech_ratio')
+    
+    def __init__(self, audio_dir=None, report_file=None, workers=None):
+        self.audio_dir = Path(audio_dir) if audio_dir else Config.AUDIO_DIR
+        self.report_file = Path(report_file) if report_file else Config.QUALITY_REPORT_FILE
+        self.workers = workers or Config.QUALITY_WORKERS
+        self.columns = self.load()
+    
+    def empty_columns(self):
+        columns = {'name': np.array([], dtype=str), 'mtime': np.array([], dtype=np.float64)}
+        for metric in self.METRICS:
+            columns[metric] = np.array([], dtype=np.float32)
+        return columns
+    
+    def load(self):
+        if self.report_file.exists():
+            try:
+                with np.load(self.report_file, allow_pickle=False) as data:
+                    return {key: data[key] for key in data.files}
+            except Exception as e:
+                print(f"⚠️ Kalite raporu okunamadı: {e}")
+        return self.empty_columns()
+    
+    def save(self):
+        # np.savez ".npz" uzantısı eklediği için dosya nesnesiyle yaz
+        with open(self.report_file, 'wb') as f:
+            np.savez(f, **self.columns)
+    
+    def run(self, progress_callback=None):
+        """Analyze new/changed files, drop removed ones; return count analyzed"""
+        cached = {name: (i, mtime) for i, (name, mtime) in enumerate(zip(self.columns['name'], self.columns['mtime']))}
+        keep_rows = []
+        pending = []
+        for entry in os.scandir(self.audio_dir):
+            if not entry.name.lower().endswith('.wav') or not entry.is_file():
+                continue
+            mtime = entry.stat().st_mtime
+            row = cached.get(entry.name)
+            if row and row[1] == mtime:
+                keep_rows.append(row[0])
+            else:
+                pending.append((entry.name, entry.path, mtime))
+        
+        new_rows = []
+        if pending:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                futures = [executor.submit(analyze_audio_file, path) for _, path, _ in pending]
+                try:
+                    for done, ((name, _, mtime), future) in enumerate(zip(pending, futures), 1):
+                        try:
+                            new_rows.append((name, mtime, future.result()))
+                        except Exception as e:
+                            print(f"⚠️ Analiz edilemedi: {name} - {e}")
+                        if progress_callback:
+                            progress_callback(done, len(pending))
+                except BaseException:
+                    # İptal: kuyruktakileri analiz etmeden çık, bitenleri kaydet
+                    executor.shutdown(cancel_futures=True)
+                    self._merge(keep_rows, new_rows)
+                    raise
+        
+        self._merge(keep_rows, new_rows)
+        return len(pending)
+    
+    def _merge(self, keep_rows, new_rows):
+        """Kept cached rows + newly analyzed rows -> columns; save if changed"""
+        keep = np.array(keep_rows, dtype=np.int64)
+        columns = {key: values[keep] for key, values in self.columns.items()}
+        if new_rows:
+            columns['name'] = np.concatenate([columns['name'], np.array([row[0] for row in new_rows], dtype=str)])
+            columns['mtime'] = np.concatenate([columns['mtime'], np.array([row[1] for row in new_rows])])
+            for metric in self.METRICS:
+                values = np.array([row[2][metric] for row in new_rows], dtype=np.float32)
+                columns[metric] = np.concatenate([columns[metric], values])
+        
+        changed = bool(new_rows) or len(keep_rows) != len(self.columns['name'])
+        self.columns = columns
+        if changed:
+            self.save()
+    
+    def rows(self):
+        """Report as a list of dicts (one per file)"""
+        names = self.columns['name']
+        return [
+            dict({'name': str(names[i])}, **{metric: float(self.columns[metric][i]) for metric in self.METRICS})
+            for i in range(len(names))
+        ]
@@ -0,0 +1,1060 @@
+"""
+Microphone recording and audio post-processing
+"""
+
+import math
+import threading
+import queue
+import time
+
+import numpy as np
+import soundfile as sf
+
+from .config import Config, LazyModule
+
+sd = LazyModule("sounddevice")  # kayıt cihazı yoksa bile import edilebilsin
+
+
+class LevelMeter:
+    """Latest input level, written by the audio thread and read by the UI
+
+    publish() runs inside the recording callback or stream reader on the raw
+    int16 block. It looks at every Config.METER_DECIMATION-th frame, computes
+    peak and RMS with integer math and stores one immutable (seq, peak, rms)
+    tuple. Rebinding an attribute is atomic, so neither side takes a lock and
+    the reader always sees a consistent triple; seq tells it whether a new
+    block arrived since the last look.
+    """
+
+    FULL_SCALE = 32768
+
+    def __init__(self):
+        self.slot = (0, 0, 0)  # (seq, peak, rms) int16 ölçeğinde
+
+    def publish(self, block):
+        samples = np.asarray(block)[::Config.METER_DECIMATION].ravel()
+        if samples.size == 0:
+            return
+        if samples.dtype.kind == 'f':  # float kaynaklar için (eski yollar)
+            samples = samples * self.FULL_SCALE
+        samples = samples.astype(np.int64)
+        peak = int(np.abs(samples).max())
+        rms = math.isqrt(int(np.dot(samples, samples)) // samples.size)
+        self.slot = (self.slot[0] + 1, min(peak, self.FULL_SCALE), rms)
+
+    def reset(self):
+        self.slot = (self.slot[0] + 1, 0, 0)
+
+    def read(self):
+        """(seq, peak, rms) - peak ve rms 0..32768"""
+        return self.slot
+
+    def level(self):
+        """Peak as a float in 0..1"""
+        return self.slot[1] / self.FULL_SCALE
+
+
+class AudioManager:
+    """Enhanced audio recording manager with device selection and quality control"""
+    
+    def __init__(self):
+        self.devices = []
+        self._selected_device = None
+        self.selected_is_bluetooth = False  # Cihaz değiştiğinde bir kez hesaplanır
+        self.is_recording = False
+        self.current_recording = []
+        self.audio_queue = queue.Queue()
+        self.recording_thread = None
+        self.is_sentence_mode = False  # Track recording mode for dynamic timeouts
+        self.consecutive_empty = 0
+        self.meter = LevelMeter()  # For UI monitoring
+        self.audio_chunks = []  # For callback recording
+        self.sample_rate = Config.SAMPLE_RATE
+        
+        self.refresh_devices()
+    
+    @property
+    def selected_device(self):
+        return self._selected_device
+    
+    @selected_device.setter
+    def selected_device(self, device_id):
+        self._selected_device = device_id
+        self.selected_is_bluetooth = self._classify_bluetooth(device_id)
+    
+    @property
+    def current_audio_level(self):
+        """Latest peak level (0..1) for UI monitoring"""
+        return self.meter.level()
+    
+    def refresh_devices(self):
+        """Refresh available audio input devices"""
+        try:
+            devices_info = sd.query_devices()
+            self.devices = []
+            
+            for i, device in enumerate(devices_info):
+                if device['max_input_channels'] > 0:
+                    self.devices.append({
+                        'id': i,
+                        'name': device['name'],
+                        'channels': device['max_input_channels'],
+                        'sample_rate': device['default_samplerate']
+                    })
+            
+            if self.devices:
+                self.selected_device = self.devices[0]['id']
+            else:
+                self.selected_is_bluetooth = False
+            
+            return True, f"Found {len(self.devices)} input devices"
+        except Exception as e:
+            return False, f"Error detecting devices: {str(e)}"
+    
+    def check_microphone(self):
+        """Check if microphone is working with detailed diagnostics"""
+        try:
+            if not self.devices:
+                return False, "No audio input devices found"
+            
+            # Testing microphone
+            
+            # Try multiple test approaches
+            devices_to_test = [self.selected_device, None]  # Test selected and default
+            
+            for device_id in devices_to_test:
+                device_name = self.get_selected_device_name() if device_id == self.selected_device else "System Default"
+                print(f"🎤 Testing device: {device_name}")
+                
+                try:
+                    test_duration = 0.5  # Longer test
+                    test_data = sd.rec(
+                        int(test_duration * Config.SAMPLE_RATE),
+                        samplerate=Config.SAMPLE_RATE,
+                        channels=Config.CHANNELS,
+                        device=device_id,
+                        dtype=np.int16  # Use int16 for compatibility
+                    )
+                    sd.wait()
+                    
+                    if test_data is not None and len(test_data) > 0:
+                        # Convert to float for level checking
+                        test_float = test_data.astype(np.float32) / 32768.0
+                        max_level = np.max(np.abs(test_float))
+                        rms_level = np.sqrt(np.mean(test_float**2))
+                        
+                        # Audio levels checked
+                        
+                        if max_level > 0.0001:  # Very low threshold
+                            return True, f"Microphone OK (Device: {device_name}, Max level: {max_level:.4f})"
+                        elif max_level > 0:
+                            return True, f"Microphone detected but very quiet (Device: {device_name}, Max level: {max_level:.6f})"
+                        else:
+                            pass  # Silent audio detected
+                            
+                except Exception as device_error:
+                    print(f"❌ Device {device_name} test failed: {device_error}")
+                    continue
+            
+            return False, "All microphone tests failed - please check microphone connection and permissions"
+            
+        except Exception as e:
+            return False, f"Audio system error: {str(e)}"
+    
+    def get_selected_device_name(self):
+        """Get the name of the currently selected device"""
+        for device in self.devices:
+            if device['id'] == self.selected_device:
+                return device['name']
+        return "Unknown Device"
+    
+    def is_bluetooth_device(self, device_id=None):
+        """Check if the device is likely a Bluetooth audio device"""
+        if device_id is None or device_id == self._selected_device:
+            return self.selected_is_bluetooth
+        return self._classify_bluetooth(device_id)
+    
+    def _classify_bluetooth(self, device_id):
+        device_name = ""
+        for device in self.devices:
+            if device['id'] == device_id:
+                device_name = device['name'].lower()
+                break
+        
+        # Common Bluetooth device indicators
+        bluetooth_indicators = [
+            'airpods', 'bluetooth', 'wireless', 'bt', 'headset',
+            'headphone', 'earbuds', 'sony', 'bose', 'beats',
+            'jabra', 'plantronics', 'samsung buds'
+        ]
+        
+        return any(indicator in device_name for indicator in bluetooth_indicators)
+    
+    def start_recording(self, device_id=None):
+        """Start recording audio - simplified approach"""
+        if self.is_recording:
+            return False, "Already recording"
+        
+        if device_id is not None:
+            self.selected_device = device_id
+        
+        try:
+            # Starting recording with selected device
+            
+            # Clear previous recording
+            self.current_recording = []
+            self.is_recording = True
+            
+            # Get content type for timeout calculation
+            content_type = getattr(self, 'content_type', 'word')
+            is_sentence_mode = getattr(self, 'is_sentence_mode', False)
+            
+            # Set recording duration based on mode
+            if content_type == "paragraph":
+                max_duration = 45.0  # 45 seconds for paragraphs
+            elif content_type == "sentence" or is_sentence_mode:
+                max_duration = 25.0  # 25 seconds for long sentences
+            else:
+                max_duration = 3.0   # 3 seconds for words - enough for any single word
+            
+            # Recording mode configuration (output cleaned up for user)
+            
+            # Detect device type and choose optimal recording method
+            is_bluetooth = self.is_bluetooth_device()
+            device_name = self.get_selected_device_name()
+            
+            if is_bluetooth:
+                print(f"🎧 Detected Bluetooth device: {device_name}")
+                print(f"🎙️ Using Bluetooth-optimized recording method")
+                self.recording_thread = threading.Thread(target=self._bluetooth_recording_worker, args=(max_duration,))
+            elif content_type in ("sentence", "paragraph") or is_sentence_mode:
+                print(f"🎙️ Using streaming recording method for longer stability")
+                self.recording_thread = threading.Thread(target=self._streaming_recording_worker, args=(max_duration,))
+            else:
+                print(f"🎙️ Using fallback recording method for better stability")
+                self.recording_thread = threading.Thread(target=self._fallback_recording_worker, args=(max_duration,))
+            self.recording_thread.start()
+            
+            return True
+        except Exception as e:
+            self.is_recording = False
+            # Recording start error handled
+            return False, f"Failed to start recording: {str(e)}"
+    
+    def _simple_recording_worker(self, max_duration):
+        """Enhanced recording worker with real-time audio level monitoring"""
+        print(f"🎙️ Recording worker started - Duration: {max_duration}s")
+        try:
+            # Starting recording (output cleaned up for user)
+            
+            # Try multiple device options in case of failure
+            devices_to_try = [self.selected_device, None]  # None uses default device
+            audio_data = None
+            
+            for device in devices_to_try:
+                try:
+                    # Trying recording device
+                    
+                    # Initialize recording with callback for real-time monitoring
+                    self.audio_chunks = []
+                    
+                    def audio_callback(indata, frames, time, status):
+                        """Store the block and publish its level (no printing on the audio thread)"""
+                        self.audio_chunks.append(indata.copy())
+                        self.meter.publish(indata)
+                    
+                    # Start recording with callback and more robust configuration
+                    with sd.InputStream(
+                        device=device,
+                        channels=Config.CHANNELS,
+                        samplerate=Config.SAMPLE_RATE,
+                        dtype=np.int16,
+                        callback=audio_callback,
+                        blocksize=Config.CHUNK_SIZE,
+                        latency='low'  # Lower latency for better responsiveness
+                    ):
+                        # Recording in progress
+                        
+                        # Wait for recording to complete or until manually stopped
+                        start_time = time.time()
+                        last_chunk_time = start_time
+                        print(f"🎤 Starting {max_duration}s recording session...")
+                        
+                        chunk_count_last_check = 0
+                        last_chunk_check_time = start_time
+                        
+                        while self.is_recording and (time.time() - start_time) < max_duration:
+                            current_time = time.time()
+                            elapsed = current_time - start_time
+                            current_chunk_count = len(self.audio_chunks)
+                            
+                            # Check if we're still getting audio chunks
+                            if current_chunk_count > chunk_count_last_check:
+                                last_chunk_time = current_time
+                                chunk_count_last_check = current_chunk_count
+                            
+                            # Show progress every 2 seconds
+                            if int(elapsed) % 2 == 0 and int(elapsed) != int(elapsed - 0.05):
+                                print(f"⏱️  Recording... {elapsed:.1f}s / {max_duration}s - Chunks: {current_chunk_count}")
+                                
+                                # Check for stalled audio stream
+                                if current_time - last_chunk_check_time > 1.0 and current_chunk_count == 0:
+                                    print(f"⚠️ Warning: No audio chunks received for 1 second!")
+                                    
+                            # More frequent check but longer patience
+                            time.sleep(0.05)  # Check every 50ms for better responsiveness
+                    
+                    # Show recording completion info
+                    recording_duration = time.time() - start_time
+                    print(f"🎙️ Recording session completed: {recording_duration:.1f}s of {max_duration:.1f}s")
+                    
+                    # Combine all audio chunks
+                    if self.audio_chunks:
+                        audio_data = np.concatenate(self.audio_chunks, axis=0)
+                    
+                    # Check if we got valid audio data
+                    if audio_data is not None and len(audio_data) > 0:
+                        # Convert to float for processing and check amplitude
+                        audio_float = audio_data.astype(np.float32) / 32768.0  # Normalize int16 to float
+                        max_amplitude = np.max(np.abs(audio_float))
+                        # Audio amplitude check completed
+                        
+                        if max_amplitude > 0.0001:  # Lower threshold for valid audio
+                            # Recording completed successfully
+                            self.current_recording = [audio_float]  # Store as float
+                            print(f"✅ Recording completed: {len(audio_float)/Config.SAMPLE_RATE:.1f}s, amplitude: {max_amplitude:.6f}")
+                            return
+                        else:
+                            print(f"⚠️ Audio too quiet: {max_amplitude:.6f}")
+                    else:
+                        pass  # No audio data received
+                        
+                except Exception as device_error:
+                    # Device failed, trying next
+                    continue
+            
+            # If we get here, all devices failed
+            # All recording attempts failed
+            self.current_recording = []
+                
+        except Exception as e:
+            # Recording worker error handled
+            self.current_recording = []
+        finally:
+            self.is_recording = False
+            self.meter.reset()
+    
+    def _fallback_recording_worker(self, max_duration):
+        """Robust segmented recording method to avoid Windows audio driver issues"""
+        print(f"🎙️ Robust recording worker started - Duration: {max_duration}s")
+        try:
+            # Record in segments to avoid Windows audio driver timeout issues
+            # Use smaller segments for short recordings (words), larger for long ones
+            if max_duration <= 5.0:
+                segment_duration = max_duration  # Single segment for short recordings
+            else:
+                segment_duration = 5.0  # 5-second segments for longer recordings
+            segments = []
+            total_segments = int(max_duration / segment_duration) + 1
+            
+            print(f"🎤 Recording in {total_segments} segments of {segment_duration}s each...")
+            
+            for segment_num in range(total_segments):
+                if not self.is_recording:
+                    print(f"🛑 Recording stopped manually at segment {segment_num}")
+                    break
+                
+                # Calculate remaining time for this segment
+                remaining_time = max_duration - (segment_num * segment_duration)
+                current_segment_duration = min(segment_duration, remaining_time)
+                
+                if current_segment_duration <= 0:
+                    break
+                
+                print(f"🎙️ Recording segment {segment_num + 1}/{total_segments} ({current_segment_duration:.1f}s)...")
+                
+                try:
+                    # Record this segment with proper device configuration
+                    segment_data = sd.rec(
+                        int(current_segment_duration * Config.SAMPLE_RATE),
+                        samplerate=Config.SAMPLE_RATE,
+                        channels=Config.CHANNELS,
+                        dtype=np.int16,
+                        device=self.selected_device
+                    )
+                    
+                    # Wait for segment with periodic stop checks
+                    check_interval = 0.1  # Check every 100ms
+                    elapsed = 0
+                    while elapsed < current_segment_duration:
+                        if not self.is_recording:
+                            # User clicked stop - abort this segment
+                            sd.stop()
+                            print(f"🛑 Recording stopped manually during segment {segment_num + 1}")
+                            break
+                        time.sleep(check_interval)
+                        elapsed += check_interval
+                    
+                    # Only add segment if we completed it
+                    if self.is_recording and segment_data is not None and len(segment_data) > 0:
+                        # Check segment quality
+                        segment_float = segment_data.astype(np.float32) / 32768.0
+                        segment_amplitude = np.max(np.abs(segment_float))
+                        
+                        print(f"✅ Segment {segment_num + 1} completed: amplitude {segment_amplitude:.6f}")
+                        segments.append(segment_float)
+                        
+                        # Store current level for UI
+                        self.meter.publish(segment_data)
+                    elif not self.is_recording:
+                        # Stopped early - only keep the audio recorded so far
+                        recorded_samples = int(elapsed * Config.SAMPLE_RATE)
+                        if segment_data is not None and recorded_samples > 0:
+                            segment_float = segment_data[:recorded_samples].astype(np.float32) / 32768.0
+                            segment_amplitude = np.max(np.abs(segment_float))
+                            print(f"✅ Partial segment {segment_num + 1}: {elapsed:.2f}s, amplitude {segment_amplitude:.6f}")
+                            segments.append(segment_float)
+                        break  # Exit the segment loop
+                    else:
+                        print(f"⚠️ Segment {segment_num + 1} failed - no data")
+                        # Add silence for missing segment
+                        silence = np.zeros((int(current_segment_duration * Config.SAMPLE_RATE), Config.CHANNELS), dtype=np.float32)
+                        segments.append(silence)
+                    
+                    # Brief pause between segments to reinitialize driver
+                    time.sleep(0.1)
+                    
+                except Exception as segment_error:
+                    print(f"❌ Segment {segment_num + 1} error: {segment_error}")
+                    # Add silence for failed segment
+                    silence = np.zeros((int(current_segment_duration * Config.SAMPLE_RATE), Config.CHANNELS), dtype=np.float32)
+                    segments.append(silence)
+            
+            # Combine all segments
+            if segments:
+                audio_float = np.concatenate(segments, axis=0)
+                
+                # Remove buzzing artifacts from the very end (typical with sd.rec())
+                # Buzzing usually appears in the last 10-20ms
+                buzz_removal_samples = int(Config.SAMPLE_RATE * 0.015)  # Remove last 15ms
+                if len(audio_float) > buzz_removal_samples:
+                    audio_float = audio_float[:-buzz_removal_samples]
+                    print(f"🔧 Removed last 15ms to eliminate buzzing artifacts")
+                
+                # Apply dynamic range compression to compensate for Windows AGC
+                audio_float = self._normalize_audio_levels(audio_float)
+                max_amplitude = np.max(np.abs(audio_float))
+                
+                print(f"✅ Segmented recording completed: {len(audio_float)/Config.SAMPLE_RATE:.1f}s, amplitude: {max_amplitude:.6f}")
+                
+                if max_amplitude > 0.0001:
+                    self.current_recording = [audio_float]
+                else:
+                    print(f"⚠️ Combined audio too quiet: {max_amplitude:.6f}")
+                    self.current_recording = []
+            else:
+                print(f"❌ No segments recorded")
+                self.current_recording = []
+                
+        except Exception as e:
+            print(f"❌ Robust recording error: {e}")
+            self.current_recording = []
+        finally:
+            self.is_recording = False
+            self.meter.reset()
+            print(f"🔚 Robust recording worker finished")
+
+    def _streaming_recording_worker(self, max_duration: float):
+        """Single-stream reader to avoid device reinitialization between segments.
+
+        - Keeps one InputStream open for the entire session.
+        - Reads fixed-size chunks until max_duration or manual stop.
+        - Updates UI level and analyzes/saves debug output at the end.
+        """
+        print(f"🎙️ Streaming recording worker started - Duration: {max_duration}s")
+        frames_per_read = int(self.sample_rate * 0.25)  # ~250ms per read
+        collected = []
+        start_time = time.time()
+        total_frames = 0
+        try:
+            stream = sd.InputStream(
+                device=self.selected_device,
+                channels=Config.CHANNELS,
+                samplerate=self.sample_rate,
+                dtype=np.int16,
+                blocksize=Config.CHUNK_SIZE,
+                latency='high'
+            )
+            stream.start()
+            print("🎤 Stream opened")
+
+            while self.is_recording:
+                # Respect max_duration based on frames collected
+                if total_frames >= int(max_duration * self.sample_rate):
+                    break
+                try:
+                    indata, overflowed = stream.read(frames_per_read)
+                except Exception as re:
+                    print(f"⚠️ Stream read error: {re}")
+                    # Brief backoff and continue
+                    time.sleep(0.05)
+                    continue
+
+                if indata is None or len(indata) == 0:
+                    time.sleep(0.01)
+                    continue
+
+                # UI level update
+                self.meter.publish(indata)
+
+                # Convert to float32 mono
+                chunk = indata.astype(np.float32) / 32768.0
+                if chunk.ndim > 1:
+                    chunk = np.mean(chunk, axis=1, dtype=np.float32)
+                collected.append(chunk)
+
+                total_frames += chunk.size
+
+            # Stop and close stream
+            try:
+                stream.stop()
+            except Exception:
+                pass
+            try:
+                stream.close()
+            except Exception:
+                pass
+
+            duration_s = total_frames / float(self.sample_rate) if self.sample_rate else 0.0
+            print(f"🎙️ Streaming session completed: {duration_s:.2f}s of {max_duration:.2f}s")
+
+            if collected:
+                audio_float = np.concatenate(collected, axis=0)
+                # Normalize/level
+                audio_float = self._normalize_audio_levels(audio_float)
+                max_amp = float(np.max(np.abs(audio_float))) if audio_float.size else 0.0
+
+                if max_amp > 1e-5 and duration_s >= 0.5:
+                    self.current_recording = [audio_float]
+                else:
+                    print(f"⚠️ Streaming audio too quiet/short (amp {max_amp:.6f}, dur {duration_s:.2f}s)")
+                    self.current_recording = []
+            else:
+                print("❌ No audio collected in streaming worker")
+                self.current_recording = []
+
+        except Exception as e:
+            print(f"❌ Streaming recording error: {e}")
+            self.current_recording = []
+        finally:
+            self.is_recording = False
+            self.meter.reset()
+            print("🔚 Streaming recording worker finished")
+    
+    def _bluetooth_recording_worker(self, max_duration: float):
+        """Specialized recording worker optimized for Bluetooth audio devices.
+        
+        Uses smaller buffers, more frequent reads, and aggressive fallback strategies
+        to handle Bluetooth audio latency and connection stability issues.
+        """
+        print(f"🎧 Bluetooth recording worker started - Duration: {max_duration}s")
+        device_name = self.get_selected_device_name()
+        
+        # Bluetooth-optimized settings
+        bt_chunk_size = 512  # Smaller chunks for Bluetooth
+        read_interval = 0.1  # Read every 100ms
+        frames_per_read = int(self.sample_rate * read_interval)
+        
+        collected = []
+        start_time = time.time()
+        total_frames = 0
+        consecutive_failures = 0
+        last_level_time = start_time
+        
+        try:
+            # Try Bluetooth device with optimized settings
+            print(f"🎧 Attempting Bluetooth recording with {device_name}")
+            
+            stream = sd.InputStream(
+                device=self.selected_device,
+                channels=Config.CHANNELS,
+                samplerate=self.sample_rate,
+                dtype=np.int16,
+                blocksize=bt_chunk_size,  # Smaller buffer for Bluetooth
+                latency='low'  # Lower latency for wireless
+            )
+            stream.start()
+            print("🎧 Bluetooth stream opened successfully")
+            
+            while self.is_recording:
+                current_time = time.time()
+                
+                # Check total duration
+                if total_frames >= int(max_duration * self.sample_rate):
+                    print(f"✅ Reached maximum duration: {max_duration:.1f}s")
+                    break
+                
+                try:
+                    # Read smaller chunks more frequently
+                    indata, overflowed = stream.read(frames_per_read)
+                    
+                    if overflowed:
+                        print(f"⚠️ Bluetooth audio buffer overflow detected")
+                    
+                    if indata is None or len(indata) == 0:
+                        consecutive_failures += 1
+                        if consecutive_failures > 10:
+                            print(f"❌ Too many consecutive read failures: {consecutive_failures}")
+                            break
+                        time.sleep(0.01)
+                        continue
+                    
+                    # Reset failure counter on successful read
+                    consecutive_failures = 0
+                    
+                    # Convert to float32 mono
+                    chunk = indata.astype(np.float32) / 32768.0
+                    if chunk.ndim > 1:
+                        chunk = np.mean(chunk, axis=1, dtype=np.float32)
+                    
+                    collected.append(chunk)
+                    total_frames += len(chunk)
+                    
+                    # Monitor audio levels
+                    self.meter.publish(indata)
+                    level = self.meter.level()
+                    
+                    # Show progress every 2 seconds with level monitoring
+                    if current_time - last_level_time >= 2.0:
+                        elapsed = current_time - start_time
+                        level_bar = "█" * int(level * 20) + "░" * (20 - int(level * 20))
+                        print(f"🎧 [{level_bar}] {elapsed:.1f}s/{max_duration:.1f}s - Level: {level:.3f}")
+                        last_level_time = current_time
+                        
+                        # Warn if no audio detected for extended period
+                        if level < 0.001:
+                            print(f"⚠️ Very low audio level detected - check Bluetooth connection")
+                    
+                    # Brief pause to prevent overwhelming Bluetooth buffer
+                    time.sleep(0.01)
+                    
+                except Exception as read_error:
+                    consecutive_failures += 1
+                    print(f"⚠️ Bluetooth read error {consecutive_failures}: {read_error}")
+                    
+                    if consecutive_failures > 20:
+                        print(f"❌ Bluetooth connection appears unstable - switching to fallback")
+                        break
+                    
+                    time.sleep(0.05)  # Brief recovery pause
+            
+            # Clean up stream
+            try:
+                stream.stop()
+                stream.close()
+            except Exception:
+                pass
+            
+            # Process collected audio
+            if collected:
+                audio_float = np.concatenate(collected, axis=0)
+                duration_s = len(audio_float) / float(self.sample_rate)
+                
+                print(f"🎧 Bluetooth recording completed: {duration_s:.2f}s")
+                
+                # Apply normalization for Bluetooth audio
+                audio_float = self._normalize_audio_levels(audio_float)
+                max_amp = float(np.max(np.abs(audio_float))) if audio_float.size > 0 else 0.0
+                
+                # More lenient validation for Bluetooth
+                if max_amp > 5e-5 and duration_s >= 0.3:  # Lower thresholds for Bluetooth
+                    self.current_recording = [audio_float]
+                    print(f"✅ Bluetooth recording successful: amp={max_amp:.6f}, dur={duration_s:.2f}s")
+                else:
+                    print(f"⚠️ Bluetooth audio quality insufficient")
+                    print(f"   Amplitude: {max_amp:.6f} (need > 5e-5)")
+                    print(f"   Duration: {duration_s:.2f}s (need > 0.3s)")
+                    # Try emergency fallback
+                    self._emergency_fallback_recording(max_duration - (time.time() - start_time))
+            else:
+                print(f"❌ No Bluetooth audio collected")
+                # Try emergency fallback
+                self._emergency_fallback_recording(max_duration - (time.time() - start_time))
+                
+        except Exception as e:
+            print(f"❌ Bluetooth recording failed: {e}")
+            print(f"🚨 Attempting emergency fallback to system default...")
+            # Try emergency fallback
+            self._emergency_fallback_recording(max_duration - (time.time() - start_time))
+            
+        finally:
+            self.is_recording = False
+            self.meter.reset()
+            print("🔚 Bluetooth recording worker finished")
+    
+    def _emergency_fallback_recording(self, remaining_duration):
+        """Emergency fallback to system default microphone when Bluetooth fails"""
+        if remaining_duration <= 0.5:
+            print("⏰ Not enough time remaining for fallback recording")
+            self.current_recording = []
+            return
+            
+        print(f"🚨 EMERGENCY FALLBACK: Switching to system default microphone")
+        print(f"⏱️ Time remaining: {remaining_duration:.1f}s")
+        
+        try:
+            # Use system default device (None = default)
+            fallback_data = sd.rec(
+                int(remaining_duration * self.sample_rate),
+                samplerate=self.sample_rate,
+                channels=Config.CHANNELS,
+                dtype=np.int16,
+                device=None  # System default
+            )
+            
+            # Wait for recording to complete
+            sd.wait()
+            
+            if fallback_data is not None and len(fallback_data) > 0:
+                # Convert and process
+                audio_float = fallback_data.astype(np.float32) / 32768.0
+                if audio_float.ndim > 1:
+                    audio_float = np.mean(audio_float, axis=1, dtype=np.float32)
+                
+                max_amp = float(np.max(np.abs(audio_float)))
+                duration_s = len(audio_float) / float(self.sample_rate)
+                
+                print(f"🚨 Emergency fallback completed: {duration_s:.2f}s, amp: {max_amp:.6f}")
+                
+                if max_amp > 1e-4 and duration_s >= 0.3:
+                    self.current_recording = [audio_float]
+                    print("✅ Emergency fallback successful!")
+                else:
+                    print("❌ Emergency fallback also failed")
+                    self.current_recording = []
+            else:
+                print("❌ Emergency fallback - no data received")
+                self.current_recording = []
+                
+        except Exception as e:
+            print(f"❌ Emergency fallback error: {e}")
+            self.current_recording = []
+    
+    def _analyze_recording(self, audio_data, filename):
+        """Analyze recording to understand the audio capture issue"""
+        try:
+            duration = len(audio_data) / Config.SAMPLE_RATE
+            max_amp = np.max(np.abs(audio_data))
+            rms = np.sqrt(np.mean(audio_data**2))
+            
+            # Analyze in 1-second chunks
+            chunk_size = Config.SAMPLE_RATE  # 1 second
+            chunks = []
+            
+            print(f"\n🔍 AUDIO ANALYSIS for {filename}:")
+            print(f"📊 Total duration: {duration:.2f}s")
+            print(f"📊 Max amplitude: {max_amp:.6f}")
+            print(f"📊 RMS level: {rms:.6f}")
+            print(f"📊 Chunk analysis (1-second intervals):")
+            
+            for i in range(0, len(audio_data), chunk_size):
+                chunk = audio_data[i:i+chunk_size]
+                if len(chunk) > 0:
+                    chunk_max = np.max(np.abs(chunk))
+                    chunk_rms = np.sqrt(np.mean(chunk**2))
+                    second = i // chunk_size + 1
+                    chunks.append((second, chunk_max, chunk_rms))
+                    
+                    # Visual level indicator
+                    level_bar = "█" * int(chunk_max * 20) + "░" * (20 - int(chunk_max * 20))
+                    print(f"   Second {second:2d}: [{level_bar}] Max:{chunk_max:.4f} RMS:{chunk_rms:.4f}")
+            
+            # Check for silence pattern
+            silent_chunks = [c for c in chunks if c[1] < 0.01]  # Max amplitude < 0.01
+            if len(silent_chunks) > 0:
+                print(f"⚠️ Found {len(silent_chunks)} silent/very quiet chunks out of {len(chunks)} total")
+                if len(silent_chunks) > len(chunks) / 2:
+                    print(f"🚨 ISSUE: More than half the recording is silent!")
+            
+            print(f"🔍 Analysis complete\n")
+            
+        except Exception as e:
+            print(f"❌ Analysis error: {e}")
+    
+    def _normalize_audio_levels(self, audio_data):
+        """Normalize audio levels and trim silence to prevent noise amplification"""
+        try:
+            # Smart speech endpoint detection
+            # Calculate energy in 50ms windows
+            window_size = int(Config.SAMPLE_RATE * 0.05)  # 50ms
+            energy = []
+            for i in range(0, len(audio_data), window_size):
+                window = audio_data[i:i+window_size]
+                energy.append(np.mean(np.abs(window)))
+            
+            if len(energy) > 2:
+                # Find where energy drops significantly and stays low
+                max_energy = np.max(energy)
+                threshold = max_energy * 0.15  # 15% of peak energy
+                
+                # Find last high-energy window
+                last_speech = 0
+                for i in range(len(energy)-1, -1, -1):
+                    if energy[i] > threshold:
+                        last_speech = i
+                        break
+                
+                # Cut audio at this point with small tail
+                cut_sample = (last_speech + 2) * window_size  # Add 2 windows (100ms) tail
+                if cut_sample < len(audio_data):
+                    # Apply quick fade-out
+                    fade_samples = int(Config.SAMPLE_RATE * 0.05)
+                    fade_start = cut_sample
+                    fade_end = min(cut_sample + fade_samples, len(audio_data))
+                    fade_length = fade_end - fade_start
+                    if fade_length > 0:
+                        fade_curve = np.linspace(1.0, 0.0, fade_length)
+                        audio_data[fade_start:fade_end] *= fade_curve
+                    
+                    audio_data = audio_data[:fade_end]
+                    print(f"🔧 Smart trim - final duration: {len(audio_data)/Config.SAMPLE_RATE:.2f}s")
+            
+            # Simple overall normalization (no chunk boosting to avoid noise amplification)
+            max_amplitude = np.max(np.abs(audio_data))
+            if max_amplitude > 0.01:  # Only normalize if there's actual audio
+                # Normalize to 0.5 (50% of max) to avoid clipping but maintain good volume
+                target_level = 0.5
+                normalization_factor = target_level / max_amplitude
+                # Limit boost to prevent noise amplification
+                normalization_factor = min(normalization_factor, 1.5)
+                audio_data = audio_data * normalization_factor
+                print(f"✅ Audio normalized by {normalization_factor:.2f}x (peak: {max_amplitude:.3f} → {np.max(np.abs(audio_data)):.3f})")
+            
+            return audio_data
+            
+        except Exception as e:
+            print(f"⚠️ Audio normalization failed: {e}")
+            return audio_data  # Return original if normalization fails
+    
+    def _recording_worker(self):
+        """Old complex recording worker - keeping for compatibility"""
+        try:
+            def audio_callback(indata, frames, time, status):
+                if status:
+                    pass  # Audio callback status monitoring
+                self.audio_queue.put(indata.copy())
+                self.meter.publish(indata)
+            
+            # Initialize consecutive empty counter
+            consecutive_empty = 0
+            
+            with sd.InputStream(
+                device=self.selected_device,
+                channels=Config.CHANNELS,
+                samplerate=Config.SAMPLE_RATE,
+                dtype=Config.DTYPE,
+                callback=audio_callback,
+                blocksize=Config.CHUNK_SIZE
+            ):
+                while self.is_recording:
+                    try:
+                        # Dynamic timeout based on recording mode
+                        # Much longer timeouts for sentence recording to prevent premature stops
+                        content_type = getattr(self, 'content_type', 'word')
+                        is_sentence_mode = getattr(self, 'is_sentence_mode', False)
+                        
+                        if content_type == "paragraph":
+                            timeout_duration = 15.0  # Very long for paragraphs
+                        elif content_type == "sentence" or is_sentence_mode:
+                            timeout_duration = 12.0  # Much longer for sentences
+                        else:
+                            timeout_duration = 2.0   # Reasonable for words
+                        
+                        audio_chunk = self.audio_queue.get(timeout=timeout_duration)
+                        self.current_recording.append(audio_chunk)
+                        
+                        # Reset consecutive empty count on successful data
+                        consecutive_empty = 0
+                        
+                    except queue.Empty:
+                        # Increment consecutive empty counter properly
+                        consecutive_empty += 1
+                        
+                        # Much more patient empty cycles for sentence recording
+                        if content_type == "paragraph":
+                            max_empty_cycles = 80   # Very patient for paragraphs
+                        elif content_type == "sentence" or is_sentence_mode:
+                            max_empty_cycles = 65   # Very patient for sentences
+                        else:
+                            max_empty_cycles = 8    # Quick for words
+                        
+                        # Empty cycle monitoring (cleaned up)
+                        
+                        if consecutive_empty > max_empty_cycles:
+                            # Recording auto-stopped due to silence
+                            break
+                        continue
+                    except Exception as e:
+                        # Recording error handled
+                        break
+        except Exception as e:
+            # Recording worker error handled
+            pass  
+        finally:
+            self.is_recording = False
+            self.meter.reset()  # Reset level for UI
+    
+    def set_sentence_mode(self, is_sentence_mode, content_type="word"):
+        """Update recording mode for dynamic timeout adjustment"""
+        self.is_sentence_mode = is_sentence_mode
+        self.content_type = content_type
+        mode_name = content_type.upper() if content_type in ["word", "sentence", "paragraph"] else ("SENTENCE" if is_sentence_mode else "WORD")
+        # AudioManager mode updated
+    
+    def stop_recording(self):
+        """Stop recording and return audio data"""
+        if not self.is_recording:
+            return None
+        
+        print(f"🛑 Stopping recording manually...")
+        self.is_recording = False
+        
+        # Stop sounddevice if it's still recording
+        try:
+            sd.stop()
+        except:
+            pass
+        
+        # Wait for recording thread to finish
+        if self.recording_thread:
+            self.recording_thread.join(timeout=2.0)
+        
+        # For simple recording, current_recording contains the direct audio data
+        if self.current_recording is not None and len(self.current_recording) > 0:
+            # Normalize to a single numpy array
+            if isinstance(self.current_recording, np.ndarray):
+                audio_data = self.current_recording
+            elif len(self.current_recording) == 1 and isinstance(self.current_recording[0], np.ndarray):
+                audio_data = self.current_recording[0]
+            else:
+                # Complex recording format - concatenate chunks
+                # Clear any remaining queue items first
+                if hasattr(self, 'audio_queue'):
+                    while not self.audio_queue.empty():
+                        try:
+                            chunk = self.audio_queue.get_nowait()
+                            self.current_recording.append(chunk)
+                        except queue.Empty:
+                            break
+                try:
+                    audio_data = np.concatenate(self.current_recording, axis=0)
+                except Exception:
+                    # Fallback: flatten list of lists
+                    audio_data = np.array(self.current_recording, dtype=np.float32).flatten()
+
+            # Ensure float32 mono array
+            try:
+                if audio_data.dtype != np.float32:
+                    audio_data = audio_data.astype(np.float32)
+                if audio_data.ndim > 1:
+                    audio_data = np.mean(audio_data, axis=1).astype(np.float32)
+            except Exception:
+                pass
+
+            # Apply noise reduction and normalization
+            processed_audio = self._process_audio(audio_data)
+            return processed_audio
+        
+        return None
+    
+    def _process_audio(self, audio_data):
+        """Enhanced audio processing to reduce noise and artifacts"""
+        try:
+            # Convert to mono if needed
+            if len(audio_data.shape) > 1:
+                audio_data = np.mean(audio_data, axis=1)
+            
+            # Convert to float if it's still int16
+            if audio_data.dtype == np.int16:
+                audio_data = audio_data.astype(np.float32) / 32768.0
+            
+            # Remove DC offset safely
+            mean_val = np.mean(audio_data)
+            if not np.isnan(mean_val) and np.isfinite(mean_val):
+                audio_data = audio_data - mean_val
+            
+            # Simple noise reduction - remove very quiet noise
+            noise_threshold = 0.01  # Threshold for noise
+            audio_data = np.where(np.abs(audio_data) < noise_threshold, 0, audio_data)
+            
+            # Gentle low-pass filter to remove high-frequency artifacts (without scipy)
+            # Simple moving average filter
+            window_size = 3
+            if len(audio_data) > window_size:
+                padded = np.pad(audio_data, (window_size//2, window_size//2), mode='edge')
+                filtered = np.convolve(padded, np.ones(window_size)/window_size, mode='valid')
+                audio_data = filtered[:len(audio_data)]
+            
+            # Soft limiting to prevent clipping distortion
+            max_amplitude = np.max(np.abs(audio_data))
+            if max_amplitude > 0 and np.isfinite(max_amplitude):
+                # Gentle compression instead of hard limiting
+                if max_amplitude > 0.9:
+                    compression_ratio = 0.8 / max_amplitude
+                    audio_data = np.tanh(audio_data * compression_ratio) * 0.8
+                else:
+                    # Normal normalization
+                    audio_data = audio_data / max_amplitude * 0.8
+            
+            # Ensure no NaN or infinite values
+            audio_data = np.nan_to_num(audio_data, nan=0.0, posinf=0.0, neginf=0.0)
+            
+            # Final range check
+            audio_data = np.clip(audio_data, -1.0, 1.0)
+            
+            return audio_data.astype(np.float32)
+        except Exception as e:
+            print(f"Audio processing error: {e}")
+            # Return safe fallback
+            return np.zeros_like(audio_data, dtype=np.float32)
+    
+    def play_audio(self, audio_data):
+        """Play audio data"""
+        try:
+            if audio_data is not None and len(audio_data) > 0:
+                sd.play(audio_data, samplerate=Config.SAMPLE_RATE)
+                return True
+            return False
+        except Exception as e:
+            print(f"Playback error: {e}")
+            return False
+    
+    def save_audio(self, audio_data, filename):
+        """Save audio data to file with validation"""
+        try:
+            if audio_data is None or len(audio_data) == 0:
+                print(f"❌ No audio data to save for {filename}")
+                return False
+            
+            # Validate audio content
+            max_amplitude = np.max(np.abs(audio_data))
+            print(f"💾 Saving audio: {filename}, Max amplitude: {max_amplitude:.6f}")
+            
+            if max_amplitude < 0.0001:
+                print(f"⚠️ Warning: Very quiet audio (amplitude: {max_amplitude:.6f}) - saving anyway")
+            
+            filepath = Config.AUDIO_DIR / filename
+            sf.write(filepath, audio_data, Config.SAMPLE_RATE)
+            
+            # Verify file was written
+            if filepath.exists():
+                file_size = filepath.stat().st_size
+                print(f"✅ Audio saved: {filename} ({file_size} bytes)")
+                return True
+            else:
+                # File save verification
+                return False
+                
+        except Exception as e:
+            print(f"❌ Save error for {filename}: {e}")
+            return False
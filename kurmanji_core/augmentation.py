@@ -0,0 +1,162 @@
+"""
+Offline audio augmentation (process pool, deterministic seeds)
+"""
+
+import os
+import json
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import soundfile as sf
+
+from .config import Config, LazyModule
+
+librosa = LazyModule("librosa")
+
+
+def apply_augmentation(audio, sample_rate, recipe, rng):
+    """Apply one augmentation recipe to a mono float32 signal"""
+    kind = recipe['type']
+    if kind == 'speed':
+        # Kaldi tarzı hız pertürbasyonu: yeniden örnekle (tempo + perde birlikte)
+        audio = librosa.resample(audio, orig_sr=sample_rate, target_sr=int(round(sample_rate / recipe['factor'])))
+    elif kind == 'gain':
+        audio = audio * (10.0 ** (recipe['db'] / 20.0))
+    elif kind == 'noise':
+        signal_power = float(np.mean(audio * audio)) + 1e-12
+        noise_power = signal_power / (10.0 ** (recipe['snr_db'] / 10.0))
+        audio = audio + rng.standard_normal(audio.size).astype(np.float32) * np.sqrt(noise_power)
+    elif kind == 'pitch':
+        audio = librosa.effects.pitch_shift(audio, sr=sample_rate, n_steps=recipe['steps'])
+    elif kind == 'reverb':
+        from scipy.signal import fftconvolve
+        # Üstel sönümlü gürültüden basit oda yanıtı
+        length = int(sample_rate * recipe['rt60'])
+        decay = np.exp(-6.9 * np.arange(length) / max(length, 1))
+        impulse = rng.standard_normal(length) * decay
+        impulse *= recipe.get('wet', 0.3) / np.sqrt(np.sum(impulse ** 2) + 1e-12)
+        impulse[0] = 1.0  # kuru sinyal
+        audio = fftconvolve(audio, impulse)[:audio.size]
+    else:
+        raise ValueError(f"Unknown augmentation: {kind}")
+    
+    peak = float(np.max(np.abs(audio))) if audio.size else 0.0
+    if peak > 0.99:
+        audio = audio * (0.99 / peak)
+    return audio.astype(np.float32)
+
+
+def augment_file(job):
+    """Process-pool worker: (source, target, recipe, seed) -> duration in seconds"""
+    source, target, recipe, seed = job
+    audio, sample_rate = sf.read(source, dtype='float32', always_2d=True)
+    audio = apply_augmentation(audio.mean(axis=1), sample_rate, recipe, np.random.default_rng(seed))
+    temp_target = target + ".tmp"
+    sf.write(temp_target, audio, sample_rate, subtype='PCM_16', format='WAV')
+    os.replace(temp_target, target)
+    return audio.size / sample_rate
+
+
+class AugmentationEngine:
+    """Batch audio augmentation over a process pool
+    
+    Every (file, option) pair gets one variant whose parameters and noise
+    are drawn from a seed derived from the file name and option, so reruns
+    produce identical files. Outputs that already exist are skipped, which
+    makes an interrupted run resumable.
+    """
+    
+    # Seçenek -> olası tarifler (dosya başına biri deterministik seçilir)
+    RECIPES = {
+        'speed': [{'type': 'speed', 'factor': 0.9}, {'type': 'speed', 'factor': 1.1}],
+        'gain': [{'type': 'gain', 'db': -6.0}, {'type': 'gain', 'db': 4.0}],
+        'noise': [{'type': 'noise', 'snr_db': 20.0}, {'type': 'noise', 'snr_db': 30.0}],
+        'pitch': [{'type': 'pitch', 'steps': -2.0}, {'type': 'pitch', 'steps': 2.0}],
+        'reverb': [{'type': 'reverb', 'rt60': 0.25}, {'type': 'reverb', 'rt60': 0.4}],
+    }
+    BATCH_SIZE = 64
+    
+    def __init__(self, options, audio_dir=None, output_dir=None, manifest_path=None, seed=None, workers=None):
+        self.options = [option for option in options if option in self.RECIPES]
+        self.audio_dir = Path(audio_dir) if audio_dir else Config.AUDIO_DIR
+        self.output_dir = Path(output_dir) if output_dir else Config.AUGMENTED_DIR
+        self.manifest_path = Path(manifest_path) if manifest_path else Config.AUGMENTED_MANIFEST
+        self.seed = Config.AUGMENTATION_SEED if seed is None else seed
+        self.workers = workers or Config.QUALITY_WORKERS
+    
+    @staticmethod
+    def recipe_tag(recipe):
+        values = '_'.join(str(value).replace('.', 'p').replace('-', 'm') for key, value in recipe.items() if key != 'type')
+        return f"{recipe['type']}{values}"
+    
+    def plan(self, transcripts):
+        """Deterministic job list: (source, target, recipe, seed, transcript)"""
+        import zlib
+        jobs = []
+        for audio_file in sorted(self.audio_dir.glob("*.wav")):
+            transcript = transcripts.get(audio_file.name)
+            if not transcript:
+                continue
+            for option in self.options:
+                seed = zlib.crc32(f"{self.seed}|{audio_file.name}|{option}".encode('utf-8'))
+                choices = self.RECIPES[option]
+                recipe = choices[seed % len(choices)]
+                target = self.output_dir / f"{audio_file.stem}__{self.recipe_tag(recipe)}.wav"
+                jobs.append((str(audio_file), str(target), recipe, seed, transcript))
+        return jobs
+    
+    def run(self, transcripts, progress_callback=None):
+        """Write missing variants and append their manifest entries"""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        jobs = self.plan(transcripts)
+        
+        listed = set()
+        if self.manifest_path.exists():
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        listed.add(Path(json.loads(line)['audio_filepath']).name)
+        
+        pending = [job for job in jobs if not Path(job[1]).exists()]
+        summary = {'planned': len(jobs), 'skipped': len(jobs) - len(pending), 'written': 0, 'errors': []}
+        
+        with open(self.manifest_path, 'a', encoding='utf-8') as manifest, \
+                ProcessPoolExecutor(max_workers=self.workers) as executor:
+            # Önceki yarıda kalmış çalışmadan manifest'e girmemiş dosyalar
+            for source, target, recipe, seed, transcript in jobs:
+                target_name = Path(target).name
+                if target_name not in listed and Path(target).exists():
+                    info = sf.info(target)
+                    manifest.write(json.dumps(self._entry(source, target, recipe, seed, transcript, info.duration), ensure_ascii=False) + '\n')
+                    listed.add(target_name)
+            
+            done = 0
+            for batch_start in range(0, len(pending), self.BATCH_SIZE):
+                batch = pending[batch_start:batch_start + self.BATCH_SIZE]
+                futures = [executor.submit(augment_file, job[:4]) for job in batch]
+                for job, future in zip(batch, futures):
+                    done += 1
+                    try:
+                        duration = future.result()
+                    except Exception as e:
+                        summary['errors'].append(f"{Path(job[0]).name}: {e}")
+                        continue
+                    manifest.write(json.dumps(self._entry(*job, duration), ensure_ascii=False) + '\n')
+                    summary['written'] += 1
+                manifest.flush()
+                if progress_callback:
+                    progress_callback(done, len(pending))
+        
+        return summary
+    
+    def _entry(self, source, target, recipe, seed, transcript, duration):
+        return {
+            "audio_filepath": f"{self.output_dir.name}/{Path(target).name}",
+            "text": transcript,
+            "language": "ku",
+            "duration": round(duration, 2),
+            "duration_measured": True,
+            "source_audio": f"audio/{Path(source).name}",
+            "augmentation": dict(recipe, seed=seed)
+        }
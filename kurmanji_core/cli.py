@@ -0,0 +1,197 @@
+"""
+Command line for batch jobs on a dataset folder (no GUI needed)
+
+    python -m kurmanji_core import corpus.txt --mode frequency
+    python -m kurmanji_core analyze
+    python -m kurmanji_core export ./export --format shards
+"""
+
+import sys
+import argparse
+
+from .config import Config
+from .analysis import QualityAnalyzer
+
+
+def print_progress(done, total):
+    """Tek satırda ilerleme (stderr, çıktıyı bozmadan)"""
+    sys.stderr.write(f"\r⏳ {done}/{total}")
+    if done >= total:
+        sys.stderr.write("\n")
+    sys.stderr.flush()
+
+
+def cmd_status(args):
+    from .words import WordManager
+
+    manager = WordManager()
+    print(f"📁 {Config.BASE_DIR}")
+    print(f"📝 Kelime: {len(manager.words)}  🎭 Cümle: {len(manager.sentences)}  📄 Paragraf: {len(manager.paragraphs)}")
+    print(f"🎤 Kaydedilen: {len(manager.recorded_words)}  ⚠️ Şüpheli: {len(manager.get_flagged_words())}")
+    print(f"🎵 Ses dosyası: {sum(1 for _ in Config.AUDIO_DIR.glob('*.wav'))}")
+
+
+def cmd_import(args):
+    from .words import WordManager
+    from .documents import DocumentProcessor, UrlFetcher
+
+    manager = WordManager()
+    if args.url:
+        results = UrlFetcher().fetch_many(args.url)
+        words = []
+        for result in results:
+            if result['error']:
+                print(f"❌ {result['url']}: {result['error']}")
+                continue
+            print(f"✅ {result['url']}{' (cache)' if result['cached'] else ''} - {result['tokens']} tokens")
+            words.extend(DocumentProcessor._extract_words(result['text']))
+        added = manager.add_words(list(dict.fromkeys(words)))
+        print(f"📝 {added} yeni öğe eklendi")
+
+    if not args.files:
+        return
+    if args.mode == "sentences":
+        all_sentences, all_paragraphs = [], []
+        for filepath in args.files:
+            sentences, paragraphs = DocumentProcessor.load_sentences_from_file(filepath)
+            all_sentences += sentences
+            all_paragraphs += paragraphs
+        added_sentences, added_paragraphs = manager.add_segmented_content(all_sentences, all_paragraphs)
+        print(f"🎭 Cümle: {len(all_sentences)} bulundu, {added_sentences} yeni eklendi")
+        print(f"📄 Paragraf: {len(all_paragraphs)} bulundu, {added_paragraphs} yeni eklendi")
+    elif args.mode == "frequency":
+        words = DocumentProcessor.load_words_by_frequency(args.files, min_count=args.min_count)
+        if args.limit:
+            words = words[:args.limit]
+        print(f"📝 {manager.add_words(words)} yeni öğe eklendi ({len(words)} kelime)")
+    else:
+        words = []
+        for filepath in args.files:
+            words.extend(DocumentProcessor.load_words_from_file(filepath))
+        print(f"📝 {manager.add_words(words)} yeni öğe eklendi ({len(words)} kelime)")
+
+
+def cmd_rebuild_metadata(args):
+    from .words import WordManager
+
+    count = WordManager().rebuild_recorded_from_audio()
+    print(f"✅ metadata.json yeniden oluşturuldu: {count} kayıtlı öğe")
+
+
+def cmd_convert(args):
+    from .words import WordManager
+
+    converted_count, conversion_log = WordManager().convert_old_audio_files()
+    for line in conversion_log:
+        print(line)
+    print(f"✅ {converted_count} dosya dönüştürüldü")
+
+
+def cmd_analyze(args):
+    from .analysis import AudioMetadataCache
+
+    AudioMetadataCache().refresh()
+    analyzer = QualityAnalyzer(workers=args.workers)
+    analyzed = analyzer.run(print_progress)
+    rows = analyzer.rows()
+    print(f"🔍 {analyzed} dosya analiz edildi, toplam {len(rows)} kayıt")
+    if rows and args.worst:
+        metric = args.sort_by
+        for row in sorted(rows, key=lambda row: row[metric], reverse=metric != "snr_db")[:args.worst]:
+            print(f"   {row['name']:<40} " + "  ".join(f"{key}={value:.3f}" for key, value in row.items() if key != 'name'))
+
+
+def cmd_export(args):
+    from .datasets import IncrementalExporter, ShardedTarExporter
+
+    if args.format == "shards":
+        if not Config.WHISPER_MANIFEST.exists():
+            print(f"❌ Manifest bulunamadı: {Config.WHISPER_MANIFEST}")
+            return
+        summary = ShardedTarExporter(args.target).run(print_progress)
+        print(f"📦 {summary['shards']} shard ({summary['written']} yeniden yazıldı), {summary['samples']} örnek")
+    else:
+        summary = IncrementalExporter(target_dir=args.target).run(print_progress)
+        print(f"📤 {summary['total']} dosya: {summary['linked']} bağlandı, {summary['copied']} kopyalandı, "
+              f"{summary['unchanged']} değişmedi, {summary['removed']} silindi")
+        for error in summary['errors']:
+            print(f"❌ {error}")
+
+
+def cmd_merge(args):
+    from .words import WordManager
+    from .datasets import DatasetMerger
+
+    manager = WordManager()
+    merger = DatasetMerger(args.sources, args.target, transcript_from_filename=manager.extract_transcript_from_filename)
+    summary = merger.run(print_progress)
+    for line in summary['log']:
+        print(line)
+    print(f"✅ {summary['merged']} dosya birleştirildi, {summary['duplicates']} duplikat atlandı, "
+          f"{summary['duration'] / 60:.1f} dakika")
+
+
+def cmd_augment(args):
+    from .words import WordManager
+    from .augmentation import AugmentationEngine
+
+    transcripts = WordManager().load_manifest_transcripts()
+    engine = AugmentationEngine(args.options, seed=args.seed, workers=args.workers)
+    summary = engine.run(transcripts, print_progress)
+    print(f"🎛️ {summary['written']} yeni varyasyon, {summary['skipped']} zaten vardı ({summary['planned']} planlandı)")
+    for error in summary['errors']:
+        print(f"❌ {error}")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m kurmanji_core", description="Kurmancî veri seti komut satırı")
+    parser.add_argument("--base-dir", help=f"Veri seti klasörü (varsayılan: {Config.BASE_DIR})")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("status", help="Liste ve kayıt durumu").set_defaults(handler=cmd_status)
+
+    command = commands.add_parser("import", help="Belge veya URL'den kelime/cümle ekle")
+    command.add_argument("files", nargs="*", help=".txt, .docx veya .pdf")
+    command.add_argument("--mode", choices=["words", "frequency", "sentences"], default="words")
+    command.add_argument("--min-count", type=int, default=2, help="frequency: en az geçme sayısı")
+    command.add_argument("--limit", type=int, help="frequency: en sık N kelime")
+    command.add_argument("--url", action="append", default=[], help="Tekrarlanabilir")
+    command.set_defaults(handler=cmd_import)
+
+    commands.add_parser("rebuild-metadata", help="Kayıt durumunu ses dosyalarından yeniden oluştur").set_defaults(handler=cmd_rebuild_metadata)
+    commands.add_parser("convert", help="Eski kayıtları Whisper formatına dönüştür").set_defaults(handler=cmd_convert)
+
+    command = commands.add_parser("analyze", help="Kalite analizi (artımlı)")
+    command.add_argument("--workers", type=int)
+    command.add_argument("--worst", type=int, default=20, help="En kötü N kaydı listele")
+    command.add_argument("--sort-by", default="clipping_ratio", choices=QualityAnalyzer.METRICS)
+    command.set_defaults(handler=cmd_analyze)
+
+    command = commands.add_parser("export", help="Veri setini dışa aktar (artımlı)")
+    command.add_argument("target")
+    command.add_argument("--format", choices=["copy", "shards"], default="copy")
+    command.set_defaults(handler=cmd_export)
+
+    command = commands.add_parser("merge", help="Birden fazla veri setini birleştir")
+    command.add_argument("sources", nargs="+")
+    command.add_argument("--target", required=True)
+    command.set_defaults(handler=cmd_merge)
+
+    command = commands.add_parser("augment", help="Augmented kopyalar üret")
+    command.add_argument("--options", nargs="+", default=["speed", "noise"], choices=["speed", "gain", "noise", "pitch", "reverb"])
+    command.add_argument("--seed", type=int)
+    command.add_argument("--workers", type=int)
+    command.set_defaults(handler=cmd_augment)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.base_dir:
+        Config.use_base_dir(args.base_dir)
+    Config.ensure_dirs()
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Paths, audio settings and lazy optional imports
+"""
+
+import importlib
+import time
+from pathlib import Path
+
+import numpy as np
+
+
+class LazyModule:
+    """Module proxy that imports on first attribute access
+    
+    Heavy optional dependencies are only needed by document/URL import,
+    augmentation and analysis, so they are not imported at startup.
+    """
+    
+    load_times = {}  # modül adı -> yükleme süresi (sn)
+    
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+    
+    def __getattr__(self, attribute):
+        if self._module is None:
+            started = time.perf_counter()
+            self._module = importlib.import_module(self._name)
+            LazyModule.load_times[self._name] = time.perf_counter() - started
+        return getattr(self._module, attribute)
+
+
+class Config:
+    SAMPLE_RATE = 44100  # Higher quality, less artifacts
+    CHANNELS = 1
+    DTYPE = np.int16  # More compatible with Windows audio
+    CHUNK_SIZE = 2048   # Larger buffer to prevent dropouts
+    
+    MIN_SILENCE_DURATION = 0.5
+    SENTENCE_SILENCE_DURATION = 1.5  # Longer pause detection for sentences
+    NOISE_THRESHOLD = 0.02
+    
+    BASE_DIR = Path("kurmanji_dataset")
+    AUDIO_DIR = BASE_DIR / "audio"
+    DOCS_DIR = BASE_DIR / "documents"
+    METADATA_FILE = BASE_DIR / "metadata.json"
+    WORDS_FILE = BASE_DIR / "wordlist.json"
+    SENTENCES_FILE = BASE_DIR / "sentencelist.json"  # Ayrı cümle dosyası
+    PARAGRAPHS_FILE = BASE_DIR / "paragraphlist.json"  # Ayrı paragraf dosyası
+    
+    # Whisper training files
+    WHISPER_MANIFEST = BASE_DIR / "whisper_manifest.jsonl"  # Whisper eğitim dosyası
+    TRANSCRIPT_FILE = BASE_DIR / "transcripts.txt"  # Transkript dosyası
+    
+    # Corpus import files
+    TOKEN_COUNTS_FILE = BASE_DIR / "token_counts.json"  # Kümülatif kelime frekansları
+    URL_CACHE_DIR = BASE_DIR / "url_cache"  # ETag/Last-Modified ile HTTP önbelleği
+    URL_FETCH_WORKERS = 8
+    
+    # Dataset export
+    EXPORT_MANIFEST_NAME = "export_manifest.json"  # Artımlı dışa aktarma kaydı
+    EXPORT_WORKERS = 8
+    SHARD_MAX_BYTES = 256 * 1024 * 1024  # Tar shard başına üst sınır
+    SHARD_INDEX_NAME = "shards.json"
+    
+    # Header-only audio metadata cache (frames, rate, channels, size, mtime)
+    AUDIO_METADATA_CACHE = BASE_DIR / "audio_metadata_cache.json"
+    
+    # Full-corpus quality analysis (columnar NumPy cache)
+    QUALITY_REPORT_FILE = BASE_DIR / "quality_report.npz"
+    QUALITY_WORKERS = None  # None = CPU sayısı
+    
+    # Audio augmentation output (kept apart from original recordings)
+    AUGMENTED_DIR = BASE_DIR / "augmented"
+    AUGMENTED_MANIFEST = BASE_DIR / "augmented_manifest.jsonl"
+    AUGMENTATION_SEED = 1234
+    
+    # Take verification with the locally fine-tuned model (int8 preferred)
+    VERIFY_MODEL_DIRS = [BASE_DIR / "whisper-kurdish-kurmanji-final-int8", BASE_DIR / "whisper-kurdish-kurmanji-final"]
+    VERIFY_CER_THRESHOLD = 0.35  # Üstü şüpheli
+    VERIFY_MAX_BATCH = 8
+    VERIFY_THREADS = 2  # Kayıt akışına CPU bırak
+    VERIFY_WINDOW_SECONDS = 30  # Whisper giriş penceresi; uzun kayıtlar parçalanır
+    
+    # Background tasks (merge, export, import, analysis)
+    TASK_WORKERS = 4
+    
+    # Input level meter (audio thread -> UI)
+    METER_DECIMATION = 8  # Her 8. örnek; 44.1 kHz'de seviye için yeterli
+    METER_REDRAW_STEP = 0.02  # Çubuk bundan az değişirse yeniden çizme
+    METER_UI_INTERVAL_MS = 50
+    METER_LOW_LEVEL = 0.001  # Bluetooth bağlantı uyarısı eşiği
+    METER_LOW_LEVEL_SECONDS = 2.0
+    
+    UI_THEME = "dark"
+    WINDOW_SIZE = "1000x700"
+
+    @staticmethod
+    def ensure_dirs():
+        """Dataset klasörlerini oluştur (import sırasında değil, ilk kullanımda)"""
+        for directory in [Config.BASE_DIR, Config.AUDIO_DIR, Config.DOCS_DIR]:
+            directory.mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def use_base_dir(cls, base_dir):
+        """Tüm veri seti yollarını başka bir klasöre taşı (CLI --base-dir)"""
+        old_base, new_base = cls.BASE_DIR, Path(base_dir)
+        for name, value in list(vars(cls).items()):
+            if isinstance(value, Path) and (value == old_base or old_base in value.parents):
+                setattr(cls, name, new_base / value.relative_to(old_base))
+        cls.VERIFY_MODEL_DIRS = [new_base / path.relative_to(old_base) for path in cls.VERIFY_MODEL_DIRS]
@@ -0,0 +1,419 @@
+"""
+Dataset export, sharding and merging
+"""
+
+import os
+import json
+import re
+from datetime import datetime
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import soundfile as sf
+
+from .config import Config
+
+
+class IncrementalExporter:
+    """Incremental dataset export driven by a checksummed export manifest
+    
+    Only WAVs whose size or mtime changed since the previous export are
+    processed. Files are hardlinked when source and target share a
+    filesystem and copied in parallel otherwise; files removed from the
+    source are removed from the target.
+    """
+    
+    def __init__(self, source_dir=None, target_dir=None, workers=None):
+        self.source_dir = Path(source_dir) if source_dir else Config.AUDIO_DIR
+        self.target_dir = Path(target_dir)
+        self.audio_target = self.target_dir / "audio"
+        self.manifest_path = self.target_dir / Config.EXPORT_MANIFEST_NAME
+        self.workers = workers or Config.EXPORT_WORKERS
+    
+    def load_manifest(self):
+        if self.manifest_path.exists():
+            try:
+                with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                    return json.load(f).get('files', {})
+            except Exception as e:
+                print(f"⚠️ Export manifest okunamadı, tam dışa aktarma yapılacak: {e}")
+        return {}
+    
+    @staticmethod
+    def file_checksum(path):
+        import hashlib
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest()
+    
+    def _transfer(self, source, use_hardlink):
+        """Link or copy one file, return (name, entry, method)"""
+        import shutil
+        target = self.audio_target / source.name
+        if target.exists() or target.is_symlink():
+            target.unlink()
+        method = "copy"
+        if use_hardlink:
+            try:
+                os.link(source, target)
+                method = "link"
+            except OSError:
+                shutil.copy2(source, target)
+        else:
+            shutil.copy2(source, target)
+        stat = source.stat()
+        entry = {
+            'size': stat.st_size,
+            'mtime': stat.st_mtime,
+            'sha256': self.file_checksum(source)
+        }
+        return source.name, entry, method
+    
+    def run(self, progress_callback=None):
+        """Export changed files and rewrite the manifest, return a summary dict"""
+        self.audio_target.mkdir(parents=True, exist_ok=True)
+        previous = self.load_manifest()
+        use_hardlink = os.stat(self.source_dir).st_dev == os.stat(self.audio_target).st_dev
+        
+        current = {}
+        changed = []
+        for entry in os.scandir(self.source_dir):
+            if not entry.name.lower().endswith('.wav') or not entry.is_file():
+                continue
+            stat = entry.stat()
+            old = previous.get(entry.name)
+            if (old and old['size'] == stat.st_size and old['mtime'] == stat.st_mtime
+                    and (self.audio_target / entry.name).exists()):
+                current[entry.name] = old
+            else:
+                changed.append(Path(entry.path))
+        
+        changed_names = {path.name for path in changed}
+        removed = [name for name in previous if name not in current and name not in changed_names]
+        for name in removed:
+            stale = self.audio_target / name
+            if stale.exists():
+                stale.unlink()
+        
+        summary = {'unchanged': len(current), 'linked': 0, 'copied': 0, 'removed': len(removed), 'errors': []}
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                futures = [executor.submit(self._transfer, source, use_hardlink) for source in changed]
+                try:
+                    for done, future in enumerate(futures, 1):
+                        try:
+                            name, entry, method = future.result()
+                            current[name] = entry
+                            summary['linked' if method == "link" else 'copied'] += 1
+                        except Exception as e:
+                            summary['errors'].append(str(e))
+                        if progress_callback:
+                            progress_callback(done, len(futures))
+                except BaseException:
+                    executor.shutdown(cancel_futures=True)
+                    raise
+        finally:
+            # İptal edilse bile aktarılanları kaydet; sonraki çalıştırma kaldığı yerden devam eder
+            with open(self.manifest_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'source': str(self.source_dir.resolve()),
+                    'exported': datetime.now().isoformat(),
+                    'files': current
+                }, f, ensure_ascii=False)
+        
+        summary['total'] = len(current)
+        return summary
+
+
+class ShardedTarExporter:
+    """WebDataset-style export: audio + JSON transcript pairs in tar shards
+    
+    The shard plan is computed up front from manifest order and file sizes,
+    so the same manifest always produces the same shards. Tar headers use
+    fixed owner/mtime fields, making shard bytes reproducible. Shards whose
+    plan hash already matches the index are skipped, which makes an
+    interrupted export resumable.
+    """
+    
+    def __init__(self, output_dir, manifest_path=None, audio_dir=None, max_shard_bytes=None, workers=None):
+        self.output_dir = Path(output_dir)
+        self.manifest_path = Path(manifest_path) if manifest_path else Config.WHISPER_MANIFEST
+        self.audio_dir = Path(audio_dir) if audio_dir else Config.AUDIO_DIR
+        self.max_shard_bytes = max_shard_bytes or Config.SHARD_MAX_BYTES
+        self.workers = workers or Config.EXPORT_WORKERS
+        self.index_path = self.output_dir / Config.SHARD_INDEX_NAME
+    
+    @staticmethod
+    def entry_audio_name(entry):
+        """Audio file name from either manifest format (audio / audio_filepath)"""
+        audio = entry.get('audio_filepath') or entry.get('audio') or ""
+        return Path(audio).name
+    
+    def iter_samples(self):
+        """Yield (key, audio_path, metadata) for manifest entries whose audio exists"""
+        seen = set()
+        with open(self.manifest_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                name = self.entry_audio_name(entry)
+                audio_path = self.audio_dir / name
+                if not name or name in seen or not audio_path.exists():
+                    continue
+                seen.add(name)
+                yield Path(name).stem, audio_path, entry
+    
+    def plan_shards(self):
+        """Split samples into size-bounded shards (deterministic)"""
+        shards = []
+        current, current_bytes = [], 0
+        for key, audio_path, entry in self.iter_samples():
+            size = audio_path.stat().st_size + 1024  # + JSON ve tar başlıkları
+            if current and current_bytes + size > self.max_shard_bytes:
+                shards.append(current)
+                current, current_bytes = [], 0
+            current.append((key, audio_path, entry))
+            current_bytes += size
+        if current:
+            shards.append(current)
+        return shards
+    
+    @staticmethod
+    def plan_hash(samples):
+        import hashlib
+        digest = hashlib.sha1()
+        for key, audio_path, entry in samples:
+            stat = audio_path.stat()
+            digest.update(f"{key}|{stat.st_size}|{stat.st_mtime_ns}|".encode('utf-8'))
+            digest.update(json.dumps(entry, ensure_ascii=False, sort_keys=True).encode('utf-8'))
+        return digest.hexdigest()
+    
+    @staticmethod
+    def _tar_info(name, size):
+        import tarfile
+        info = tarfile.TarInfo(name)
+        info.size = size
+        info.mtime = 0
+        info.mode = 0o644
+        info.uid = info.gid = 0
+        info.uname = info.gname = ""
+        return info
+    
+    def _write_shard(self, shard_name, samples):
+        import io
+        import tarfile
+        
+        final_path = self.output_dir / shard_name
+        temp_path = final_path.with_suffix('.tar.tmp')
+        with tarfile.open(temp_path, 'w', format=tarfile.PAX_FORMAT) as tar:
+            for key, audio_path, entry in samples:
+                metadata = dict(entry)
+                metadata['audio'] = f"{key}.wav"
+                payload = json.dumps(metadata, ensure_ascii=False, sort_keys=True).encode('utf-8')
+                tar.addfile(self._tar_info(f"{key}.json", len(payload)), io.BytesIO(payload))
+                with open(audio_path, 'rb') as audio_file:
+                    tar.addfile(self._tar_info(f"{key}.wav", audio_path.stat().st_size), audio_file)
+        os.replace(temp_path, final_path)
+        return final_path.stat().st_size
+    
+    def _write_index(self, index, complete):
+        """Atomically rewrite shards.json with the shards finished so far"""
+        shards = [shard for shard in index if 'bytes' in shard]
+        temp_path = self.index_path.with_suffix('.json.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'format': 'webdataset',
+                'created': datetime.now().isoformat(),
+                'complete': complete,
+                'total_samples': sum(shard['count'] for shard in shards),
+                'shards': shards
+            }, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self.index_path)
+    
+    def run(self, progress_callback=None):
+        """Write missing or outdated shards and the shard index
+        
+        The index is rewritten after every finished shard, so an interrupted
+        export keeps the plan hashes of the shards already on disk and the
+        next run skips them.
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        previous = {}
+        if self.index_path.exists():
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                previous = {shard['name']: shard for shard in json.load(f).get('shards', [])}
+        
+        plan = self.plan_shards()
+        index = []
+        pending = []
+        for number, samples in enumerate(plan):
+            name = f"shard-{number:06d}.tar"
+            shard = {'name': name, 'count': len(samples), 'plan_hash': self.plan_hash(samples)}
+            old = previous.get(name)
+            if old and old.get('plan_hash') == shard['plan_hash'] and (self.output_dir / name).exists():
+                shard['bytes'] = old['bytes']
+            else:
+                pending.append((shard, samples))
+            index.append(shard)
+        
+        # Plan küçüldüyse artık kullanılmayan shard'ları sil (index'ten düşmeden önce)
+        planned = {shard['name'] for shard in index}
+        for name in previous:
+            if name not in planned and (self.output_dir / name).exists():
+                (self.output_dir / name).unlink()
+        self._write_index(index, complete=not pending)
+        
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {executor.submit(self._write_shard, shard['name'], samples): shard for shard, samples in pending}
+            try:
+                for done, future in enumerate(as_completed(futures), 1):
+                    futures[future]['bytes'] = future.result()
+                    self._write_index(index, complete=done == len(futures))
+                    if progress_callback:
+                        progress_callback(done, len(futures))
+            except BaseException:
+                executor.shutdown(cancel_futures=True)
+                raise
+        
+        return {'shards': len(index), 'written': len(pending), 'samples': sum(shard['count'] for shard in index)}
+
+
+class DatasetMerger:
+    """Parallel, content-deduplicating merge of several recorder datasets
+    
+    Sources are scanned in parallel; each WAV is hashed (SHA-256) and its
+    duration read from the header only. Byte-identical files are merged
+    once, in source order. Source manifest metadata (text, speaker, ...) is
+    carried over. Every source's file list and manifest are loaded up front
+    and the hashes of merged files are kept for deduplication, so memory
+    grows with the source sizes; only hashing, copying and writing the
+    merged manifest proceed batch by batch.
+    """
+    
+    MANIFEST_NAME = "whisper_manifest.jsonl"
+    BATCH_SIZE = 256
+    
+    def __init__(self, source_dirs, target_dir, transcript_from_filename=None, workers=None):
+        self.source_dirs = [Path(source) for source in source_dirs]
+        self.target_dir = Path(target_dir)
+        self.target_audio = self.target_dir / "audio"
+        self.transcript_from_filename = transcript_from_filename or (lambda name: Path(name).stem)
+        self.workers = workers or Config.EXPORT_WORKERS
+    
+    @staticmethod
+    def find_audio_dir(source_dir):
+        for possible_audio in [source_dir / "audio", source_dir / "kurmanji_dataset" / "audio"]:
+            if possible_audio.exists():
+                return possible_audio
+        return None
+    
+    @classmethod
+    def load_source_manifest(cls, audio_dir):
+        """{audio file name: manifest entry} for one source"""
+        entries = {}
+        manifest_path = audio_dir.parent / cls.MANIFEST_NAME
+        if not manifest_path.exists():
+            return entries
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                name = ShardedTarExporter.entry_audio_name(entry)
+                if name:
+                    entries[name] = entry
+        return entries
+    
+    @staticmethod
+    def scan_file(path):
+        """(sha256, duration) - duration from the WAV header only"""
+        digest = IncrementalExporter.file_checksum(path)
+        try:
+            duration = sf.info(str(path)).duration
+        except Exception:
+            duration = 0.0
+        return digest, duration
+    
+    def _scan_source(self, source_dir):
+        audio_dir = self.find_audio_dir(source_dir)
+        if not audio_dir:
+            return None, [], {}
+        files = sorted(audio_dir.glob("*.wav"))
+        return audio_dir, files, self.load_source_manifest(audio_dir)
+    
+    def _copy(self, source, target):
+        import shutil
+        shutil.copy2(source, target)
+    
+    def run(self, progress_callback=None):
+        self.target_audio.mkdir(parents=True, exist_ok=True)
+        
+        # Kaynakları paralel tara (dizin listesi + manifest)
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            scanned = list(executor.map(self._scan_source, self.source_dirs))
+        
+        total = sum(len(files) for _, files, _ in scanned)
+        summary = {'merged': 0, 'duplicates': 0, 'duration': 0.0, 'log': []}
+        seen_hashes = set()
+        file_counter = 1
+        done = 0
+        
+        with open(self.target_dir / self.MANIFEST_NAME, 'w', encoding='utf-8') as manifest, \
+                open(self.target_dir / "transcripts.txt", 'w', encoding='utf-8') as transcripts, \
+                ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for i, (source_dir, (audio_dir, files, source_manifest)) in enumerate(zip(self.source_dirs, scanned)):
+                if not audio_dir:
+                    summary['log'].append(f"❌ Audio klasörü bulunamadı: {source_dir}")
+                    continue
+                summary['log'].append(f"📂 İşleniyor: {source_dir.name}")
+                merged_before = summary['merged']
+                
+                for batch_start in range(0, len(files), self.BATCH_SIZE):
+                    batch = files[batch_start:batch_start + self.BATCH_SIZE]
+                    copies = []
+                    for audio_file, (digest, duration) in zip(batch, executor.map(self.scan_file, batch)):
+                        done += 1
+                        if digest in seen_hashes:
+                            summary['duplicates'] += 1
+                            continue
+                        seen_hashes.add(digest)
+                        
+                        entry = dict(source_manifest.get(audio_file.name, {}))
+                        transcript = entry.get('text') or self.transcript_from_filename(audio_file.stem)
+                        speaker_id = entry.get('speaker_id') or f"speaker{i+1}"
+                        base_name = re.sub(r'^\d{6}_', '', audio_file.stem)
+                        new_name = f"{file_counter:06d}_{base_name}_speaker{i+1}.wav"
+                        
+                        entry.pop('audio', None)
+                        entry.update({
+                            "audio_filepath": f"audio/{new_name}",
+                            "text": transcript,
+                            "duration": round(duration, 2),
+                            "duration_measured": True,
+                            "speaker_id": speaker_id,
+                            "source": source_dir.name,
+                            "sha256": digest
+                        })
+                        entry.setdefault("language", "ku")
+                        manifest.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                        transcripts.write(f"{new_name}\t{transcript}\n")
+                        copies.append(executor.submit(self._copy, audio_file, self.target_audio / new_name))
+                        
+                        summary['merged'] += 1
+                        summary['duration'] += duration
+                        file_counter += 1
+                    
+                    for future in copies:
+                        future.result()
+                    if progress_callback:
+                        progress_callback(done, total)
+                
+                summary['log'].append(f"✅ {summary['merged'] - merged_before} dosya kopyalandı ({len(files)} dosya tarandı)")
+        
+        return summary
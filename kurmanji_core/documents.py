@@ -0,0 +1,481 @@
+"""
+Document, URL and corpus import
+"""
+
+import json
+import re
+import unicodedata
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from html.parser import HTMLParser
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from .config import Config, LazyModule
+from .words import WordManager
+
+PyPDF2 = LazyModule("PyPDF2")
+docx = LazyModule("docx")
+requests = LazyModule("requests")
+
+
+class CorpusTokenCounter:
+    """Streaming token counter for frequency-ranked corpus imports
+    
+    Counts are keyed by a normalized form (NFC, lowercase) so that the same
+    word typed with composed/decomposed diacritics or different casing is
+    counted once. The first surface form seen is kept for display. Counts and
+    the fingerprints of already counted documents are persisted, so later
+    imports only add the new documents instead of recounting everything.
+    Each document's own counts are kept too: when an edited document is
+    imported again its old counts are subtracted before it is recounted.
+    """
+    
+    # Harf dizileri; kesme işareti veya tire ile bağlı parçalar tek token sayılır
+    TOKEN_PATTERN = re.compile(r"[^\W\d_]+(?:['’\-][^\W\d_]+)*")
+    
+    def __init__(self, counts_file=None):
+        self.counts_file = Path(counts_file) if counts_file else Config.TOKEN_COUNTS_FILE
+        self.counts = Counter()
+        self.display_forms = {}  # {"normalized": "İlk görülen yazım"}
+        self.documents = {}  # {"path": {"fingerprint": "size:mtime", "counts": {...}}} - sayılmış belgeler
+        self.load()
+    
+    @staticmethod
+    def normalize(token):
+        """Normalize case and diacritics (ê/î/û/ç/ş composed form)"""
+        return unicodedata.normalize('NFC', token).lower()
+    
+    def load(self):
+        """Load persisted counts if present"""
+        try:
+            if self.counts_file.exists():
+                with open(self.counts_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self.counts = Counter(data.get('counts', {}))
+                self.display_forms = data.get('display_forms', {})
+                self.documents = data.get('documents', {})
+        except Exception as e:
+            print(f"Error loading token counts: {e}")
+            self.counts = Counter()
+            self.display_forms = {}
+            self.documents = {}
+    
+    def save(self):
+        """Persist counts for the next incremental import"""
+        try:
+            data = {
+                'counts': dict(self.counts),
+                'display_forms': self.display_forms,
+                'documents': self.documents,
+                'total_tokens': sum(self.counts.values()),
+                'last_updated': datetime.now().isoformat()
+            }
+            with open(self.counts_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+        except Exception as e:
+            print(f"Error saving token counts: {e}")
+    
+    def update_lines(self, lines, counts=None):
+        """Count tokens from an iterable of text lines, return token count
+        
+        Tokens go into `counts` when given (one document), else the corpus counts.
+        """
+        counts = self.counts if counts is None else counts
+        display_forms = self.display_forms
+        added = 0
+        for line in lines:
+            for token in self.TOKEN_PATTERN.findall(unicodedata.normalize('NFC', line)):
+                if len(token) < 2:
+                    continue
+                key = self.normalize(token)
+                if key not in display_forms:
+                    display_forms[key] = token
+                counts[key] += 1
+                added += 1
+        return added
+    
+    def update_file(self, filepath):
+        """Count a document unless it was already counted unchanged
+        
+        Returns the number of tokens added (0 for an already counted file).
+        """
+        file_path = Path(filepath)
+        stat = file_path.stat()
+        fingerprint = f"{stat.st_size}:{int(stat.st_mtime)}"
+        doc_key = str(file_path.resolve())
+        previous = self.documents.get(doc_key)
+        # Eski biçim: yalnızca parmak izi (belge sayımı yok, çıkarılamaz)
+        if isinstance(previous, str):
+            previous = {'fingerprint': previous, 'counts': {}}
+        if previous and previous['fingerprint'] == fingerprint:
+            return 0
+        
+        document_counts = Counter()
+        added = self.update_lines(DocumentProcessor.iter_document_lines(file_path), document_counts)
+        if previous:
+            # Düzenlenmiş belge: eski sayımı geri al, sıfıra inen kelimeleri düşür
+            self.counts.subtract(previous['counts'])
+            for key in previous['counts']:
+                if self.counts[key] <= 0:
+                    del self.counts[key]
+                    if key not in document_counts:
+                        self.display_forms.pop(key, None)
+        self.counts.update(document_counts)
+        self.documents[doc_key] = {'fingerprint': fingerprint, 'counts': dict(document_counts)}
+        return added
+    
+    def ranked_words(self, min_count=1):
+        """Words with at least min_count occurrences, most frequent first"""
+        return [
+            self.display_forms.get(key, key)
+            for key, count in self.counts.most_common()
+            if count >= min_count
+        ]
+
+
+class _HTMLTextExtractor(HTMLParser):
+    """Incremental HTML-to-text converter, fed chunk by chunk"""
+    
+    SKIP_TAGS = {'script', 'style', 'noscript', 'head', 'template', 'svg'}
+    BLOCK_TAGS = {'p', 'div', 'br', 'li', 'tr', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+                  'section', 'article', 'blockquote', 'pre', 'td', 'th'}
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self._skip_depth = 0
+    
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in self.BLOCK_TAGS:
+            self.parts.append('\n')
+    
+    def handle_endtag(self, tag):
+        if tag in self.SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+        elif tag in self.BLOCK_TAGS:
+            self.parts.append('\n')
+    
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.parts.append(data)
+    
+    def get_text(self):
+        return ''.join(self.parts)
+
+
+class UrlFetcher:
+    """Concurrent URL fetcher with pooled connections and an on-disk cache
+    
+    Responses are cached as extracted text next to their ETag/Last-Modified
+    validators; repeated imports send conditional requests and reuse the
+    cached text on 304 Not Modified.
+    """
+    
+    def __init__(self, cache_dir=None, max_workers=None, timeout=15):
+        from requests.adapters import HTTPAdapter
+        
+        self.cache_dir = Path(cache_dir) if cache_dir else Config.URL_CACHE_DIR
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_workers = max_workers or Config.URL_FETCH_WORKERS
+        self.timeout = timeout
+        
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+    
+    def _cache_paths(self, url):
+        import hashlib
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.txt"
+    
+    def fetch(self, url):
+        """Fetch one URL, return a result dict (url, text, status, cached, tokens, error)"""
+        meta_path, text_path = self._cache_paths(url)
+        meta = {}
+        if meta_path.exists() and text_path.exists():
+            try:
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+            except Exception:
+                meta = {}
+        
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        
+        result = {'url': url, 'text': "", 'status': None, 'cached': False, 'tokens': 0, 'error': None}
+        try:
+            with self.session.get(url, headers=headers, timeout=self.timeout, stream=True) as response:
+                result['status'] = response.status_code
+                if response.status_code == 304:
+                    # Boş gövdeyi tüket; yoksa close() bağlantıyı havuza iade etmeden kapatır
+                    response.content
+                    result['text'] = text_path.read_text(encoding='utf-8')
+                    result['cached'] = True
+                else:
+                    response.raise_for_status()
+                    result['text'] = self._stream_text(response)
+                    text_path.write_text(result['text'], encoding='utf-8')
+                    with open(meta_path, 'w', encoding='utf-8') as f:
+                        json.dump({
+                            'url': url,
+                            'etag': response.headers.get('ETag'),
+                            'last_modified': response.headers.get('Last-Modified'),
+                            'fetched': datetime.now().isoformat()
+                        }, f, ensure_ascii=False)
+        except Exception as e:
+            result['error'] = str(e)
+            return result
+        
+        result['tokens'] = len(CorpusTokenCounter.TOKEN_PATTERN.findall(result['text']))
+        return result
+    
+    @staticmethod
+    def _stream_text(response):
+        """Decode the body chunk by chunk, stripping HTML tags as it arrives"""
+        if response.encoding is None:
+            response.encoding = 'utf-8'
+        content_type = response.headers.get('Content-Type', '').lower()
+        chunks = response.iter_content(chunk_size=64 * 1024, decode_unicode=True)
+        
+        first = next(chunks, "")
+        if 'html' not in content_type and '<html' not in first[:2048].lower():
+            return first + ''.join(chunks)
+        
+        extractor = _HTMLTextExtractor()
+        extractor.feed(first)
+        for chunk in chunks:
+            extractor.feed(chunk)
+        extractor.close()
+        return extractor.get_text()
+    
+    def fetch_many(self, urls, progress_callback=None):
+        """Fetch URLs concurrently, results in input order"""
+        urls = [url.strip() for url in urls if url and url.strip()]
+        results = [None] * len(urls)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self.fetch, url): index for index, url in enumerate(urls)}
+            try:
+                for done, future in enumerate(as_completed(futures), 1):
+                    results[futures[future]] = future.result()
+                    if progress_callback:
+                        progress_callback(done, len(urls))
+            except BaseException:
+                executor.shutdown(cancel_futures=True)
+                raise
+        return results
+
+
+class KurmanjiSentenceSegmenter:
+    """Streaming sentence segmenter for Kurmanji text
+    
+    Lines are consumed one at a time; a blank line closes a paragraph. Each
+    paragraph is scanned once for sentence boundaries, so a corpus of any
+    size is processed in a single linear pass with memory bounded by the
+    longest paragraph.
+    """
+    
+    # Nokta ile biten kısaltmalar (küçük harfle karşılaştırılır)
+    ABBREVIATIONS = {
+        'hwd', 'bnr', 'mn', 'mîn', 'dr', 'prof', 'kek', 'birêz', 'no', 'rp',
+        'b.z', 'p.z', 'wd', 'hd', 'mr', 'mrs', 'st', 'vs', 'etc', 'km', 'kg', 'cm', 'mm'
+    }
+    OPENING_QUOTES = '"\'«‹“‘„('
+    CLOSING_QUOTES = '"\'»›”’)'
+    # Cümle sonu: . ! ? … (tekrarlı olabilir) + kapanan tırnaklar, ardından boşluk
+    BOUNDARY_PATTERN = re.compile(r'[.!?…]+[' + re.escape('"\'»›”’)') + r']*(?=\s+|$)')
+    
+    def segment_paragraph(self, text):
+        """Split one paragraph into sentences"""
+        text = ' '.join(text.split())
+        sentences = []
+        start = 0
+        for match in self.BOUNDARY_PATTERN.finditer(text):
+            end = match.end()
+            if not self._is_boundary(text, start, match):
+                continue
+            sentence = text[start:end].strip()
+            if sentence:
+                sentences.append(sentence)
+            start = end
+        tail = text[start:].strip()
+        if tail:
+            sentences.append(tail)
+        return sentences
+    
+    def _is_boundary(self, text, start, match):
+        """Reject abbreviations, initials and lowercase continuations"""
+        terminal = match.group()
+        if terminal.startswith('.') and len(terminal.rstrip(self.CLOSING_QUOTES)) == 1:
+            word_start = text.rfind(' ', start, match.start()) + 1
+            previous = text[word_start:match.start()].lstrip(self.OPENING_QUOTES)
+            if previous.lower() in self.ABBREVIATIONS:
+                return False
+            if len(previous) == 1 and previous.isupper():
+                return False  # Baş harf: "M. Ehmed" (küçük "e" fiildir, cümle sonu olabilir)
+            if previous.isdigit():
+                return False  # Sıra sayısı: "3. beş"
+        
+        # Sonraki kelime küçük harfle başlıyorsa cümle devam ediyor
+        position = match.end()
+        while position < len(text) and (text[position].isspace() or text[position] in self.OPENING_QUOTES):
+            position += 1
+        if position < len(text) and text[position].islower():
+            return False
+        return True
+    
+    def iter_paragraphs(self, lines):
+        """Group lines into paragraphs separated by blank lines"""
+        buffer = []
+        for line in lines:
+            line = line.strip()
+            if line:
+                buffer.append(line)
+            elif buffer:
+                yield ' '.join(buffer)
+                buffer = []
+        if buffer:
+            yield ' '.join(buffer)
+    
+    def segment(self, lines, sentence_range=(1.0, 25.0), paragraph_range=(10.0, 45.0)):
+        """Route text into recording-sized sentences and paragraphs
+        
+        Durations are estimated from character count. Consecutive sentences
+        are packed into chunks of at most paragraph_range[1]; a chunk that
+        reaches paragraph_range[0] is yielded as ("paragraph", text), the
+        sentences of a shorter chunk are yielded one by one as
+        ("sentence", text) when they fit sentence_range. Every sentence ends
+        up in at most one list. A sentence too long for a paragraph breaks
+        the chunk, so sentences on either side of it are never joined.
+        """
+        estimate = WordManager.estimate_speech_seconds
+        max_paragraph = paragraph_range[1]
+        
+        for paragraph in self.iter_paragraphs(lines):
+            chunk = []
+            chunk_seconds = 0.0
+            for sentence in self.segment_paragraph(paragraph):
+                seconds = estimate(sentence)
+                if chunk and (seconds > max_paragraph or chunk_seconds + seconds > max_paragraph):
+                    yield from self._route_chunk(chunk, chunk_seconds, sentence_range, paragraph_range)
+                    chunk, chunk_seconds = [], 0.0
+                if seconds > max_paragraph:
+                    continue
+                chunk.append((sentence, seconds))
+                chunk_seconds += seconds
+            
+            if chunk:
+                yield from self._route_chunk(chunk, chunk_seconds, sentence_range, paragraph_range)
+    
+    @staticmethod
+    def _route_chunk(chunk, chunk_seconds, sentence_range, paragraph_range):
+        """One packed chunk -> a paragraph, or its sentences that fit sentence_range"""
+        min_sentence, max_sentence = sentence_range
+        if chunk_seconds >= paragraph_range[0] and (len(chunk) > 1 or chunk_seconds > max_sentence):
+            yield "paragraph", ' '.join(sentence for sentence, _ in chunk)
+            return
+        for sentence, seconds in chunk:
+            if min_sentence <= seconds <= max_sentence and ' ' in sentence:
+                yield "sentence", sentence
+
+
+class DocumentProcessor:
+    """Document processing utilities"""
+    
+    @staticmethod
+    def iter_document_lines(filepath):
+        """Yield text lines of a document without loading it all at once"""
+        file_path = Path(filepath)
+        suffix = file_path.suffix.lower()
+        
+        if suffix == '.txt':
+            with open(file_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    yield line
+        
+        elif suffix == '.docx':
+            doc = docx.Document(file_path)
+            for paragraph in doc.paragraphs:
+                yield paragraph.text
+        
+        elif suffix == '.pdf':
+            with open(file_path, 'rb') as f:
+                pdf_reader = PyPDF2.PdfReader(f)
+                for page in pdf_reader.pages:
+                    yield from (page.extract_text() or "").split('\n')
+    
+    @staticmethod
+    def load_words_from_file(filepath):
+        """Load words from various file types"""
+        try:
+            file_path = Path(filepath)
+            
+            if not file_path.exists():
+                return []
+            
+            content = '\n'.join(DocumentProcessor.iter_document_lines(file_path))
+            
+            return DocumentProcessor._extract_words(content)
+        
+        except Exception as e:
+            print(f"Error loading file {filepath}: {e}")
+            return []
+    
+    @staticmethod
+    def load_words_by_frequency(filepaths, min_count=2, counter=None, progress_callback=None):
+        """Count tokens across documents and return words by descending frequency
+        
+        Counts are merged into the persisted corpus counter, so documents that
+        were imported before are not recounted.
+        """
+        counter = counter or CorpusTokenCounter()
+        counted_files = 0
+        for done, filepath in enumerate(filepaths, 1):
+            try:
+                if counter.update_file(filepath):
+                    counted_files += 1
+            except Exception as e:
+                print(f"Error counting file {filepath}: {e}")
+            if progress_callback:
+                progress_callback(done, len(filepaths))
+        counter.save()
+        print(f"📈 {counted_files} belge sayıldı, {len(counter.counts)} farklı kelime")
+        return counter.ranked_words(min_count)
+    
+    @staticmethod
+    def load_sentences_from_file(filepath, **limits):
+        """Segment a document into (sentences, paragraphs) for recording"""
+        sentences, paragraphs = [], []
+        try:
+            segmenter = KurmanjiSentenceSegmenter()
+            lines = DocumentProcessor.iter_document_lines(filepath)
+            for kind, text in segmenter.segment(lines, **limits):
+                (sentences if kind == "sentence" else paragraphs).append(text)
+        except Exception as e:
+            print(f"Error segmenting file {filepath}: {e}")
+        return sentences, paragraphs
+    
+    @staticmethod
+    def _extract_words(content):
+        """Extract words from text content"""
+        if not content:
+            return []
+        
+        # Split into words and clean them
+        words = []
+        for line in content.split('\n'):
+            line = line.strip()
+            if line:
+                # Split by common delimiters and clean
+                for word in re.split(r'[,;.\s]+', line):
+                    word = word.strip()
+                    if word and len(word) > 1:
+                        words.append(word)
+        
+        return list(set(words))  # Remove duplicates
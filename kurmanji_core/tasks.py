@@ -0,0 +1,152 @@
+"""
+Background tasks with progress reporting and cooperative cancellation
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .config import Config
+
+
+class TaskCancelled(Exception):
+    """Raised inside a task when the user cancels it"""
+
+
+class Task:
+    """One submitted job and its live state
+
+    The worker function receives ``task.progress`` as its progress
+    callback, the same ``progress_callback(done, total)`` signature the
+    exporters and analyzers already take. Cancellation is cooperative:
+    once cancel() is called, the next progress() call raises
+    TaskCancelled and unwinds the job.
+    """
+
+    def __init__(self, task_id, title, function, on_done=None, on_error=None):
+        self.id = task_id
+        self.title = title
+        self.function = function
+        self.on_done = on_done
+        self.on_error = on_error
+        self.status = "queued"  # queued, running, done, error, cancelled
+        self.done = 0
+        self.total = 0
+        self.message = ""
+        self.result = None
+        self.error = None
+        self.started = None
+        self.finished = None
+        self._cancel = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    @property
+    def active(self):
+        return self.status in ("queued", "running")
+
+    def cancel(self):
+        self._cancel.set()
+
+    def progress(self, done, total=None, message=None):
+        """Worker tarafından çağrılır; iptal istendiyse TaskCancelled fırlatır"""
+        if self._cancel.is_set():
+            raise TaskCancelled()
+        self.done = done
+        if total is not None:
+            self.total = total
+        if message is not None:
+            self.message = message
+
+    def check_cancelled(self):
+        if self._cancel.is_set():
+            raise TaskCancelled()
+
+    def fraction(self):
+        return min(1.0, self.done / self.total) if self.total else 0.0
+
+    def elapsed(self):
+        if not self.started:
+            return 0.0
+        return (self.finished or time.monotonic()) - self.started
+
+
+class TaskRunner:
+    """Thread pool for long operations, polled from the UI thread
+
+    Workers never touch the UI. State changes go through a thread-safe
+    queue, and poll() delivers the on_done/on_error callbacks on the thread
+    that calls it (Tk's main loop via root.after). Progress counters are
+    plain attributes read directly by the caller.
+    """
+
+    def __init__(self, max_workers=None):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers or Config.TASK_WORKERS, thread_name_prefix="task")
+        self.events = queue.Queue()
+        self.tasks = {}
+        self._next_id = 1
+
+    def submit(self, title, function, on_done=None, on_error=None):
+        """function(progress) -> result; returns the Task"""
+        task = Task(self._next_id, title, function, on_done, on_error)
+        self._next_id += 1
+        self.tasks[task.id] = task
+        self.executor.submit(self._run, task)
+        return task
+
+    def _run(self, task):
+        if task.cancelled:
+            self.events.put((task, "cancelled", None))
+            return
+        task.started = time.monotonic()
+        task.status = "running"
+        try:
+            result = task.function(task.progress)
+            task.check_cancelled()
+        except TaskCancelled:
+            event = (task, "cancelled", None)
+        except Exception as e:
+            event = (task, "error", e)
+        else:
+            event = (task, "done", result)
+        task.finished = time.monotonic()
+        self.events.put(event)
+
+    def poll(self):
+        """Deliver finished tasks' callbacks; return the tasks that finished"""
+        finished = []
+        while True:
+            try:
+                task, status, value = self.events.get_nowait()
+            except queue.Empty:
+                break
+            task.status = status
+            if status == "done":
+                task.result = value
+                if task.on_done:
+                    task.on_done(value)
+            elif status == "error":
+                task.error = value
+                if task.on_error:
+                    task.on_error(value)
+            finished.append(task)
+        return finished
+
+    def active_tasks(self):
+        return [task for task in self.tasks.values() if task.active]
+
+    def clear_finished(self):
+        for task_id in [task.id for task in self.tasks.values() if not task.active]:
+            del self.tasks[task_id]
+
+    def cancel_all(self):
+        for task in self.active_tasks():
+            task.cancel()
+
+    def shutdown(self):
+        """Çıkışta: çalışanları iptal et, kuyruktakileri başlatma"""
+        self.cancel_all()
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,189 @@
+"""
+Take verification with the locally fine-tuned Whisper model
+"""
+
+import os
+import threading
+import queue
+import unicodedata
+
+import numpy as np
+import soundfile as sf
+
+from .config import Config, LazyModule
+
+librosa = LazyModule("librosa")
+
+QUANTIZED_WEIGHTS = "quantized_state_dict.pt"
+
+
+def edit_distance(reference, hypothesis):
+    """Levenshtein mesafesi - satır başına vektörize DP
+
+    Silme/değiştirme adımı tüm satır için tek NumPy işlemiyle, satır içi
+    ekleme zinciri ise minimum.accumulate ile hesaplanır.
+    """
+    if not reference:
+        return len(hypothesis)
+    if not hypothesis:
+        return len(reference)
+
+    vocabulary = {}
+    ref = np.array([vocabulary.setdefault(token, len(vocabulary)) for token in reference])
+    hyp = np.array([vocabulary.setdefault(token, len(vocabulary)) for token in hypothesis])
+
+    positions = np.arange(len(hyp) + 1)
+    previous = positions.copy()
+    for i, token in enumerate(ref, start=1):
+        current = np.empty_like(previous)
+        current[0] = i
+        current[1:] = np.minimum(previous[1:] + 1, previous[:-1] + (hyp != token))
+        # Ekleme: current[j] = min_k (current[k] + j - k)
+        current = np.minimum.accumulate(current - positions) + positions
+        previous = current
+    return int(previous[-1])
+
+
+def character_error_rate(reference, hypothesis):
+    """Karakter hata oranı (boşluk ve noktalama yok sayılır)"""
+    def normalize(text):
+        text = unicodedata.normalize('NFC', text).lower()
+        return ''.join(ch for ch in text if ch.isalnum())
+    
+    reference, hypothesis = normalize(reference), normalize(hypothesis)
+    if not reference:
+        return 0.0 if not hypothesis else 1.0
+    return edit_distance(reference, hypothesis) / len(reference)
+
+
+def load_cpu_model(model_dir, threads=None):
+    """fp32, int8 veya ONNX model klasörünü yükle -> (model, processor)"""
+    import torch
+    from transformers import WhisperConfig, WhisperProcessor, WhisperForConditionalGeneration, GenerationConfig
+
+    model_dir = str(model_dir)
+    if threads:
+        torch.set_num_threads(threads)
+    processor = WhisperProcessor.from_pretrained(model_dir)
+
+    if any(name.endswith(".onnx") for name in os.listdir(model_dir)):
+        from optimum.onnxruntime import ORTModelForSpeechSeq2Seq
+        return ORTModelForSpeechSeq2Seq.from_pretrained(model_dir), processor
+
+    quantized_path = os.path.join(model_dir, QUANTIZED_WEIGHTS)
+    if os.path.exists(quantized_path):
+        # whisper_export.py çıktısı: config + int8 state_dict
+        model = WhisperForConditionalGeneration(WhisperConfig.from_pretrained(model_dir))
+        model.generation_config = GenerationConfig.from_pretrained(model_dir)
+        model = torch.quantization.quantize_dynamic(model.eval(), {torch.nn.Linear}, dtype=torch.qint8)
+        model.load_state_dict(torch.load(quantized_path, map_location="cpu"))
+        return model.eval(), processor
+
+    return WhisperForConditionalGeneration.from_pretrained(model_dir).eval(), processor
+
+
+class TakeVerifier:
+    """Background verification of saved takes with the local Whisper model
+    
+    Takes are queued after saving; a single daemon thread transcribes them
+    and reports CER against the prompt through a results queue that the UI
+    polls. When several takes are waiting they are decoded as one batch.
+    Recording never waits on this thread.
+    """
+    
+    def __init__(self, model_dir=None, threshold=None, max_batch=None):
+        self.model_dir = model_dir or self.find_model_dir()
+        self.threshold = Config.VERIFY_CER_THRESHOLD if threshold is None else threshold
+        self.max_batch = max_batch or Config.VERIFY_MAX_BATCH
+        self.pending = queue.Queue()
+        self.results = queue.Queue()
+        self._thread = None
+        self._model = None
+        self._processor = None
+    
+    @staticmethod
+    def find_model_dir():
+        for model_dir in Config.VERIFY_MODEL_DIRS:
+            if (model_dir / "config.json").exists():
+                return model_dir
+        return None
+    
+    def available(self):
+        return self.model_dir is not None
+    
+    def submit(self, filename, prompt):
+        """Kaydı doğrulama kuyruğuna ekle (bloklamaz)"""
+        if not self.available():
+            return
+        self.pending.put((filename, prompt))
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._worker, daemon=True)
+            self._thread.start()
+    
+    def _load_model(self):
+        self._model, self._processor = load_cpu_model(self.model_dir, Config.VERIFY_THREADS)
+    
+    def _transcribe(self, filenames):
+        import torch
+        
+        sampling_rate = self._processor.feature_extractor.sampling_rate
+        arrays, owners = [], []
+        for index, filename in enumerate(filenames):
+            audio, file_rate = sf.read(str(Config.AUDIO_DIR / filename), dtype='float32', always_2d=True)
+            audio = audio.mean(axis=1)
+            if file_rate != sampling_rate:
+                audio = librosa.resample(audio, orig_sr=file_rate, target_sr=sampling_rate)
+            windows = self.split_windows(audio, sampling_rate)
+            arrays.extend(windows)
+            owners.extend([index] * len(windows))
+        features = self._processor.feature_extractor(arrays, sampling_rate=sampling_rate, return_tensors="pt").input_features
+        with torch.inference_mode():
+            generated = self._model.generate(features, max_length=225)
+        
+        # Pencere çıktılarını kayıt başına sırayla birleştir
+        texts = [[] for _ in filenames]
+        for index, text in zip(owners, self._processor.batch_decode(generated, skip_special_tokens=True)):
+            texts[index].append(text.strip())
+        return [" ".join(text for text in parts if text) for parts in texts]
+    
+    @staticmethod
+    def split_windows(audio, sampling_rate, window_seconds=None):
+        """Whisper 30 s'den sonrasını keser: uzun kaydı ardışık pencerelere böl"""
+        window = int((window_seconds or Config.VERIFY_WINDOW_SECONDS) * sampling_rate)
+        if len(audio) <= window:
+            return [audio]
+        return [audio[start:start + window] for start in range(0, len(audio), window)]
+    
+    def _worker(self):
+        try:
+            self._load_model()
+        except Exception as e:
+            self.results.put({'error': f"Doğrulama modeli yüklenemedi: {e}"})
+            self.model_dir = None
+            return
+        
+        while True:
+            batch = [self.pending.get()]
+            # Kuyruk birikmişse tek seferde çöz
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self.pending.get_nowait())
+                except queue.Empty:
+                    break
+            
+            try:
+                hypotheses = self._transcribe([filename for filename, _ in batch])
+            except Exception as e:
+                for filename, prompt in batch:
+                    self.results.put({'filename': filename, 'prompt': prompt, 'error': str(e)})
+                continue
+            
+            for (filename, prompt), hypothesis in zip(batch, hypotheses):
+                cer = character_error_rate(prompt, hypothesis)
+                self.results.put({
+                    'filename': filename,
+                    'prompt': prompt,
+                    'hypothesis': hypothesis.strip(),
+                    'cer': round(cer, 3),
+                    'flagged': cer > self.threshold
+                })
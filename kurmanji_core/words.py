@@ -0,0 +1,862 @@
+"""
+Word, sentence and paragraph lists with recording progress
+"""
+
+import json
+import re
+import unicodedata
+from datetime import datetime
+from pathlib import Path
+
+from .config import Config
+from .datasets import ShardedTarExporter
+
+
+class WordManager:
+    """Enhanced word list manager with progress tracking"""
+    
+    def __init__(self):
+        Config.ensure_dirs()
+        self.words = []  # Sadece kelimeler
+        self.sentences = []  # Sadece cümleler
+        self.recorded_words = set()
+        # Multi-speed recording tracking
+        self.recorded_speeds = {}  # {"word": {"slow": True, "normal": False, "fast": True}}
+        self.current_recording_speed = "normal"  # "slow", "normal", "fast"
+        self.current_index = 0
+        self.speaker_id = self.load_speaker_id()
+        self.is_sentence_mode = False  # Kelime/Cümle modu (backward compatibility)
+        self.current_content_type = "word"  # "word", "sentence", "paragraph"
+        self.paragraphs = []  # Paragraf listesi
+        self.schedule_mode = "sequential"  # "sequential" veya "coverage"
+        self._coverage_schedule = None  # (cache_key, [index, ...])
+        self.take_verification = {}  # {"dosya.wav": {"prompt", "hypothesis", "cer", "flagged"}}
+        self.load_data()
+        self.load_paragraphs()
+    
+    def load_speaker_id(self):
+        """Konuşmacı ID'sini yükle"""
+        try:
+            speaker_file = Config.BASE_DIR / "speaker_config.txt"
+            if speaker_file.exists():
+                with open(speaker_file, "r", encoding="utf-8") as f:
+                    return f.read().strip()
+        except:
+            pass
+        return "default"  # Varsayılan ID
+    
+    def load_data(self):
+        """Load words, sentences and recording progress"""
+        try:
+            # Load word list (individual words only)
+            if Config.WORDS_FILE.exists():
+                with open(Config.WORDS_FILE, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                    # Sadece kelimeleri yükle (cümle olmayan)
+                    all_items = data.get('words', [])
+                    self.words = [item for item in all_items if not self.is_sentence(item)]
+                    print(f"✅ Loaded {len(self.words)} words from wordlist.json")
+                    self.current_index = data.get('current_index', 0)
+                    self.schedule_mode = data.get('schedule_mode', "sequential")
+            
+            # Load sentence list (sentences only)
+            if Config.SENTENCES_FILE.exists():
+                with open(Config.SENTENCES_FILE, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                    self.sentences = data.get('sentences', [])
+            else:
+                # Eğer sentence dosyası yoksa, mevcut wordlist'ten cümleleri ayır
+                if Config.WORDS_FILE.exists():
+                    with open(Config.WORDS_FILE, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                        all_items = data.get('words', [])
+                        self.sentences = [item for item in all_items if self.is_sentence(item)]
+                    self.save_sentences()  # Ayrı dosyaya kaydet
+            
+            # Load metadata (recorded words)
+            if Config.METADATA_FILE.exists():
+                with open(Config.METADATA_FILE, 'r', encoding='utf-8') as f:
+                    metadata = json.load(f)
+                    self.recorded_words = set(metadata.get('recorded_words', []))
+                    self.recorded_speeds = metadata.get('recorded_speeds', {})
+                    self.take_verification = metadata.get('take_verification', {})
+        except Exception as e:
+            print(f"Error loading data: {e}")
+            self.words = []
+            self.sentences = []
+            self.recorded_words = set()
+            self.recorded_speeds = {}
+            self.current_index = 0
+    
+    def save_data(self):
+        """Save words and recording progress"""
+        try:
+            # Save word list (kelimeler)
+            word_data = {
+                'words': self.words,
+                'current_index': self.current_index,
+                'schedule_mode': self.schedule_mode,
+                'last_updated': datetime.now().isoformat()
+            }
+            with open(Config.WORDS_FILE, 'w', encoding='utf-8') as f:
+                json.dump(word_data, f, ensure_ascii=False, indent=2)
+            
+            # Save sentences separately
+            self.save_sentences()
+            
+            # Save paragraphs separately
+            self.save_paragraphs()
+            
+            # Save metadata
+            metadata = {
+                'recorded_words': list(self.recorded_words),
+                'recorded_speeds': self.recorded_speeds,  # Multi-speed tracking
+                'take_verification': self.take_verification,  # Model ile otomatik doğrulama
+                'total_words': len(self.words),
+                'total_sentences': len(self.sentences),
+                'total_paragraphs': len(self.paragraphs),
+                'last_updated': datetime.now().isoformat()
+            }
+            with open(Config.METADATA_FILE, 'w', encoding='utf-8') as f:
+                json.dump(metadata, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            print(f"Error saving data: {e}")
+    
+    def save_sentences(self):
+        """Save sentences to separate file"""
+        try:
+            sentence_data = {
+                'sentences': self.sentences,
+                'last_updated': datetime.now().isoformat()
+            }
+            with open(Config.SENTENCES_FILE, 'w', encoding='utf-8') as f:
+                json.dump(sentence_data, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            print(f"Error saving sentences: {e}")
+    
+    def load_paragraphs(self):
+        """Load paragraphs from file or create sample paragraphs"""
+        try:
+            # Load from file if exists
+            if Config.PARAGRAPHS_FILE.exists():
+                with open(Config.PARAGRAPHS_FILE, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                    self.paragraphs = data.get('paragraphs', [])
+                    print(f"Loaded {len(self.paragraphs)} paragraphs from file")
+            else:
+                # Create sample Kurdish paragraphs for recording
+                self.paragraphs = [
+                    "Ez ji Kurdistan hatim û Kurdistan gelek cîhek xweş e. Xelkê me gelek xwedî rûmet in û ev erd ji me re gelek giring e. Em dixwazin ku zarokên me bi zimanê xwe mezin bibin.",
+                    "Rojhilata navîn gelek caran di şer û pevçûnê de maye. Lê gelê Kurd her dem hêviya aştiyê kiriye û dixwaze ku li vir jiyan aram be. Çanda me dewlemend e û em ê wê biparêzin.",
+                    "Zimanê kurdî gelek kevnar û dewlemend e. Em dixwazin ku zarokên xwe bi vî zimanî axivin û nivîsin. Pirtûkên kurdî, stranên kurdî û çîrokên kurdî girîng in ji bo me.",
+                    "Li gundên Kurdistan, xelk bi çandiniyê mijûl dibin. Genim, ceriş û darên fêkiyê gelek in. Rûbarên me gelek xweş in û av gelekî pak e.",
+                    "Stranbêjên kurd gelek navdar in. Stranên wan li her cîhê cîhanê tên gotin. Muzîka kurdî dilê mirov dixoşe û rûhê mirovan geş dike."
+                ]
+                self.save_paragraphs()
+                # Sample paragraphs created
+                    
+        except Exception as e:
+            print(f"Error loading paragraphs: {e}")
+            # Fallback to sample paragraphs
+            self.paragraphs = [
+                "Ez ji Kurdistan hatim û Kurdistan gelek cîhek xweş e. Xelkê me gelek xwedî rûmet in û ev erd ji me re gelek giring e.",
+                "Zimanê kurdî gelek kevnar û dewlemend e. Em dixwazin ku zarokên xwe bi vî zimanî axivin û nivîsin."
+            ]
+    
+    def save_paragraphs(self):
+        """Save paragraphs to separate file"""
+        try:
+            paragraph_data = {
+                'paragraphs': self.paragraphs,
+                'last_updated': datetime.now().isoformat()
+            }
+            with open(Config.PARAGRAPHS_FILE, 'w', encoding='utf-8') as f:
+                json.dump(paragraph_data, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            print(f"Error saving paragraphs: {e}")
+    
+    def add_words(self, new_words):
+        """Add new words or sentences to appropriate lists"""
+        added_words = 0
+        added_sentences = 0
+        # Liste üzerinde "in" her öğe için O(n); büyük importlarda set kullan
+        known_sentences = set(self.sentences)
+        known_words = set(self.words)
+        
+        for item in new_words:
+            item = item.strip()
+            if not item:
+                continue
+                
+            if self.is_sentence(item):
+                # Cümle ise sentences listesine ekle
+                if item not in known_sentences:
+                    known_sentences.add(item)
+                    self.sentences.append(item)
+                    added_sentences += 1
+            else:
+                # Kelime ise words listesine ekle
+                if item not in known_words:
+                    known_words.add(item)
+                    self.words.append(item)
+                    added_words += 1
+        
+        if added_words > 0 or added_sentences > 0:
+            self._coverage_schedule = None
+            self.save_data()
+        
+        return added_words + added_sentences
+    
+    def add_segmented_content(self, sentences, paragraphs):
+        """Add segmenter output to the sentence and paragraph lists"""
+        known_sentences = set(self.sentences)
+        known_paragraphs = set(self.paragraphs)
+        added_sentences = 0
+        added_paragraphs = 0
+        
+        for sentence in sentences:
+            if sentence not in known_sentences:
+                known_sentences.add(sentence)
+                self.sentences.append(sentence)
+                added_sentences += 1
+        
+        for paragraph in paragraphs:
+            if paragraph not in known_paragraphs:
+                known_paragraphs.add(paragraph)
+                self.paragraphs.append(paragraph)
+                added_paragraphs += 1
+        
+        if added_sentences or added_paragraphs:
+            self._coverage_schedule = None
+            self.save_data()
+        
+        return added_sentences, added_paragraphs
+    
+    def get_current_word(self):
+        """Get the current word or sentence based on active mode"""
+        filtered_content = self.get_filtered_content()
+        if 0 <= self.current_index < len(filtered_content):
+            return filtered_content[self.current_index]
+        return None
+    
+    def next_word(self):
+        """Move to next unrecorded word or sentence based on active mode"""
+        if self.schedule_mode == "coverage":
+            scheduled = self.next_scheduled_word()
+            if scheduled is not None:
+                return scheduled
+        
+        filtered_content = self.get_filtered_content()
+        
+        # İlk olarak kayıt edilmemiş içerik bul
+        for i in range(self.current_index + 1, len(filtered_content)):
+            if filtered_content[i] not in self.recorded_words:
+                self.current_index = i
+                self.save_data()
+                return self.get_current_word()
+        
+        # Eğer sonunda kayıt edilmemiş içerik yoksa, baştan ara
+        for i in range(0, self.current_index):
+            if filtered_content[i] not in self.recorded_words:
+                self.current_index = i
+                self.save_data()
+                return self.get_current_word()
+        
+        # Tüm içerik kayıt edilmişse normal ilerleme
+        if self.current_index < len(filtered_content) - 1:
+            self.current_index += 1
+            self.save_data()
+        return self.get_current_word()
+    
+    @staticmethod
+    def prompt_units(text, n=2):
+        """Grapheme n-grams of a prompt, with word boundaries marked by '#'"""
+        normalized = unicodedata.normalize('NFC', text).lower()
+        units = set()
+        for token in re.findall(r"[^\W\d_]+", normalized):
+            padded = f"#{token}#"
+            for i in range(len(padded) - n + 1):
+                units.add(padded[i:i + n])
+        return units
+    
+    @staticmethod
+    def estimate_speech_seconds(text):
+        """Rough speaking time from character count (~13 chars/s + onset)"""
+        return 0.3 + len(text) / 13.0
+    
+    def build_coverage_schedule(self, n=2):
+        """Order unrecorded prompts by greedy set cover over grapheme n-grams
+        
+        Every next prompt adds the most not-yet-covered units per expected
+        second of speech. Gains only shrink as coverage grows, so a lazy
+        priority queue re-evaluates just the popped candidate.
+        """
+        import heapq
+        
+        filtered_content = self.get_filtered_content()
+        covered = set()
+        candidates = []
+        for i, item in enumerate(filtered_content):
+            units = self.prompt_units(item, n)
+            if item in self.recorded_words:
+                covered |= units
+            else:
+                candidates.append((i, units, self.estimate_speech_seconds(item)))
+        
+        heap = [(-len(units) / cost, i, units, cost) for i, units, cost in candidates]
+        heapq.heapify(heap)
+        
+        schedule = []
+        while heap:
+            neg_score, i, units, cost = heapq.heappop(heap)
+            score = len(units - covered) / cost
+            if heap and score < -heap[0][0]:
+                # Eski kazanç - güncel değerle tekrar kuyruğa koy
+                heapq.heappush(heap, (-score, i, units, cost))
+                continue
+            schedule.append(i)
+            covered |= units
+        return schedule
+    
+    def get_coverage_schedule(self):
+        """Cached coverage schedule for the active content list"""
+        filtered_content = self.get_filtered_content()
+        cache_key = (self.current_content_type, self.is_sentence_mode, len(filtered_content))
+        if self._coverage_schedule is None or self._coverage_schedule[0] != cache_key:
+            self._coverage_schedule = (cache_key, self.build_coverage_schedule())
+        return self._coverage_schedule[1]
+    
+    def next_scheduled_word(self):
+        """Move to the next unrecorded prompt in coverage order"""
+        filtered_content = self.get_filtered_content()
+        schedule = self.get_coverage_schedule()
+        # Mevcut öğenin sırasından sonra devam et, sonda başa dön
+        try:
+            start = schedule.index(self.current_index) + 1
+        except ValueError:
+            start = 0
+        for i in schedule[start:] + schedule[:start]:
+            if i != self.current_index and i < len(filtered_content) and filtered_content[i] not in self.recorded_words:
+                self.current_index = i
+                self.save_data()
+                return self.get_current_word()
+        return None
+    
+    def set_schedule_mode(self, mode):
+        """Set prompt ordering: 'sequential' (list order) or 'coverage'"""
+        if mode in ("sequential", "coverage"):
+            self.schedule_mode = mode
+            self._coverage_schedule = None
+            self.save_data()
+    
+    def previous_word(self):
+        """Move to previous word or sentence (recorded or not)"""
+        # Normal geri gitme - kaydedilen içeriği de göster
+        if self.current_index > 0:
+            self.current_index -= 1
+            self.save_data()
+        return self.get_current_word()
+    
+    def mark_recorded(self, word, audio_filename=None):
+        """Mark a word as recorded and update Whisper training files"""
+        self.recorded_words.add(word)
+        
+        # Whisper eğitimi için kayıt
+        if audio_filename:
+            self.update_whisper_files(word, audio_filename)
+        
+        self.save_data()
+    
+    def update_whisper_files(self, transcript, audio_filename):
+        """Whisper eğitimi için gerekli dosyaları güncelle"""
+        try:
+            # JSONL formatında Whisper manifest dosyasını güncelle
+            manifest_entry = {
+                "audio_filepath": f"audio/{audio_filename}",
+                "text": transcript.strip(),
+                "language": "ku",  # Kurdish language code
+                "duration": 2.0,  # Varsayılan süre
+                "speaker_id": self.speaker_id
+            }
+            
+            # Manifest dosyasına ekle
+            with open(Config.WHISPER_MANIFEST, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(manifest_entry, ensure_ascii=False) + '\n')
+            
+            # Transkript dosyasına ekle (basit format)
+            with open(Config.TRANSCRIPT_FILE, 'a', encoding='utf-8') as f:
+                f.write(f"{audio_filename}\t{transcript.strip()}\n")
+                
+            print(f"✅ Whisper eğitim dosyaları güncellendi: {audio_filename} -> '{transcript}'")
+            
+        except Exception as e:
+            print(f"❌ Whisper dosyaları güncellenirken hata: {e}")
+    
+    def update_manifest_duration(self, filename, duration):
+        """Manifest dosyasındaki son satırın ses uzunluğunu güncelle"""
+        try:
+            if not Config.WHISPER_MANIFEST.exists():
+                return
+                
+            # Mevcut manifest dosyasını oku
+            lines = []
+            with open(Config.WHISPER_MANIFEST, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+            
+            # Son satırı güncelle (yeni eklenen dosya)
+            if lines:
+                last_line = lines[-1].strip()
+                if last_line:
+                    manifest_entry = json.loads(last_line)
+                    if manifest_entry.get('audio_filepath') == f"audio/{filename}" or manifest_entry.get('audio') == filename:
+                        manifest_entry['duration'] = round(duration, 2)
+                        manifest_entry['duration_measured'] = True  # 2.0 yer tutucusu değil
+                        lines[-1] = json.dumps(manifest_entry, ensure_ascii=False) + '\n'
+                        
+                        # Dosyayı yeniden yaz
+                        with open(Config.WHISPER_MANIFEST, 'w', encoding='utf-8') as f:
+                            f.writelines(lines)
+            
+        except Exception as e:
+            print(f"⚠️ Manifest güncelleme hatası: {e}")
+    
+    def is_current_recorded(self):
+        """Check if current word is recorded"""
+        current_word = self.get_current_word()
+        return current_word in self.recorded_words if current_word else False
+    
+    def get_word_speed_status(self, word):
+        """Get recording status for all speeds of a word"""
+        if word not in self.recorded_speeds:
+            return {"slow": False, "normal": False, "fast": False}
+        return self.recorded_speeds.get(word, {"slow": False, "normal": False, "fast": False})
+    
+    def mark_speed_recorded(self, word, speed, audio_filename=None):
+        """Mark a specific speed as recorded for a word"""
+        if word not in self.recorded_speeds:
+            self.recorded_speeds[word] = {"slow": False, "normal": False, "fast": False}
+        
+        self.recorded_speeds[word][speed] = True
+        
+        # Mark word as recorded if any speed is recorded
+        self.recorded_words.add(word)
+        
+        # Whisper eğitimi için kayıt
+        if audio_filename:
+            self.update_whisper_files(word, audio_filename)
+        
+        self.save_data()
+        print(f"✅ {word} - {speed} speed recorded: {audio_filename}")
+    
+    def set_take_verification(self, result):
+        """Doğrulama sonucunu kataloğa yaz"""
+        self.take_verification[result['filename']] = {
+            'prompt': result['prompt'],
+            'hypothesis': result['hypothesis'],
+            'cer': result['cer'],
+            'flagged': result['flagged'],
+            'checked': datetime.now().isoformat()
+        }
+        self.save_data()
+    
+    def get_flagged_words(self):
+        """Şüpheli kaydı olan kelimeler"""
+        return {
+            info['prompt'] for filename, info in self.take_verification.items()
+            if info.get('flagged') and (Config.AUDIO_DIR / filename).exists()
+        }
+    
+    def get_missing_speeds(self, word):
+        """Get list of missing speeds for a word"""
+        speeds = self.get_word_speed_status(word)
+        missing = [speed for speed, recorded in speeds.items() if not recorded]
+        return missing
+    
+    def get_completion_status(self, word):
+        """Get completion percentage for a word (0-100)"""
+        speeds = self.get_word_speed_status(word)
+        completed = sum(1 for recorded in speeds.values() if recorded)
+        return (completed / 3) * 100  # 3 speeds total
+    
+    def set_recording_speed(self, speed):
+        """Set current recording speed"""
+        if speed in ["slow", "normal", "fast"]:
+            self.current_recording_speed = speed
+            print(f"🎚️ Recording speed set to: {speed.upper()}")
+        else:
+            print(f"❌ Invalid speed: {speed}. Use 'slow', 'normal', or 'fast'")
+    
+    def generate_speed_filename(self, word, speed):
+        """Generate filename for specific word and speed"""
+        # Get next available number
+        existing_files = list(Config.AUDIO_DIR.glob("*.wav"))
+        numbers = []
+        for f in existing_files:
+            match = re.match(r'^(\d{6})_', f.name)
+            if match:
+                numbers.append(int(match.group(1)))
+        
+        next_number = max(numbers, default=0) + 1
+        
+        # Clean word for filename
+        clean_word = re.sub(r'[^\w\s\-]', '', word).replace(' ', '_')
+        
+        return f"{next_number:06d}_{clean_word}_{speed}.wav"
+    
+    def get_progress(self):
+        """Get recording progress based on active mode"""
+        filtered_content = self.get_filtered_content()
+        
+        # Filtrelenmiş içerikteki kayıtlı öğeleri say
+        recorded_in_filtered = sum(1 for item in filtered_content if item in self.recorded_words)
+        total_filtered = len(filtered_content)
+        
+        return recorded_in_filtered, total_filtered
+    
+    def extract_transcript_from_filename(self, filename):
+        """Dosya isminden transkripti çıkar"""
+        try:
+            import re
+            
+            # Dosya uzantısını kaldır
+            basename = filename.stem if hasattr(filename, 'stem') else Path(filename).stem
+            
+            # Farklı formatları dene (öncelik sırasına göre)
+            patterns = [
+                # Whisper formatı: 000001_word
+                r'^\d{6}_(.+)$',
+                
+                # Duplikat formatı: 000001_000002_word
+                r'^\d{6}_\d{6}_(.+)$',
+                
+                # Tarih-saat formatları
+                r'^(.+?)_\d{8}_\d{6}$',  # word_20251004_123456
+                r'^(.+?)_\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2}$',  # word_2024-01-15_14-30-45
+                
+                # Timestamp formatları
+                r'^(.+?)_\d{10,}$',  # word_1234567890 (unix timestamp)
+                r'^(.+?)_\d+$',  # word_123456789
+                
+                # Özel formatlar
+                r'^(.+?)_recording$',  # word_recording
+                r'^(.+?)_audio$',  # word_audio
+                
+                # Sadece kelime
+                r'^(.+)$'
+            ]
+            
+            for pattern in patterns:
+                match = re.match(pattern, basename)
+                if match:
+                    transcript = match.group(1).strip()
+                    if transcript and not transcript.isdigit():  # Sadece rakam değilse
+                        # Özel karakterleri temizle
+                        transcript = re.sub(r'[^\w\s\-\.\_]', '', transcript)
+                        return transcript
+            
+            # Hiçbir pattern uymazsa basename'i döndür
+            return re.sub(r'[^\w\s\-\.\_]', '', basename)
+            
+        except Exception as e:
+            print(f"❌ Dosya isminden transkript çıkarılırken hata: {e}")
+            return str(filename).replace('.wav', '')
+    
+    def rebuild_recorded_from_audio(self):
+        """metadata.json kayıt durumunu audio klasöründen yeniden oluştur"""
+        self.recorded_words = set()
+        self.recorded_speeds = {}
+        for audio_file in sorted(Config.AUDIO_DIR.glob("*.wav")):
+            match = re.match(r'^\d{6}_(.+?)(?:_(slow|normal|fast))?\.wav$', audio_file.name)
+            if not match:
+                continue
+            word = match.group(1).replace('_', ' ')
+            speeds = self.recorded_speeds.setdefault(word, {"slow": False, "normal": False, "fast": False})
+            speeds[match.group(2) or "normal"] = True
+            self.recorded_words.add(word)
+        self.save_data()
+        return len(self.recorded_words)
+    
+    def load_manifest_transcripts(self):
+        """{ses dosyası adı: transkript} - manifest'ten, yoksa dosya adından"""
+        transcripts = {}
+        if Config.WHISPER_MANIFEST.exists():
+            with open(Config.WHISPER_MANIFEST, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        name = ShardedTarExporter.entry_audio_name(entry)
+                        if name and entry.get('text'):
+                            transcripts[name] = entry['text']
+        for audio_file in Config.AUDIO_DIR.glob("*.wav"):
+            if audio_file.name not in transcripts:
+                transcript = self.extract_transcript_from_filename(audio_file.name)
+                if transcript:
+                    transcripts[audio_file.name] = transcript
+        return transcripts
+    
+    def convert_old_audio_files(self, progress_callback=None):
+        """Eski ses dosyalarını Whisper formatına dönüştür ve duplikatları temizle
+        
+        Returns (converted_count, conversion_log); the caller decides how to
+        report it (dialog in the app, stdout in the CLI). Manifest and
+        transcripts are rebuilt from scratch, so an interrupted run is
+        repaired by running it again.
+        """
+        import shutil
+        
+        if not Config.AUDIO_DIR.exists():
+            return 0, ["⚠️ Audio klasörü bulunamadı!"]
+        
+        # Tüm ses dosyalarını al
+        all_audio_files = list(Config.AUDIO_DIR.glob("*.wav"))
+        if not all_audio_files:
+            return 0, ["ℹ️ Ses dosyası bulunamadı!"]
+        
+        conversion_log = []
+        
+        # Dosyaları kategorilere ayır
+        whisper_format_files = []  # 000001_word.wav formatındaki dosyalar
+        old_format_files = []      # word_timestamp.wav formatındaki dosyalar
+        duplicate_files = []       # 000001_000002_word.wav gibi duplikatlar
+        
+        for audio_file in all_audio_files:
+            filename = audio_file.name
+            
+            # Whisper formatı kontrolü (000001_word.wav)
+            if re.match(r'^\d{6}_[^_]+.*\.wav$', filename):
+                # Duplikat kontrolü (000001_000002_word.wav)
+                if re.match(r'^\d{6}_\d{6}_.*\.wav$', filename):
+                    duplicate_files.append(audio_file)
+                else:
+                    whisper_format_files.append(audio_file)
+            else:
+                # Eski format (word_timestamp.wav, word.wav vs)
+                old_format_files.append(audio_file)
+        
+        conversion_log.append(f"📊 Dosya Kategorileri:")
+        conversion_log.append(f"   • Whisper formatı: {len(whisper_format_files)}")
+        conversion_log.append(f"   • Eski format: {len(old_format_files)}")
+        conversion_log.append(f"   • Duplikatlar: {len(duplicate_files)}")
+        conversion_log.append("")
+        
+        total = len(duplicate_files) + len(whisper_format_files) + len(old_format_files)
+        done = 0
+        if progress_callback:
+            progress_callback(done, total)
+        
+        # Duplikatları sil
+        if duplicate_files:
+            conversion_log.append("🗑️ Duplikat dosyalar siliniyor:")
+            for dup_file in duplicate_files:
+                try:
+                    dup_file.unlink()
+                    conversion_log.append(f"   ✅ Silindi: {dup_file.name}")
+                except Exception as e:
+                    conversion_log.append(f"   ❌ Silinemedi: {dup_file.name} - {e}")
+                done += 1
+                if progress_callback:
+                    progress_callback(done, total)
+            conversion_log.append("")
+        
+        # Mevcut Whisper manifest'i temizle ve yeniden oluştur
+        if Config.WHISPER_MANIFEST.exists():
+            Config.WHISPER_MANIFEST.unlink()
+        if Config.TRANSCRIPT_FILE.exists():
+            Config.TRANSCRIPT_FILE.unlink()
+        
+        conversion_log.append("🔄 Whisper dosyaları yeniden oluşturuluyor:")
+        
+        # Whisper formatındaki dosyalar için manifest yeniden oluştur
+        current_whisper_files = []
+        for audio_file in whisper_format_files:
+            try:
+                # Transkript çıkar
+                transcript = self.extract_transcript_from_filename(audio_file.name)
+                self.update_whisper_files(transcript, audio_file.name)
+                current_whisper_files.append((audio_file.name, transcript))
+                conversion_log.append(f"   ✅ Manifest güncellendi: {audio_file.name}")
+            except Exception as e:
+                conversion_log.append(f"   ❌ Hata: {audio_file.name} - {e}")
+            done += 1
+            if progress_callback:
+                progress_callback(done, total)
+        
+        # Eski formatdaki dosyaları dönüştür
+        if old_format_files:
+            conversion_log.append("")
+            conversion_log.append("🔄 Eski format dosyalar dönüştürülüyor:")
+            
+            # Yeni numara başlangıcı
+            next_number = len(current_whisper_files) + 1
+            
+            for audio_file in old_format_files:
+                try:
+                    # Transkript çıkar
+                    transcript = self.extract_transcript_from_filename(audio_file.name)
+                    
+                    # Yeni dosya adı
+                    new_filename = f"{next_number:06d}_{transcript}.wav"
+                    new_filepath = Config.AUDIO_DIR / new_filename
+                    
+                    # Dosyayı yeni isimle kopyala
+                    shutil.copy2(audio_file, new_filepath)
+                    
+                    # Whisper dosyalarını güncelle
+                    self.update_whisper_files(transcript, new_filename)
+                    
+                    # Eski dosyayı sil
+                    audio_file.unlink()
+                    
+                    conversion_log.append(f"   ✅ Dönüştürüldü: {audio_file.name} → {new_filename}")
+                    next_number += 1
+                    
+                except Exception as e:
+                    conversion_log.append(f"   ❌ Hata: {audio_file.name} - {e}")
+                done += 1
+                if progress_callback:
+                    progress_callback(done, total)
+        
+        conversion_log.append("")
+        conversion_log.append(f"🗑️ Duplikatlar temizlendi: {len(duplicate_files)}")
+        conversion_log.append(f"🔄 Eski formatlar dönüştürüldü: {len(old_format_files)}")
+        conversion_log.append("✅ Dönüştürme tamamlandı!")
+        
+        # Dönüştürme logunu sakla
+        self.conversion_log = conversion_log
+        return len(duplicate_files) + len(old_format_files), conversion_log
+
+    def find_first_unrecorded_word(self):
+        """Find and jump to the first unrecorded word or sentence based on active mode"""
+        filtered_content = self.get_filtered_content()
+        
+        for i, item in enumerate(filtered_content):
+            if item not in self.recorded_words:
+                self.current_index = i
+                self.save_data()
+                return item
+        
+        # If all content is recorded, stay at current position
+        return self.get_current_word()
+    
+    def jump_to_first_unrecorded(self):
+        """Jump to first unrecorded word and return True if found"""
+        first_unrecorded = self.find_first_unrecorded_word()
+        return first_unrecorded is not None and first_unrecorded not in self.recorded_words
+    
+    def separate_mixed_content(self):
+        """Mevcut karışık içeriği kelime ve cümlelere ayır"""
+        try:
+            # Mevcut wordlist dosyasından tüm içeriği yükle
+            if Config.WORDS_FILE.exists():
+                with open(Config.WORDS_FILE, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                    all_items = data.get('words', [])
+                
+                # İçeriği ayır
+                separated_words = []
+                separated_sentences = []
+                
+                for item in all_items:
+                    if self.is_sentence(item):
+                        separated_sentences.append(item)
+                    else:
+                        separated_words.append(item)
+                
+                # Listeleri güncelle
+                self.words = separated_words
+                self.sentences = separated_sentences
+                
+                # Dosyalara kaydet
+                self.save_data()
+                
+                print(f"✅ Content separated: {len(separated_words)} words, {len(separated_sentences)} sentences")
+                return len(separated_words), len(separated_sentences)
+        except Exception as e:
+            print(f"Error separating content: {e}")
+            return 0, 0
+    
+    @staticmethod
+    def is_sentence(text):
+        """Bir metnin cümle mi kelime mi olduğunu tespit et"""
+        if not text or not text.strip():
+            return False
+        
+        text = text.strip()
+        text_lower = text.lower()
+        
+        # 1. Noktalama işaretleri - kesin cümle belirtisi
+        punctuation_marks = ['?', '!', '.']
+        for mark in punctuation_marks:
+            if mark in text:
+                return True
+        
+        # 2. Boşluk içeriyor - çoklu kelime
+        if ' ' in text:
+            return True
+        
+        # 3. Kurmancî özel cümle kalıpları
+        kurdish_sentence_patterns = [
+            # Soru kalıpları
+            'çawa', 'kî', 'kengî', 'li ku', 'li kî', 'çi', 'çend',
+            # Fiil çekimleri (cümle sonları)
+            ' im', ' e', ' in', ' yî', ' ne', ' n', ' re',
+            # Cümle başlangıçları
+            'ez ', 'tu ', 'ew ', 'em ', 'hûn ', 'ewan ',
+            # Yaygın cümle kelimeleri
+            'dixwazim', 'dibînim', 'dikim', 'diçim', 'tê'
+        ]
+        
+        for pattern in kurdish_sentence_patterns:
+            if pattern in text_lower:
+                return True
+        
+        # 4. Uzunluk kontrolü - 12+ karakter muhtemelen cümle
+        if len(text) >= 12:
+            return True
+            
+        # 5. Üç kelimeden fazlaysa kesinlikle cümle
+        word_count = len(text.split())
+        if word_count >= 3:
+            return True
+        
+        # 6. İki kelime ama yaygın cümle kalıpları
+        if word_count == 2:
+            two_word_sentence_patterns = [
+                'roj baş', 'spas dikim', 'ez hatim', 'tu çû', 'ew hat',
+                'em çûn', 'hûn hatin', 'gellek spas', 'her tim'
+            ]
+            for pattern in two_word_sentence_patterns:
+                if pattern in text_lower:
+                    return True
+            
+        return False
+    
+    def get_filtered_content(self):
+        """Aktif moda göre filtrelenmiş içerik döndür"""
+        if self.current_content_type == "paragraph":
+            # Paragraf modu
+            # Paragraph mode loaded
+            if self.paragraphs:
+                # Paragraphs loaded successfully
+                pass
+            else:
+                # No paragraphs found
+                pass
+            return self.paragraphs
+        elif self.is_sentence_mode or self.current_content_type == "sentence":
+            # Cümle modu - sentences listesini kullan
+            # Sentence mode loaded
+            if self.sentences:
+                # Sentences loaded successfully
+                pass
+            else:
+                # No sentences found
+                pass
+            return self.sentences
+        else:
+            # Kelime modu - words listesini kullan
+            # Word mode loaded
+            if self.words:
+                # Words loaded successfully
+                pass
+            return self.words
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Kurmancî Whisper Değerlendirme Scripti
+Fine-tune edilmiş bir checkpoint'i ayrılmış test kayıtları üzerinde
+batch'li CPU üretimiyle çalıştırır, WER/CER hesaplar ve sonuçları içerik
+türüne (kelime/cümle/paragraf) ve konuşma hızına (slow/normal/fast) göre
+ayırır. Model çıktıları önbelleğe alınır; normalizasyon değişince yeniden
+puanlama için modeli tekrar çalıştırmak gerekmez.
+
+Kullanım:
+    python whisper_evaluate.py --model ./whisper-kurdish-kurmanji-final
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+import unicodedata
+import numpy as np
+
+# kurmanji_core, veri seti klasörünün bulunduğu uygulama klasöründe
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from kurmanji_core.words import WordManager
+from kurmanji_core.documents import KurmanjiSentenceSegmenter
+from kurmanji_core.verification import edit_distance
+
+MANIFEST_FILE = "whisper_manifest.jsonl"
+AUDIO_PATH = "audio"
+HYPOTHESIS_CACHE = "eval_hypotheses.jsonl"
+
+SPEED_PATTERN = re.compile(r'_(slow|normal|fast)\.wav$')
+PUNCTUATION_PATTERN = re.compile(r"[^\w\s']")
+
+def normalize_text(text):
+    """Puanlama öncesi normalizasyon: NFC, küçük harf, noktalama yok"""
+    text = unicodedata.normalize("NFC", text).lower()
+    text = PUNCTUATION_PATTERN.sub(" ", text)
+    return " ".join(text.split())
+
+def error_rate(references, hypotheses, unit="word"):
+    """Toplam hata / toplam referans birimi (WER veya CER)"""
+    errors, total = 0, 0
+    for reference, hypothesis in zip(references, hypotheses):
+        ref = reference.split() if unit == "word" else list(reference.replace(" ", ""))
+        hyp = hypothesis.split() if unit == "word" else list(hypothesis.replace(" ", ""))
+        errors += edit_distance(ref, hyp)
+        total += len(ref)
+    return errors / total if total else 0.0
+
+class ContentTypeIndex:
+    """Metin -> içerik türü, kaydedicinin kendi listelerinden
+
+    Manifest içerik türü yazmaz. Kaydedici öğeleri wordlist.json,
+    sentencelist.json ve paragraphlist.json'da ayrı tutar; tür buradan
+    okunur. Hiçbir listede olmayan metin (silinmiş öğe, birleştirilmiş
+    veri seti) WordManager.is_sentence kurallarıyla sınıflandırılır;
+    birden fazla cümle içeriyorsa paragraf sayılır.
+    """
+
+    LISTS = (("wordlist.json", "words", "word"),
+             ("sentencelist.json", "sentences", "sentence"),
+             ("paragraphlist.json", "paragraphs", "paragraph"))
+
+    def __init__(self, dataset_dir="."):
+        self.types = {}
+        for filename, key, kind in self.LISTS:
+            path = os.path.join(dataset_dir, filename)
+            if not os.path.exists(path):
+                continue
+            with open(path, 'r', encoding='utf-8') as f:
+                for item in json.load(f).get(key, []):
+                    self.types[self.key(item)] = kind
+        self.segmenter = KurmanjiSentenceSegmenter()
+
+    @staticmethod
+    def key(text):
+        return unicodedata.normalize("NFC", text).strip()
+
+    def __call__(self, text):
+        kind = self.types.get(self.key(text))
+        if kind:
+            return kind
+        if not WordManager.is_sentence(text):
+            return "word"
+        return "paragraph" if len(self.segmenter.segment_paragraph(text)) > 1 else "sentence"
+
+def speech_speed(audio_name):
+    match = SPEED_PATTERN.search(audio_name)
+    return match.group(1) if match else "unknown"
+
+def make_compute_metrics(processor):
+    """Seq2SeqTrainer için compute_metrics (predict_with_generate=True)"""
+    def compute_metrics(pred):
+        label_ids = np.where(pred.label_ids == -100, processor.tokenizer.pad_token_id, pred.label_ids)
+        predictions = processor.tokenizer.batch_decode(pred.predictions, skip_special_tokens=True)
+        references = processor.tokenizer.batch_decode(label_ids, skip_special_tokens=True)
+        predictions = [normalize_text(text) for text in predictions]
+        references = [normalize_text(text) for text in references]
+        return {
+            "wer": 100 * error_rate(references, predictions, "word"),
+            "cer": 100 * error_rate(references, predictions, "char"),
+        }
+    return compute_metrics
+
+def load_heldout(manifest_path, audio_path, test_percent=10):
+    """Test kayıtları - eğitimdeki özet tabanlı ayrımla aynı (--stream)"""
+    from whisper_training import ManifestStreamingDataset
+
+    splitter = ManifestStreamingDataset(manifest_path, audio_path, split="test", test_percent=test_percent)
+    items, seen = [], set()
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            name = splitter.entry_audio_name(entry)
+            audio_file = os.path.join(audio_path, name)
+            if not name or name in seen or not splitter.in_split(name) or not os.path.exists(audio_file):
+                continue
+            seen.add(name)
+            items.append({"audio": name, "path": audio_file, "text": entry["text"]})
+    return items
+
+class HypothesisCache:
+    """Ses başına model çıktısı; model ağırlıkları değişince geçersiz olur"""
+
+    def __init__(self, model_dir):
+        self.path = os.path.join(model_dir, HYPOTHESIS_CACHE)
+        self.fingerprint = self.model_fingerprint(model_dir)
+        self.entries = {}
+        if os.path.exists(self.path):
+            with open(self.path, 'r', encoding='utf-8') as f:
+                header = json.loads(f.readline() or "{}")
+                if header.get("fingerprint") == self.fingerprint:
+                    for line in f:
+                        if line.strip():
+                            entry = json.loads(line)
+                            self.entries[entry["key"]] = entry["hypothesis"]
+        if not self.entries:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps({"fingerprint": self.fingerprint}) + "\n")
+
+    @staticmethod
+    def model_fingerprint(model_dir):
+        parts = []
+        for name in sorted(os.listdir(model_dir)):
+            if name.endswith((".bin", ".safetensors", ".onnx", ".pt", "config.json")):
+                stat = os.stat(os.path.join(model_dir, name))
+                parts.append(f"{name}:{stat.st_size}:{stat.st_mtime_ns}")
+        return "|".join(parts)
+
+    @staticmethod
+    def audio_key(path):
+        stat = os.stat(path)
+        return f"{os.path.basename(path)}:{stat.st_size}:{stat.st_mtime_ns}"
+
+    def get(self, path):
+        return self.entries.get(self.audio_key(path))
+
+    def add_many(self, paths, hypotheses):
+        with open(self.path, 'a', encoding='utf-8') as f:
+            for path, hypothesis in zip(paths, hypotheses):
+                key = self.audio_key(path)
+                self.entries[key] = hypothesis
+                f.write(json.dumps({"key": key, "hypothesis": hypothesis}, ensure_ascii=False) + "\n")
+
+def transcribe_arrays(model, processor, arrays, num_beams=1, max_length=225):
+    """16 kHz mono dizileri tek bir generate çağrısıyla çöz"""
+    import torch
+
+    sampling_rate = processor.feature_extractor.sampling_rate
+    features = processor.feature_extractor(arrays, sampling_rate=sampling_rate, return_tensors="pt").input_features
+    with torch.inference_mode():
+        generated = model.generate(features, num_beams=num_beams, max_length=max_length)
+    return processor.batch_decode(generated, skip_special_tokens=True)
+
+def transcribe_batch(model, processor, paths, num_beams=1, max_length=225):
+    """Dosya listesini tek bir generate çağrısıyla çöz"""
+    import librosa
+
+    sampling_rate = processor.feature_extractor.sampling_rate
+    arrays = [librosa.load(path, sr=sampling_rate, mono=True)[0] for path in paths]
+    return transcribe_arrays(model, processor, arrays, num_beams, max_length)
+
+def generate_hypotheses(model_dir, items, batch_size=16, threads=None):
+    """Önbellekte olmayan kayıtlar için batch'li CPU üretimi"""
+    cache = HypothesisCache(model_dir)
+    missing = [item for item in items if cache.get(item["path"]) is None]
+
+    if missing:
+        import torch
+        from transformers import WhisperProcessor, WhisperForConditionalGeneration
+
+        if threads:
+            torch.set_num_threads(threads)
+        processor = WhisperProcessor.from_pretrained(model_dir)
+        model = WhisperForConditionalGeneration.from_pretrained(model_dir).eval()
+
+        for start in range(0, len(missing), batch_size):
+            batch = missing[start:start + batch_size]
+            paths = [item["path"] for item in batch]
+            cache.add_many(paths, transcribe_batch(model, processor, paths))
+            print(f"🔄 {min(start + batch_size, len(missing))}/{len(missing)} kayıt çözüldü")
+
+    print(f"💾 Önbellekten: {len(items) - len(missing)}, yeni çözülen: {len(missing)}")
+    return [cache.get(item["path"]) for item in items]
+
+def score(items, hypotheses, content_type=None):
+    """Genel ve kırılımlı WER/CER raporu"""
+    content_type = content_type or ContentTypeIndex()
+    references = [normalize_text(item["text"]) for item in items]
+    hypotheses = [normalize_text(text) for text in hypotheses]
+
+    def block(indices):
+        refs = [references[i] for i in indices]
+        hyps = [hypotheses[i] for i in indices]
+        return {
+            "count": len(indices),
+            "wer": 100 * error_rate(refs, hyps, "word"),
+            "cer": 100 * error_rate(refs, hyps, "char"),
+        }
+
+    report = {"overall": block(range(len(items))), "by_content_type": {}, "by_speed": {}}
+    for group, key_function in (("by_content_type", lambda item: content_type(item["text"])),
+                                ("by_speed", lambda item: speech_speed(item["audio"]))):
+        groups = {}
+        for index, item in enumerate(items):
+            groups.setdefault(key_function(item), []).append(index)
+        report[group] = {key: block(indices) for key, indices in sorted(groups.items())}
+    return report
+
+def print_report(report):
+    overall = report["overall"]
+    print(f"\n📊 Genel: WER %{overall['wer']:.2f}  CER %{overall['cer']:.2f}  ({overall['count']} kayıt)")
+    for title, group in (("İçerik türü", "by_content_type"), ("Hız", "by_speed")):
+        print(f"\n{title}:")
+        for key, values in report[group].items():
+            print(f"   {key:<10} WER %{values['wer']:6.2f}  CER %{values['cer']:6.2f}  ({values['count']})")
+
+def evaluate_model(model_dir, manifest_path=MANIFEST_FILE, audio_path=AUDIO_PATH, batch_size=16, test_percent=10, threads=None):
+    """Test ayrımında modeli değerlendir ve raporu döndür"""
+    items = load_heldout(manifest_path, audio_path, test_percent)
+    if not items:
+        print("⚠️ Test kaydı bulunamadı")
+        return None
+    hypotheses = generate_hypotheses(model_dir, items, batch_size, threads)
+    return score(items, hypotheses, ContentTypeIndex(os.path.dirname(os.path.abspath(manifest_path))))
+
+def main():
+    parser = argparse.ArgumentParser(description="Kurmancî Whisper WER/CER değerlendirmesi")
+    parser.add_argument("--model", default="./whisper-kurdish-kurmanji-final", help="Model klasörü")
+    parser.add_argument("--manifest", default=MANIFEST_FILE)
+    parser.add_argument("--audio", default=AUDIO_PATH)
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--test-percent", type=int, default=10)
+    parser.add_argument("--threads", type=int, help="torch CPU iş parçacığı sayısı")
+    parser.add_argument("--output", help="Raporu JSON olarak kaydet")
+    args = parser.parse_args()
+
+    report = evaluate_model(args.model, args.manifest, args.audio, args.batch_size, args.test_percent, args.threads)
+    if report is None:
+        return
+    print_report(report)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n📁 Rapor kaydedildi: {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Kurmancî Whisper CPU Dışa Aktarma
+GPU'suz kayıt istasyonları için fine-tune edilmiş modelden iki CPU sürümü
+üretir:
+    <model>-int8/   torch dinamik int8 niceleme (Linear katmanları)
+    <model>-onnx/   ONNX grafiği (encoder/decoder), onnxruntime ile int8
+
+Her ikisi de load_cpu_model() ile yüklenir ve .generate() destekler.
+--benchmark, test kayıtlarında gerçek zaman oranını (RTF) ve WER'i fp32
+modelle karşılaştırır.
+
+Kullanım:
+    python whisper_export.py --model ./whisper-kurdish-kurmanji-final --benchmark
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+
+# kurmanji_core, veri seti klasörünün bulunduğu uygulama klasöründe
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from kurmanji_core.verification import QUANTIZED_WEIGHTS, load_cpu_model
+
+def export_int8(model_dir, output_dir=None):
+    """Linear katmanlarını dinamik int8'e nicele ve kaydet"""
+    import torch
+    from transformers import WhisperProcessor, WhisperForConditionalGeneration
+
+    output_dir = output_dir or model_dir.rstrip("/\\") + "-int8"
+    os.makedirs(output_dir, exist_ok=True)
+
+    model = WhisperForConditionalGeneration.from_pretrained(model_dir).eval()
+    quantized = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    # Nicelenmiş modül save_pretrained ile yazılamaz; config + state_dict saklanır
+    model.config.save_pretrained(output_dir)
+    model.generation_config.save_pretrained(output_dir)
+    WhisperProcessor.from_pretrained(model_dir).save_pretrained(output_dir)
+    torch.save(quantized.state_dict(), os.path.join(output_dir, QUANTIZED_WEIGHTS))
+
+    print(f"✅ int8 model: {output_dir}")
+    return output_dir
+
+def export_onnx(model_dir, output_dir=None, quantize=True):
+    """ONNX'e aktar (optimum gerekli) ve isteğe bağlı int8 nicele"""
+    try:
+        from optimum.onnxruntime import ORTModelForSpeechSeq2Seq
+    except ImportError:
+        print("⚠️ ONNX dışa aktarma için: pip install optimum[onnxruntime]")
+        return None
+    from transformers import WhisperProcessor
+
+    output_dir = output_dir or model_dir.rstrip("/\\") + "-onnx"
+    model = ORTModelForSpeechSeq2Seq.from_pretrained(model_dir, export=True)
+    model.save_pretrained(output_dir)
+    WhisperProcessor.from_pretrained(model_dir).save_pretrained(output_dir)
+
+    if quantize:
+        from onnxruntime.quantization import quantize_dynamic, QuantType
+        for name in os.listdir(output_dir):
+            if name.endswith(".onnx"):
+                path = os.path.join(output_dir, name)
+                quantize_dynamic(path, path + ".int8", weight_type=QuantType.QInt8)
+                os.replace(path + ".int8", path)
+
+    print(f"✅ ONNX model: {output_dir}")
+    return output_dir
+
+def export_for_cpu(model_dir):
+    """Eğitim sonrası adım: int8 ve (varsa optimum) ONNX sürümleri"""
+    return {"int8": export_int8(model_dir), "onnx": export_onnx(model_dir)}
+
+def benchmark(model_dirs, manifest_path, audio_path, batch_size=8, limit=None, threads=None):
+    """Her model için RTF (işlem süresi / ses süresi) ve WER"""
+    import librosa
+    from whisper_evaluate import ContentTypeIndex, load_heldout, transcribe_arrays, score
+
+    items = load_heldout(manifest_path, audio_path)[:limit]
+    if not items:
+        print("⚠️ Test kaydı bulunamadı")
+        return {}
+
+    results = {}
+    arrays = None
+    content_type = ContentTypeIndex(os.path.dirname(os.path.abspath(manifest_path)))
+    for label, model_dir in model_dirs.items():
+        if not model_dir:
+            continue
+        model, processor = load_cpu_model(model_dir, threads)
+        sampling_rate = processor.feature_extractor.sampling_rate
+        if arrays is None:
+            arrays = [librosa.load(item["path"], sr=sampling_rate, mono=True)[0] for item in items]
+        audio_seconds = sum(array.size for array in arrays) / sampling_rate
+
+        hypotheses = []
+        started = time.perf_counter()
+        for start in range(0, len(arrays), batch_size):
+            hypotheses.extend(transcribe_arrays(model, processor, arrays[start:start + batch_size]))
+        elapsed = time.perf_counter() - started
+
+        report = score(items, hypotheses, content_type)
+        results[label] = {
+            "rtf": elapsed / audio_seconds if audio_seconds else 0.0,
+            "seconds": elapsed,
+            "wer": report["overall"]["wer"],
+            "cer": report["overall"]["cer"],
+        }
+        print(f"⏱️ {label:<5} RTF {results[label]['rtf']:.3f}  WER %{results[label]['wer']:.2f}  CER %{results[label]['cer']:.2f}")
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Kurmancî Whisper CPU dışa aktarma ve kıyaslama")
+    parser.add_argument("--model", default="./whisper-kurdish-kurmanji-final", help="fp32 model klasörü")
+    parser.add_argument("--skip-export", action="store_true", help="Var olan -int8/-onnx klasörlerini kullan")
+    parser.add_argument("--benchmark", action="store_true", help="Test kayıtlarında RTF/WER karşılaştır")
+    parser.add_argument("--manifest", default="whisper_manifest.jsonl")
+    parser.add_argument("--audio", default="audio")
+    parser.add_argument("--limit", type=int, help="Kıyaslamada en fazla kayıt")
+    parser.add_argument("--threads", type=int)
+    parser.add_argument("--output", help="Kıyaslama sonucunu JSON olarak kaydet")
+    args = parser.parse_args()
+
+    base = args.model.rstrip("/\\")
+    if args.skip_export:
+        exported = {name: base + suffix for name, suffix in (("int8", "-int8"), ("onnx", "-onnx")) if os.path.isdir(base + suffix)}
+    else:
+        exported = export_for_cpu(args.model)
+
+    if args.benchmark:
+        results = benchmark({"fp32": args.model, **exported}, args.manifest, args.audio, limit=args.limit, threads=args.threads)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
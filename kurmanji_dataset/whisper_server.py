@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Kurmancî Whisper Yerel Transkripsiyon Sunucusu
+Fine-tune edilmiş modeli bir kez yükler ve localhost üzerinde basit bir
+HTTP API sunar. Eşzamanlı istekler dinamik batch'lerde toplanır: ilk istek
+geldikten sonra batch dolana veya gecikme bütçesi (--max-wait-ms) dolana
+kadar beklenir, sonra tek bir generate çağrısı yapılır. Yalnızca CPU.
+
+Uç noktalar:
+    POST /transcribe   gövde: WAV baytları  ->  {"text": ..., "latency_ms": ...}
+    GET  /stats        işlem hacmi ve gecikme yüzdelikleri
+
+Kullanım:
+    python whisper_server.py --model ./whisper-kurdish-kurmanji-final --port 8765
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+# kurmanji_core, veri seti klasörünün bulunduğu uygulama klasöründe
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from kurmanji_core.verification import TakeVerifier
+
+DEFAULT_MODEL = "./whisper-kurdish-kurmanji-final"
+MAX_BODY_BYTES = 50 * 1024 * 1024
+
+class ServerStats:
+    """İşlem hacmi, gecikme yüzdelikleri ve batch boyu dağılımı"""
+
+    def __init__(self, window=10000):
+        self.started = time.monotonic()
+        self.completed = 0
+        self.audio_seconds = 0.0
+        self.latencies = deque(maxlen=window)
+        self.batch_sizes = {}
+
+    def record_batch(self, size):
+        self.batch_sizes[size] = self.batch_sizes.get(size, 0) + 1
+
+    def record_request(self, latency, audio_seconds):
+        self.completed += 1
+        self.audio_seconds += audio_seconds
+        self.latencies.append(latency)
+
+    def snapshot(self):
+        elapsed = time.monotonic() - self.started
+        report = {
+            "completed": self.completed,
+            "uptime_s": round(elapsed, 1),
+            "requests_per_s": round(self.completed / elapsed, 3) if elapsed else 0.0,
+            "audio_seconds_per_s": round(self.audio_seconds / elapsed, 3) if elapsed else 0.0,
+            "batch_sizes": dict(sorted(self.batch_sizes.items())),
+        }
+        if self.latencies:
+            p50, p90, p99 = np.percentile(np.asarray(self.latencies), [50, 90, 99])
+            report["latency_ms"] = {"p50": round(p50 * 1000, 1), "p90": round(p90 * 1000, 1), "p99": round(p99 * 1000, 1)}
+        return report
+
+class DynamicBatcher:
+    """Kuyruktaki istekleri batch boyu / gecikme bütçesine göre grupla
+    
+    Whisper 30 sn'den sonrasını keser; uzun klipler (paragraf kayıtları
+    ~45 sn) TakeVerifier ile aynı şekilde 30 sn'lik pencerelere bölünür,
+    pencereler aynı generate çağrısında çözülür ve metinleri birleştirilir.
+    """
+
+    def __init__(self, model, processor, max_batch_size=8, max_wait_ms=50, stats=None):
+        self.model = model
+        self.processor = processor
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.stats = stats or ServerStats()
+        self.queue = asyncio.Queue()
+        # Model tek iş parçacığında çalışır; torch kendi içinde paralelleşir
+        self.executor = ThreadPoolExecutor(max_workers=1)
+
+    async def submit(self, array):
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((array, future, time.monotonic()))
+        return await future
+
+    async def run(self):
+        from whisper_evaluate import transcribe_arrays
+
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = batch[0][2] + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            sampling_rate = self.processor.feature_extractor.sampling_rate
+            windows, owners = [], []
+            for index, (array, _, _) in enumerate(batch):
+                parts = TakeVerifier.split_windows(array, sampling_rate)
+                windows.extend(parts)
+                owners.extend([index] * len(parts))
+            self.stats.record_batch(len(batch))
+            try:
+                window_texts = await loop.run_in_executor(self.executor, transcribe_arrays, self.model, self.processor, windows)
+            except Exception as e:
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            parts = [[] for _ in batch]
+            for index, text in zip(owners, window_texts):
+                parts[index].append(text.strip())
+            texts = [" ".join(text for text in request_parts if text) for request_parts in parts]
+
+            finished = time.monotonic()
+            for (array, future, enqueued), text in zip(batch, texts):
+                latency = finished - enqueued
+                self.stats.record_request(latency, array.size / sampling_rate)
+                if not future.done():
+                    future.set_result({"text": text.strip(), "latency_ms": round(latency * 1000, 1), "batch_size": len(batch)})
+
+def decode_wav(data, sampling_rate):
+    """WAV baytlarını modelin örnekleme hızında mono float32'ye çevir"""
+    import soundfile as sf
+
+    array, source_rate = sf.read(io.BytesIO(data), dtype="float32", always_2d=True)
+    array = array.mean(axis=1)
+    if source_rate != sampling_rate:
+        import librosa
+        array = librosa.resample(array, orig_sr=source_rate, target_sr=sampling_rate)
+    return array
+
+class TranscriptionServer:
+    """Bağımlılıksız minimal HTTP/1.1 sunucusu (asyncio streams)"""
+
+    def __init__(self, batcher, decode_workers=2):
+        self.batcher = batcher
+        # WAV okuma + librosa yeniden örnekleme event loop'u bloklamasın; model
+        # executor'ından ayrı ki çözme generate'in arkasında sıra beklemesin
+        self.decode_executor = ThreadPoolExecutor(max_workers=decode_workers, thread_name_prefix="decode")
+
+    async def handle(self, reader, writer):
+        try:
+            request_line = await reader.readline()
+            parts = request_line.decode("latin-1").split()
+            if len(parts) < 2:
+                return
+            method, path = parts[0], parts[1]
+
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                key, _, value = line.decode("latin-1").partition(":")
+                headers[key.strip().lower()] = value.strip()
+
+            if method == "GET" and path == "/stats":
+                await self.respond(writer, 200, self.batcher.stats.snapshot())
+            elif method == "POST" and path == "/transcribe":
+                try:
+                    length = int(headers.get("content-length", 0))
+                except ValueError:
+                    length = 0
+                if not 0 < length <= MAX_BODY_BYTES:
+                    await self.respond(writer, 400, {"error": "WAV gövdesi gerekli"})
+                    return
+                body = await reader.readexactly(length)
+                try:
+                    array = await asyncio.get_running_loop().run_in_executor(
+                        self.decode_executor, decode_wav, body, self.batcher.processor.feature_extractor.sampling_rate)
+                except Exception as e:
+                    await self.respond(writer, 400, {"error": f"Ses okunamadı: {e}"})
+                    return
+                try:
+                    result = await self.batcher.submit(array)
+                except Exception as e:
+                    await self.respond(writer, 500, {"error": str(e)})
+                    return
+                await self.respond(writer, 200, result)
+            else:
+                await self.respond(writer, 404, {"error": "Bulunamadı"})
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def respond(writer, status, payload):
+        reasons = {200: "OK", 400: "Bad Request", 404: "Not Found", 500: "Internal Server Error"}
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        writer.write(
+            f"HTTP/1.1 {status} {reasons[status]}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: close\r\n\r\n".encode("latin-1") + body
+        )
+        await writer.drain()
+
+def load_model(model_dir, threads=None):
+    # fp32, -int8 veya -onnx klasörlerinin hepsi desteklenir
+    from whisper_export import load_cpu_model
+    return load_cpu_model(model_dir, threads)
+
+async def serve(args):
+    model, processor = load_model(args.model, args.threads)
+    batcher = DynamicBatcher(model, processor, args.max_batch_size, args.max_wait_ms)
+    server = TranscriptionServer(batcher, args.decode_workers)
+    batch_task = asyncio.create_task(batcher.run())
+
+    tcp_server = await asyncio.start_server(server.handle, args.host, args.port)
+    print(f"🎧 Transkripsiyon sunucusu: http://{args.host}:{args.port} (batch ≤ {args.max_batch_size}, bekleme ≤ {args.max_wait_ms} ms)")
+    try:
+        async with tcp_server:
+            await tcp_server.serve_forever()
+    finally:
+        batch_task.cancel()
+        server.decode_executor.shutdown(wait=False, cancel_futures=True)
+        print(json.dumps(batcher.stats.snapshot(), ensure_ascii=False, indent=2))
+
+def main():
+    parser = argparse.ArgumentParser(description="Kurmancî Whisper yerel transkripsiyon sunucusu")
+    parser.add_argument("--model", default=DEFAULT_MODEL, help="Model klasörü")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--max-batch-size", type=int, default=8)
+    parser.add_argument("--max-wait-ms", type=float, default=50, help="İlk istekten sonra batch için en fazla bekleme")
+    parser.add_argument("--threads", type=int, help="torch CPU iş parçacığı sayısı")
+    parser.add_argument("--decode-workers", type=int, default=2, help="WAV çözme/yeniden örnekleme iş parçacıkları")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        print("\n👋 Sunucu durduruldu")
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,15 @@ Bu script, kaydedilmiş Kurmancî dataset ile Whisper modelini fine-tune eder.
 """
 
 import os
+import io
 import json
+import hashlib
+import random
+import functools
+import zlib
+import tarfile
+import argparse
+from datetime import datetime
 import torch
 from datasets import Dataset, Audio
 from transformers import (
@@ -14,17 +22,38 @@ from transformers import (
     WhisperTokenizer,
     Seq2SeqTrainingArguments,
     Seq2SeqTrainer,
-    WhisperFeatureExtractor
+    WhisperFeatureExtractor,
+    TrainerCallback
 )
 from dataclasses import dataclass
 from typing import Dict, List, Union
 import librosa
+import numpy as np
 import soundfile as sf
+from whisper_evaluate import make_compute_metrics, evaluate_model, print_report
+from whisper_export import export_for_cpu
 
 # Dataset yolu - Bu scripti kurmanji_dataset klasörüne koyun
 DATASET_PATH = "."
 AUDIO_PATH = "audio"
 MANIFEST_FILE = "whisper_manifest.jsonl"
+TRAIN_BATCH_SIZE = 8
+BASE_MODEL = "openai/whisper-small"
+OUTPUT_DIR = "./whisper-kurdish-kurmanji"
+FINAL_MODEL_DIR = "./whisper-kurdish-kurmanji-final"
+INCREMENTAL_STATE = "incremental_state.json"
+
+def entry_duration(entry, audio_file):
+    """Manifest süresi yalnızca ölçülmüşse; aksi halde WAV başlığından
+    
+    update_whisper_files her satıra 2.0 yer tutucusu yazar; gerçek süre
+    update_manifest_duration (veya birleştirme/augmentation) tarafından
+    yazıldığında satır "duration_measured" ile işaretlenir. Başlık okumak
+    ucuzdur, bu yüzden işaretsiz hiçbir değere güvenilmez.
+    """
+    if entry.get('duration_measured') and entry.get('duration'):
+        return entry['duration']
+    return sf.info(audio_file).duration
 
 class KurmanjiWhisperDataset:
     def __init__(self, manifest_path, audio_path):
@@ -42,29 +71,520 @@ class KurmanjiWhisperDataset:
                     data.append(entry)
         return data
     
-    def create_hf_dataset(self):
-        """Hugging Face Dataset oluştur"""
+    def iter_examples(self):
+        """(ses dosyası yolu, transkript, süre) üçlüleri - mevcut dosyalar için"""
+        for entry in self.data:
+            # Manifest'te iki biçim var: {"audio": ad} ve {"audio_filepath": "audio/ad"}
+            name = entry.get('audio') or entry.get('audio_filepath', '').replace('audio/', '')
+            audio_file = os.path.join(self.audio_path, name)
+            if name and os.path.exists(audio_file):
+                yield audio_file, entry['text'], entry_duration(entry, audio_file)
+    
+    def create_hf_dataset(self, sampling_rate=22050, examples=None):
+        """Hugging Face Dataset oluştur (examples verilmezse tüm manifest)"""
         # Veri hazırlığı
         audio_paths = []
         transcripts = []
+        durations = []
         
-        for entry in self.data:
-            audio_file = os.path.join(self.audio_path, entry['audio_filepath'].replace('audio/', ''))
-            if os.path.exists(audio_file):
-                audio_paths.append(audio_file)
-                transcripts.append(entry['text'])
+        for audio_file, transcript, duration in (self.iter_examples() if examples is None else examples):
+            audio_paths.append(audio_file)
+            transcripts.append(transcript)
+            durations.append(duration)
         
         # Dataset oluştur
         dataset = Dataset.from_dict({
             "audio": audio_paths,
-            "transcription": transcripts
+            "transcription": transcripts,
+            "duration": durations
         })
         
         # Audio özelliğini ekle
-        dataset = dataset.cast_column("audio", Audio(sampling_rate=22050))
+        dataset = dataset.cast_column("audio", Audio(sampling_rate=sampling_rate))
         
         return dataset
 
+class ShardedWhisperDataset(torch.utils.data.IterableDataset):
+    """Tar shard'larından (WebDataset formatı) örnekleri sırayla akış halinde oku
+    
+    Shard'lar kaydedicinin "Tar Shard Olarak Ver" dışa aktarımıyla oluşturulur.
+    Her shard baştan sona tek seferde okunur; dosya başına os.path.exists
+    çağrısı veya rastgele erişim yapılmaz. DataLoader worker'ları shard'ları
+    kendi aralarında paylaşır. split="train"/"test" verilirse örnekler ses
+    adının özetiyle (ManifestStreamingDataset.is_test) süzülür; böylece shard
+    eğitimi de değerlendirmeyle aynı test kayıtlarını dışarıda tutar.
+    """
+    
+    def __init__(self, shard_dir, processor=None, shard_names=None, sampling_rate=16000, augmentation=None,
+                 split=None, test_percent=10):
+        self.shard_dir = shard_dir
+        self.processor = processor
+        self.augmentation = augmentation
+        self.split = split
+        self.test_percent = test_percent
+        self.sampling_rate = processor.feature_extractor.sampling_rate if processor else sampling_rate
+        
+        with open(os.path.join(shard_dir, "shards.json"), 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        counts = {shard["name"]: shard["count"] for shard in index["shards"]}
+        self.shards = list(shard_names) if shard_names else list(counts)
+        self.num_samples = sum(counts[name] for name in self.shards)
+        if split is not None:
+            self.num_samples = sum(
+                1 for name in self.shards for audio_name in self.audio_names(name) if self.in_split(audio_name)
+            )
+    
+    def __len__(self):
+        return self.num_samples
+    
+    def audio_names(self, shard_name):
+        """Shard'daki ses adları - yalnızca tar başlıkları okunur (veri atlanır)"""
+        with tarfile.open(os.path.join(self.shard_dir, shard_name), "r:") as tar:
+            return [member.name for member in tar.getmembers() if member.name.endswith(".wav")]
+    
+    def in_split(self, audio_name):
+        if self.split is None:
+            return True
+        return ManifestStreamingDataset.is_test(audio_name, self.test_percent) == (self.split == "test")
+    
+    def __iter__(self):
+        worker = torch.utils.data.get_worker_info()
+        shards = self.shards if worker is None else self.shards[worker.id::worker.num_workers]
+        
+        for name in shards:
+            # "r|" = sıralı akış modu, geri sarma yok
+            with tarfile.open(os.path.join(self.shard_dir, name), "r|") as tar:
+                pending = {}
+                for member in tar:
+                    if not member.isfile():
+                        continue
+                    key, ext = os.path.splitext(member.name)
+                    if not self.in_split(key + ".wav"):
+                        continue
+                    sample = pending.setdefault(key, {})
+                    sample[ext] = tar.extractfile(member).read()
+                    if ".wav" in sample and ".json" in sample:
+                        del pending[key]
+                        yield self.decode(sample)
+    
+    def decode(self, sample):
+        """Shard örneğini Whisper girdisine dönüştür"""
+        metadata = json.loads(sample[".json"].decode("utf-8"))
+        array, sampling_rate = sf.read(io.BytesIO(sample[".wav"]), dtype="float32")
+        if array.ndim > 1:
+            array = array.mean(axis=1)
+        if sampling_rate != self.sampling_rate:
+            array = librosa.resample(array, orig_sr=sampling_rate, target_sr=self.sampling_rate)
+        if self.augmentation is not None:
+            array = self.augmentation(array, key=metadata.get("audio"))
+        
+        example = {
+            "audio": {"array": array, "sampling_rate": self.sampling_rate},
+            "transcription": metadata["text"],
+        }
+        if self.processor is not None:
+            return prepare_dataset(example, self.processor)
+        return example
+
+class ManifestStreamingDataset(torch.utils.data.IterableDataset):
+    """whisper_manifest.jsonl'yi satır satır okuyan akış veri seti
+    
+    Manifest belleğe alınmaz; her satır ses adının özetine (crc32) göre
+    tek bir (host, worker) yuvasına düşer, ses yalnızca o yuvada ve
+    okunduğu anda çözülür. Eğitim/test ayrımı da özetle yapılır.
+    Her yuva son verdiği satırın bayt ofsetini state_dir'e yazar;
+    resume=True iken her yuva kendi ofsetine seek eder. DataLoader ön
+    belleğindeki birkaç batch yeniden görülebilir (en az bir kez).
+    
+    Çoklu GPU: Trainer/accelerate IterableDataset'i süreçler arasında
+    kendisi böler (dispatch_batches=False -> IterableDatasetShard, her
+    süreç batch'lerin 1/N'ini alır). Veri iki kez bölünmesin diye
+    Trainer ile kullanırken rank=0, world_size=1 verilir ve yalnızca
+    accelerate'in bölmesi kullanılır. RANK/WORLD_SIZE ortam değişkenleri
+    yalnızca accelerate olmadan kurulan kendi döngüler içindir.
+    """
+    
+    STATE_EVERY = 100
+    
+    def __init__(self, manifest_path, audio_path, processor=None, split=None, test_percent=10,
+                 augmentation=None, state_dir=None, resume=False, rank=None, world_size=None):
+        self.manifest_path = manifest_path
+        self.audio_path = audio_path
+        self.processor = processor
+        self.sampling_rate = processor.feature_extractor.sampling_rate if processor else 16000
+        self.split = split
+        self.test_percent = test_percent
+        self.augmentation = augmentation
+        self.state_dir = state_dir
+        self.resume = resume
+        self.rank = int(os.environ.get("RANK", 0)) if rank is None else rank
+        self.world_size = int(os.environ.get("WORLD_SIZE", 1)) if world_size is None else world_size
+    
+    @staticmethod
+    def entry_audio_name(entry):
+        return entry.get("audio") or entry.get("audio_filepath", "").replace("audio/", "")
+    
+    @staticmethod
+    def is_test(name, test_percent=10):
+        """Tek eğitim/test ayrımı: tüm eğitim yolları ve whisper_evaluate bunu kullanır"""
+        return zlib.crc32(f"split:{name}".encode("utf-8")) % 100 < test_percent
+    
+    def in_split(self, name):
+        if self.split is None:
+            return True
+        return self.is_test(name, self.test_percent) == (self.split == "test")
+    
+    def _slot(self):
+        worker = torch.utils.data.get_worker_info()
+        worker_id, num_workers = (worker.id, worker.num_workers) if worker is not None else (0, 1)
+        return self.rank * num_workers + worker_id, self.world_size * num_workers
+    
+    def _state_path(self, slot, total):
+        return os.path.join(self.state_dir, f"stream_{self.split or 'all'}_{slot}of{total}.json")
+    
+    def saved_offset(self, slot, total):
+        if not (self.resume and self.state_dir):
+            return 0
+        path = self._state_path(slot, total)
+        if not os.path.exists(path):
+            return 0
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f).get("offset", 0)
+    
+    def save_offset(self, slot, total, offset):
+        if not self.state_dir:
+            return
+        os.makedirs(self.state_dir, exist_ok=True)
+        path = self._state_path(slot, total)
+        with open(path + ".tmp", 'w', encoding='utf-8') as f:
+            json.dump({"offset": offset}, f)
+        os.replace(path + ".tmp", path)
+    
+    def __iter__(self):
+        slot, total = self._slot()
+        yielded = 0
+        with open(self.manifest_path, 'rb') as f:
+            f.seek(self.saved_offset(slot, total))
+            for line in iter(f.readline, b''):
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                name = self.entry_audio_name(entry)
+                if not name or zlib.crc32(name.encode("utf-8")) % total != slot or not self.in_split(name):
+                    continue
+                audio_file = os.path.join(self.audio_path, name)
+                if not os.path.exists(audio_file):
+                    continue
+                yield self.decode(audio_file, entry, name)
+                yielded += 1
+                if yielded % self.STATE_EVERY == 0:
+                    self.save_offset(slot, total, f.tell())
+        # Dosya sonu: bir sonraki geçiş baştan başlar
+        self.save_offset(slot, total, 0)
+    
+    def decode(self, audio_file, entry, name):
+        array, sampling_rate = sf.read(audio_file, dtype="float32", always_2d=True)
+        array = array.mean(axis=1)
+        if sampling_rate != self.sampling_rate:
+            array = librosa.resample(array, orig_sr=sampling_rate, target_sr=self.sampling_rate)
+        if self.augmentation is not None:
+            array = self.augmentation(array, key=name)
+        example = {
+            "audio": {"array": array, "sampling_rate": self.sampling_rate},
+            "transcription": entry["text"],
+        }
+        if self.processor is not None:
+            return prepare_dataset(example, self.processor)
+        return example
+
+def split_name(test_percent=10):
+    """Artımlı durum dosyasına yazılan ayrım kimliği"""
+    return f"crc32:{test_percent}"
+
+def split_examples(examples, test_percent=10):
+    """(ses yolu, metin, süre) örneklerini özet ayrımıyla (train, test) olarak böl
+    
+    Son değerlendirme (whisper_evaluate.load_heldout) aynı ayrımı kullanır;
+    rastgele bölme test kayıtlarını eğitime sızdırıp WER/CER'i şişirirdi.
+    """
+    train, test = [], []
+    for example in examples:
+        name = os.path.basename(example[0])
+        (test if ManifestStreamingDataset.is_test(name, test_percent) else train).append(example)
+    return train, test
+
+class SpeechAugmentation:
+    """Yükleme anında örnek başına rastgele hız / gürültü / kazanç pertürbasyonu
+    
+    Diske kopya yazılmaz; her epoch farklı varyant görülür: DataLoader her
+    epoch worker'lara yeni bir torch tohumu (torch.initial_seed) verir ve bu
+    tohum rastgelelik kaynağına katılır, yani yeniden kurulan worker'lar
+    aynı pertürbasyon dizisini tekrarlamaz. Gürültü bankası
+    her worker sürecinde bir kez oluşturulur (veya noise_dir'deki wav'lardan
+    okunur) ve rastgele ofsetlerden dilimlenir. Uygulanan parametreler
+    worker başına bir jsonl dosyasına yazılır.
+    """
+    
+    def __init__(self, sampling_rate=16000, speed_factors=(0.9, 1.0, 1.1), gain_db=(-6.0, 6.0),
+                 snr_db=(15.0, 40.0), noise_prob=0.5, noise_dir=None, noise_bank_seconds=60,
+                 seed=0, log_dir=None):
+        self.sampling_rate = sampling_rate
+        self.speed_factors = np.asarray(speed_factors, dtype=np.float32)
+        self.gain_db = gain_db
+        self.snr_db = snr_db
+        self.noise_prob = noise_prob
+        self.noise_dir = noise_dir
+        self.noise_bank_seconds = noise_bank_seconds
+        self.seed = seed
+        self.log_dir = log_dir
+        # Worker sürecinde tembel olarak oluşturulur (pickle edilmez)
+        self._state = None
+    
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_state"] = None
+        return state
+    
+    def _worker_state(self):
+        worker = torch.utils.data.get_worker_info()
+        worker_id = worker.id if worker is not None else 0
+        if self._state is None or self._state["pid"] != os.getpid():
+            log_file = None
+            if self.log_dir:
+                os.makedirs(self.log_dir, exist_ok=True)
+                log_file = open(os.path.join(self.log_dir, f"augmentation_log.w{worker_id}.{os.getpid()}.jsonl"), "a", encoding="utf-8")
+            self._state = {
+                "pid": os.getpid(),
+                "worker": worker_id,
+                # Worker'da initial_seed = DataLoader'ın epoch başına çektiği taban + worker id
+                "rng": np.random.default_rng([self.seed, worker_id, torch.initial_seed() % 2 ** 32]),
+                "noise": self._build_noise_bank(np.random.default_rng([self.seed, 10_000 + worker_id])),
+                "count": 0,
+                "log": log_file,
+            }
+        return self._state
+    
+    def _build_noise_bank(self, rng):
+        """Gürültü bankası: noise_dir wav'ları veya beyaz + pembe sentetik gürültü"""
+        clips = []
+        if self.noise_dir and os.path.isdir(self.noise_dir):
+            for name in sorted(os.listdir(self.noise_dir)):
+                if name.lower().endswith(".wav"):
+                    clip, sr = sf.read(os.path.join(self.noise_dir, name), dtype="float32", always_2d=True)
+                    clip = clip.mean(axis=1)
+                    if sr != self.sampling_rate:
+                        clip = librosa.resample(clip, orig_sr=sr, target_sr=self.sampling_rate)
+                    clips.append(clip)
+        if not clips:
+            length = int(self.noise_bank_seconds * self.sampling_rate)
+            white = rng.standard_normal(length).astype(np.float32)
+            # 1/f spektrum ile pembe gürültü
+            spectrum = np.fft.rfft(rng.standard_normal(length))
+            spectrum /= np.sqrt(np.maximum(np.arange(spectrum.size), 1))
+            pink = np.fft.irfft(spectrum, n=length).astype(np.float32)
+            clips = [white, pink]
+        return [clip / (np.sqrt(np.mean(clip * clip)) + 1e-8) for clip in clips]
+    
+    def __call__(self, array, key=None):
+        """array: mono float32; pertürbe edilmiş kopyayı döndürür"""
+        state = self._worker_state()
+        rng = state["rng"]
+        params = {"worker": state["worker"], "index": state["count"], "key": key}
+        state["count"] += 1
+        
+        # Hız: doğrusal enterpolasyonla yeniden örnekleme (perde + tempo)
+        speed = float(self.speed_factors[rng.integers(self.speed_factors.size)])
+        if speed != 1.0 and array.size > 1:
+            positions = np.arange(0, array.size - 1, speed, dtype=np.float32)
+            array = np.interp(positions, np.arange(array.size, dtype=np.float32), array).astype(np.float32)
+        params["speed"] = speed
+        
+        gain_db = float(rng.uniform(*self.gain_db))
+        array = array * np.float32(10.0 ** (gain_db / 20.0))
+        params["gain_db"] = round(gain_db, 2)
+        
+        if array.size and rng.random() < self.noise_prob:
+            bank_index = int(rng.integers(len(state["noise"])))
+            noise = state["noise"][bank_index]
+            offset = int(rng.integers(max(noise.size - array.size, 1)))
+            segment = np.resize(noise[offset:offset + array.size], array.size)
+            snr_db = float(rng.uniform(*self.snr_db))
+            signal_rms = np.sqrt(np.mean(array * array)) + 1e-8
+            array = array + segment * np.float32(signal_rms / (10.0 ** (snr_db / 20.0)))
+            params.update(noise_bank=bank_index, noise_offset=offset, snr_db=round(snr_db, 2))
+        
+        peak = np.max(np.abs(array)) if array.size else 0.0
+        if peak > 1.0:
+            array = array / peak
+        
+        if state["log"] is not None:
+            state["log"].write(json.dumps(params, ensure_ascii=False) + "\n")
+            state["log"].flush()
+        return array.astype(np.float32)
+
+def make_augmented_transform(processor, augmentation):
+    """HF Dataset.set_transform için: batch başına tembel augmentation + özellik çıkarımı"""
+    def transform(batch):
+        features, labels = [], []
+        for audio, transcription in zip(batch["audio"], batch["transcription"]):
+            array = np.asarray(audio["array"], dtype=np.float32)
+            array = augmentation(array, key=os.path.basename(audio.get("path") or ""))
+            example = prepare_dataset(
+                {"audio": {"array": array, "sampling_rate": audio["sampling_rate"]}, "transcription": transcription},
+                processor
+            )
+            features.append(example["input_features"])
+            labels.append(example["labels"])
+        return {"input_features": features, "labels": labels}
+    return transform
+
+class FeatureCache:
+    """Kalıcı log-mel özellik önbelleği
+    
+    Özellikler float16 olarak tek bir ikili dosyaya (features.f16) ardışık
+    yazılır; index.json her ses özetinin (sha1) ofsetini ve şeklini tutar.
+    Klasör, feature extractor ayarlarının özetiyle ayrılır; ayarlar
+    değişirse önbellek baştan kurulur. Dosya boyutu/mtime değişmeyen
+    kayıtlar yeniden özetlenmez, yalnızca yeni veya değişen kayıtlar için
+    özellik hesaplanır. Okuma np.memmap üzerinden kopyasızdır.
+    """
+    
+    DATA_FILE = "features.f16"
+    INDEX_FILE = "index.json"
+    SAVE_EVERY = 200
+    
+    def __init__(self, cache_root, feature_extractor):
+        self.feature_extractor = feature_extractor
+        self.config_hash = self.extractor_hash(feature_extractor)
+        self.cache_dir = os.path.join(cache_root, self.config_hash)
+        self.data_path = os.path.join(self.cache_dir, self.DATA_FILE)
+        self.index_path = os.path.join(self.cache_dir, self.INDEX_FILE)
+        self.index = self.load_index()
+        self._memmap = None
+    
+    @staticmethod
+    def extractor_hash(feature_extractor):
+        config = {
+            "class": type(feature_extractor).__name__,
+            **{key: getattr(feature_extractor, key, None) for key in (
+                "feature_size", "sampling_rate", "hop_length", "chunk_length",
+                "n_fft", "n_samples", "padding_value"
+            )}
+        }
+        return hashlib.sha1(json.dumps(config, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+    
+    def load_index(self):
+        index = {"features": {}, "files": {}}
+        if os.path.exists(self.index_path):
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        # Yarım kalmış yazımdan sonra dosya sonunu aşan kayıtları at
+        data_size = os.path.getsize(self.data_path) // 2 if os.path.exists(self.data_path) else 0
+        index["features"] = {
+            key: item for key, item in index["features"].items()
+            if item["offset"] + int(np.prod(item["shape"])) <= data_size
+        }
+        return index
+    
+    def save_index(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temp_path = self.index_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.index, f)
+        os.replace(temp_path, self.index_path)
+    
+    def audio_hash(self, audio_file):
+        """Ses dosyası özeti; boyut ve mtime değişmediyse önceki özet kullanılır"""
+        stat = os.stat(audio_file)
+        known = self.index["files"].get(audio_file)
+        if known and known[0] == stat.st_size and known[1] == stat.st_mtime_ns:
+            return known[2]
+        digest = hashlib.sha1()
+        with open(audio_file, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        self.index["files"][audio_file] = [stat.st_size, stat.st_mtime_ns, digest.hexdigest()]
+        return digest.hexdigest()
+    
+    def compute(self, audio_file):
+        array, _ = librosa.load(audio_file, sr=self.feature_extractor.sampling_rate, mono=True)
+        return self.feature_extractor(
+            array, sampling_rate=self.feature_extractor.sampling_rate, return_tensors="np"
+        ).input_features[0]
+    
+    def build(self, audio_files):
+        """Eksik özellikleri hesapla; dosya başına özet listesini döndür"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        keys, computed = [], 0
+        with open(self.data_path, 'ab') as data:
+            offset = data.tell() // 2
+            for audio_file in audio_files:
+                key = self.audio_hash(audio_file)
+                keys.append(key)
+                if key in self.index["features"]:
+                    continue
+                features = np.ascontiguousarray(self.compute(audio_file), dtype=np.float16)
+                data.write(features.tobytes())
+                self.index["features"][key] = {"offset": offset, "shape": list(features.shape)}
+                offset += features.size
+                computed += 1
+                if computed % self.SAVE_EVERY == 0:
+                    data.flush()
+                    self.save_index()
+        self.save_index()
+        self._memmap = None
+        print(f"💾 Özellik önbelleği: {len(keys) - computed} hazır, {computed} yeni hesaplandı")
+        return keys
+    
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_memmap"] = None
+        return state
+    
+    def get(self, key):
+        """Önbellekteki özelliklerin kopyasız float16 görünümü"""
+        if self._memmap is None:
+            self._memmap = np.memmap(self.data_path, dtype=np.float16, mode='r')
+        item = self.index["features"][key]
+        size = int(np.prod(item["shape"]))
+        return self._memmap[item["offset"]:item["offset"] + size].reshape(item["shape"])
+
+class CachedFeatureDataset(torch.utils.data.Dataset):
+    """Önbellekteki log-mel özelliklerinden okuyan eğitim veri seti"""
+    
+    def __init__(self, cache, keys, labels, durations=None):
+        self.cache = cache
+        self.keys = keys
+        self.labels = labels
+        self.durations = durations
+    
+    def __len__(self):
+        return len(self.keys)
+    
+    def __getitem__(self, index):
+        return {"input_features": self.cache.get(self.keys[index]), "labels": self.labels[index]}
+
+def load_cached_datasets(dataset_loader, processor, cache_root, augmentation=None, test_percent=10):
+    """Özellik önbelleğiyle eğitim/test veri setleri (augmentation varsa eğitim tarafı canlı hesaplanır)"""
+    train, test = split_examples(dataset_loader.iter_examples(), test_percent)
+    splits = {"test": test, "train": train}
+    
+    cache = FeatureCache(cache_root, processor.feature_extractor)
+    datasets = {}
+    for split, split_items in splits.items():
+        audio_files = [example[0] for example in split_items]
+        transcripts = [example[1] for example in split_items]
+        durations = [example[2] for example in split_items]
+        if split == "train" and augmentation is not None:
+            dataset = Dataset.from_dict({"audio": audio_files, "transcription": transcripts, "duration": durations})
+            dataset = dataset.cast_column("audio", Audio(sampling_rate=processor.feature_extractor.sampling_rate))
+            dataset.set_transform(make_augmented_transform(processor, augmentation))
+        else:
+            labels = processor.tokenizer(transcripts).input_ids if transcripts else []
+            dataset = CachedFeatureDataset(cache, cache.build(audio_files), labels, durations)
+        datasets[split] = dataset
+    return datasets["train"], datasets["test"]
+
 @dataclass
 class DataCollatorSpeechSeq2SeqWithPadding:
     """Whisper için özel data collator"""
@@ -75,6 +595,8 @@ class DataCollatorSpeechSeq2SeqWithPadding:
         # Audio özelliklerini ayır
         input_features = [{"input_features": feature["input_features"]} for feature in features]
         batch = self.processor.feature_extractor.pad(input_features, return_tensors="pt")
+        # Önbellekten gelen float16 özellikler modele float32 girer
+        batch["input_features"] = batch["input_features"].float()
 
         # Etiketleri ayır  
         label_features = [{"input_ids": feature["labels"]} for feature in features]
@@ -110,38 +632,436 @@ def prepare_dataset(batch, processor):
         "labels": labels,
     }
 
+class DurationBucketSampler(torch.utils.data.Sampler):
+    """Süreye göre kovalanmış batch sampler
+    
+    Örnekler süre sınırlarına (saniye) göre kovalara ayrılır, her kova
+    kendi içinde karıştırılıp batch'lere bölünür, sonra batch sırası
+    karıştırılır. Böylece tek kelimelik klipler ile uzun paragraflar aynı
+    batch'e düşmez; etiketler ve decoder adımları en uzun üyeye göre
+    doldurulduğu için boşa giden hesap azalır. Her __iter__ yeni bir epoch
+    sayılır ve karıştırma (seed, epoch) ile belirlenir.
+    """
+    
+    def __init__(self, durations, batch_size, boundaries=(1.0, 3.0, 8.0, 15.0, 30.0), shuffle=True, seed=42, drop_last=False):
+        self.durations = np.asarray(durations, dtype=np.float32)
+        self.batch_size = batch_size
+        self.boundaries = sorted(boundaries)
+        self.shuffle = shuffle
+        self.seed = seed
+        self.drop_last = drop_last
+        self.epoch = 0
+        bucket_ids = np.searchsorted(self.boundaries, self.durations, side="left")
+        self.buckets = [np.flatnonzero(bucket_ids == bucket) for bucket in range(len(self.boundaries) + 1)]
+    
+    def set_epoch(self, epoch):
+        self.epoch = epoch
+    
+    def batches(self, epoch=None):
+        rng = np.random.default_rng([self.seed, self.epoch if epoch is None else epoch])
+        batches = []
+        for bucket in self.buckets:
+            indices = rng.permutation(bucket) if self.shuffle else bucket
+            for start in range(0, len(indices), self.batch_size):
+                batch = indices[start:start + self.batch_size]
+                if self.drop_last and len(batch) < self.batch_size:
+                    continue
+                batches.append(batch.tolist())
+        if self.shuffle:
+            batches = [batches[i] for i in rng.permutation(len(batches))]
+        return batches
+    
+    def __iter__(self):
+        batches = self.batches()
+        self.epoch += 1
+        return iter(batches)
+    
+    def __len__(self):
+        if self.drop_last:
+            return sum(len(bucket) // self.batch_size for bucket in self.buckets)
+        return sum(-(-len(bucket) // self.batch_size) for bucket in self.buckets)
+    
+    @staticmethod
+    def padding_efficiency(lengths, batches):
+        """Gerçek içerik / (batch başına en uzun * batch boyu)"""
+        lengths = np.asarray(lengths, dtype=np.float64)
+        used = sum(lengths[batch].sum() for batch in batches)
+        padded = sum(lengths[batch].max() * len(batch) for batch in batches if len(batch))
+        return float(used / padded) if padded else 1.0
+    
+    def padding_report(self, label_lengths):
+        """Kovalı ve rastgele batch'leme için etiket (token) doldurma verimliliği
+        
+        Ses tarafı ölçülmez: Whisper feature extractor her girdiyi 30 sn'ye
+        tamamlar, kovalamanın kazancı etiket/decoder adımlarındadır.
+        """
+        bucketed = self.batches(epoch=0)
+        order = np.random.default_rng(self.seed).permutation(len(self.durations))
+        random_batches = [order[i:i + self.batch_size].tolist() for i in range(0, len(order), self.batch_size)]
+        return {
+            "buckets": [len(bucket) for bucket in self.buckets],
+            "labels_bucketed": self.padding_efficiency(label_lengths, bucketed),
+            "labels_random": self.padding_efficiency(label_lengths, random_batches),
+        }
+
+class BucketedSeq2SeqTrainer(Seq2SeqTrainer):
+    """Eğitim DataLoader'ını DurationBucketSampler ile kuran Trainer"""
+    
+    def __init__(self, *args, bucket_sampler=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.bucket_sampler = bucket_sampler
+    
+    def get_train_dataloader(self):
+        if self.bucket_sampler is None:
+            return super().get_train_dataloader()
+        dataloader = torch.utils.data.DataLoader(
+            self.train_dataset,
+            batch_sampler=self.bucket_sampler,
+            collate_fn=self.data_collator,
+            num_workers=self.args.dataloader_num_workers,
+            pin_memory=self.args.dataloader_pin_memory,
+        )
+        return self.accelerator.prepare(dataloader) if hasattr(self, "accelerator") else dataloader
+
+def print_padding_report(report):
+    print(f"🪣 Kova dağılımı: {report['buckets']}")
+    print(f"   Etiket (token) doldurma verimi: %{report['labels_bucketed'] * 100:.1f} (rastgele: %{report['labels_random'] * 100:.1f})")
+
+def dataset_label_lengths(dataset, tokenizer):
+    """Eğitim örneği başına etiket uzunluğu - her veri seti yolunda
+    
+    Önbellek veri seti etiketleri kendisi tutar; map ile hazırlanmış HF
+    Dataset'te "labels" sütunu okunur. set_transform (augmentation) ile
+    ses her okumada çözüleceği için dönüşümsüz kopyadaki transkriptler
+    tokenize edilir.
+    """
+    if isinstance(dataset, CachedFeatureDataset):
+        return [len(labels) for labels in dataset.labels]
+    if "labels" in dataset.column_names:
+        return [len(labels) for labels in dataset["labels"]]
+    transcripts = dataset.with_format(None)["transcription"]
+    return [len(labels) for labels in tokenizer(transcripts).input_ids]
+
+# Süreç başına etiket önbelleği: aynı transkript bir kez tokenize edilir
+_LABEL_CACHE = {}
+
+def prepare_dataset_batched(batch, processor):
+    """Batch'li hazırlama - Dataset.map(batched=True, num_proc=N) için
+    
+    Feature extractor tüm batch için tek çağrıda NumPy çıktı üretir
+    (örnek başına tensör oluşturup [0] indekslemek yok). Tekrarlanan
+    transkriptler (aynı kelimenin yavaş/normal/hızlı kayıtları gibi) süreç
+    içinde önbellekten etiketlenir.
+    """
+    sampling_rate = processor.feature_extractor.sampling_rate
+    arrays = []
+    for audio in batch["audio"]:
+        array = np.asarray(audio["array"], dtype=np.float32)
+        if audio["sampling_rate"] != sampling_rate:
+            array = librosa.resample(array, orig_sr=audio["sampling_rate"], target_sr=sampling_rate)
+        arrays.append(array)
+    input_features = processor.feature_extractor(
+        arrays, sampling_rate=sampling_rate, return_tensors="np"
+    ).input_features
+    
+    missing = sorted({text for text in batch["transcription"] if text not in _LABEL_CACHE})
+    if missing:
+        for text, ids in zip(missing, processor.tokenizer(missing).input_ids):
+            _LABEL_CACHE[text] = ids
+    
+    return {
+        "input_features": list(input_features),
+        "labels": [_LABEL_CACHE[text] for text in batch["transcription"]],
+    }
+
+def data_fingerprint(audio_files):
+    """Eğitim verisinin özeti (ad, boyut, mtime)"""
+    digest = hashlib.sha1()
+    for audio_file in sorted(audio_files):
+        stat = os.stat(audio_file)
+        digest.update(f"{os.path.basename(audio_file)}|{stat.st_size}|{stat.st_mtime_ns}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+def load_incremental_state(model_dir):
+    path = os.path.join(model_dir, INCREMENTAL_STATE)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_incremental_state(model_dir, state):
+    os.makedirs(model_dir, exist_ok=True)
+    with open(os.path.join(model_dir, INCREMENTAL_STATE), 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+
+def find_incremental_base():
+    """En son kaydedilen model: son checkpoint veya final klasörü (hangisi yeniyse)"""
+    from transformers.trainer_utils import get_last_checkpoint
+    
+    candidates = []
+    if os.path.isdir(OUTPUT_DIR):
+        checkpoint = get_last_checkpoint(OUTPUT_DIR)
+        if checkpoint:
+            candidates.append(checkpoint)
+    if os.path.exists(os.path.join(FINAL_MODEL_DIR, "config.json")):
+        candidates.append(FINAL_MODEL_DIR)
+    candidates = [path for path in candidates if load_incremental_state(path)]
+    if not candidates:
+        return None, None
+    latest = max(candidates, key=lambda path: os.path.getmtime(os.path.join(path, INCREMENTAL_STATE)))
+    return latest, load_incremental_state(latest)
+
+def select_incremental_examples(examples, state, replay_ratio=0.3, min_replay=32, test_percent=10, seed=42):
+    """Önceki çalışmaların eğitmediği kayıtlar + eski verilerden tekrar örneği
+    
+    Yenilik mtime'a değil, durum dosyasındaki eğitilmiş dosya adları kümesine
+    bakılarak belirlenir: merge/convert'in copy2 ile kopyaladığı (eski mtime'lı)
+    dosyalar da yeni sayılır. Yalnızca watermark_ns içeren eski durum dosyaları
+    için mtime filigranına geri dönülür.
+    Test kayıtları, tam eğitimle ve değerlendirmeyle aynı özet ayrımından
+    (split_examples) gelir; eğitime hiç girmez, değerlendirme için döner.
+    """
+    trained = set(state["trained_audio"]) if state and "trained_audio" in state else None
+    watermark = state["watermark_ns"] if state else -1
+    if state and state.get("split") != split_name(test_percent):
+        # Önceki çalışma başka (ör. rastgele) ayrımla eğitti: test kayıtlarının bir kısmı görülmüş olabilir
+        print("⚠️ Önceki durum farklı bir eğitim/test ayrımıyla kaydedilmiş; test sonuçları iyimser olabilir")
+    train, test = split_examples(examples, test_percent)
+    new, old = [], []
+    for example in train:
+        name = os.path.basename(example[0])
+        if (name not in trained) if trained is not None else (os.stat(example[0]).st_mtime_ns > watermark):
+            new.append(example)
+        else:
+            old.append(example)
+    
+    replay_count = min(len(old), max(min_replay, int(len(new) * replay_ratio))) if new else 0
+    replay = random.Random(seed).sample(old, replay_count)
+    return new, replay, test
+
+def manifest_train_files(manifest_path, audio_path, test_percent=10):
+    """Ayrımın eğitim tarafındaki ses yolları, manifest satır satır okunarak
+    
+    Süre için ses başlığı okunmaz ve manifest girdileri belleğe alınmaz;
+    yalnızca ad listesi tutulur (akış modu için).
+    """
+    files, seen = [], set()
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            name = ManifestStreamingDataset.entry_audio_name(json.loads(line))
+            if not name or name in seen or ManifestStreamingDataset.is_test(name, test_percent):
+                continue
+            seen.add(name)
+            audio_file = os.path.join(audio_path, name)
+            if os.path.exists(audio_file):
+                files.append(audio_file)
+    return files
+
+def build_incremental_state(trained_files, base_model, previous_state):
+    """Bir sonraki artımlı çalışma için eğitilmiş dosyalar ve veri özeti"""
+    state = {
+        "watermark_ns": max((os.stat(path).st_mtime_ns for path in trained_files), default=-1),
+        "data_fingerprint": data_fingerprint(trained_files),
+        "base_model": base_model,
+        "previous_fingerprint": previous_state["data_fingerprint"] if previous_state else None,
+        "examples": len(trained_files),
+        "trained_audio": sorted(os.path.basename(path) for path in trained_files),
+        "split": split_name(),
+    }
+    state["watermark"] = datetime.fromtimestamp(state["watermark_ns"] / 1e9).isoformat() if trained_files else None
+    return state
+
+class IncrementalStateCallback(TrainerCallback):
+    """Her checkpoint'e eğitilmiş dosyaları ve veri özetini yaz
+    
+    Durum ilk kayıtta bir kez hesaplanır; böylece eğitim başlamadan önce
+    manifest taranmaz (akış modu sabit bellekle başlar).
+    """
+    
+    def __init__(self, build_state):
+        self.build_state = build_state
+        self._state = None
+    
+    @property
+    def state(self):
+        if self._state is None:
+            self._state = self.build_state()
+        return self._state
+    
+    def on_save(self, args, state, control, **kwargs):
+        save_incremental_state(os.path.join(args.output_dir, f"checkpoint-{state.global_step}"), self.state)
+
+def parse_args():
+    """Komut satırı seçenekleri"""
+    parser = argparse.ArgumentParser(description="Kurmancî Whisper fine-tuning")
+    parser.add_argument("--shards", help="Tar shard klasörü (shards.json içeren); verilirse manifest yerine shard'lardan akış yapılır")
+    parser.add_argument("--dataloader-workers", type=int, default=0, help="DataLoader worker sayısı")
+    parser.add_argument("--augment", action="store_true", help="Eğitim örneklerine yükleme anında hız/gürültü/kazanç augmentation uygula")
+    parser.add_argument("--noise-dir", help="Augmentation gürültü bankası için wav klasörü (yoksa sentetik gürültü)")
+    parser.add_argument("--augment-seed", type=int, default=0, help="Augmentation rastgelelik tohumu")
+    parser.add_argument("--bucket-by-duration", action="store_true", help="Eğitim batch'lerini süreye göre kovala")
+    parser.add_argument("--bucket-boundaries", default="1,3,8,15,30", help="Kova sınırları (saniye, virgülle)")
+    parser.add_argument("--incremental", action="store_true", help="Son checkpoint'ten devam et; yalnızca henüz eğitilmemiş kayıtlar + tekrar örneği")
+    parser.add_argument("--replay-ratio", type=float, default=0.3, help="Artımlı modda yeni kayıt başına eski kayıt oranı")
+    parser.add_argument("--incremental-epochs", type=float, default=3.0, help="Artımlı modda seçilen veri üzerinde epoch sayısı")
+    parser.add_argument("--no-cpu-export", action="store_true", help="Eğitim sonrası int8/ONNX CPU dışa aktarmayı atla")
+    parser.add_argument("--stream", action="store_true", help="Manifest'i belleğe almadan satır satır akış halinde oku")
+    parser.add_argument("--resume-stream", action="store_true", help="Akışı kaydedilmiş ofsetlerden sürdür")
+    parser.add_argument("--prep-workers", type=int, default=os.cpu_count() or 1, help="Dataset hazırlama süreç sayısı")
+    parser.add_argument("--prep-batch-size", type=int, default=64, help="Hazırlama çağrısı başına örnek sayısı")
+    parser.add_argument("--feature-cache", help="Log-mel özellik önbelleği klasörü (ör. feature_cache); yalnızca yeni/değişen kayıtlar hesaplanır")
+    return parser.parse_args()
+
+def load_sharded_datasets(shard_dir, processor, augmentation=None):
+    """Shard'lardan eğitim/test - her iki taraf tüm shard'ları okur, özet ayrımıyla süzer"""
+    train_dataset = ShardedWhisperDataset(shard_dir, processor, augmentation=augmentation, split="train")
+    eval_dataset = ShardedWhisperDataset(shard_dir, processor, split="test")
+    return train_dataset, eval_dataset
+
 def main():
     """Ana eğitim fonksiyonu"""
+    args = parse_args()
     print("🚀 Kurmancî Whisper Fine-tuning başlatılıyor...")
     
     # Model ve processor yükle
-    model_name = "openai/whisper-small"  # Küçük model ile başla
-    processor = WhisperProcessor.from_pretrained(model_name, language="ku", task="transcribe")
+    model_name = BASE_MODEL  # Küçük model ile başla
+    previous_state = None
+    if args.incremental:
+        base_dir, previous_state = find_incremental_base()
+        if base_dir:
+            model_name = base_dir
+            print(f"♻️ Artımlı eğitim: {base_dir} (önceki eğitim: {previous_state.get('examples', 0)} kayıt)")
+        else:
+            print("⚠️ Kayıtlı artımlı durum yok, tam eğitim yapılıyor")
+    # Tokenizer temel modelle aynı; checkpoint klasörlerinde tokenizer dosyası yok
+    processor = WhisperProcessor.from_pretrained(BASE_MODEL, language="ku", task="transcribe")
     model = WhisperForConditionalGeneration.from_pretrained(model_name)
     
     # Tokenizer ayarları
-    tokenizer = WhisperTokenizer.from_pretrained(model_name, language="ku", task="transcribe")
-    
-    # Dataset yükle
-    dataset_loader = KurmanjiWhisperDataset(MANIFEST_FILE, AUDIO_PATH)
-    dataset = dataset_loader.create_hf_dataset()
+    tokenizer = WhisperTokenizer.from_pretrained(BASE_MODEL, language="ku", task="transcribe")
     
-    print(f"📊 Toplam örnek sayısı: {len(dataset)}")
+    output_dir = OUTPUT_DIR
+    max_steps = 2000
+    trained_files = None
+    augmentation = None
+    if args.augment:
+        augmentation = SpeechAugmentation(
+            sampling_rate=processor.feature_extractor.sampling_rate,
+            noise_dir=args.noise_dir,
+            seed=args.augment_seed,
+            log_dir=os.path.join(output_dir, "augmentation_logs"),
+        )
+        print(f"🎛️ Yükleme anında augmentation aktif (seed={args.augment_seed})")
     
-    # Dataset'i hazırla
-    dataset = dataset.map(
-        lambda batch: prepare_dataset(batch, processor),
-        remove_columns=dataset.column_names,
-        desc="Dataset hazırlanıyor"
-    )
+    if args.incremental:
+        dataset_loader = KurmanjiWhisperDataset(MANIFEST_FILE, AUDIO_PATH)
+        examples = list(dataset_loader.iter_examples())
+        new, replay, test = select_incremental_examples(examples, previous_state, args.replay_ratio)
+        print(f"🆕 Yeni kayıt: {len(new)}, tekrar örneği: {len(replay)}, test: {len(test)}")
+        if not new:
+            print("✅ Eğitilmemiş yeni kayıt yok, eğitim gerekmiyor")
+            return
+        
+        # Eğitilmiş küme ayrımın tüm eğitim tarafını (eskiler dahil) kapsar; test kayıtları hariç
+        test_files = {example[0] for example in test}
+        trained_files = [example[0] for example in examples if example[0] not in test_files]
+        prepared = {}
+        for split, split_items in (("train", new + replay), ("test", test[:500])):
+            split_dataset = Dataset.from_dict({
+                "audio": [example[0] for example in split_items],
+                "transcription": [example[1] for example in split_items],
+                "duration": [example[2] for example in split_items],
+            }).cast_column("audio", Audio(sampling_rate=processor.feature_extractor.sampling_rate))
+            if split == "train" and augmentation is not None:
+                split_dataset.set_transform(make_augmented_transform(processor, augmentation))
+            else:
+                split_dataset = split_dataset.map(
+                    functools.partial(prepare_dataset_batched, processor=processor),
+                    batched=True,
+                    batch_size=args.prep_batch_size,
+                    num_proc=max(1, min(args.prep_workers, len(split_dataset))),
+                    remove_columns=split_dataset.column_names,
+                    desc="Dataset hazırlanıyor"
+                )
+            prepared[split] = split_dataset
+        train_dataset, eval_dataset = prepared["train"], prepared["test"]
+        train_dataset.durations = [example[2] for example in new + replay]
+        # Adım sayısı seçilen veri miktarına göre (dakikalar, saatler değil)
+        max_steps = max(50, int(args.incremental_epochs * len(new + replay) / (TRAIN_BATCH_SIZE * 2)))
+    elif args.shards:
+        # Shard'lardan akış - özellikler yükleme sırasında hesaplanır
+        train_dataset, eval_dataset = load_sharded_datasets(args.shards, processor, augmentation)
+        print(f"📦 Shard klasörü: {args.shards} ({len(train_dataset.shards)} eğitim shard'ı)")
+    elif args.stream:
+        # Sabit bellek: manifest ve ses dosyaları okunduğu anda işlenir
+        state_dir = os.path.join(output_dir, "stream_state")
+        # Süreçler arası bölme accelerate'te (bkz. training_args); burada rank bölmesi yok
+        train_dataset = ManifestStreamingDataset(
+            MANIFEST_FILE, AUDIO_PATH, processor, split="train",
+            augmentation=augmentation, state_dir=state_dir, resume=args.resume_stream,
+            rank=0, world_size=1
+        )
+        eval_dataset = ManifestStreamingDataset(MANIFEST_FILE, AUDIO_PATH, processor, split="test", rank=0, world_size=1)
+        print(f"🌊 Manifest akış modu (durum: {state_dir})")
+    elif args.feature_cache:
+        dataset_loader = KurmanjiWhisperDataset(MANIFEST_FILE, AUDIO_PATH)
+        train_dataset, eval_dataset = load_cached_datasets(dataset_loader, processor, args.feature_cache, augmentation)
+    else:
+        # Dataset yükle
+        dataset_loader = KurmanjiWhisperDataset(MANIFEST_FILE, AUDIO_PATH)
+        examples = list(dataset_loader.iter_examples())
+        
+        print(f"📊 Toplam örnek sayısı: {len(examples)}")
+        
+        # Train/test split - son değerlendirmeyle aynı özet ayrımı
+        train_test = {
+            split: dataset_loader.create_hf_dataset(sampling_rate=processor.feature_extractor.sampling_rate, examples=split_items)
+            for split, split_items in zip(("train", "test"), split_examples(examples))
+        }
+        train_durations = train_test["train"]["duration"]
+        
+        # Dataset'i hazırla
+        prepared = {}
+        for split in ("train", "test"):
+            if split == "train" and augmentation is not None:
+                # Özellikler her okumada augmentation sonrası hesaplanır (DataLoader worker'larında)
+                split_dataset = train_test[split]
+                split_dataset.set_transform(make_augmented_transform(processor, augmentation))
+            else:
+                # num_proc ile parçalar sırayla birleştirilir; örnek sırası korunur
+                split_dataset = train_test[split].map(
+                    functools.partial(prepare_dataset_batched, processor=processor),
+                    batched=True,
+                    batch_size=args.prep_batch_size,
+                    num_proc=max(1, min(args.prep_workers, len(train_test[split]))),
+                    remove_columns=train_test[split].column_names,
+                    desc="Dataset hazırlanıyor"
+                )
+            prepared[split] = split_dataset
+        train_dataset = prepared["train"]
+        train_dataset.durations = train_durations
+        eval_dataset = prepared["test"]
     
-    # Train/test split
-    train_test = dataset.train_test_split(test_size=0.1)
-    train_dataset = train_test["train"]
-    eval_dataset = train_test["test"]
+    if hasattr(train_dataset, "__len__"):
+        print(f"📚 Eğitim örnekleri: {len(train_dataset)}")
+        print(f"🧪 Test örnekleri: {len(eval_dataset)}")
     
-    print(f"📚 Eğitim örnekleri: {len(train_dataset)}")
-    print(f"🧪 Test örnekleri: {len(eval_dataset)}")
+    bucket_sampler = None
+    if args.bucket_by_duration:
+        durations = getattr(train_dataset, "durations", None)
+        if durations is None and isinstance(train_dataset, Dataset) and "duration" in train_dataset.column_names:
+            durations = train_dataset["duration"]
+        if durations is None:
+            print("⚠️ Shard akışında süre kovalama desteklenmiyor, atlanıyor")
+        else:
+            bucket_sampler = DurationBucketSampler(
+                durations,
+                batch_size=TRAIN_BATCH_SIZE,
+                boundaries=[float(value) for value in args.bucket_boundaries.split(",") if value.strip()],
+            )
+            print_padding_report(bucket_sampler.padding_report(dataset_label_lengths(train_dataset, processor.tokenizer)))
     
     # Data collator
     data_collator = DataCollatorSpeechSeq2SeqWithPadding(
@@ -149,38 +1069,61 @@ def main():
         decoder_start_token_id=model.generation_config.decoder_start_token_id,
     )
     
+    # Bir sonraki artımlı çalışma için eğitilmiş dosyalar ve veri özeti (ilk checkpoint'te hesaplanır)
+    def incremental_state():
+        # Yalnızca ayrımın eğitim tarafı: test kayıtları "eğitildi" sayılmamalı
+        files = trained_files if trained_files is not None else manifest_train_files(MANIFEST_FILE, AUDIO_PATH)
+        return build_incremental_state(files, model_name, previous_state)
+    state_callback = IncrementalStateCallback(incremental_state)
+    
     # Eğitim parametreleri
+    checkpoint_steps = min(500, max_steps)
+    extra_args = {}
+    if args.stream:
+        # Akış veri setini accelerate böler: her süreç manifest'i okur, batch'lerin
+        # kendi payını alır (IterableDatasetShard). Rank 0'dan dağıtım (dispatch) yok.
+        if "accelerator_config" in Seq2SeqTrainingArguments.__dataclass_fields__:
+            extra_args["accelerator_config"] = {"dispatch_batches": False, "split_batches": False}
+        else:
+            extra_args.update(dispatch_batches=False, split_batches=False)
     training_args = Seq2SeqTrainingArguments(
-        output_dir="./whisper-kurdish-kurmanji",
-        per_device_train_batch_size=8,
+        output_dir=output_dir,
+        per_device_train_batch_size=TRAIN_BATCH_SIZE,
         gradient_accumulation_steps=2,
         learning_rate=1e-5,
-        warmup_steps=500,
-        max_steps=2000,
+        warmup_steps=min(500, max_steps // 10),
+        max_steps=max_steps,
         gradient_checkpointing=True,
         fp16=True,
         evaluation_strategy="steps",
         per_device_eval_batch_size=8,
         predict_with_generate=True,
         generation_max_length=225,
-        save_steps=500,
-        eval_steps=500,
+        save_steps=checkpoint_steps,
+        eval_steps=checkpoint_steps,
         logging_steps=25,
         report_to=["tensorboard"],
         load_best_model_at_end=True,
         metric_for_best_model="wer",
         greater_is_better=False,
         push_to_hub=False,
+        dataloader_num_workers=args.dataloader_workers,
+        # set_transform ile gelen ham "audio" sütunu Trainer tarafından silinmemeli
+        remove_unused_columns=False,
+        **extra_args,
     )
     
     # Trainer oluştur
-    trainer = Seq2SeqTrainer(
+    trainer = BucketedSeq2SeqTrainer(
+        bucket_sampler=bucket_sampler,
         args=training_args,
         model=model,
         train_dataset=train_dataset,
         eval_dataset=eval_dataset,
         data_collator=data_collator,
+        compute_metrics=make_compute_metrics(processor),
         tokenizer=processor.feature_extractor,
+        callbacks=[state_callback],
     )
     
     # Eğitimi başlat
@@ -190,13 +1133,20 @@ def main():
     # Modeli kaydet
     trainer.save_model("./whisper-kurdish-kurmanji-final")
     processor.save_pretrained("./whisper-kurdish-kurmanji-final")
+    save_incremental_state(FINAL_MODEL_DIR, state_callback.state)
     
     print("✅ Eğitim tamamlandı!")
     print("📁 Model kaydedildi: ./whisper-kurdish-kurmanji-final")
     
+    # GPU'suz istasyonlar için int8 ve ONNX sürümleri
+    if not args.no_cpu_export:
+        export_for_cpu("./whisper-kurdish-kurmanji-final")
+    
     # Test
     print("🧪 Model test ediliyor...")
-    # Burada test kodu eklenebilir
+    report = evaluate_model("./whisper-kurdish-kurmanji-final", MANIFEST_FILE, AUDIO_PATH)
+    if report is not None:
+        print_report(report)
 
 if __name__ == "__main__":
     main()
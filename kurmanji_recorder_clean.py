@@ -3,33 +3,30 @@ Fixed Kurmanji Word Recorder with Menu System
 This version fixes the edit/delete functionality and adds a clean menu system
 """
 
-import os
+import time
+STARTUP_MARKS = [("start", time.perf_counter())]  # --profile-startup
+
+import sys
 import json
-import threading
 import queue
-import time
 import re
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+from typing import List, Tuple
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from pathlib import Path
+STARTUP_MARKS.append(("stdlib + tkinter", time.perf_counter()))
 
-# Audio processing
-import sounddevice as sd
-import soundfile as sf
-import numpy as np
-import librosa
-from scipy.signal import butter, filtfilt
-
-# UI Framework
-import customtkinter as ctk
+# Recording, word lists, import and export (GUI-free, see kurmanji_core/)
+from kurmanji_core import (
+    Config, LazyModule, AudioManager, WordManager, DocumentProcessor, UrlFetcher,
+    AudioMetadataCache, QualityAnalyzer, AugmentationEngine, TakeVerifier,
+    IncrementalExporter, ShardedTarExporter, DatasetMerger, TaskRunner,
+)
+STARTUP_MARKS.append(("kurmanji_core", time.perf_counter()))
 
-# Document processing
-import docx
-import PyPDF2
-import requests
-from urllib.parse import urlparse
+# UI Framework (yalnızca pencere açılırken yüklenir)
+ctk = LazyModule("customtkinter")
 
 # Language Support System
 class LanguageManager:
@@ -98,7 +95,8 @@ class LanguageManager:
                 "skip_word": "⏭️ Skip This Word",
                 "not_recorded_yet": "Not Recorded",
                 "recorded": "Recorded",
-                "completion": "Completion"
+                "completion": "Completion",
+                "task_panel": "⏳ Background Tasks"
             },
             "tr": {
                 # Turkish translations
@@ -180,6 +178,7 @@ class LanguageManager:
                 "sentence_mode_toggle": "🔄 Mod Değiştir (Kelime→Cümle→Paragraf)",
                 "generate_sentence_list": "📝 Cümle Listesi Oluştur",
                 "audio_quality_test": "🔊 Ses Kalitesi Testi",
+                "quality_report": "📋 Tüm Kayıtlar Kalite Raporu",
                 "audio_augmentation": "🎵 Ses Zenginleştirme",
                 "whisper_training_prep": "🚀 Whisper Eğitim Hazırlığı",
                 "merge_datasets": "🔗 Datasetleri Birleştir",
@@ -188,15 +187,22 @@ class LanguageManager:
                 "split_word_list": "✂️ Kelime Listesi Böl",
                 "create_sub_list": "📄 Alt Liste Oluştur",
                 "random_distribute": "🔀 Rastgele Dağıt",
+                "coverage_schedule": "🧩 Fonetik Kapsam Sırası",
                 "show_list_stats": "📊 Liste İstatistikleri",
                 "import_txt": "📄 TXT Dosyası Al",
                 "import_docx": "📘 DOCX Dosyası Al",
                 "import_pdf": "📕 PDF Dosyası Al",
+                "import_sentences": "🎭 Belgeden Cümle Al",
                 "load_from_url": "🌐 URL'den Yükle",
+                "load_from_urls": "🌐 Çoklu URL'den Yükle",
+                "import_frequency": "📈 Frekansa Göre Al",
                 "export_words": "📤 Kelimeleri Ver",
                 "export_dataset": "📦 Dataset Ver",
+                "export_dataset_incremental": "📦 Artımlı Dataset Ver",
+                "export_dataset_shards": "📦 Tar Shard Olarak Ver",
                 "toggle_theme": "🌙 Tema Değiştir",
-                "test_audio": "🎙️ Ses Sistemini Test Et"
+                "test_audio": "🎙️ Ses Sistemini Test Et",
+                "task_panel": "⏳ Arka Plan Görevleri"
             },
             "ku": {
                 # Kurdish (Kurmanji) translations
@@ -278,6 +284,7 @@ class LanguageManager:
                 "sentence_mode_toggle": "🎭 Moda Hevokan (Peyv→Hevok)",
                 "generate_sentence_list": "📝 Lîsta Hevokan Ava Bike",
                 "audio_quality_test": "🔊 Cîrbendiya Dengê Test Bike",
+                "quality_report": "📋 Rapora Kalîteya Hemû Tomaran",
                 "audio_augmentation": "🎵 Deng Dewlemend Bike",
                 "whisper_training_prep": "🚀 Amadekariya Perwerdeya Whisper'ê",
                 "merge_datasets": "🔗 Datasetan Yek Bike",
@@ -286,1904 +293,44 @@ class LanguageManager:
                 "split_word_list": "✂️ Lîsta Peyvan Parve Bike",
                 "create_sub_list": "📄 Bin-lîste Ava Bike",
                 "random_distribute": "🔀 Bi Rastî Belav Bike",
+                "coverage_schedule": "🧩 Rêza Cihêrengiya Dengan",
                 "show_list_stats": "📊 Statîstîkên Lîstê",
                 "import_txt": "📄 Pelê TXT Bîne",
                 "import_docx": "📘 Pelê DOCX Bîne",
                 "import_pdf": "📕 Pelê PDF Bîne",
+                "import_sentences": "🎭 Hevokan ji Belgeyê Bîne",
                 "load_from_url": "🌐 Ji URLê Bar Bike",
+                "load_from_urls": "🌐 Ji Gelek URLan Bar Bike",
+                "import_frequency": "📈 Li Gorî Frekansê Bîne",
                 "export_words": "📤 Peyvan Derêxe",
                 "export_dataset": "📦 Dataset Derêxe",
+                "export_dataset_incremental": "📦 Dataset bi Gav Derêxe",
+                "export_dataset_shards": "📦 Wek Shardên Tar Derêxe",
                 "toggle_theme": "🌙 Temayê Biguhere",
-                "test_audio": "🎙️ Sîstema Dengê Test Bike"
+                "test_audio": "🎙️ Sîstema Dengê Test Bike",
+                "task_panel": "⏳ Karên Paşperdeyê"
             }
         }
     
     def set_language(self, lang_code: str):
-        """Set the current language"""
-        if lang_code in self.translations:
-            self.current_language = lang_code
-    
-    def get(self, key: str) -> str:
-        """Get translated text for the current language"""
-        return self.translations.get(self.current_language, {}).get(key, key)
-    
-    def get_available_languages(self) -> List[Tuple[str, str]]:
-        """Get list of available languages"""
-        return [
-            ("en", "English"),
-            ("tr", "Türkçe"),
-            ("ku", "Kurmancî")
-        ]
-
-# Global language manager instance
-lang = LanguageManager()
-
-# Configuration
-class Config:
-    SAMPLE_RATE = 44100  # Higher quality, less artifacts
-    CHANNELS = 1
-    DTYPE = np.int16  # More compatible with Windows audio
-    CHUNK_SIZE = 2048   # Larger buffer to prevent dropouts
-    
-    MIN_SILENCE_DURATION = 0.5
-    SENTENCE_SILENCE_DURATION = 1.5  # Longer pause detection for sentences
-    NOISE_THRESHOLD = 0.02
-    
-    BASE_DIR = Path("kurmanji_dataset")
-    AUDIO_DIR = BASE_DIR / "audio"
-    DOCS_DIR = BASE_DIR / "documents"
-    METADATA_FILE = BASE_DIR / "metadata.json"
-    WORDS_FILE = BASE_DIR / "wordlist.json"
-    SENTENCES_FILE = BASE_DIR / "sentencelist.json"  # Ayrı cümle dosyası
-    PARAGRAPHS_FILE = BASE_DIR / "paragraphlist.json"  # Ayrı paragraf dosyası
-    
-    # Whisper training files
-    WHISPER_MANIFEST = BASE_DIR / "whisper_manifest.jsonl"  # Whisper eğitim dosyası
-    TRANSCRIPT_FILE = BASE_DIR / "transcripts.txt"  # Transkript dosyası
-    
-    UI_THEME = "dark"
-    WINDOW_SIZE = "1000x700"
-
-# Ensure directories exist
-for directory in [Config.BASE_DIR, Config.AUDIO_DIR, Config.DOCS_DIR]:
-    directory.mkdir(exist_ok=True)
-
-# All classes are defined in this file - no external imports needed
-
-class AudioManager:
-    """Enhanced audio recording manager with device selection and quality control"""
-    
-    def __init__(self):
-        self.devices = []
-        self.selected_device = None
-        self.is_recording = False
-        self.current_recording = []
-        self.audio_queue = queue.Queue()
-        self.recording_thread = None
-        self.is_sentence_mode = False  # Track recording mode for dynamic timeouts
-        self.consecutive_empty = 0
-        self.current_audio_level = 0.0  # For UI monitoring
-        self.audio_chunks = []  # For callback recording
-        self.sample_rate = Config.SAMPLE_RATE
-        
-        self.refresh_devices()
-    
-    def refresh_devices(self):
-        """Refresh available audio input devices"""
-        try:
-            devices_info = sd.query_devices()
-            self.devices = []
-            
-            for i, device in enumerate(devices_info):
-                if device['max_input_channels'] > 0:
-                    self.devices.append({
-                        'id': i,
-                        'name': device['name'],
-                        'channels': device['max_input_channels'],
-                        'sample_rate': device['default_samplerate']
-                    })
-            
-            if self.devices:
-                self.selected_device = self.devices[0]['id']
-            
-            return True, f"Found {len(self.devices)} input devices"
-        except Exception as e:
-            return False, f"Error detecting devices: {str(e)}"
-    
-    def check_microphone(self):
-        """Check if microphone is working with detailed diagnostics"""
-        try:
-            if not self.devices:
-                return False, "No audio input devices found"
-            
-            # Testing microphone
-            
-            # Try multiple test approaches
-            devices_to_test = [self.selected_device, None]  # Test selected and default
-            
-            for device_id in devices_to_test:
-                device_name = self.get_selected_device_name() if device_id == self.selected_device else "System Default"
-                print(f"🎤 Testing device: {device_name}")
-                
-                try:
-                    test_duration = 0.5  # Longer test
-                    test_data = sd.rec(
-                        int(test_duration * Config.SAMPLE_RATE),
-                        samplerate=Config.SAMPLE_RATE,
-                        channels=Config.CHANNELS,
-                        device=device_id,
-                        dtype=np.int16  # Use int16 for compatibility
-                    )
-                    sd.wait()
-                    
-                    if test_data is not None and len(test_data) > 0:
-                        # Convert to float for level checking
-                        test_float = test_data.astype(np.float32) / 32768.0
-                        max_level = np.max(np.abs(test_float))
-                        rms_level = np.sqrt(np.mean(test_float**2))
-                        
-                        # Audio levels checked
-                        
-                        if max_level > 0.0001:  # Very low threshold
-                            return True, f"Microphone OK (Device: {device_name}, Max level: {max_level:.4f})"
-                        elif max_level > 0:
-                            return True, f"Microphone detected but very quiet (Device: {device_name}, Max level: {max_level:.6f})"
-                        else:
-                            pass  # Silent audio detected
-                            
-                except Exception as device_error:
-                    print(f"❌ Device {device_name} test failed: {device_error}")
-                    continue
-            
-            return False, "All microphone tests failed - please check microphone connection and permissions"
-            
-        except Exception as e:
-            return False, f"Audio system error: {str(e)}"
-    
-    def get_selected_device_name(self):
-        """Get the name of the currently selected device"""
-        for device in self.devices:
-            if device['id'] == self.selected_device:
-                return device['name']
-        return "Unknown Device"
-    
-    def is_bluetooth_device(self, device_id=None):
-        """Check if the device is likely a Bluetooth audio device"""
-        if device_id is None:
-            device_id = self.selected_device
-        
-        device_name = ""
-        for device in self.devices:
-            if device['id'] == device_id:
-                device_name = device['name'].lower()
-                break
-        
-        # Common Bluetooth device indicators
-        bluetooth_indicators = [
-            'airpods', 'bluetooth', 'wireless', 'bt', 'headset',
-            'headphone', 'earbuds', 'sony', 'bose', 'beats',
-            'jabra', 'plantronics', 'samsung buds'
-        ]
-        
-        return any(indicator in device_name for indicator in bluetooth_indicators)
-    
-    def start_recording(self, device_id=None):
-        """Start recording audio - simplified approach"""
-        if self.is_recording:
-            return False, "Already recording"
-        
-        if device_id is not None:
-            self.selected_device = device_id
-        
-        try:
-            # Starting recording with selected device
-            
-            # Clear previous recording
-            self.current_recording = []
-            self.is_recording = True
-            
-            # Get content type for timeout calculation
-            content_type = getattr(self, 'content_type', 'word')
-            is_sentence_mode = getattr(self, 'is_sentence_mode', False)
-            
-            # Set recording duration based on mode
-            if content_type == "paragraph":
-                max_duration = 45.0  # 45 seconds for paragraphs
-            elif content_type == "sentence" or is_sentence_mode:
-                max_duration = 25.0  # 25 seconds for long sentences
-            else:
-                max_duration = 3.0   # 3 seconds for words - enough for any single word
-            
-            # Recording mode configuration (output cleaned up for user)
-            
-            # Detect device type and choose optimal recording method
-            is_bluetooth = self.is_bluetooth_device()
-            device_name = self.get_selected_device_name()
-            
-            if is_bluetooth:
-                print(f"🎧 Detected Bluetooth device: {device_name}")
-                print(f"🎙️ Using Bluetooth-optimized recording method")
-                self.recording_thread = threading.Thread(target=self._bluetooth_recording_worker, args=(max_duration,))
-            elif content_type in ("sentence", "paragraph") or is_sentence_mode:
-                print(f"🎙️ Using streaming recording method for longer stability")
-                self.recording_thread = threading.Thread(target=self._streaming_recording_worker, args=(max_duration,))
-            else:
-                print(f"🎙️ Using fallback recording method for better stability")
-                self.recording_thread = threading.Thread(target=self._fallback_recording_worker, args=(max_duration,))
-            self.recording_thread.start()
-            
-            return True
-        except Exception as e:
-            self.is_recording = False
-            # Recording start error handled
-            return False, f"Failed to start recording: {str(e)}"
-    
-    def _simple_recording_worker(self, max_duration):
-        """Enhanced recording worker with real-time audio level monitoring"""
-        print(f"🎙️ Recording worker started - Duration: {max_duration}s")
-        try:
-            # Starting recording (output cleaned up for user)
-            
-            # Try multiple device options in case of failure
-            devices_to_try = [self.selected_device, None]  # None uses default device
-            audio_data = None
-            
-            for device in devices_to_try:
-                try:
-                    # Trying recording device
-                    
-                    # Initialize recording with callback for real-time monitoring
-                    self.audio_chunks = []
-                    
-                    # Initialize level monitoring
-                    self.level_counter = 0
-                    import sys
-                    
-                    def audio_callback(indata, frames, time, status):
-                        """Real-time audio monitoring callback with recovery"""
-                        if status:
-                            print(f"\n⚠️ Audio callback status: {status}")
-                        
-                        # Store audio chunk
-                        self.audio_chunks.append(indata.copy())
-                        
-                        # Real-time level monitoring (show every 10th callback ~ 0.5 seconds)
-                        self.level_counter += 1
-                        if len(indata) > 0:
-                            # Convert to float and calculate level
-                            audio_float = indata.astype(np.float32) / 32768.0
-                            level = np.max(np.abs(audio_float))
-                            rms_level = np.sqrt(np.mean(audio_float**2))
-                            
-                            # Store current level for UI monitoring
-                            self.current_audio_level = level
-                            
-                            # Show terminal level bar every 10th callback
-                            if self.level_counter % 10 == 0:
-                                # Create level bar
-                                bar_length = 20
-                                filled_bars = int(level * bar_length)
-                                level_bar = "█" * filled_bars + "░" * (bar_length - filled_bars)
-                                
-                                # Print level with carriage return for updating same line
-                                print(f"\r🎚️ [{level_bar}] {level:.3f} (RMS: {rms_level:.3f})", end="", flush=True)
-                                sys.stdout.flush()
-                                
-                                # Detect if audio stream is dying
-                                if level < 0.01 and rms_level < 0.005 and self.level_counter > 20:
-                                    print(f"\n⚠️ Low audio detected at callback {self.level_counter}")
-                    
-                    # Start recording with callback and more robust configuration
-                    with sd.InputStream(
-                        device=device,
-                        channels=Config.CHANNELS,
-                        samplerate=Config.SAMPLE_RATE,
-                        dtype=np.int16,
-                        callback=audio_callback,
-                        blocksize=Config.CHUNK_SIZE,
-                        latency='low'  # Lower latency for better responsiveness
-                    ):
-                        # Recording in progress
-                        
-                        # Wait for recording to complete or until manually stopped
-                        start_time = time.time()
-                        last_chunk_time = start_time
-                        print(f"🎤 Starting {max_duration}s recording session...")
-                        
-                        chunk_count_last_check = 0
-                        last_chunk_check_time = start_time
-                        
-                        while self.is_recording and (time.time() - start_time) < max_duration:
-                            current_time = time.time()
-                            elapsed = current_time - start_time
-                            current_chunk_count = len(self.audio_chunks)
-                            
-                            # Check if we're still getting audio chunks
-                            if current_chunk_count > chunk_count_last_check:
-                                last_chunk_time = current_time
-                                chunk_count_last_check = current_chunk_count
-                            
-                            # Show progress every 2 seconds
-                            if int(elapsed) % 2 == 0 and int(elapsed) != int(elapsed - 0.05):
-                                print(f"⏱️  Recording... {elapsed:.1f}s / {max_duration}s - Chunks: {current_chunk_count}")
-                                
-                                # Check for stalled audio stream
-                                if current_time - last_chunk_check_time > 1.0 and current_chunk_count == 0:
-                                    print(f"⚠️ Warning: No audio chunks received for 1 second!")
-                                    
-                            # More frequent check but longer patience
-                            time.sleep(0.05)  # Check every 50ms for better responsiveness
-                    
-                    # Clear the level display line
-                    print("\r" + " " * 50 + "\r", end="", flush=True)
-                    
-                    # Show recording completion info
-                    recording_duration = time.time() - start_time
-                    print(f"🎙️ Recording session completed: {recording_duration:.1f}s of {max_duration:.1f}s")
-                    
-                    # Combine all audio chunks
-                    if self.audio_chunks:
-                        audio_data = np.concatenate(self.audio_chunks, axis=0)
-                    
-                    # Check if we got valid audio data
-                    if audio_data is not None and len(audio_data) > 0:
-                        # Convert to float for processing and check amplitude
-                        audio_float = audio_data.astype(np.float32) / 32768.0  # Normalize int16 to float
-                        max_amplitude = np.max(np.abs(audio_float))
-                        # Audio amplitude check completed
-                        
-                        if max_amplitude > 0.0001:  # Lower threshold for valid audio
-                            # Recording completed successfully
-                            self.current_recording = [audio_float]  # Store as float
-                            print(f"✅ Recording completed: {len(audio_float)/Config.SAMPLE_RATE:.1f}s, amplitude: {max_amplitude:.6f}")
-                            return
-                        else:
-                            print(f"⚠️ Audio too quiet: {max_amplitude:.6f}")
-                    else:
-                        pass  # No audio data received
-                        
-                except Exception as device_error:
-                    # Device failed, trying next
-                    continue
-            
-            # If we get here, all devices failed
-            # All recording attempts failed
-            self.current_recording = []
-                
-        except Exception as e:
-            # Recording worker error handled
-            self.current_recording = []
-        finally:
-            self.is_recording = False
-            # Recording worker completed
-    
-    def _fallback_recording_worker(self, max_duration):
-        """Robust segmented recording method to avoid Windows audio driver issues"""
-        print(f"🎙️ Robust recording worker started - Duration: {max_duration}s")
-        try:
-            # Record in segments to avoid Windows audio driver timeout issues
-            # Use smaller segments for short recordings (words), larger for long ones
-            if max_duration <= 5.0:
-                segment_duration = max_duration  # Single segment for short recordings
-            else:
-                segment_duration = 5.0  # 5-second segments for longer recordings
-            segments = []
-            total_segments = int(max_duration / segment_duration) + 1
-            
-            print(f"🎤 Recording in {total_segments} segments of {segment_duration}s each...")
-            
-            for segment_num in range(total_segments):
-                if not self.is_recording:
-                    print(f"🛑 Recording stopped manually at segment {segment_num}")
-                    break
-                
-                # Calculate remaining time for this segment
-                remaining_time = max_duration - (segment_num * segment_duration)
-                current_segment_duration = min(segment_duration, remaining_time)
-                
-                if current_segment_duration <= 0:
-                    break
-                
-                print(f"🎙️ Recording segment {segment_num + 1}/{total_segments} ({current_segment_duration:.1f}s)...")
-                
-                try:
-                    # Record this segment with proper device configuration
-                    segment_data = sd.rec(
-                        int(current_segment_duration * Config.SAMPLE_RATE),
-                        samplerate=Config.SAMPLE_RATE,
-                        channels=Config.CHANNELS,
-                        dtype=np.int16,
-                        device=self.selected_device
-                    )
-                    
-                    # Wait for segment with periodic stop checks
-                    check_interval = 0.1  # Check every 100ms
-                    elapsed = 0
-                    while elapsed < current_segment_duration:
-                        if not self.is_recording:
-                            # User clicked stop - abort this segment
-                            sd.stop()
-                            print(f"🛑 Recording stopped manually during segment {segment_num + 1}")
-                            break
-                        time.sleep(check_interval)
-                        elapsed += check_interval
-                    
-                    # Only add segment if we completed it
-                    if self.is_recording and segment_data is not None and len(segment_data) > 0:
-                        # Check segment quality
-                        segment_float = segment_data.astype(np.float32) / 32768.0
-                        segment_amplitude = np.max(np.abs(segment_float))
-                        
-                        print(f"✅ Segment {segment_num + 1} completed: amplitude {segment_amplitude:.6f}")
-                        segments.append(segment_float)
-                        
-                        # Store current level for UI
-                        self.current_audio_level = segment_amplitude
-                    elif not self.is_recording:
-                        # Stopped early - only keep the audio recorded so far
-                        recorded_samples = int(elapsed * Config.SAMPLE_RATE)
-                        if segment_data is not None and recorded_samples > 0:
-                            segment_float = segment_data[:recorded_samples].astype(np.float32) / 32768.0
-                            segment_amplitude = np.max(np.abs(segment_float))
-                            print(f"✅ Partial segment {segment_num + 1}: {elapsed:.2f}s, amplitude {segment_amplitude:.6f}")
-                            segments.append(segment_float)
-                        break  # Exit the segment loop
-                    else:
-                        print(f"⚠️ Segment {segment_num + 1} failed - no data")
-                        # Add silence for missing segment
-                        silence = np.zeros((int(current_segment_duration * Config.SAMPLE_RATE), Config.CHANNELS), dtype=np.float32)
-                        segments.append(silence)
-                    
-                    # Brief pause between segments to reinitialize driver
-                    time.sleep(0.1)
-                    
-                except Exception as segment_error:
-                    print(f"❌ Segment {segment_num + 1} error: {segment_error}")
-                    # Add silence for failed segment
-                    silence = np.zeros((int(current_segment_duration * Config.SAMPLE_RATE), Config.CHANNELS), dtype=np.float32)
-                    segments.append(silence)
-            
-            # Combine all segments
-            if segments:
-                audio_float = np.concatenate(segments, axis=0)
-                
-                # Remove buzzing artifacts from the very end (typical with sd.rec())
-                # Buzzing usually appears in the last 10-20ms
-                buzz_removal_samples = int(Config.SAMPLE_RATE * 0.015)  # Remove last 15ms
-                if len(audio_float) > buzz_removal_samples:
-                    audio_float = audio_float[:-buzz_removal_samples]
-                    print(f"🔧 Removed last 15ms to eliminate buzzing artifacts")
-                
-                # Apply dynamic range compression to compensate for Windows AGC
-                audio_float = self._normalize_audio_levels(audio_float)
-                max_amplitude = np.max(np.abs(audio_float))
-                
-                print(f"✅ Segmented recording completed: {len(audio_float)/Config.SAMPLE_RATE:.1f}s, amplitude: {max_amplitude:.6f}")
-                
-                if max_amplitude > 0.0001:
-                    self.current_recording = [audio_float]
-                else:
-                    print(f"⚠️ Combined audio too quiet: {max_amplitude:.6f}")
-                    self.current_recording = []
-            else:
-                print(f"❌ No segments recorded")
-                self.current_recording = []
-                
-        except Exception as e:
-            print(f"❌ Robust recording error: {e}")
-            self.current_recording = []
-        finally:
-            self.is_recording = False
-            self.current_audio_level = 0.0
-            print(f"🔚 Robust recording worker finished")
-
-    def _streaming_recording_worker(self, max_duration: float):
-        """Single-stream reader to avoid device reinitialization between segments.
-
-        - Keeps one InputStream open for the entire session.
-        - Reads fixed-size chunks until max_duration or manual stop.
-        - Updates UI level and analyzes/saves debug output at the end.
-        """
-        print(f"🎙️ Streaming recording worker started - Duration: {max_duration}s")
-        frames_per_read = int(self.sample_rate * 0.25)  # ~250ms per read
-        collected = []
-        start_time = time.time()
-        total_frames = 0
-        try:
-            stream = sd.InputStream(
-                device=self.selected_device,
-                channels=Config.CHANNELS,
-                samplerate=self.sample_rate,
-                dtype=np.int16,
-                blocksize=Config.CHUNK_SIZE,
-                latency='high'
-            )
-            stream.start()
-            print("🎤 Stream opened")
-
-            while self.is_recording:
-                # Respect max_duration based on frames collected
-                if total_frames >= int(max_duration * self.sample_rate):
-                    break
-                try:
-                    indata, overflowed = stream.read(frames_per_read)
-                except Exception as re:
-                    print(f"⚠️ Stream read error: {re}")
-                    # Brief backoff and continue
-                    time.sleep(0.05)
-                    continue
-
-                if indata is None or len(indata) == 0:
-                    time.sleep(0.01)
-                    continue
-
-                # Convert to float32 mono
-                chunk = indata.astype(np.float32) / 32768.0
-                if chunk.ndim > 1:
-                    chunk = np.mean(chunk, axis=1, dtype=np.float32)
-                collected.append(chunk)
-
-                # UI level update
-                level = float(np.max(np.abs(chunk))) if chunk.size else 0.0
-                self.current_audio_level = level
-
-                total_frames += chunk.size
-
-            # Stop and close stream
-            try:
-                stream.stop()
-            except Exception:
-                pass
-            try:
-                stream.close()
-            except Exception:
-                pass
-
-            duration_s = total_frames / float(self.sample_rate) if self.sample_rate else 0.0
-            print(f"🎙️ Streaming session completed: {duration_s:.2f}s of {max_duration:.2f}s")
-
-            if collected:
-                audio_float = np.concatenate(collected, axis=0)
-                # Normalize/level
-                audio_float = self._normalize_audio_levels(audio_float)
-                max_amp = float(np.max(np.abs(audio_float))) if audio_float.size else 0.0
-
-                if max_amp > 1e-5 and duration_s >= 0.5:
-                    self.current_recording = [audio_float]
-                else:
-                    print(f"⚠️ Streaming audio too quiet/short (amp {max_amp:.6f}, dur {duration_s:.2f}s)")
-                    self.current_recording = []
-            else:
-                print("❌ No audio collected in streaming worker")
-                self.current_recording = []
-
-        except Exception as e:
-            print(f"❌ Streaming recording error: {e}")
-            self.current_recording = []
-        finally:
-            self.is_recording = False
-            self.current_audio_level = 0.0
-            print("🔚 Streaming recording worker finished")
-    
-    def _bluetooth_recording_worker(self, max_duration: float):
-        """Specialized recording worker optimized for Bluetooth audio devices.
-        
-        Uses smaller buffers, more frequent reads, and aggressive fallback strategies
-        to handle Bluetooth audio latency and connection stability issues.
-        """
-        print(f"🎧 Bluetooth recording worker started - Duration: {max_duration}s")
-        device_name = self.get_selected_device_name()
-        
-        # Bluetooth-optimized settings
-        bt_chunk_size = 512  # Smaller chunks for Bluetooth
-        read_interval = 0.1  # Read every 100ms
-        frames_per_read = int(self.sample_rate * read_interval)
-        
-        collected = []
-        start_time = time.time()
-        total_frames = 0
-        consecutive_failures = 0
-        last_level_time = start_time
-        
-        try:
-            # Try Bluetooth device with optimized settings
-            print(f"🎧 Attempting Bluetooth recording with {device_name}")
-            
-            stream = sd.InputStream(
-                device=self.selected_device,
-                channels=Config.CHANNELS,
-                samplerate=self.sample_rate,
-                dtype=np.int16,
-                blocksize=bt_chunk_size,  # Smaller buffer for Bluetooth
-                latency='low'  # Lower latency for wireless
-            )
-            stream.start()
-            print("🎧 Bluetooth stream opened successfully")
-            
-            while self.is_recording:
-                current_time = time.time()
-                
-                # Check total duration
-                if total_frames >= int(max_duration * self.sample_rate):
-                    print(f"✅ Reached maximum duration: {max_duration:.1f}s")
-                    break
-                
-                try:
-                    # Read smaller chunks more frequently
-                    indata, overflowed = stream.read(frames_per_read)
-                    
-                    if overflowed:
-                        print(f"⚠️ Bluetooth audio buffer overflow detected")
-                    
-                    if indata is None or len(indata) == 0:
-                        consecutive_failures += 1
-                        if consecutive_failures > 10:
-                            print(f"❌ Too many consecutive read failures: {consecutive_failures}")
-                            break
-                        time.sleep(0.01)
-                        continue
-                    
-                    # Reset failure counter on successful read
-                    consecutive_failures = 0
-                    
-                    # Convert to float32 mono
-                    chunk = indata.astype(np.float32) / 32768.0
-                    if chunk.ndim > 1:
-                        chunk = np.mean(chunk, axis=1, dtype=np.float32)
-                    
-                    collected.append(chunk)
-                    total_frames += len(chunk)
-                    
-                    # Monitor audio levels
-                    level = float(np.max(np.abs(chunk))) if chunk.size > 0 else 0.0
-                    self.current_audio_level = level
-                    
-                    # Show progress every 2 seconds with level monitoring
-                    if current_time - last_level_time >= 2.0:
-                        elapsed = current_time - start_time
-                        level_bar = "█" * int(level * 20) + "░" * (20 - int(level * 20))
-                        print(f"🎧 [{level_bar}] {elapsed:.1f}s/{max_duration:.1f}s - Level: {level:.3f}")
-                        last_level_time = current_time
-                        
-                        # Warn if no audio detected for extended period
-                        if level < 0.001:
-                            print(f"⚠️ Very low audio level detected - check Bluetooth connection")
-                    
-                    # Brief pause to prevent overwhelming Bluetooth buffer
-                    time.sleep(0.01)
-                    
-                except Exception as read_error:
-                    consecutive_failures += 1
-                    print(f"⚠️ Bluetooth read error {consecutive_failures}: {read_error}")
-                    
-                    if consecutive_failures > 20:
-                        print(f"❌ Bluetooth connection appears unstable - switching to fallback")
-                        break
-                    
-                    time.sleep(0.05)  # Brief recovery pause
-            
-            # Clean up stream
-            try:
-                stream.stop()
-                stream.close()
-            except Exception:
-                pass
-            
-            # Process collected audio
-            if collected:
-                audio_float = np.concatenate(collected, axis=0)
-                duration_s = len(audio_float) / float(self.sample_rate)
-                
-                print(f"🎧 Bluetooth recording completed: {duration_s:.2f}s")
-                
-                # Apply normalization for Bluetooth audio
-                audio_float = self._normalize_audio_levels(audio_float)
-                max_amp = float(np.max(np.abs(audio_float))) if audio_float.size > 0 else 0.0
-                
-                # More lenient validation for Bluetooth
-                if max_amp > 5e-5 and duration_s >= 0.3:  # Lower thresholds for Bluetooth
-                    self.current_recording = [audio_float]
-                    print(f"✅ Bluetooth recording successful: amp={max_amp:.6f}, dur={duration_s:.2f}s")
-                else:
-                    print(f"⚠️ Bluetooth audio quality insufficient")
-                    print(f"   Amplitude: {max_amp:.6f} (need > 5e-5)")
-                    print(f"   Duration: {duration_s:.2f}s (need > 0.3s)")
-                    # Try emergency fallback
-                    self._emergency_fallback_recording(max_duration - (time.time() - start_time))
-            else:
-                print(f"❌ No Bluetooth audio collected")
-                # Try emergency fallback
-                self._emergency_fallback_recording(max_duration - (time.time() - start_time))
-                
-        except Exception as e:
-            print(f"❌ Bluetooth recording failed: {e}")
-            print(f"🚨 Attempting emergency fallback to system default...")
-            # Try emergency fallback
-            self._emergency_fallback_recording(max_duration - (time.time() - start_time))
-            
-        finally:
-            self.is_recording = False
-            self.current_audio_level = 0.0
-            print("🔚 Bluetooth recording worker finished")
-    
-    def _emergency_fallback_recording(self, remaining_duration):
-        """Emergency fallback to system default microphone when Bluetooth fails"""
-        if remaining_duration <= 0.5:
-            print("⏰ Not enough time remaining for fallback recording")
-            self.current_recording = []
-            return
-            
-        print(f"🚨 EMERGENCY FALLBACK: Switching to system default microphone")
-        print(f"⏱️ Time remaining: {remaining_duration:.1f}s")
-        
-        try:
-            # Use system default device (None = default)
-            fallback_data = sd.rec(
-                int(remaining_duration * self.sample_rate),
-                samplerate=self.sample_rate,
-                channels=Config.CHANNELS,
-                dtype=np.int16,
-                device=None  # System default
-            )
-            
-            # Wait for recording to complete
-            sd.wait()
-            
-            if fallback_data is not None and len(fallback_data) > 0:
-                # Convert and process
-                audio_float = fallback_data.astype(np.float32) / 32768.0
-                if audio_float.ndim > 1:
-                    audio_float = np.mean(audio_float, axis=1, dtype=np.float32)
-                
-                max_amp = float(np.max(np.abs(audio_float)))
-                duration_s = len(audio_float) / float(self.sample_rate)
-                
-                print(f"🚨 Emergency fallback completed: {duration_s:.2f}s, amp: {max_amp:.6f}")
-                
-                if max_amp > 1e-4 and duration_s >= 0.3:
-                    self.current_recording = [audio_float]
-                    print("✅ Emergency fallback successful!")
-                else:
-                    print("❌ Emergency fallback also failed")
-                    self.current_recording = []
-            else:
-                print("❌ Emergency fallback - no data received")
-                self.current_recording = []
-                
-        except Exception as e:
-            print(f"❌ Emergency fallback error: {e}")
-            self.current_recording = []
-    
-    def _analyze_recording(self, audio_data, filename):
-        """Analyze recording to understand the audio capture issue"""
-        try:
-            duration = len(audio_data) / Config.SAMPLE_RATE
-            max_amp = np.max(np.abs(audio_data))
-            rms = np.sqrt(np.mean(audio_data**2))
-            
-            # Analyze in 1-second chunks
-            chunk_size = Config.SAMPLE_RATE  # 1 second
-            chunks = []
-            
-            print(f"\n🔍 AUDIO ANALYSIS for {filename}:")
-            print(f"📊 Total duration: {duration:.2f}s")
-            print(f"📊 Max amplitude: {max_amp:.6f}")
-            print(f"📊 RMS level: {rms:.6f}")
-            print(f"📊 Chunk analysis (1-second intervals):")
-            
-            for i in range(0, len(audio_data), chunk_size):
-                chunk = audio_data[i:i+chunk_size]
-                if len(chunk) > 0:
-                    chunk_max = np.max(np.abs(chunk))
-                    chunk_rms = np.sqrt(np.mean(chunk**2))
-                    second = i // chunk_size + 1
-                    chunks.append((second, chunk_max, chunk_rms))
-                    
-                    # Visual level indicator
-                    level_bar = "█" * int(chunk_max * 20) + "░" * (20 - int(chunk_max * 20))
-                    print(f"   Second {second:2d}: [{level_bar}] Max:{chunk_max:.4f} RMS:{chunk_rms:.4f}")
-            
-            # Check for silence pattern
-            silent_chunks = [c for c in chunks if c[1] < 0.01]  # Max amplitude < 0.01
-            if len(silent_chunks) > 0:
-                print(f"⚠️ Found {len(silent_chunks)} silent/very quiet chunks out of {len(chunks)} total")
-                if len(silent_chunks) > len(chunks) / 2:
-                    print(f"🚨 ISSUE: More than half the recording is silent!")
-            
-            print(f"🔍 Analysis complete\n")
-            
-        except Exception as e:
-            print(f"❌ Analysis error: {e}")
-    
-    def _normalize_audio_levels(self, audio_data):
-        """Normalize audio levels and trim silence to prevent noise amplification"""
-        try:
-            # Smart speech endpoint detection
-            # Calculate energy in 50ms windows
-            window_size = int(Config.SAMPLE_RATE * 0.05)  # 50ms
-            energy = []
-            for i in range(0, len(audio_data), window_size):
-                window = audio_data[i:i+window_size]
-                energy.append(np.mean(np.abs(window)))
-            
-            if len(energy) > 2:
-                # Find where energy drops significantly and stays low
-                max_energy = np.max(energy)
-                threshold = max_energy * 0.15  # 15% of peak energy
-                
-                # Find last high-energy window
-                last_speech = 0
-                for i in range(len(energy)-1, -1, -1):
-                    if energy[i] > threshold:
-                        last_speech = i
-                        break
-                
-                # Cut audio at this point with small tail
-                cut_sample = (last_speech + 2) * window_size  # Add 2 windows (100ms) tail
-                if cut_sample < len(audio_data):
-                    # Apply quick fade-out
-                    fade_samples = int(Config.SAMPLE_RATE * 0.05)
-                    fade_start = cut_sample
-                    fade_end = min(cut_sample + fade_samples, len(audio_data))
-                    fade_length = fade_end - fade_start
-                    if fade_length > 0:
-                        fade_curve = np.linspace(1.0, 0.0, fade_length)
-                        audio_data[fade_start:fade_end] *= fade_curve
-                    
-                    audio_data = audio_data[:fade_end]
-                    print(f"🔧 Smart trim - final duration: {len(audio_data)/Config.SAMPLE_RATE:.2f}s")
-            
-            # Simple overall normalization (no chunk boosting to avoid noise amplification)
-            max_amplitude = np.max(np.abs(audio_data))
-            if max_amplitude > 0.01:  # Only normalize if there's actual audio
-                # Normalize to 0.5 (50% of max) to avoid clipping but maintain good volume
-                target_level = 0.5
-                normalization_factor = target_level / max_amplitude
-                # Limit boost to prevent noise amplification
-                normalization_factor = min(normalization_factor, 1.5)
-                audio_data = audio_data * normalization_factor
-                print(f"✅ Audio normalized by {normalization_factor:.2f}x (peak: {max_amplitude:.3f} → {np.max(np.abs(audio_data)):.3f})")
-            
-            return audio_data
-            
-        except Exception as e:
-            print(f"⚠️ Audio normalization failed: {e}")
-            return audio_data  # Return original if normalization fails
-    
-    def _recording_worker(self):
-        """Old complex recording worker - keeping for compatibility"""
-        try:
-            def audio_callback(indata, frames, time, status):
-                if status:
-                    pass  # Audio callback status monitoring
-                self.audio_queue.put(indata.copy())
-            
-            # Initialize consecutive empty counter
-            consecutive_empty = 0
-            
-            with sd.InputStream(
-                device=self.selected_device,
-                channels=Config.CHANNELS,
-                samplerate=Config.SAMPLE_RATE,
-                dtype=Config.DTYPE,
-                callback=audio_callback,
-                blocksize=Config.CHUNK_SIZE
-            ):
-                while self.is_recording:
-                    try:
-                        # Dynamic timeout based on recording mode
-                        # Much longer timeouts for sentence recording to prevent premature stops
-                        content_type = getattr(self, 'content_type', 'word')
-                        is_sentence_mode = getattr(self, 'is_sentence_mode', False)
-                        
-                        if content_type == "paragraph":
-                            timeout_duration = 15.0  # Very long for paragraphs
-                        elif content_type == "sentence" or is_sentence_mode:
-                            timeout_duration = 12.0  # Much longer for sentences
-                        else:
-                            timeout_duration = 2.0   # Reasonable for words
-                        
-                        audio_chunk = self.audio_queue.get(timeout=timeout_duration)
-                        self.current_recording.append(audio_chunk)
-                        
-                        # Reset consecutive empty count on successful data
-                        consecutive_empty = 0
-                        
-                    except queue.Empty:
-                        # Increment consecutive empty counter properly
-                        consecutive_empty += 1
-                        
-                        # Much more patient empty cycles for sentence recording
-                        if content_type == "paragraph":
-                            max_empty_cycles = 80   # Very patient for paragraphs
-                        elif content_type == "sentence" or is_sentence_mode:
-                            max_empty_cycles = 65   # Very patient for sentences
-                        else:
-                            max_empty_cycles = 8    # Quick for words
-                        
-                        # Empty cycle monitoring (cleaned up)
-                        
-                        if consecutive_empty > max_empty_cycles:
-                            # Recording auto-stopped due to silence
-                            break
-                        continue
-                    except Exception as e:
-                        # Recording error handled
-                        break
-        except Exception as e:
-            # Recording worker error handled
-            pass  
-        finally:
-            self.is_recording = False
-            self.current_audio_level = 0.0  # Reset level for UI
-    
-    def set_sentence_mode(self, is_sentence_mode, content_type="word"):
-        """Update recording mode for dynamic timeout adjustment"""
-        self.is_sentence_mode = is_sentence_mode
-        self.content_type = content_type
-        mode_name = content_type.upper() if content_type in ["word", "sentence", "paragraph"] else ("SENTENCE" if is_sentence_mode else "WORD")
-        # AudioManager mode updated
-    
-    def stop_recording(self):
-        """Stop recording and return audio data"""
-        if not self.is_recording:
-            return None
-        
-        print(f"🛑 Stopping recording manually...")
-        self.is_recording = False
-        
-        # Stop sounddevice if it's still recording
-        try:
-            sd.stop()
-        except:
-            pass
-        
-        # Wait for recording thread to finish
-        if self.recording_thread:
-            self.recording_thread.join(timeout=2.0)
-        
-        # For simple recording, current_recording contains the direct audio data
-        if self.current_recording is not None and len(self.current_recording) > 0:
-            # Normalize to a single numpy array
-            if isinstance(self.current_recording, np.ndarray):
-                audio_data = self.current_recording
-            elif len(self.current_recording) == 1 and isinstance(self.current_recording[0], np.ndarray):
-                audio_data = self.current_recording[0]
-            else:
-                # Complex recording format - concatenate chunks
-                # Clear any remaining queue items first
-                if hasattr(self, 'audio_queue'):
-                    while not self.audio_queue.empty():
-                        try:
-                            chunk = self.audio_queue.get_nowait()
-                            self.current_recording.append(chunk)
-                        except queue.Empty:
-                            break
-                try:
-                    audio_data = np.concatenate(self.current_recording, axis=0)
-                except Exception:
-                    # Fallback: flatten list of lists
-                    audio_data = np.array(self.current_recording, dtype=np.float32).flatten()
-
-            # Ensure float32 mono array
-            try:
-                if audio_data.dtype != np.float32:
-                    audio_data = audio_data.astype(np.float32)
-                if audio_data.ndim > 1:
-                    audio_data = np.mean(audio_data, axis=1).astype(np.float32)
-            except Exception:
-                pass
-
-            # Apply noise reduction and normalization
-            processed_audio = self._process_audio(audio_data)
-            return processed_audio
-        
-        return None
-    
-    def _process_audio(self, audio_data):
-        """Enhanced audio processing to reduce noise and artifacts"""
-        try:
-            # Convert to mono if needed
-            if len(audio_data.shape) > 1:
-                audio_data = np.mean(audio_data, axis=1)
-            
-            # Convert to float if it's still int16
-            if audio_data.dtype == np.int16:
-                audio_data = audio_data.astype(np.float32) / 32768.0
-            
-            # Remove DC offset safely
-            mean_val = np.mean(audio_data)
-            if not np.isnan(mean_val) and np.isfinite(mean_val):
-                audio_data = audio_data - mean_val
-            
-            # Simple noise reduction - remove very quiet noise
-            noise_threshold = 0.01  # Threshold for noise
-            audio_data = np.where(np.abs(audio_data) < noise_threshold, 0, audio_data)
-            
-            # Gentle low-pass filter to remove high-frequency artifacts (without scipy)
-            # Simple moving average filter
-            window_size = 3
-            if len(audio_data) > window_size:
-                padded = np.pad(audio_data, (window_size//2, window_size//2), mode='edge')
-                filtered = np.convolve(padded, np.ones(window_size)/window_size, mode='valid')
-                audio_data = filtered[:len(audio_data)]
-            
-            # Soft limiting to prevent clipping distortion
-            max_amplitude = np.max(np.abs(audio_data))
-            if max_amplitude > 0 and np.isfinite(max_amplitude):
-                # Gentle compression instead of hard limiting
-                if max_amplitude > 0.9:
-                    compression_ratio = 0.8 / max_amplitude
-                    audio_data = np.tanh(audio_data * compression_ratio) * 0.8
-                else:
-                    # Normal normalization
-                    audio_data = audio_data / max_amplitude * 0.8
-            
-            # Ensure no NaN or infinite values
-            audio_data = np.nan_to_num(audio_data, nan=0.0, posinf=0.0, neginf=0.0)
-            
-            # Final range check
-            audio_data = np.clip(audio_data, -1.0, 1.0)
-            
-            return audio_data.astype(np.float32)
-        except Exception as e:
-            print(f"Audio processing error: {e}")
-            # Return safe fallback
-            return np.zeros_like(audio_data, dtype=np.float32)
-    
-    def play_audio(self, audio_data):
-        """Play audio data"""
-        try:
-            if audio_data is not None and len(audio_data) > 0:
-                sd.play(audio_data, samplerate=Config.SAMPLE_RATE)
-                return True
-            return False
-        except Exception as e:
-            print(f"Playback error: {e}")
-            return False
-    
-    def save_audio(self, audio_data, filename):
-        """Save audio data to file with validation"""
-        try:
-            if audio_data is None or len(audio_data) == 0:
-                print(f"❌ No audio data to save for {filename}")
-                return False
-            
-            # Validate audio content
-            max_amplitude = np.max(np.abs(audio_data))
-            print(f"💾 Saving audio: {filename}, Max amplitude: {max_amplitude:.6f}")
-            
-            if max_amplitude < 0.0001:
-                print(f"⚠️ Warning: Very quiet audio (amplitude: {max_amplitude:.6f}) - saving anyway")
-            
-            filepath = Config.AUDIO_DIR / filename
-            sf.write(filepath, audio_data, Config.SAMPLE_RATE)
-            
-            # Verify file was written
-            if filepath.exists():
-                file_size = filepath.stat().st_size
-                print(f"✅ Audio saved: {filename} ({file_size} bytes)")
-                return True
-            else:
-                # File save verification
-                return False
-                
-        except Exception as e:
-            print(f"❌ Save error for {filename}: {e}")
-            return False
-
-
-class WordManager:
-    """Enhanced word list manager with progress tracking"""
-    
-    def __init__(self):
-        self.words = []  # Sadece kelimeler
-        self.sentences = []  # Sadece cümleler
-        self.recorded_words = set()
-        # Multi-speed recording tracking
-        self.recorded_speeds = {}  # {"word": {"slow": True, "normal": False, "fast": True}}
-        self.current_recording_speed = "normal"  # "slow", "normal", "fast"
-        self.current_index = 0
-        self.speaker_id = self.load_speaker_id()
-        self.is_sentence_mode = False  # Kelime/Cümle modu (backward compatibility)
-        self.current_content_type = "word"  # "word", "sentence", "paragraph"
-        self.paragraphs = []  # Paragraf listesi
-        self.load_data()
-        self.load_paragraphs()
-    
-    def load_speaker_id(self):
-        """Konuşmacı ID'sini yükle"""
-        try:
-            speaker_file = Config.BASE_DIR / "speaker_config.txt"
-            if speaker_file.exists():
-                with open(speaker_file, "r", encoding="utf-8") as f:
-                    return f.read().strip()
-        except:
-            pass
-        return "default"  # Varsayılan ID
-    
-    def load_data(self):
-        """Load words, sentences and recording progress"""
-        try:
-            # Load word list (individual words only)
-            if Config.WORDS_FILE.exists():
-                with open(Config.WORDS_FILE, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    # Sadece kelimeleri yükle (cümle olmayan)
-                    all_items = data.get('words', [])
-                    self.words = [item for item in all_items if not self.is_sentence(item)]
-                    print(f"✅ Loaded {len(self.words)} words from wordlist.json")
-                    self.current_index = data.get('current_index', 0)
-            
-            # Load sentence list (sentences only)
-            if Config.SENTENCES_FILE.exists():
-                with open(Config.SENTENCES_FILE, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.sentences = data.get('sentences', [])
-            else:
-                # Eğer sentence dosyası yoksa, mevcut wordlist'ten cümleleri ayır
-                if Config.WORDS_FILE.exists():
-                    with open(Config.WORDS_FILE, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        all_items = data.get('words', [])
-                        self.sentences = [item for item in all_items if self.is_sentence(item)]
-                    self.save_sentences()  # Ayrı dosyaya kaydet
-            
-            # Load metadata (recorded words)
-            if Config.METADATA_FILE.exists():
-                with open(Config.METADATA_FILE, 'r', encoding='utf-8') as f:
-                    metadata = json.load(f)
-                    self.recorded_words = set(metadata.get('recorded_words', []))
-                    self.recorded_speeds = metadata.get('recorded_speeds', {})
-        except Exception as e:
-            print(f"Error loading data: {e}")
-            self.words = []
-            self.sentences = []
-            self.recorded_words = set()
-            self.recorded_speeds = {}
-            self.current_index = 0
-    
-    def save_data(self):
-        """Save words and recording progress"""
-        try:
-            # Save word list (kelimeler)
-            word_data = {
-                'words': self.words,
-                'current_index': self.current_index,
-                'last_updated': datetime.now().isoformat()
-            }
-            with open(Config.WORDS_FILE, 'w', encoding='utf-8') as f:
-                json.dump(word_data, f, ensure_ascii=False, indent=2)
-            
-            # Save sentences separately
-            self.save_sentences()
-            
-            # Save paragraphs separately
-            self.save_paragraphs()
-            
-            # Save metadata
-            metadata = {
-                'recorded_words': list(self.recorded_words),
-                'recorded_speeds': self.recorded_speeds,  # Multi-speed tracking
-                'total_words': len(self.words),
-                'total_sentences': len(self.sentences),
-                'total_paragraphs': len(self.paragraphs),
-                'last_updated': datetime.now().isoformat()
-            }
-            with open(Config.METADATA_FILE, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            print(f"Error saving data: {e}")
-    
-    def save_sentences(self):
-        """Save sentences to separate file"""
-        try:
-            sentence_data = {
-                'sentences': self.sentences,
-                'last_updated': datetime.now().isoformat()
-            }
-            with open(Config.SENTENCES_FILE, 'w', encoding='utf-8') as f:
-                json.dump(sentence_data, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            print(f"Error saving sentences: {e}")
-    
-    def load_paragraphs(self):
-        """Load paragraphs from file or create sample paragraphs"""
-        try:
-            # Load from file if exists
-            if Config.PARAGRAPHS_FILE.exists():
-                with open(Config.PARAGRAPHS_FILE, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.paragraphs = data.get('paragraphs', [])
-                    print(f"Loaded {len(self.paragraphs)} paragraphs from file")
-            else:
-                # Create sample Kurdish paragraphs for recording
-                self.paragraphs = [
-                    "Ez ji Kurdistan hatim û Kurdistan gelek cîhek xweş e. Xelkê me gelek xwedî rûmet in û ev erd ji me re gelek giring e. Em dixwazin ku zarokên me bi zimanê xwe mezin bibin.",
-                    "Rojhilata navîn gelek caran di şer û pevçûnê de maye. Lê gelê Kurd her dem hêviya aştiyê kiriye û dixwaze ku li vir jiyan aram be. Çanda me dewlemend e û em ê wê biparêzin.",
-                    "Zimanê kurdî gelek kevnar û dewlemend e. Em dixwazin ku zarokên xwe bi vî zimanî axivin û nivîsin. Pirtûkên kurdî, stranên kurdî û çîrokên kurdî girîng in ji bo me.",
-                    "Li gundên Kurdistan, xelk bi çandiniyê mijûl dibin. Genim, ceriş û darên fêkiyê gelek in. Rûbarên me gelek xweş in û av gelekî pak e.",
-                    "Stranbêjên kurd gelek navdar in. Stranên wan li her cîhê cîhanê tên gotin. Muzîka kurdî dilê mirov dixoşe û rûhê mirovan geş dike."
-                ]
-                self.save_paragraphs()
-                # Sample paragraphs created
-                    
-        except Exception as e:
-            print(f"Error loading paragraphs: {e}")
-            # Fallback to sample paragraphs
-            self.paragraphs = [
-                "Ez ji Kurdistan hatim û Kurdistan gelek cîhek xweş e. Xelkê me gelek xwedî rûmet in û ev erd ji me re gelek giring e.",
-                "Zimanê kurdî gelek kevnar û dewlemend e. Em dixwazin ku zarokên xwe bi vî zimanî axivin û nivîsin."
-            ]
-    
-    def save_paragraphs(self):
-        """Save paragraphs to separate file"""
-        try:
-            paragraph_data = {
-                'paragraphs': self.paragraphs,
-                'last_updated': datetime.now().isoformat()
-            }
-            with open(Config.PARAGRAPHS_FILE, 'w', encoding='utf-8') as f:
-                json.dump(paragraph_data, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            print(f"Error saving paragraphs: {e}")
-    
-    def add_words(self, new_words):
-        """Add new words or sentences to appropriate lists"""
-        added_words = 0
-        added_sentences = 0
-        
-        for item in new_words:
-            item = item.strip()
-            if not item:
-                continue
-                
-            if self.is_sentence(item):
-                # Cümle ise sentences listesine ekle
-                if item not in self.sentences:
-                    self.sentences.append(item)
-                    added_sentences += 1
-            else:
-                # Kelime ise words listesine ekle
-                if item not in self.words:
-                    self.words.append(item)
-                    added_words += 1
-        
-        if added_words > 0 or added_sentences > 0:
-            self.save_data()
-        
-        return added_words + added_sentences
-    
-    def get_current_word(self):
-        """Get the current word or sentence based on active mode"""
-        filtered_content = self.get_filtered_content()
-        if 0 <= self.current_index < len(filtered_content):
-            return filtered_content[self.current_index]
-        return None
-    
-    def next_word(self):
-        """Move to next unrecorded word or sentence based on active mode"""
-        filtered_content = self.get_filtered_content()
-        
-        # İlk olarak kayıt edilmemiş içerik bul
-        for i in range(self.current_index + 1, len(filtered_content)):
-            if filtered_content[i] not in self.recorded_words:
-                self.current_index = i
-                self.save_data()
-                return self.get_current_word()
-        
-        # Eğer sonunda kayıt edilmemiş içerik yoksa, baştan ara
-        for i in range(0, self.current_index):
-            if filtered_content[i] not in self.recorded_words:
-                self.current_index = i
-                self.save_data()
-                return self.get_current_word()
-        
-        # Tüm içerik kayıt edilmişse normal ilerleme
-        if self.current_index < len(filtered_content) - 1:
-            self.current_index += 1
-            self.save_data()
-        return self.get_current_word()
-    
-    def previous_word(self):
-        """Move to previous word or sentence (recorded or not)"""
-        # Normal geri gitme - kaydedilen içeriği de göster
-        if self.current_index > 0:
-            self.current_index -= 1
-            self.save_data()
-        return self.get_current_word()
-    
-    def mark_recorded(self, word, audio_filename=None):
-        """Mark a word as recorded and update Whisper training files"""
-        self.recorded_words.add(word)
-        
-        # Whisper eğitimi için kayıt
-        if audio_filename:
-            self.update_whisper_files(word, audio_filename)
-        
-        self.save_data()
-    
-    def update_whisper_files(self, transcript, audio_filename):
-        """Whisper eğitimi için gerekli dosyaları güncelle"""
-        try:
-            # JSONL formatında Whisper manifest dosyasını güncelle
-            manifest_entry = {
-                "audio_filepath": f"audio/{audio_filename}",
-                "text": transcript.strip(),
-                "language": "ku",  # Kurdish language code
-                "duration": 2.0,  # Varsayılan süre
-                "speaker_id": self.speaker_id
-            }
-            
-            # Manifest dosyasına ekle
-            with open(Config.WHISPER_MANIFEST, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(manifest_entry, ensure_ascii=False) + '\n')
-            
-            # Transkript dosyasına ekle (basit format)
-            with open(Config.TRANSCRIPT_FILE, 'a', encoding='utf-8') as f:
-                f.write(f"{audio_filename}\t{transcript.strip()}\n")
-                
-            print(f"✅ Whisper eğitim dosyaları güncellendi: {audio_filename} -> '{transcript}'")
-            
-        except Exception as e:
-            print(f"❌ Whisper dosyaları güncellenirken hata: {e}")
-    
-    def is_current_recorded(self):
-        """Check if current word is recorded"""
-        current_word = self.get_current_word()
-        return current_word in self.recorded_words if current_word else False
-    
-    def get_word_speed_status(self, word):
-        """Get recording status for all speeds of a word"""
-        if word not in self.recorded_speeds:
-            return {"slow": False, "normal": False, "fast": False}
-        return self.recorded_speeds.get(word, {"slow": False, "normal": False, "fast": False})
-    
-    def mark_speed_recorded(self, word, speed, audio_filename=None):
-        """Mark a specific speed as recorded for a word"""
-        if word not in self.recorded_speeds:
-            self.recorded_speeds[word] = {"slow": False, "normal": False, "fast": False}
-        
-        self.recorded_speeds[word][speed] = True
-        
-        # Mark word as recorded if any speed is recorded
-        self.recorded_words.add(word)
-        
-        # Whisper eğitimi için kayıt
-        if audio_filename:
-            self.update_whisper_files(word, audio_filename)
-        
-        self.save_data()
-        print(f"✅ {word} - {speed} speed recorded: {audio_filename}")
-    
-    def get_missing_speeds(self, word):
-        """Get list of missing speeds for a word"""
-        speeds = self.get_word_speed_status(word)
-        missing = [speed for speed, recorded in speeds.items() if not recorded]
-        return missing
-    
-    def get_completion_status(self, word):
-        """Get completion percentage for a word (0-100)"""
-        speeds = self.get_word_speed_status(word)
-        completed = sum(1 for recorded in speeds.values() if recorded)
-        return (completed / 3) * 100  # 3 speeds total
-    
-    def set_recording_speed(self, speed):
-        """Set current recording speed"""
-        if speed in ["slow", "normal", "fast"]:
-            self.current_recording_speed = speed
-            print(f"🎚️ Recording speed set to: {speed.upper()}")
-        else:
-            print(f"❌ Invalid speed: {speed}. Use 'slow', 'normal', or 'fast'")
-    
-    def generate_speed_filename(self, word, speed):
-        """Generate filename for specific word and speed"""
-        # Get next available number
-        existing_files = list(Config.AUDIO_DIR.glob("*.wav"))
-        numbers = []
-        for f in existing_files:
-            match = re.match(r'^(\d{6})_', f.name)
-            if match:
-                numbers.append(int(match.group(1)))
-        
-        next_number = max(numbers, default=0) + 1
-        
-        # Clean word for filename
-        clean_word = re.sub(r'[^\w\s\-]', '', word).replace(' ', '_')
-        
-        return f"{next_number:06d}_{clean_word}_{speed}.wav"
-    
-    def get_progress(self):
-        """Get recording progress based on active mode"""
-        filtered_content = self.get_filtered_content()
-        
-        # Filtrelenmiş içerikteki kayıtlı öğeleri say
-        recorded_in_filtered = sum(1 for item in filtered_content if item in self.recorded_words)
-        total_filtered = len(filtered_content)
-        
-        return recorded_in_filtered, total_filtered
-    
-    def extract_transcript_from_filename(self, filename):
-        """Dosya isminden transkripti çıkar"""
-        try:
-            import re
-            
-            # Dosya uzantısını kaldır
-            basename = filename.stem if hasattr(filename, 'stem') else Path(filename).stem
-            
-            # Farklı formatları dene (öncelik sırasına göre)
-            patterns = [
-                # Whisper formatı: 000001_word
-                r'^\d{6}_(.+)$',
-                
-                # Duplikat formatı: 000001_000002_word
-                r'^\d{6}_\d{6}_(.+)$',
-                
-                # Tarih-saat formatları
-                r'^(.+?)_\d{8}_\d{6}$',  # word_20251004_123456
-                r'^(.+?)_\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2}$',  # word_2024-01-15_14-30-45
-                
-                # Timestamp formatları
-                r'^(.+?)_\d{10,}$',  # word_1234567890 (unix timestamp)
-                r'^(.+?)_\d+$',  # word_123456789
-                
-                # Özel formatlar
-                r'^(.+?)_recording$',  # word_recording
-                r'^(.+?)_audio$',  # word_audio
-                
-                # Sadece kelime
-                r'^(.+)$'
-            ]
-            
-            for pattern in patterns:
-                match = re.match(pattern, basename)
-                if match:
-                    transcript = match.group(1).strip()
-                    if transcript and not transcript.isdigit():  # Sadece rakam değilse
-                        # Özel karakterleri temizle
-                        transcript = re.sub(r'[^\w\s\-\.\_]', '', transcript)
-                        return transcript
-            
-            # Hiçbir pattern uymazsa basename'i döndür
-            return re.sub(r'[^\w\s\-\.\_]', '', basename)
-            
-        except Exception as e:
-            print(f"❌ Dosya isminden transkript çıkarılırken hata: {e}")
-            return str(filename).replace('.wav', '')
-    
-    def convert_old_audio_files(self):
-        """Eski ses dosyalarını Whisper formatına dönüştür ve duplikatları temizle"""
-        try:
-            from tkinter import messagebox
-            import shutil
-            import re
-            from pathlib import Path
-            import json
-            
-            if not Config.AUDIO_DIR.exists():
-                messagebox.showwarning("Uyarı", "Audio klasörü bulunamadı!")
-                return
-            
-            # Tüm ses dosyalarını al
-            all_audio_files = list(Config.AUDIO_DIR.glob("*.wav"))
-            if not all_audio_files:
-                messagebox.showinfo("Bilgi", "Ses dosyası bulunamadı!")
-                return
-            
-            conversion_log = []
-            
-            # Dosyaları kategorilere ayır
-            whisper_format_files = []  # 000001_word.wav formatındaki dosyalar
-            old_format_files = []      # word_timestamp.wav formatındaki dosyalar
-            duplicate_files = []       # 000001_000002_word.wav gibi duplikatlar
-            
-            for audio_file in all_audio_files:
-                filename = audio_file.name
-                
-                # Whisper formatı kontrolü (000001_word.wav)
-                if re.match(r'^\d{6}_[^_]+.*\.wav$', filename):
-                    # Duplikat kontrolü (000001_000002_word.wav)
-                    if re.match(r'^\d{6}_\d{6}_.*\.wav$', filename):
-                        duplicate_files.append(audio_file)
-                    else:
-                        whisper_format_files.append(audio_file)
-                else:
-                    # Eski format (word_timestamp.wav, word.wav vs)
-                    old_format_files.append(audio_file)
-            
-            conversion_log.append(f"📊 Dosya Kategorileri:")
-            conversion_log.append(f"   • Whisper formatı: {len(whisper_format_files)}")
-            conversion_log.append(f"   • Eski format: {len(old_format_files)}")
-            conversion_log.append(f"   • Duplikatlar: {len(duplicate_files)}")
-            conversion_log.append("")
-            
-            # Duplikatları sil
-            if duplicate_files:
-                conversion_log.append("🗑️ Duplikat dosyalar siliniyor:")
-                for dup_file in duplicate_files:
-                    try:
-                        dup_file.unlink()
-                        conversion_log.append(f"   ✅ Silindi: {dup_file.name}")
-                    except Exception as e:
-                        conversion_log.append(f"   ❌ Silinemedi: {dup_file.name} - {e}")
-                conversion_log.append("")
-            
-            # Mevcut Whisper manifest'i temizle ve yeniden oluştur
-            if Config.WHISPER_MANIFEST.exists():
-                Config.WHISPER_MANIFEST.unlink()
-            if Config.TRANSCRIPT_FILE.exists():
-                Config.TRANSCRIPT_FILE.unlink()
-            
-            conversion_log.append("🔄 Whisper dosyaları yeniden oluşturuluyor:")
-            
-            # Whisper formatındaki dosyalar için manifest yeniden oluştur
-            current_whisper_files = []
-            for audio_file in whisper_format_files:
-                try:
-                    # Transkript çıkar
-                    transcript = self.extract_transcript_from_filename(audio_file.name)
-                    self.update_whisper_files(transcript, audio_file.name)
-                    current_whisper_files.append((audio_file.name, transcript))
-                    conversion_log.append(f"   ✅ Manifest güncellendi: {audio_file.name}")
-                except Exception as e:
-                    conversion_log.append(f"   ❌ Hata: {audio_file.name} - {e}")
-            
-            # Eski formatdaki dosyaları dönüştür
-            if old_format_files:
-                conversion_log.append("")
-                conversion_log.append("🔄 Eski format dosyalar dönüştürülüyor:")
-                
-                # Yeni numara başlangıcı
-                next_number = len(current_whisper_files) + 1
-                
-                for audio_file in old_format_files:
-                    try:
-                        # Transkript çıkar
-                        transcript = self.extract_transcript_from_filename(audio_file.name)
-                        
-                        # Yeni dosya adı
-                        new_filename = f"{next_number:06d}_{transcript}.wav"
-                        new_filepath = Config.AUDIO_DIR / new_filename
-                        
-                        # Dosyayı yeni isimle kopyala
-                        shutil.copy2(audio_file, new_filepath)
-                        
-                        # Whisper dosyalarını güncelle
-                        self.update_whisper_files(transcript, new_filename)
-                        
-                        # Eski dosyayı sil
-                        audio_file.unlink()
-                        
-                        conversion_log.append(f"   ✅ Dönüştürüldü: {audio_file.name} → {new_filename}")
-                        next_number += 1
-                        
-                    except Exception as e:
-                        conversion_log.append(f"   ❌ Hata: {audio_file.name} - {e}")
-            
-            conversion_log.append("")
-            conversion_log.append("✅ Dönüştürme tamamlandı!")
-            
-            # Sonuçları göster
-            messagebox.showinfo("Başarılı", 
-                f"🎯 Whisper Dönüştürme Tamamlandı!\n\n"
-                f"✅ Duplikatlar temizlendi: {len(duplicate_files)}\n"
-                f"� Eski formatlar dönüştürüldü: {len(old_format_files)}\n"
-                f"📋 Toplam Whisper dosyası: {len(current_whisper_files) + len(old_format_files)}\n\n"
-                f"📁 Manifest: whisper_manifest.jsonl\n"
-                f"📄 Transkript: transcripts.txt")
-            
-            # Dönüştürme logunu sakla
-            self.conversion_log = conversion_log
-            
-        except Exception as e:
-            messagebox.showerror("Hata", f"Dönüştürme sırasında hata oluştu: {str(e)}")
-    
-    def show_conversion_log(self):
-        """Dönüştürme logunu göster"""
-        if not hasattr(self, 'conversion_log') or not self.conversion_log:
-            from tkinter import messagebox
-            messagebox.showinfo("Bilgi", "Henüz dönüştürme işlemi yapılmamış.")
-            return
-        
-        log_text = "🔄 Whisper Dönüştürme Logu\n" + "="*50 + "\n\n"
-        for entry in self.conversion_log:
-            log_text += f"{entry}\n"
-        
-        # Log penceresini göster
-        import customtkinter as ctk
-        log_window = ctk.CTkToplevel()
-        log_window.title("Dönüştürme Logu")
-        log_window.geometry("800x600")
-        
-        text_widget = ctk.CTkTextbox(
-            log_window, 
-            width=760, 
-            height=540,
-            font=ctk.CTkFont(family="Consolas", size=11)
-        )
-        text_widget.pack(padx=20, pady=20)
-        text_widget.insert("1.0", log_text)
-        text_widget.configure(state="disabled")
-
-    def find_first_unrecorded_word(self):
-        """Find and jump to the first unrecorded word or sentence based on active mode"""
-        filtered_content = self.get_filtered_content()
-        
-        for i, item in enumerate(filtered_content):
-            if item not in self.recorded_words:
-                self.current_index = i
-                self.save_data()
-                return item
-        
-        # If all content is recorded, stay at current position
-        return self.get_current_word()
-    
-    def jump_to_first_unrecorded(self):
-        """Jump to first unrecorded word and return True if found"""
-        first_unrecorded = self.find_first_unrecorded_word()
-        return first_unrecorded is not None and first_unrecorded not in self.recorded_words
-    
-    def separate_mixed_content(self):
-        """Mevcut karışık içeriği kelime ve cümlelere ayır"""
-        try:
-            # Mevcut wordlist dosyasından tüm içeriği yükle
-            if Config.WORDS_FILE.exists():
-                with open(Config.WORDS_FILE, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    all_items = data.get('words', [])
-                
-                # İçeriği ayır
-                separated_words = []
-                separated_sentences = []
-                
-                for item in all_items:
-                    if self.is_sentence(item):
-                        separated_sentences.append(item)
-                    else:
-                        separated_words.append(item)
-                
-                # Listeleri güncelle
-                self.words = separated_words
-                self.sentences = separated_sentences
-                
-                # Dosyalara kaydet
-                self.save_data()
-                
-                print(f"✅ Content separated: {len(separated_words)} words, {len(separated_sentences)} sentences")
-                return len(separated_words), len(separated_sentences)
-        except Exception as e:
-            print(f"Error separating content: {e}")
-            return 0, 0
-    
-    def is_sentence(self, text):
-        """Bir metnin cümle mi kelime mi olduğunu tespit et"""
-        if not text or not text.strip():
-            return False
-        
-        text = text.strip()
-        text_lower = text.lower()
-        
-        # 1. Noktalama işaretleri - kesin cümle belirtisi
-        punctuation_marks = ['?', '!', '.']
-        for mark in punctuation_marks:
-            if mark in text:
-                return True
-        
-        # 2. Boşluk içeriyor - çoklu kelime
-        if ' ' in text:
-            return True
-        
-        # 3. Kurmancî özel cümle kalıpları
-        kurdish_sentence_patterns = [
-            # Soru kalıpları
-            'çawa', 'kî', 'kengî', 'li ku', 'li kî', 'çi', 'çend',
-            # Fiil çekimleri (cümle sonları)
-            ' im', ' e', ' in', ' yî', ' ne', ' n', ' re',
-            # Cümle başlangıçları
-            'ez ', 'tu ', 'ew ', 'em ', 'hûn ', 'ewan ',
-            # Yaygın cümle kelimeleri
-            'dixwazim', 'dibînim', 'dikim', 'diçim', 'tê'
-        ]
-        
-        for pattern in kurdish_sentence_patterns:
-            if pattern in text_lower:
-                return True
-        
-        # 4. Uzunluk kontrolü - 12+ karakter muhtemelen cümle
-        if len(text) >= 12:
-            return True
-            
-        # 5. Üç kelimeden fazlaysa kesinlikle cümle
-        word_count = len(text.split())
-        if word_count >= 3:
-            return True
-        
-        # 6. İki kelime ama yaygın cümle kalıpları
-        if word_count == 2:
-            two_word_sentence_patterns = [
-                'roj baş', 'spas dikim', 'ez hatim', 'tu çû', 'ew hat',
-                'em çûn', 'hûn hatin', 'gellek spas', 'her tim'
-            ]
-            for pattern in two_word_sentence_patterns:
-                if pattern in text_lower:
-                    return True
-            
-        return False
-    
-    def get_filtered_content(self):
-        """Aktif moda göre filtrelenmiş içerik döndür"""
-        if self.current_content_type == "paragraph":
-            # Paragraf modu
-            # Paragraph mode loaded
-            if self.paragraphs:
-                # Paragraphs loaded successfully
-                pass
-            else:
-                # No paragraphs found
-                pass
-            return self.paragraphs
-        elif self.is_sentence_mode or self.current_content_type == "sentence":
-            # Cümle modu - sentences listesini kullan
-            # Sentence mode loaded
-            if self.sentences:
-                # Sentences loaded successfully
-                pass
-            else:
-                # No sentences found
-                pass
-            return self.sentences
-        else:
-            # Kelime modu - words listesini kullan
-            # Word mode loaded
-            if self.words:
-                # Words loaded successfully
-                pass
-            return self.words
-
-
-class DocumentProcessor:
-    """Document processing utilities"""
-    
-    @staticmethod
-    def load_words_from_file(filepath):
-        """Load words from various file types"""
-        try:
-            file_path = Path(filepath)
-            
-            if not file_path.exists():
-                return []
-            
-            content = ""
-            
-            if file_path.suffix.lower() == '.txt':
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-            
-            elif file_path.suffix.lower() == '.docx':
-                doc = docx.Document(file_path)
-                content = '\n'.join([paragraph.text for paragraph in doc.paragraphs])
-            
-            elif file_path.suffix.lower() == '.pdf':
-                with open(file_path, 'rb') as f:
-                    pdf_reader = PyPDF2.PdfReader(f)
-                    content = ""
-                    for page in pdf_reader.pages:
-                        content += page.extract_text() + "\n"
-            
-            return DocumentProcessor._extract_words(content)
-        
-        except Exception as e:
-            print(f"Error loading file {filepath}: {e}")
-            return []
-    
-    @staticmethod
-    def _extract_words(content):
-        """Extract words from text content"""
-        if not content:
-            return []
-        
-        # Split into words and clean them
-        words = []
-        for line in content.split('\n'):
-            line = line.strip()
-            if line:
-                # Split by common delimiters and clean
-                for word in re.split(r'[,;.\s]+', line):
-                    word = word.strip()
-                    if word and len(word) > 1:
-                        words.append(word)
-        
-        return list(set(words))  # Remove duplicates
+        """Set the current language"""
+        if lang_code in self.translations:
+            self.current_language = lang_code
     
-    @staticmethod
-    def get_manual_words_dialog(parent):
-        """Show dialog to manually enter words"""
-        dialog = ctk.CTkToplevel(parent)
-        dialog.title("Add Words Manually")
-        dialog.geometry("600x500")
-        dialog.transient(parent)
-        dialog.grab_set()
-        
-        # Center the dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() - dialog.winfo_width()) // 2
-        y = (dialog.winfo_screenheight() - dialog.winfo_height()) // 2
-        dialog.geometry(f"+{x}+{y}")
-        
-        main_frame = ctk.CTkFrame(dialog)
-        main_frame.pack(fill="both", expand=True, padx=20, pady=20)
-        
-        # Instructions
-        ctk.CTkLabel(
-            main_frame,
-            text="📝 Add Words or Sentences",
-            font=ctk.CTkFont(size=18, weight="bold")
-        ).pack(pady=(10, 5))
-        
-        ctk.CTkLabel(
-            main_frame,
-            text="Enter words or sentences (one per line):",
-            font=ctk.CTkFont(size=12)
-        ).pack(pady=(0, 10))
-        
-        # Text area
-        text_widget = ctk.CTkTextbox(
-            main_frame,
-            width=550,
-            height=300,
-            font=ctk.CTkFont(family="Consolas", size=12)
-        )
-        text_widget.pack(pady=(0, 20))
-        
-        # Sample text
-        sample_text = """spî
-reş
-sor
-kesk
-zer
-Example sentence: Ez hêviya te dikim."""
-        text_widget.insert("1.0", sample_text)
-        
-        result = {'words': None}
-        
-        def save_words():
-            content = text_widget.get("1.0", "end").strip()
-            if content:
-                lines = [line.strip() for line in content.split('\n') if line.strip()]
-                result['words'] = lines
-            dialog.destroy()
-        
-        def cancel():
-            result['words'] = None
-            dialog.destroy()
-        
-        # Buttons
-        button_frame = ctk.CTkFrame(main_frame)
-        button_frame.pack(fill="x")
-        
-        ctk.CTkButton(
-            button_frame,
-            text="💾 Add Words",
-            command=save_words,
-            width=150,
-            height=40,
-            fg_color="green",
-            hover_color="darkgreen"
-        ).pack(side="left", padx=(20, 10), pady=10)
-        
-        ctk.CTkButton(
-            button_frame,
-            text="❌ Cancel",
-            command=cancel,
-            width=100,
-            height=40
-        ).pack(side="right", padx=(10, 20), pady=10)
-        
-        # Wait for dialog to close
-        dialog.wait_window()
-        
-        return result['words']
+    def get(self, key: str) -> str:
+        """Get translated text for the current language"""
+        return self.translations.get(self.current_language, {}).get(key, key)
+    
+    def get_available_languages(self) -> List[Tuple[str, str]]:
+        """Get list of available languages"""
+        return [
+            ("en", "English"),
+            ("tr", "Türkçe"),
+            ("ku", "Kurmancî")
+        ]
 
+# Global language manager instance
+lang = LanguageManager()
 
 class SimpleWordViewer:
     """Enhanced word viewer with checkbox selection and bulk operations"""
@@ -2195,6 +342,7 @@ class SimpleWordViewer:
         self.selected_words = set()  # Track selected words
         self.word_checkboxes = {}    # Map words to checkbox widgets
         self.filtered_words = []     # Current filtered word list
+        self.flagged_words = set()   # Words with takes flagged by verification
         
         # Pagination variables
         self.current_page = 0
@@ -2312,6 +460,14 @@ class SimpleWordViewer:
             command=self.filter_words
         ).pack(side="left", padx=5)
         
+        ctk.CTkRadioButton(
+            filter_controls,
+            text="⚠️ Suspicious",
+            variable=self.filter_var,
+            value="flagged",
+            command=self.filter_words
+        ).pack(side="left", padx=5)
+        
         # All action buttons above word list (duplicated for easy access)
         top_buttons_frame = ctk.CTkFrame(main_frame)
         top_buttons_frame.pack(fill="x", pady=(0, 10))
@@ -2465,7 +621,6 @@ class SimpleWordViewer:
         
 
 
-
         
         # Keyboard shortcuts
         self.dialog.bind('<Control-f>', lambda e: self.focus_search())
@@ -2511,6 +666,9 @@ class SimpleWordViewer:
             self.filtered_words = unrecorded_words
         elif filter_type == "recorded":
             self.filtered_words = recorded_words
+        elif filter_type == "flagged":
+            flagged = self.word_manager.get_flagged_words()
+            self.filtered_words = [word for word in recorded_words if word in flagged]
         
         # Calculate pagination
         self.total_pages = max(1, (len(self.filtered_words) + self.words_per_page - 1) // self.words_per_page)
@@ -2520,6 +678,7 @@ class SimpleWordViewer:
             self.current_page = 0
         
         # Create checkboxes for current page only
+        self.flagged_words = self.word_manager.get_flagged_words()
         self.display_current_page()
         
         # Update pagination info
@@ -2537,6 +696,8 @@ class SimpleWordViewer:
         """Create a checkbox for a word"""
         is_recorded = word in self.word_manager.recorded_words
         status_icon = "✅" if is_recorded else "⭕"
+        if is_recorded and word in self.flagged_words:
+            status_icon = "⚠️"
         
         # Create frame for this word
         word_frame = ctk.CTkFrame(self.word_list_frame)
@@ -3221,10 +1382,13 @@ class SimplifiedRecorderApp:
     def __init__(self):
         # Set default language to Turkish for Kurdish recorder
         lang.set_language("tr")
+        Config.ensure_dirs()
         
         # Initialize managers
         self.audio_manager = AudioManager()
+        STARTUP_MARKS.append(("AudioManager", time.perf_counter()))
         self.word_manager = WordManager()
+        STARTUP_MARKS.append(("WordManager", time.perf_counter()))
         
         # Set initial recording mode in audio manager
         self.audio_manager.set_sentence_mode(self.word_manager.is_sentence_mode, self.word_manager.current_content_type)
@@ -3233,6 +1397,11 @@ class SimplifiedRecorderApp:
         self.current_recording = None
         self.is_recording = False
         self.menu_window = None
+        self.take_verifier = TakeVerifier()
+        self.task_runner = TaskRunner()
+        self.task_poll_scheduled = False
+        self.task_panel = None
+        self.url_fetcher = None  # İlk URL importunda oluşturulur (requests'i geç yükle)
         
         # Initialize UI
         ctk.set_appearance_mode(Config.UI_THEME)
@@ -3241,14 +1410,20 @@ class SimplifiedRecorderApp:
         self.root = ctk.CTk()
         self.root.title("Kurmanji Word Recorder - Enhanced")
         self.root.geometry("900x600")
+        STARTUP_MARKS.append(("customtkinter + root window", time.perf_counter()))
         
         self.setup_ui()
+        STARTUP_MARKS.append(("setup_ui", time.perf_counter()))
         self.check_microphone_status()
         
         # Auto-jump to first unrecorded word on startup
         self.jump_to_first_unrecorded_word()
         
         self.update_word_display()
+        STARTUP_MARKS.append(("first word display", time.perf_counter()))
+        
+        if self.take_verifier.available():
+            self.root.after(1000, self.poll_take_verification)
     
     def setup_ui(self):
         """Setup the simplified UI"""
@@ -3629,6 +1804,7 @@ class SimplifiedRecorderApp:
             text_color=("green", "lightgreen")
         )
         self.status_label.pack(pady=(0, 10))
+        self.status_label.bind("<Button-1>", lambda event: self.show_task_panel())
     
 
 
@@ -3678,6 +1854,7 @@ class SimplifiedRecorderApp:
             (lang.get('show_conversion_results'), self.show_whisper_status, "blue"),
             (lang.get('generate_sentence_list'), self.generate_sentence_list, "green"),
             (lang.get('audio_quality_test'), self.audio_quality_test, "orange"),
+            (lang.get('quality_report'), self.show_quality_report, "orange"),
             (lang.get('audio_augmentation'), self.audio_augmentation_dialog, "red"),
             (lang.get('whisper_training_prep'), self.prepare_whisper_training, "purple")
         ])
@@ -3694,6 +1871,7 @@ class SimplifiedRecorderApp:
             (lang.get('split_word_list'), self.split_word_list, "purple"),
             (lang.get('create_sub_list'), self.create_sub_list, "orange"),
             (lang.get('random_distribute'), self.random_distribute, "blue"),
+            (lang.get('coverage_schedule'), self.toggle_coverage_schedule, "green"),
             (lang.get('show_list_stats'), self.show_list_stats, "gray")
         ])
         
@@ -3702,15 +1880,21 @@ class SimplifiedRecorderApp:
             (lang.get('import_txt'), lambda: self.load_document('txt'), "blue"),
             (lang.get('import_docx'), lambda: self.load_document('docx'), "blue"),
             (lang.get('import_pdf'), lambda: self.load_document('pdf'), "blue"),
+            (lang.get('import_sentences'), self.load_sentences_from_documents, "purple"),
             (lang.get('load_from_url'), self.load_from_url, "blue"),
+            (lang.get('load_from_urls'), self.load_from_urls, "blue"),
+            (lang.get('import_frequency'), self.load_documents_by_frequency, "purple"),
             (lang.get('export_words'), self.export_words, "green"),
-            (lang.get('export_dataset'), self.export_dataset, "green")
+            (lang.get('export_dataset'), self.export_dataset, "green"),
+            (lang.get('export_dataset_incremental'), self.export_dataset_incremental, "green"),
+            (lang.get('export_dataset_shards'), self.export_dataset_shards, "green")
         ])
         
         # Settings Section
         self.create_menu_section(main_frame, f"⚙️ {lang.get('settings')}", [
             (lang.get('toggle_theme'), self.toggle_theme, "purple"),
-            (lang.get('test_audio'), self.test_audio, "gray")
+            (lang.get('test_audio'), self.test_audio, "gray"),
+            (lang.get('task_panel'), self.show_task_panel, "blue")
         ])
     
     def create_menu_section(self, parent, title, buttons):
@@ -4247,6 +2431,11 @@ class SimplifiedRecorderApp:
             )
             self.play_btn.configure(state="disabled")
             self.save_btn.configure(state="disabled")
+            self._meter_seq = None
+            self._meter_seq_time = time.monotonic()
+            self._meter_drawn = 0.0
+            self._low_level_since = None
+            self._bluetooth_warning = False
             self.monitor_audio_level()
         else:
             messagebox.showerror(lang.get("error"), f"Failed to start recording: {result[1] if isinstance(result, tuple) else 'Unknown error'}")
@@ -4308,48 +2497,69 @@ class SimplifiedRecorderApp:
                 "Please check your microphone and try again.")
     
     def monitor_audio_level(self):
-        """Monitor real-time audio level for UI display"""
-        if self.is_recording and hasattr(self.audio_manager, 'current_audio_level'):
-            try:
-                # Get current audio level from AudioManager
-                level = getattr(self.audio_manager, 'current_audio_level', 0.0)
-                
-                # Update UI progress bar (scale level appropriately)
-                scaled_level = min(level * 3.0, 1.0)  # Scale up for better visibility
-                self.audio_level_bar.set(scaled_level)
+        """Redraw the level bar from the audio thread's meter slot
+
+        The recording callback publishes (seq, peak, rms) into
+        audio_manager.meter; this tick only compares integers and touches
+        the widget when a new block arrived and the bar would move
+        noticeably. Device class (Bluetooth or not) is cached by the
+        AudioManager when the device changes. A stalled stream publishes no
+        blocks, so the time since the last new block is tracked as well and
+        counts as silence for the Bluetooth low-level check.
+        """
+        if not self.is_recording:
+            self.audio_level_bar.set(0)
+            self._meter_drawn = 0.0
+            return
+        try:
+            seq, peak, rms = self.audio_manager.meter.read()
+            now = time.monotonic()
+            if seq != self._meter_seq:
+                self._meter_seq = seq
+                self._meter_seq_time = now
+                level = peak / self.audio_manager.meter.FULL_SCALE
                 
-                # Check for Bluetooth connection issues
-                if hasattr(self.audio_manager, 'is_bluetooth_device') and self.audio_manager.is_bluetooth_device():
-                    # Monitor Bluetooth audio quality
-                    if level < 0.001:
-                        self._low_level_count = getattr(self, '_low_level_count', 0) + 1
-                        if self._low_level_count > 40:  # 2 seconds of low audio
-                            # Show Bluetooth warning in status
-                            if hasattr(self, 'status_label'):
-                                self.status_label.configure(
-                                    text="⚠️ Bluetooth audio level very low - check AirPods connection",
-                                    text_color=("orange", "yellow")
-                                )
-                    else:
-                        self._low_level_count = 0
-                        # Clear warning if audio recovers  
-                        if hasattr(self, 'status_label') and level > 0.01:
-                            self.status_label.configure(
-                                text="🎧 Bluetooth recording active",
-                                text_color=("green", "lightgreen")
-                            )
+                # Scale up for better visibility
+                scaled_level = min(level * 3.0, 1.0)
+                if abs(scaled_level - self._meter_drawn) >= Config.METER_REDRAW_STEP:
+                    self.audio_level_bar.set(scaled_level)
+                    self._meter_drawn = scaled_level
                 
-                # Continue monitoring
-                self.root.after(50, self.monitor_audio_level)  # Update every 50ms for smoother UI
-            except Exception as e:
-                print(f"Audio level monitoring error: {e}")
-                self.audio_level_bar.set(0)
-                self.root.after(100, self.monitor_audio_level)
-        else:
-            # Not recording, set to zero
+                if self.audio_manager.selected_is_bluetooth:
+                    self.check_bluetooth_level(level)
+            elif self.audio_manager.selected_is_bluetooth:
+                # Yeni blok yok (akış durdu): son bloktan beri sessiz say
+                self.check_bluetooth_level(0.0, since=self._meter_seq_time)
+        except Exception as e:
+            print(f"Audio level monitoring error: {e}")
             self.audio_level_bar.set(0)
-            if self.is_recording:  # Only continue if still recording
-                self.root.after(100, self.monitor_audio_level)
+            self._meter_drawn = 0.0
+        self.root.after(Config.METER_UI_INTERVAL_MS, self.monitor_audio_level)
+    
+    def check_bluetooth_level(self, level, since=None):
+        """Warn once when a Bluetooth mic stays silent, clear it when audio returns
+        
+        since: when the silence started, if known (time of the last meter block).
+        """
+        now = time.monotonic()
+        if level < Config.METER_LOW_LEVEL:
+            if self._low_level_since is None:
+                self._low_level_since = now if since is None else since
+            if not self._bluetooth_warning and now - self._low_level_since > Config.METER_LOW_LEVEL_SECONDS:
+                self._bluetooth_warning = True
+                self.status_label.configure(
+                    text="⚠️ Bluetooth audio level very low - check AirPods connection",
+                    text_color=("orange", "yellow")
+                )
+        else:
+            self._low_level_since = None
+            # Clear warning if audio recovers
+            if self._bluetooth_warning and level > 0.01:
+                self._bluetooth_warning = False
+                self.status_label.configure(
+                    text="🎧 Bluetooth recording active",
+                    text_color=("green", "lightgreen")
+                )
     
     def play_recording(self):
         if self.current_recording is not None:
@@ -4360,53 +2570,270 @@ class SimplifiedRecorderApp:
             messagebox.showwarning("Warning", "No recording to save.")
             return
         
-        current_word = self.word_manager.get_current_word()
-        if not current_word:
-            messagebox.showwarning("Warning", "No current word to save.")
-            return
+        current_word = self.word_manager.get_current_word()
+        if not current_word:
+            messagebox.showwarning("Warning", "No current word to save.")
+            return
+        
+        try:
+            # Multi-speed recording için filename oluştur
+            current_speed = self.word_manager.current_recording_speed
+            filename = self.word_manager.generate_speed_filename(current_word, current_speed)
+            
+            if self.audio_manager.save_audio(self.current_recording, filename):
+                # Speed-specific recording olarak kaydet
+                self.word_manager.mark_speed_recorded(current_word, current_speed, filename)
+                
+                # Ses dosyasının uzunluğunu hesapla ve güncelle
+                self.update_audio_duration(filename)
+                self.take_verifier.submit(filename, current_word)
+                
+                self.current_recording = None
+                self.play_btn.configure(state="disabled")
+                self.save_btn.configure(state="disabled")
+                
+                # Check if all speeds are completed for this word
+                missing_speeds = self.word_manager.get_missing_speeds(current_word)
+                completion = self.word_manager.get_completion_status(current_word)
+                
+                if not missing_speeds:  # All speeds completed
+                    # Auto-move to next word when all 3 speeds are done
+                    self.word_manager.next_word()
+                    self.update_status_message(f"🎉 '{current_word}' tüm hızlarda tamamlandı! Sonraki kelimeye geçiliyor...")
+                    print(f"🎉 '{current_word}' - All speeds completed! Moving to next word.")
+                else:
+                    # Stay on same word, show which speeds are missing
+                    missing_names = {
+                        "slow": "🐌 Yavaş",
+                        "normal": "🎯 Normal", 
+                        "fast": "🚀 Hızlı"
+                    }
+                    missing_list = [missing_names[speed] for speed in missing_speeds]
+                    self.update_status_message(f"✅ '{current_word}' {current_speed} kaydedildi. Kalan: {', '.join(missing_list)}")
+                    print(f"✅ '{current_word}' - {current_speed} speed saved. Missing: {missing_speeds}")
+                
+                self.update_word_display()
+                print(f"✅ '{current_word}' {current_speed} kaydedildi: {filename} (Completion: {completion:.0f}%)")
+            else:
+                messagebox.showerror(lang.get("error"), "Ses dosyası kaydedilemedi.")
+        except Exception as e:
+            messagebox.showerror(lang.get("error"), f"Kaydetme hatası: {str(e)}")
+    
+    def poll_take_verification(self):
+        """Arka plan doğrulama sonuçlarını ana thread'de işle"""
+        try:
+            while True:
+                result = self.take_verifier.results.get_nowait()
+                if 'error' in result:
+                    print(f"⚠️ Kayıt doğrulama: {result.get('filename', '')} {result['error']}")
+                    continue
+                self.word_manager.set_take_verification(result)
+                if result['flagged']:
+                    self.update_status_message(
+                        f"⚠️ Şüpheli kayıt: '{result['prompt']}' → '{result['hypothesis']}' (CER %{result['cer'] * 100:.0f})"
+                    )
+                    print(f"⚠️ Şüpheli kayıt: {result['filename']} CER={result['cer']:.2f} '{result['hypothesis']}'")
+        except queue.Empty:
+            pass
+        if self.take_verifier.available():
+            self.root.after(1000, self.poll_take_verification)
+    
+    def run_background_task(self, title, function, on_done, on_error=None):
+        """Uzun işlemi arka planda çalıştır; sonuç ana thread'de on_done'a gelir
+        
+        function(progress) -> result, progress(done, total) iptal edilince
+        TaskCancelled fırlatır. function içinde Tk'ya dokunulmaz.
+        """
+        if on_error is None:
+            on_error = lambda error: messagebox.showerror("Hata", f"{title}: {error}")
+        task = self.task_runner.submit(title, function, on_done, on_error)
+        self.status_label.configure(text=f"⏳ {title}...")
+        if not self.task_poll_scheduled:
+            self.task_poll_scheduled = True
+            self.root.after(200, self.poll_background_tasks)
+        self.refresh_task_panel()
+        return task
+    
+    def poll_background_tasks(self):
+        """Görev kuyruğunu boşalt, durum satırını ve görev panelini güncelle"""
+        finished = self.task_runner.poll()
+        active = self.task_runner.active_tasks()
+        cancelled = [task for task in finished if task.status == "cancelled"]
+        
+        if active:
+            task = active[0]
+            counts = f" {task.done}/{task.total}" if task.total else ""
+            others = f" (+{len(active) - 1} görev)" if len(active) > 1 else ""
+            self.status_label.configure(text=f"⏳ {task.title}{counts}{others}")
+        elif cancelled:
+            self.update_status_message(f"⛔ {cancelled[-1].title} iptal edildi")
+        elif finished:
+            self.status_label.configure(text="")
+        
+        self.refresh_task_panel()
+        if active:
+            self.root.after(200, self.poll_background_tasks)
+        else:
+            self.task_poll_scheduled = False
+    
+    def show_task_panel(self):
+        """Çalışan ve biten arka plan görevleri"""
+        if self.task_panel and self.task_panel.winfo_exists():
+            self.task_panel.lift()
+            return
+        
+        self.task_panel = ctk.CTkToplevel(self.root)
+        self.task_panel.title(lang.get('task_panel'))
+        self.task_panel.geometry("620x420")
+        self.task_panel.transient(self.root)
+        self.task_rows = {}
+        
+        self.task_list_frame = ctk.CTkScrollableFrame(self.task_panel)
+        self.task_list_frame.pack(fill="both", expand=True, padx=15, pady=(15, 5))
+        
+        button_frame = ctk.CTkFrame(self.task_panel)
+        button_frame.pack(fill="x", padx=15, pady=10)
+        
+        def clear_finished():
+            self.task_runner.clear_finished()
+            self.refresh_task_panel()
+        
+        ctk.CTkButton(button_frame, text="🧹 Bitenleri Temizle", command=clear_finished, width=160, height=35).pack(side="left", padx=10, pady=10)
+        ctk.CTkButton(button_frame, text="❌ Kapat", command=self.task_panel.destroy, width=100, height=35).pack(side="right", padx=10, pady=10)
+        self.refresh_task_panel()
+    
+    def refresh_task_panel(self):
+        """Görev satırlarını yerinde güncelle (satırlar her seferinde yeniden oluşturulmaz)"""
+        if not (self.task_panel and self.task_panel.winfo_exists()):
+            return
+        
+        tasks = self.task_runner.tasks
+        for task_id in [task_id for task_id in self.task_rows if task_id not in tasks]:
+            self.task_rows.pop(task_id)['frame'].destroy()
+        
+        for task in tasks.values():
+            row = self.task_rows.get(task.id)
+            if row is None:
+                frame = ctk.CTkFrame(self.task_list_frame)
+                frame.pack(fill="x", pady=4, padx=5)
+                ctk.CTkLabel(frame, text=task.title, font=ctk.CTkFont(size=13, weight="bold"), anchor="w").pack(fill="x", padx=10, pady=(8, 0))
+                bar = ctk.CTkProgressBar(frame)
+                bar.pack(fill="x", padx=10, pady=4)
+                bottom = ctk.CTkFrame(frame, fg_color="transparent")
+                bottom.pack(fill="x", padx=10, pady=(0, 8))
+                status = ctk.CTkLabel(bottom, text="", anchor="w")
+                status.pack(side="left", fill="x", expand=True)
+                cancel = ctk.CTkButton(bottom, text="⛔ İptal", width=80, height=26, fg_color="#dc3545", command=task.cancel)
+                cancel.pack(side="right")
+                row = self.task_rows[task.id] = {'frame': frame, 'bar': bar, 'status': status, 'cancel': cancel}
+            
+            if task.status == "running":
+                text = f"{task.done}/{task.total}" if task.total else "çalışıyor..."
+                text += f"  •  {task.elapsed():.0f} sn"
+                if task.message:
+                    text += f"  •  {task.message}"
+                if task.cancelled:
+                    text += "  •  iptal ediliyor..."
+            elif task.status == "queued":
+                text = "sırada"
+            elif task.status == "done":
+                text = f"✅ tamamlandı ({task.elapsed():.1f} sn)"
+            elif task.status == "error":
+                text = f"❌ {task.error}"
+            else:
+                text = "⛔ iptal edildi"
+            row['status'].configure(text=text)
+            row['bar'].set(1.0 if task.status == "done" else task.fraction())
+            row['cancel'].configure(state="normal" if task.active and not task.cancelled else "disabled")
+    
+    @staticmethod
+    def get_manual_words_dialog(parent):
+        """Show dialog to manually enter words"""
+        dialog = ctk.CTkToplevel(parent)
+        dialog.title("Add Words Manually")
+        dialog.geometry("600x500")
+        dialog.transient(parent)
+        dialog.grab_set()
+        
+        # Center the dialog
+        dialog.update_idletasks()
+        x = (dialog.winfo_screenwidth() - dialog.winfo_width()) // 2
+        y = (dialog.winfo_screenheight() - dialog.winfo_height()) // 2
+        dialog.geometry(f"+{x}+{y}")
+        
+        main_frame = ctk.CTkFrame(dialog)
+        main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+        
+        # Instructions
+        ctk.CTkLabel(
+            main_frame,
+            text="📝 Add Words or Sentences",
+            font=ctk.CTkFont(size=18, weight="bold")
+        ).pack(pady=(10, 5))
+        
+        ctk.CTkLabel(
+            main_frame,
+            text="Enter words or sentences (one per line):",
+            font=ctk.CTkFont(size=12)
+        ).pack(pady=(0, 10))
+        
+        # Text area
+        text_widget = ctk.CTkTextbox(
+            main_frame,
+            width=550,
+            height=300,
+            font=ctk.CTkFont(family="Consolas", size=12)
+        )
+        text_widget.pack(pady=(0, 20))
+        
+        # Sample text
+        sample_text = """spî
+reş
+sor
+kesk
+zer
+Example sentence: Ez hêviya te dikim."""
+        text_widget.insert("1.0", sample_text)
+        
+        result = {'words': None}
+        
+        def save_words():
+            content = text_widget.get("1.0", "end").strip()
+            if content:
+                lines = [line.strip() for line in content.split('\n') if line.strip()]
+                result['words'] = lines
+            dialog.destroy()
+        
+        def cancel():
+            result['words'] = None
+            dialog.destroy()
         
-        try:
-            # Multi-speed recording için filename oluştur
-            current_speed = self.word_manager.current_recording_speed
-            filename = self.word_manager.generate_speed_filename(current_word, current_speed)
-            
-            if self.audio_manager.save_audio(self.current_recording, filename):
-                # Speed-specific recording olarak kaydet
-                self.word_manager.mark_speed_recorded(current_word, current_speed, filename)
-                
-                # Ses dosyasının uzunluğunu hesapla ve güncelle
-                self.update_audio_duration(filename)
-                
-                self.current_recording = None
-                self.play_btn.configure(state="disabled")
-                self.save_btn.configure(state="disabled")
-                
-                # Check if all speeds are completed for this word
-                missing_speeds = self.word_manager.get_missing_speeds(current_word)
-                completion = self.word_manager.get_completion_status(current_word)
-                
-                if not missing_speeds:  # All speeds completed
-                    # Auto-move to next word when all 3 speeds are done
-                    self.word_manager.next_word()
-                    self.update_status_message(f"🎉 '{current_word}' tüm hızlarda tamamlandı! Sonraki kelimeye geçiliyor...")
-                    print(f"🎉 '{current_word}' - All speeds completed! Moving to next word.")
-                else:
-                    # Stay on same word, show which speeds are missing
-                    missing_names = {
-                        "slow": "🐌 Yavaş",
-                        "normal": "🎯 Normal", 
-                        "fast": "🚀 Hızlı"
-                    }
-                    missing_list = [missing_names[speed] for speed in missing_speeds]
-                    self.update_status_message(f"✅ '{current_word}' {current_speed} kaydedildi. Kalan: {', '.join(missing_list)}")
-                    print(f"✅ '{current_word}' - {current_speed} speed saved. Missing: {missing_speeds}")
-                
-                self.update_word_display()
-                print(f"✅ '{current_word}' {current_speed} kaydedildi: {filename} (Completion: {completion:.0f}%)")
-            else:
-                messagebox.showerror(lang.get("error"), "Ses dosyası kaydedilemedi.")
-        except Exception as e:
-            messagebox.showerror(lang.get("error"), f"Kaydetme hatası: {str(e)}")
+        # Buttons
+        button_frame = ctk.CTkFrame(main_frame)
+        button_frame.pack(fill="x")
+        
+        ctk.CTkButton(
+            button_frame,
+            text="💾 Add Words",
+            command=save_words,
+            width=150,
+            height=40,
+            fg_color="green",
+            hover_color="darkgreen"
+        ).pack(side="left", padx=(20, 10), pady=10)
+        
+        ctk.CTkButton(
+            button_frame,
+            text="❌ Cancel",
+            command=cancel,
+            width=100,
+            height=40
+        ).pack(side="right", padx=(10, 20), pady=10)
+        
+        # Wait for dialog to close
+        dialog.wait_window()
+        
+        return result['words']
     
     def update_status_message(self, message):
         """Status bar'da mesaj göster"""
@@ -4443,6 +2870,7 @@ class SimplifiedRecorderApp:
                 
                 # Ses dosyasının uzunluğunu hesapla
                 self.update_audio_duration(filename)
+                self.take_verifier.submit(filename, current_word)
                 
                 # UI'yi temizle
                 self.current_recording = None
@@ -4479,40 +2907,13 @@ class SimplifiedRecorderApp:
                 duration = len(audio_data) / sample_rate
                 
                 # Manifest dosyasını güncelle
-                self.update_manifest_duration(filename, duration)
+                self.word_manager.update_manifest_duration(filename, duration)
                 
                 print(f"🎵 Ses uzunluğu hesaplandı: {filename} = {duration:.2f} saniye")
                 
         except Exception as e:
             print(f"⚠️ Ses uzunluğu hesaplanamadı: {e}")
     
-    def update_manifest_duration(self, filename, duration):
-        """Manifest dosyasındaki ses uzunluğunu güncelle"""
-        try:
-            if not Config.WHISPER_MANIFEST.exists():
-                return
-                
-            # Mevcut manifest dosyasını oku
-            lines = []
-            with open(Config.WHISPER_MANIFEST, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            # Son satırı güncelle (yeni eklenen dosya)
-            if lines:
-                last_line = lines[-1].strip()
-                if last_line:
-                    manifest_entry = json.loads(last_line)
-                    if manifest_entry.get('audio') == filename:
-                        manifest_entry['duration'] = round(duration, 2)
-                        lines[-1] = json.dumps(manifest_entry, ensure_ascii=False) + '\n'
-                        
-                        # Dosyayı yeniden yaz
-                        with open(Config.WHISPER_MANIFEST, 'w', encoding='utf-8') as f:
-                            f.writelines(lines)
-            
-        except Exception as e:
-            print(f"⚠️ Manifest güncelleme hatası: {e}")
-    
     def convert_old_audio_files(self):
         """Önceki ses dosyalarını Whisper formatına dönüştür"""
         try:
@@ -4559,7 +2960,8 @@ class SimplifiedRecorderApp:
                             "audio": filename,
                             "text": transcript,
                             "language": "ku",
-                            "duration": round(duration, 2)
+                            "duration": round(duration, 2),
+                            "duration_measured": True
                         }
                         
                         with open(Config.WHISPER_MANIFEST, 'a', encoding='utf-8') as f:
@@ -4633,7 +3035,7 @@ class SimplifiedRecorderApp:
     
     # Menu functions
     def add_words_manually(self):
-        words = DocumentProcessor.get_manual_words_dialog(self.root)
+        words = self.get_manual_words_dialog(self.root)
         if words:
             self.word_manager.add_words(words)
             self.update_word_display()
@@ -4669,35 +3071,174 @@ class SimplifiedRecorderApp:
         )
         
         if filename:
-            words = DocumentProcessor.load_words_from_file(filename)
+            def on_done(words):
+                if words:
+                    self.word_manager.add_words(words)
+                    self.update_word_display()
+                    messagebox.showinfo("Success", f"Loaded {len(words)} words from document.")
+                else:
+                    messagebox.showwarning("Warning", "No words found in the document.")
+            
+            self.run_background_task(
+                f"📄 {Path(filename).name}",
+                lambda progress: DocumentProcessor.load_words_from_file(filename),
+                on_done
+            )
+    
+    def load_documents_by_frequency(self):
+        """Belgelerdeki kelimeleri frekansa göre sıralayarak ekle"""
+        filenames = filedialog.askopenfilenames(
+            title="Select documents",
+            filetypes=[("Documents", "*.txt *.docx *.pdf")]
+        )
+        if not filenames:
+            return
+        
+        dialog = ctk.CTkInputDialog(text="Minimum frequency (min count):", title="Frequency Import")
+        try:
+            min_count = max(1, int(dialog.get_input() or "2"))
+        except ValueError:
+            messagebox.showwarning("Uyarı", "Geçerli bir sayı girin!")
+            return
+        
+        def on_done(words):
             if words:
-                self.word_manager.add_words(words)
+                added = self.word_manager.add_words(words)
                 self.update_word_display()
-                messagebox.showinfo("Success", f"Loaded {len(words)} words from document.")
+                messagebox.showinfo("Success", f"{len(words)} words ranked by frequency, {added} new added.")
             else:
-                messagebox.showwarning("Warning", "No words found in the document.")
+                messagebox.showwarning("Warning", f"No words with at least {min_count} occurrences found.")
+        
+        self.run_background_task(
+            f"📈 Frekans sayımı ({len(filenames)} belge)",
+            lambda progress: DocumentProcessor.load_words_by_frequency(filenames, min_count, progress_callback=progress),
+            on_done
+        )
+    
+    def load_sentences_from_documents(self):
+        """Belgeleri cümle ve paragraflara bölerek ekle"""
+        filenames = filedialog.askopenfilenames(
+            title="Select documents",
+            filetypes=[("Documents", "*.txt *.docx *.pdf")]
+        )
+        if not filenames:
+            return
+        
+        def worker(progress):
+            all_sentences, all_paragraphs = [], []
+            for done, filename in enumerate(filenames, 1):
+                sentences, paragraphs = DocumentProcessor.load_sentences_from_file(filename)
+                all_sentences.extend(sentences)
+                all_paragraphs.extend(paragraphs)
+                progress(done, len(filenames))
+            return all_sentences, all_paragraphs
+        
+        def on_done(result):
+            all_sentences, all_paragraphs = result
+            if not all_sentences and not all_paragraphs:
+                messagebox.showwarning("Warning", "No sentences found in the documents.")
+                return
+            
+            added_sentences, added_paragraphs = self.word_manager.add_segmented_content(all_sentences, all_paragraphs)
+            self.update_word_display()
+            messagebox.showinfo("Success",
+                f"📄 {len(filenames)} belge bölündü\n\n"
+                f"🎭 Cümle: {len(all_sentences)} bulundu, {added_sentences} yeni eklendi\n"
+                f"📄 Paragraf: {len(all_paragraphs)} bulundu, {added_paragraphs} yeni eklendi")
+        
+        self.run_background_task(f"🎭 Cümle bölme ({len(filenames)} belge)", worker, on_done)
     
     def load_from_url(self):
         dialog = ctk.CTkInputDialog(text="Enter URL:", title="Load from URL")
         url = dialog.get_input()
         if url and url.strip():
-            try:
-                response = requests.get(url.strip(), timeout=10)
-                response.raise_for_status()
-                content = response.text
-                if '<html' in content.lower():
-                    content = re.sub(r'<[^>]+>', ' ', content)
-                    import html
-                    content = html.unescape(content)
-                words = DocumentProcessor._extract_words(content)
+            def on_done(result):
+                if result['error']:
+                    messagebox.showerror("URL Error", f"Failed to load from URL:\n{result['error']}")
+                    return
+                words = DocumentProcessor._extract_words(result['text'])
                 if words:
                     self.word_manager.add_words(words)
                     self.update_word_display()
                     messagebox.showinfo("Success", f"Loaded {len(words)} words from URL!")
                 else:
                     messagebox.showwarning("No Words", "No words found at the URL.")
-            except Exception as e:
-                messagebox.showerror("URL Error", f"Failed to load from URL:\n{str(e)}")
+            
+            fetcher = self.get_url_fetcher()
+            self.run_background_task(f"🌐 {url.strip()}", lambda progress: fetcher.fetch(url.strip()), on_done)
+    
+    def get_url_fetcher(self):
+        """Tek UrlFetcher - bağlantı havuzu importlar arasında korunur (UI thread'inde çağır)"""
+        if self.url_fetcher is None:
+            self.url_fetcher = UrlFetcher()
+        return self.url_fetcher
+    
+    def load_from_urls(self):
+        """Birden fazla URL'yi eşzamanlı olarak indir ve kelimeleri ekle"""
+        dialog = ctk.CTkToplevel(self.root)
+        dialog.title("Load from URLs")
+        dialog.geometry("600x450")
+        dialog.transient(self.root)
+        dialog.grab_set()
+        
+        ctk.CTkLabel(
+            dialog,
+            text="🌐 Enter URLs (one per line):",
+            font=ctk.CTkFont(size=14, weight="bold")
+        ).pack(pady=(15, 10))
+        
+        text_widget = ctk.CTkTextbox(dialog, width=560, height=300, font=ctk.CTkFont(family="Consolas", size=12))
+        text_widget.pack(padx=20, pady=(0, 15))
+        
+        result = {'urls': None}
+        
+        def start():
+            result['urls'] = [line.strip() for line in text_widget.get("1.0", "end").split('\n') if line.strip()]
+            dialog.destroy()
+        
+        ctk.CTkButton(dialog, text="🚀 Fetch", command=start, width=150, height=40, fg_color="green").pack(side="left", padx=20, pady=10)
+        ctk.CTkButton(dialog, text="❌ Cancel", command=dialog.destroy, width=100, height=40).pack(side="right", padx=20, pady=10)
+        dialog.wait_window()
+        
+        urls = result['urls']
+        if not urls:
+            return
+        
+        fetcher = self.get_url_fetcher()
+        self.run_background_task(
+            f"🌐 {len(urls)} URL indiriliyor",
+            lambda progress: fetcher.fetch_many(urls, progress),
+            self._finish_url_import
+        )
+    
+    def _finish_url_import(self, results):
+        """Toplu URL indirme sonuçlarını listeye ekle ve raporla"""
+        words = []
+        seen = set()
+        report = ["🌐 URL Import Report", "=" * 50, ""]
+        for result in results:
+            if result['error']:
+                report.append(f"❌ {result['url']}\n    {result['error']}")
+                continue
+            cache_note = " (cache)" if result['cached'] else ""
+            report.append(f"✅ {result['url']}{cache_note}\n    {result['tokens']} tokens")
+            for word in DocumentProcessor._extract_words(result['text']):
+                if word not in seen:
+                    seen.add(word)
+                    words.append(word)
+        
+        added = self.word_manager.add_words(words) if words else 0
+        self.update_word_display()
+        report += ["", f"📝 {len(words)} unique words, {added} new added."]
+        
+        log_window = ctk.CTkToplevel(self.root)
+        log_window.title("URL Import")
+        log_window.geometry("700x500")
+        
+        text_widget = ctk.CTkTextbox(log_window, width=660, height=440, font=ctk.CTkFont(family="Consolas", size=11))
+        text_widget.pack(padx=20, pady=20)
+        text_widget.insert("1.0", "\n".join(report))
+        text_widget.configure(state="disabled")
     
     def remove_duplicates(self):
         original_count = len(self.word_manager.words)
@@ -4861,33 +3402,100 @@ Durum:
             return
         
         export_dir = filedialog.askdirectory(title="Whisper Dataset Dışa Aktarma")
-        if export_dir:
-            try:
-                import shutil
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                export_path = Path(export_dir) / f"whisper_kurmanci_{timestamp}"
-                export_path.mkdir(exist_ok=True)
-                
-                # Audio klasörü oluştur ve ses dosyalarını kopyala
-                audio_export = export_path / "audio"  
-                audio_export.mkdir(exist_ok=True)
-                audio_files = list(Config.AUDIO_DIR.glob("*.wav"))
-                for audio_file in audio_files:
-                    shutil.copy2(audio_file, audio_export / audio_file.name)
-                
-                # Whisper dosyalarını kopyala
-                if Config.WHISPER_MANIFEST.exists():
-                    shutil.copy2(Config.WHISPER_MANIFEST, export_path / "manifest.jsonl")
-                if Config.TRANSCRIPT_FILE.exists():
-                    shutil.copy2(Config.TRANSCRIPT_FILE, export_path / "transcripts.txt")
-                
-                # README oluştur
-                readme = f"# Kurmancî Whisper Dataset\\n\\nToplam: {len(audio_files)} ses dosyası\\nTarih: {timestamp}\\nDil: ku"
-                (export_path / "README.md").write_text(readme, encoding='utf-8')
-                
-                messagebox.showinfo("Başarılı", f"Whisper dataset hazır!\\n{export_path}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Export failed: {str(e)}")
+        if not export_dir:
+            return
+        
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        export_path = Path(export_dir) / f"whisper_kurmanci_{timestamp}"
+        
+        def worker(progress):
+            import shutil
+            export_path.mkdir(exist_ok=True)
+            
+            # Audio klasörü oluştur ve ses dosyalarını kopyala
+            audio_export = export_path / "audio"  
+            audio_export.mkdir(exist_ok=True)
+            audio_files = list(Config.AUDIO_DIR.glob("*.wav"))
+            for done, audio_file in enumerate(audio_files, 1):
+                shutil.copy2(audio_file, audio_export / audio_file.name)
+                progress(done, len(audio_files))
+            
+            # Whisper dosyalarını kopyala
+            if Config.WHISPER_MANIFEST.exists():
+                shutil.copy2(Config.WHISPER_MANIFEST, export_path / "manifest.jsonl")
+            if Config.TRANSCRIPT_FILE.exists():
+                shutil.copy2(Config.TRANSCRIPT_FILE, export_path / "transcripts.txt")
+            
+            # README oluştur
+            readme = f"# Kurmancî Whisper Dataset\\n\\nToplam: {len(audio_files)} ses dosyası\\nTarih: {timestamp}\\nDil: ku"
+            (export_path / "README.md").write_text(readme, encoding='utf-8')
+        
+        self.run_background_task(
+            "📦 Dataset dışa aktarma",
+            worker,
+            lambda result: messagebox.showinfo("Başarılı", f"Whisper dataset hazır!\\n{export_path}"),
+            lambda error: messagebox.showerror("Error", f"Export failed: {str(error)}")
+        )
+    
+    def export_dataset_incremental(self):
+        """Dataset'i sabit bir klasöre artımlı olarak dışa aktar"""
+        export_dir = filedialog.askdirectory(title="Artımlı Dataset Dışa Aktarma")
+        if not export_dir:
+            return
+        
+        export_path = Path(export_dir) / "whisper_kurmanci"
+        exporter = IncrementalExporter(Config.AUDIO_DIR, export_path)
+        
+        def worker(progress):
+            import shutil
+            summary = exporter.run(progress)
+            if Config.WHISPER_MANIFEST.exists():
+                shutil.copy2(Config.WHISPER_MANIFEST, export_path / "manifest.jsonl")
+            if Config.TRANSCRIPT_FILE.exists():
+                shutil.copy2(Config.TRANSCRIPT_FILE, export_path / "transcripts.txt")
+            return summary
+        
+        def on_done(result):
+            messagebox.showinfo("Başarılı",
+                f"📦 Artımlı dışa aktarma tamamlandı!\n\n"
+                f"📁 {export_path}\n"
+                f"• Değişmeyen: {result['unchanged']}\n"
+                f"• Hardlink: {result['linked']}\n"
+                f"• Kopyalanan: {result['copied']}\n"
+                f"• Silinen: {result['removed']}\n"
+                f"• Hata: {len(result['errors'])}\n"
+                f"• Toplam: {result['total']} dosya")
+        
+        self.run_background_task(
+            "📦 Artımlı dışa aktarma", worker, on_done,
+            lambda error: messagebox.showerror("Error", f"Export failed: {str(error)}")
+        )
+    
+    def export_dataset_shards(self):
+        """Dataset'i eğitim için tar shard'larına paketle"""
+        if not Config.WHISPER_MANIFEST.exists():
+            messagebox.showwarning("Warning", "Whisper manifest bulunamadı.")
+            return
+        
+        export_dir = filedialog.askdirectory(title="Tar Shard Dışa Aktarma")
+        if not export_dir:
+            return
+        
+        shard_path = Path(export_dir) / "whisper_kurmanci_shards"
+        exporter = ShardedTarExporter(shard_path)
+        
+        def on_done(result):
+            messagebox.showinfo("Başarılı",
+                f"📦 Shard dışa aktarma tamamlandı!\n\n"
+                f"📁 {shard_path}\n"
+                f"• Shard: {result['shards']} ({result['written']} yeni yazıldı)\n"
+                f"• Örnek: {result['samples']}\n\n"
+                f"python whisper_training.py --shards {shard_path}")
+        
+        self.run_background_task(
+            "📦 Shard dışa aktarma", exporter.run, on_done,
+            lambda error: messagebox.showerror("Error", f"Export failed: {str(error)}")
+        )
     
     def toggle_theme(self):
         try:
@@ -4908,9 +3516,16 @@ Durum:
         except Exception as e:
             messagebox.showerror("Theme Error", f"Failed to change theme: {str(e)}")
     
+    def get_audio_metadata(self):
+        """Paylaşılan ses meta önbelleğini güncelleyip döndür"""
+        if not hasattr(self, 'audio_metadata'):
+            self.audio_metadata = AudioMetadataCache()
+        self.audio_metadata.refresh()
+        return self.audio_metadata
+    
     def show_statistics(self):
         recorded, total = self.word_manager.get_progress()
-        audio_files = list(Config.AUDIO_DIR.glob("*.wav"))
+        audio_totals = self.get_audio_metadata().totals()
         
         stats_text = f"""📊 Recording Statistics
 
@@ -4921,7 +3536,9 @@ Durum:
 • Progress: {(recorded/total*100) if total > 0 else 0:.1f}%
 
 🎵 Audio:
-• Audio files: {len(audio_files)}
+• Audio files: {audio_totals['files']}
+• Total duration: {audio_totals['total_duration']/60:.1f} min ({audio_totals['total_duration']/3600:.2f} h)
+• Average length: {audio_totals['avg_duration']:.2f} s
 • Dataset location: {Config.BASE_DIR.absolute()}
 • Audio quality: {Config.SAMPLE_RATE} Hz, Mono
 • Format: WAV (16-bit PCM)"""
@@ -4995,10 +3612,22 @@ Durum:
     
     def convert_old_recordings(self):
         """Eski ses kayıtlarını Whisper formatına dönüştür"""
-        if hasattr(self.word_manager, 'convert_old_audio_files'):
-            self.word_manager.convert_old_audio_files()
-        else:
-            messagebox.showwarning("Uyarı", "Dönüştürme fonksiyonu bulunamadı!")
+        def on_done(result):
+            converted_count, conversion_log = result
+            self.update_word_display()
+            messagebox.showinfo("Başarılı", 
+                f"🎯 Whisper Dönüştürme Tamamlandı!\n\n"
+                f"✅ İşlenen dosya: {converted_count}\n\n"
+                f"📁 Manifest: whisper_manifest.jsonl\n"
+                f"📄 Transkript: transcripts.txt")
+            self.show_conversion_log(conversion_log)
+        
+        self.run_background_task(
+            "🎵 Whisper formatına dönüştürme",
+            self.word_manager.convert_old_audio_files,
+            on_done,
+            lambda error: messagebox.showerror("Hata", f"Dönüştürme sırasında hata oluştu: {str(error)}")
+        )
     
     def set_speaker_id(self):
         """Konuşmacı ID'sini ayarla"""
@@ -5022,8 +3651,6 @@ Durum:
     def merge_datasets(self):
         """Birden fazla dataset'i birleştir"""
         from tkinter import filedialog
-        import json
-        import shutil
         
         # Kaynak klasörleri seç
         source_dirs = []
@@ -5045,89 +3672,34 @@ Durum:
             return
         
         target_path = Path(target_dir) / "merged_dataset"
-        target_audio = target_path / "audio"
-        target_audio.mkdir(parents=True, exist_ok=True)
-        
-        merge_log = []
-        file_counter = 1
-        merged_manifest = []
-        merged_transcripts = []
-        
-        for i, source_dir in enumerate(source_dirs):
-            try:
-                # Audio klasörünü bul
-                audio_dir = None
-                for possible_audio in [source_dir / "audio", source_dir / "kurmanji_dataset" / "audio"]:
-                    if possible_audio.exists():
-                        audio_dir = possible_audio
-                        break
-                
-                if not audio_dir:
-                    merge_log.append(f"❌ Audio klasörü bulunamadı: {source_dir}")
-                    continue
-                
-                merge_log.append(f"📂 İşleniyor: {source_dir.name}")
-                
-                # Ses dosyalarını kopyala
-                audio_files = list(audio_dir.glob("*.wav"))
-                for audio_file in audio_files:
-                    # Yeni dosya adı
-                    original_name = audio_file.stem
-                    transcript = self.word_manager.extract_transcript_from_filename(original_name)
-                    new_name = f"{file_counter:06d}_{transcript}_speaker{i+1}.wav"
-                    
-                    # Dosyayı kopyala
-                    shutil.copy2(audio_file, target_audio / new_name)
-                    
-                    # Manifest ve transcript için kaydet
-                    merged_manifest.append({
-                        "audio_filepath": f"audio/{new_name}",
-                        "text": transcript,
-                        "duration": 2.0,  # Varsayılan
-                        "speaker_id": f"speaker{i+1}"
-                    })
-                    merged_transcripts.append(f"{new_name}\t{transcript}")
-                    
-                    file_counter += 1
-                
-                merge_log.append(f"✅ {len(audio_files)} dosya kopyalandı")
-                
-            except Exception as e:
-                merge_log.append(f"❌ Hata ({source_dir.name}): {e}")
-        
-        # Birleşik dosyaları yaz
-        try:
-            # Whisper manifest
-            with open(target_path / "whisper_manifest.jsonl", "w", encoding="utf-8") as f:
-                for entry in merged_manifest:
-                    json.dump(entry, f, ensure_ascii=False)
-                    f.write("\n")
-            
-            # Transcripts
-            with open(target_path / "transcripts.txt", "w", encoding="utf-8") as f:
-                for transcript in merged_transcripts:
-                    f.write(transcript + "\n")
-            
-            merge_log.append("")
-            merge_log.append("✅ Birleştirme tamamlandı!")
-            merge_log.append(f"📁 Hedef: {target_path}")
-            merge_log.append(f"🎵 Toplam dosya: {len(merged_manifest)}")
+        merger = DatasetMerger(source_dirs, target_path, self.word_manager.extract_transcript_from_filename)
+        
+        def on_done(summary):
+            merge_log = summary['log'] + [
+                "",
+                "✅ Birleştirme tamamlandı!",
+                f"📁 Hedef: {target_path}",
+                f"🎵 Toplam dosya: {summary['merged']}",
+                f"♻️ Atlanan kopya (aynı içerik): {summary['duplicates']}",
+                f"⏱️ Toplam süre: {summary['duration']/60:.1f} dakika"
+            ]
             
             # Log göster
-            log_text = "\n".join(merge_log)
             log_window = ctk.CTkToplevel(self.root)
             log_window.title("Dataset Birleştirme Sonucu")
             log_window.geometry("700x500")
             
             text_widget = ctk.CTkTextbox(log_window, width=660, height=440)
             text_widget.pack(padx=20, pady=20)
-            text_widget.insert("1.0", log_text)
+            text_widget.insert("1.0", "\n".join(merge_log))
             text_widget.configure(state="disabled")
             
-            messagebox.showinfo("Başarılı", f"Dataset birleştirme tamamlandı!\nToplam: {len(merged_manifest)} dosya")
-            
-        except Exception as e:
-            messagebox.showerror("Hata", f"Birleştirme sırasında hata: {e}")
+            messagebox.showinfo("Başarılı", f"Dataset birleştirme tamamlandı!\nToplam: {summary['merged']} dosya")
+        
+        self.run_background_task(
+            f"🔗 Dataset birleştirme ({len(source_dirs)} kaynak)", merger.run, on_done,
+            lambda error: messagebox.showerror("Hata", f"Birleştirme sırasında hata: {error}")
+        )
     
     def show_merged_stats(self):
         """Birleşik dataset istatistiklerini göster"""
@@ -5377,6 +3949,24 @@ Durum:
         
         messagebox.showinfo("Başarılı", info_text)
     
+    def toggle_coverage_schedule(self):
+        """Liste sırası ile fonetik kapsam sırası arasında geçiş yap"""
+        if self.word_manager.schedule_mode == "coverage":
+            self.word_manager.set_schedule_mode("sequential")
+            messagebox.showinfo("Sıralama", "📋 Liste sırası aktif.\nKelimeler listedeki sırayla gösterilecek.")
+            return
+        
+        self.word_manager.set_schedule_mode("coverage")
+        schedule = self.word_manager.get_coverage_schedule()
+        if schedule:
+            self.word_manager.current_index = schedule[0]
+            self.word_manager.save_data()
+        self.update_word_display()
+        messagebox.showinfo("Sıralama",
+            f"🧩 Fonetik kapsam sırası aktif!\n\n"
+            f"• {len(schedule)} kaydedilmemiş öğe sıralandı\n"
+            f"• Her sonraki öğe, konuşma saniyesi başına en çok yeni harf çiftini ekler")
+    
     def show_list_stats(self):
         """Kelime listesi istatistiklerini göster"""
         if not self.word_manager.words:
@@ -6032,6 +4622,15 @@ Nivroj ezî diçim xwarinê
             fg_color="blue"
         ).pack(side="left", padx=10, pady=10)
         
+        ctk.CTkButton(
+            test_frame,
+            text="📋 Kalite Raporu",
+            command=self.show_quality_report,
+            width=150,
+            height=40,
+            fg_color="purple"
+        ).pack(side="left", padx=10, pady=10)
+        
         ctk.CTkButton(
             test_frame,
             text="❌ Kapat",
@@ -6145,12 +4744,12 @@ Nivroj ezî diçim xwarinê
         self.quality_results.delete("1.0", "end")
         self.quality_results.insert("1.0", "🔍 Mevcut kayıtlar analiz ediliyor...\n\n")
         
-        try:
-            import soundfile as sf
-            
-            total_duration = 0
+        def build_report(progress):
+            # Tüm dosyalar için başlık bilgisinden kesin süreler (önbellekli)
+            file_durations = self.get_audio_metadata().durations()
+            durations = list(file_durations.values())
+            total_duration = sum(durations)
             total_files = len(audio_files)
-            durations = []
             
             analysis_text = f"""📊 MEVCUT KAYITLAR ANALİZİ
 {"="*40}
@@ -6158,18 +4757,14 @@ Nivroj ezî diçim xwarinê
 📁 Toplam dosya sayısı: {total_files}
 📂 Klasör: {Config.AUDIO_DIR}
 
-🎵 DOSYA ANALİZİ:
+🎵 DOSYA ANALİZİ (ilk 10):
 """
             
-            for i, audio_file in enumerate(audio_files[:10]):  # İlk 10 dosyayı analiz et
-                try:
-                    data, samplerate = sf.read(audio_file)
-                    duration = len(data) / samplerate
-                    total_duration += duration
-                    durations.append(duration)
-                    
+            for i, audio_file in enumerate(audio_files[:10]):
+                duration = file_durations.get(audio_file.name)
+                if duration is not None:
                     analysis_text += f"   {i+1:2d}. {audio_file.name:<30} | {duration:.2f}s\n"
-                except:
+                else:
                     analysis_text += f"   {i+1:2d}. {audio_file.name:<30} | HATA\n"
             
             if durations:
@@ -6206,12 +4801,91 @@ Nivroj ezî diçim xwarinê
    4. Whisper eğitim dosyalarını hazırlayın
 """
             
-            self.quality_results.delete("1.0", "end")
-            self.quality_results.insert("1.0", analysis_text)
-            
-        except Exception as e:
+            return analysis_text
+        
+        def on_done(text):
+            if self.quality_results.winfo_exists():
+                self.quality_results.delete("1.0", "end")
+                self.quality_results.insert("1.0", text)
+        
+        def on_error(e):
             error_text = f"❌ Analiz sırasında hata: {str(e)}"
-            self.quality_results.insert("end", error_text)
+            if self.quality_results.winfo_exists():
+                self.quality_results.insert("end", error_text)
+        
+        self.run_background_task("🔍 Kayıt analizi", build_report, on_done, on_error)
+    
+    def show_quality_report(self):
+        """Tüm korpus için kalite analizini arka planda çalıştır ve tabloyu göster"""
+        if not Config.AUDIO_DIR.exists():
+            messagebox.showwarning("Uyarı", "Henüz ses kaydı bulunamadı!")
+            return
+        
+        analyzer = QualityAnalyzer()
+        self.run_background_task(
+            "📋 Kalite analizi", analyzer.run,
+            lambda analyzed: self._show_quality_table(analyzer.rows()),
+            lambda error: messagebox.showerror("Hata", f"Kalite analizi hatası: {error}")
+        )
+    
+    def _show_quality_table(self, rows):
+        """Sıralanabilir ve filtrelenebilir kalite tablosu"""
+        filters = {
+            "Tümü": lambda row: True,
+            "Kırpılma > %0.1": lambda row: row['clipping_ratio'] > 0.001,
+            "SNR < 15 dB": lambda row: row['snr_db'] < 15,
+            "Düşük seviye (tepe < 0.05)": lambda row: row['peak'] < 0.05,
+            "Baş sessizlik > 1 sn": lambda row: row['leading_silence'] > 1.0,
+            "Son sessizlik > 1.5 sn": lambda row: row['trailing_silence'] > 1.5,
+            "Konuşma oranı < %20": lambda row: row['speech_ratio'] < 0.2,
+            "DC ofset > 0.01": lambda row: abs(row['dc_offset']) > 0.01,
+        }
+        columns = ('name',) + QualityAnalyzer.METRICS
+        
+        report_window = ctk.CTkToplevel(self.root)
+        report_window.title(f"Kalite Raporu ({len(rows)} dosya)")
+        report_window.geometry("1100x600")
+        
+        control_frame = ctk.CTkFrame(report_window)
+        control_frame.pack(fill="x", padx=10, pady=10)
+        
+        filter_var = tk.StringVar(value="Tümü")
+        search_var = tk.StringVar()
+        count_label = ctk.CTkLabel(control_frame, text="")
+        
+        tree = ttk.Treeview(report_window, columns=columns, show="headings")
+        scrollbar = ttk.Scrollbar(report_window, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        sort_state = {'column': 'name', 'reverse': False}
+        
+        def refresh(*args):
+            predicate = filters[filter_var.get()]
+            needle = search_var.get().strip().lower()
+            visible = [row for row in rows if predicate(row) and needle in row['name'].lower()]
+            visible.sort(key=lambda row: row[sort_state['column']], reverse=sort_state['reverse'])
+            tree.delete(*tree.get_children())
+            for row in visible:
+                tree.insert("", "end", values=[row['name']] + [f"{row[metric]:.3f}" for metric in QualityAnalyzer.METRICS])
+            count_label.configure(text=f"{len(visible)} / {len(rows)} dosya")
+        
+        def sort_by(column):
+            sort_state['reverse'] = not sort_state['reverse'] if sort_state['column'] == column else False
+            sort_state['column'] = column
+            refresh()
+        
+        for column in columns:
+            tree.heading(column, text=column, command=lambda c=column: sort_by(c))
+            tree.column(column, width=260 if column == 'name' else 95, anchor="w" if column == 'name' else "e")
+        
+        ctk.CTkComboBox(control_frame, values=list(filters), variable=filter_var, command=refresh, width=220).pack(side="left", padx=10)
+        search_entry = ctk.CTkEntry(control_frame, textvariable=search_var, placeholder_text="🔍 Dosya adı...", width=250)
+        search_entry.pack(side="left", padx=10)
+        search_entry.bind("<KeyRelease>", refresh)
+        count_label.pack(side="right", padx=10)
+        
+        tree.pack(side="left", fill="both", expand=True, padx=(10, 0), pady=(0, 10))
+        scrollbar.pack(side="right", fill="y", pady=(0, 10))
+        refresh()
     
     def audio_augmentation_dialog(self):
         """Ses geliştirme ve çoğaltma seçenekleri"""
@@ -6255,6 +4929,7 @@ Mevcut ses kayıtlarınızı farklı versiyonlarla çoğaltarak Whisper'ın daha
         self.aug_volume = tk.BooleanVar(value=True)  
         self.aug_noise = tk.BooleanVar(value=False)
         self.aug_pitch = tk.BooleanVar(value=False)
+        self.aug_reverb = tk.BooleanVar(value=False)
         
         ctk.CTkLabel(options_frame, text="🎛️ Augmentation Seçenekleri:", font=ctk.CTkFont(size=14, weight="bold")).pack(pady=(10, 10))
         
@@ -6265,6 +4940,7 @@ Mevcut ses kayıtlarınızı farklı versiyonlarla çoğaltarak Whisper'ın daha
         ctk.CTkCheckBox(options_grid, text="🔊 Ses Seviyesi Varyasyonları", variable=self.aug_volume).pack(anchor="w", pady=5)
         ctk.CTkCheckBox(options_grid, text="🔇 Hafif Arka Plan Gürültüsü", variable=self.aug_noise).pack(anchor="w", pady=5)
         ctk.CTkCheckBox(options_grid, text="🎵 Pitch/Ton Değişiklikleri", variable=self.aug_pitch).pack(anchor="w", pady=5)
+        ctk.CTkCheckBox(options_grid, text="🏛️ Hafif Yankı (Reverb)", variable=self.aug_reverb).pack(anchor="w", pady=5)
         
         # Sonuç alanı
         self.aug_results = ctk.CTkTextbox(main_frame, width=750, height=200, font=ctk.CTkFont(size=11))
@@ -6300,32 +4976,53 @@ Mevcut ses kayıtlarınızı farklı versiyonlarla çoğaltarak Whisper'ın daha
             height=40
         ).pack(side="right", padx=10, pady=10)
     
+    def selected_augmentation_options(self):
+        """Diyalogda seçili augmentation seçenekleri"""
+        selected = [
+            ('speed', self.aug_speed), ('gain', self.aug_volume), ('noise', self.aug_noise),
+            ('pitch', self.aug_pitch), ('reverb', self.aug_reverb)
+        ]
+        return [option for option, var in selected if var.get()]
+    
     def start_audio_augmentation(self):
         """Audio augmentation işlemini başlat"""
         self.aug_results.delete("1.0", "end")
-        self.aug_results.insert("1.0", "🔄 Audio augmentation başlatılıyor...\n\n")
         
-        # Bu işlem için gelişmiş kütüphaneler gerekebilir
-        warning_text = """⚠️ GELIŞMIŞ ÖZELLİK UYARISI
-
-Audio Augmentation işlemi için aşağıdaki Python kütüphaneleri gereklidir:
-   • librosa (ses işleme)
-   • pydub (audio manipülasyon)
-   • scipy (sinyal işleme)
-
-📥 Kurulum komutu:
-pip install librosa pydub
+        options = self.selected_augmentation_options()
+        if not options:
+            self.aug_results.insert("1.0", "⚠️ En az bir augmentation seçeneği seçin.")
+            return
+        
+        self.aug_results.insert("1.0", "🔄 Audio augmentation başlatılıyor...\n\n⏳ İlerleme durum satırında ve görev panelinde.\n")
+        engine = AugmentationEngine(options)
+        
+        def show_result(text):
+            # Diyalog kapatılmış olabilir
+            if self.aug_results.winfo_exists():
+                self.aug_results.delete("1.0", "end")
+                self.aug_results.insert("1.0", text)
+        
+        def on_done(summary):
+            report = f"""✅ AUGMENTATION TAMAMLANDI
 
-🔧 Manuel Augmentation Önerileri:
-   1. Mevcut kayıtlarınızı farklı hızlarda kaydedin (yavaş/hızlı konuşma)
-   2. Farklı ses seviyelerinde kayıt yapın
-   3. Farklı ortamlarda (sessiz oda, doğal ortam) kayıt yapın
-   4. Farklı mikrofonlar kullanın
-   5. Farklı konuşmacılardan aynı cümleleri kaydedin
+   • Planlanan varyant: {summary['planned']}
+   • Yeni yazılan: {summary['written']}
+   • Zaten mevcut (atlandı): {summary['skipped']}
+   • Hata: {len(summary['errors'])}
 
-💡 Bu yöntemlerle zaten çok etkili bir dataset oluşturabilirsiniz!"""
-        
-        self.aug_results.insert("end", warning_text)
+📁 Klasör: {Config.AUGMENTED_DIR}
+📋 Manifest: {Config.AUGMENTED_MANIFEST.name} (her giriş augmentation tarifini içerir)
+"""
+            for error in summary['errors'][:20]:
+                report += f"\n   ❌ {error}"
+            show_result(report)
+        
+        self.run_background_task(
+            f"🎵 Audio augmentation ({', '.join(options)})",
+            lambda progress: engine.run(self.word_manager.load_manifest_transcripts(), progress),
+            on_done,
+            lambda error: show_result(f"❌ Augmentation hatası: {error}")
+        )
     
     def preview_augmentation(self):
         """Augmentation önizlemesi"""
@@ -6346,6 +5043,8 @@ Seçilen Seçenekler:
             preview_text += "   ✅ Gürültü ekleme aktif (2x çoğaltma)\n"
         if self.aug_pitch.get():
             preview_text += "   ✅ Pitch değişiklikleri aktif (2x çoğaltma)\n"
+        if self.aug_reverb.get():
+            preview_text += "   ✅ Yankı (reverb) aktif (2x çoğaltma)\n"
         
         audio_files = list(Config.AUDIO_DIR.glob("*.wav"))
         current_count = len(audio_files)
@@ -6355,6 +5054,7 @@ Seçilen Seçenekler:
         if self.aug_volume.get(): multiplier += 1
         if self.aug_noise.get(): multiplier += 1
         if self.aug_pitch.get(): multiplier += 1
+        if self.aug_reverb.get(): multiplier += 1
         
         new_count = current_count * multiplier
         
@@ -6440,7 +5140,7 @@ Seçilen Seçenekler:
         self.prep_results.delete("1.0", "end")
         self.prep_results.insert("1.0", "🔍 Dataset durumu kontrol ediliyor...\n\n")
         
-        try:
+        def build_report(progress):
             # Dosya sayıları
             audio_files = list(Config.AUDIO_DIR.glob("*.wav")) if Config.AUDIO_DIR.exists() else []
             manifest_exists = Config.WHISPER_MANIFEST.exists()
@@ -6455,23 +5155,8 @@ Seçilen Seçenekler:
                 except:
                     manifest_entries = 0
             
-            # Toplam süre hesabı
-            total_duration = 0
-            if audio_files:
-                try:
-                    import soundfile as sf
-                    for audio_file in audio_files[:50]:  # İlk 50 dosyayı kontrol et
-                        try:
-                            data, samplerate = sf.read(audio_file)
-                            total_duration += len(data) / samplerate
-                        except:
-                            continue
-                    # Tahmini toplam süre
-                    if len(audio_files) > 50:
-                        avg_duration = total_duration / 50
-                        total_duration = avg_duration * len(audio_files)
-                except:
-                    total_duration = len(audio_files) * 2  # Tahmini 2 saniye/dosya
+            # Toplam süre hesabı - başlık önbelleğinden kesin değer
+            total_duration = self.get_audio_metadata().totals()['total_duration'] if audio_files else 0
             
             # Rapor oluştur
             status_report = f"""🎯 WHISPER EĞİTİM DATASET DURUMU
@@ -6479,7 +5164,7 @@ Seçilen Seçenekler:
 
 📊 DATASET İSTATİSTİKLERİ:
    📁 Ses dosyası sayısı: {len(audio_files)}
-   ⏱️  Tahmini toplam süre: {total_duration/60:.1f} dakika ({total_duration/3600:.1f} saat)
+   ⏱️  Toplam süre: {total_duration/60:.1f} dakika ({total_duration/3600:.1f} saat)
    📋 Manifest girişi: {manifest_entries}
    📄 Transkript dosyası: {'✅ Mevcut' if transcript_exists else '❌ Eksik'}
 
@@ -6559,12 +5244,19 @@ Seçilen Seçenekler:
    • Web uygulaması veya API oluşturabilirsiniz
    • Ses-metin çeviri sistemi geliştirebilirsiniz"""
             
-            self.prep_results.delete("1.0", "end")
-            self.prep_results.insert("1.0", status_report)
-            
-        except Exception as e:
+            return status_report
+        
+        def on_done(text):
+            if self.prep_results.winfo_exists():
+                self.prep_results.delete("1.0", "end")
+                self.prep_results.insert("1.0", text)
+        
+        def on_error(e):
             error_text = f"❌ Durum kontrolü sırasında hata: {str(e)}"
-            self.prep_results.insert("end", error_text)
+            if self.prep_results.winfo_exists():
+                self.prep_results.insert("end", error_text)
+        
+        self.run_background_task("🎯 Dataset durumu", build_report, on_done, on_error)
     
     def open_training_files(self):
         """Eğitim dosyalarını sistem dosya gezgininde aç"""
@@ -6795,8 +5487,12 @@ if __name__ == "__main__":
         # Scripti kaydet
         script_path = Config.BASE_DIR / "whisper_training.py"
         try:
-            with open(script_path, 'w', encoding='utf-8') as f:
-                f.write(script_content)
+            # Mevcut (genişletilmiş) eğitim scriptinin üzerine sormadan yazma
+            if not script_path.exists() or messagebox.askyesno(
+                    "Script Mevcut",
+                    f"{script_path.name} zaten var.\nTemel şablonla değiştirilsin mi?"):
+                with open(script_path, 'w', encoding='utf-8') as f:
+                    f.write(script_content)
             
             requirements_content = '''# Whisper Fine-tuning Requirements
 torch>=1.9.0
@@ -6884,12 +5580,30 @@ print(transcription[0])
     
     def run(self):
         self.root.mainloop()
+        # Pencere kapandı: çalışan görevleri iptal et, sıradakileri başlatma
+        self.task_runner.shutdown()
+
+
+def print_startup_profile():
+    """--profile-startup: import ve başlatma sürelerinin dökümü"""
+    print("\n⏱️ Başlangıç profili")
+    previous = STARTUP_MARKS[0][1]
+    for label, moment in STARTUP_MARKS[1:]:
+        print(f"   {label:<34} {(moment - previous) * 1000:8.1f} ms")
+        previous = moment
+    print(f"   {'TOPLAM':<34} {(previous - STARTUP_MARKS[0][1]) * 1000:8.1f} ms")
+    for name, seconds in sorted(LazyModule.load_times.items()):
+        print(f"   (tembel yüklendi: {name} {seconds * 1000:.1f} ms)")
 
 
 def main():
     """Main entry point"""
     try:
         app = SimplifiedRecorderApp()
+        if "--profile-startup" in sys.argv:
+            app.root.update()
+            STARTUP_MARKS.append(("first frame", time.perf_counter()))
+            print_startup_profile()
         app.run()
     except Exception as e:
         print(f"Error starting application: {e}")
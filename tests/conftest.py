@@ -0,0 +1,19 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from kurmanji_core import Config  # noqa: E402
+
+
+@pytest.fixture
+def dataset_dir(tmp_path):
+    """Point every Config path at an empty dataset folder for one test"""
+    original = Config.BASE_DIR
+    base_dir = tmp_path / "kurmanji_dataset"
+    Config.use_base_dir(base_dir)
+    Config.ensure_dirs()
+    yield base_dir
+    Config.use_base_dir(original)
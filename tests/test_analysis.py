@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+import soundfile as sf
+
+from kurmanji_core import AudioMetadataCache, QualityAnalyzer, TaskCancelled
+
+
+def write_takes(audio_dir, count):
+    t = np.arange(8000, dtype=np.float32) / 16000
+    for i in range(count):
+        tone = 0.3 * np.sin(2 * np.pi * 220 * t) * (t > 0.1)
+        sf.write(audio_dir / f"{i + 1:06d}_peyv{i}_normal.wav", tone.astype(np.float32), 16000)
+
+
+def test_cancelled_analysis_keeps_finished_rows_and_resumes(dataset_dir, tmp_path):
+    audio_dir = dataset_dir / "audio"
+    report = tmp_path / "quality_report.npz"
+    write_takes(audio_dir, 5)
+
+    def cancel_after_two(done, total):
+        if done == 2:
+            raise TaskCancelled()
+
+    analyzer = QualityAnalyzer(audio_dir, report, workers=1)
+    with pytest.raises(TaskCancelled):
+        analyzer.run(cancel_after_two)
+
+    resumed = QualityAnalyzer(audio_dir, report, workers=1)
+    assert len(resumed.columns["name"]) == 2
+    # Yalnızca kalan üç dosya analiz edilir
+    assert resumed.run() == 3
+    assert sorted(row["name"] for row in resumed.rows()) == sorted(path.name for path in audio_dir.iterdir())
+    assert QualityAnalyzer(audio_dir, report, workers=1).run() == 0
+
+
+def test_metadata_cache_reads_headers_only_for_new_or_changed_files(dataset_dir, monkeypatch):
+    audio_dir = dataset_dir / "audio"
+    sf.write(audio_dir / "000001_av_normal.wav", np.zeros(16000, dtype=np.float32), 16000)
+    sf.write(audio_dir / "000002_mal_normal.wav", np.zeros(8000, dtype=np.float32), 16000)
+    (audio_dir / "notes.txt").write_text("ne ses e", encoding="utf-8")
+
+    reads = []
+    original = AudioMetadataCache.read_header
+    monkeypatch.setattr(AudioMetadataCache, "read_header",
+                        staticmethod(lambda path, stat: reads.append(path) or original(path, stat)))
+
+    cache = AudioMetadataCache()
+    assert cache.refresh() == 2
+    assert cache.totals()["files"] == 2
+    assert cache.totals()["total_duration"] == 1.5
+
+    # Kaydedilmiş önbellekten: değişmeyen dosyalar yeniden okunmaz
+    reads.clear()
+    reloaded = AudioMetadataCache()
+    assert reloaded.refresh() == 0 and reads == []
+
+    sf.write(audio_dir / "000001_av_normal.wav", np.zeros(48000, dtype=np.float32), 16000)
+    (audio_dir / "000002_mal_normal.wav").unlink()
+    assert reloaded.refresh() == 1
+    assert reloaded.durations() == {"000001_av_normal.wav": 3.0}
@@ -0,0 +1,57 @@
+import json
+
+import numpy as np
+import soundfile as sf
+
+from kurmanji_core import AugmentationEngine, Config
+
+
+def write_takes(names):
+    t = np.arange(8000, dtype=np.float32) / 16000
+    for name in names:
+        sf.write(Config.AUDIO_DIR / name, (0.2 * np.sin(2 * np.pi * 200 * t)).astype(np.float32), 16000)
+
+
+def manifest_names(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line)["audio_filepath"] for line in f if line.strip()]
+
+
+def test_augmentation_resumes_manifest_without_rewriting_variants(dataset_dir):
+    names = ["000001_av_normal.wav", "000002_mal_normal.wav"]
+    write_takes(names)
+    transcripts = {"000001_av_normal.wav": "av", "000002_mal_normal.wav": "mal"}
+
+    engine = AugmentationEngine(["gain", "noise"], workers=1)
+    first = engine.run(transcripts)
+    assert (first["planned"], first["written"], first["skipped"]) == (4, 4, 0)
+    outputs = sorted(Config.AUGMENTED_DIR.glob("*.wav"))
+    assert len(outputs) == 4 and sorted(manifest_names(Config.AUGMENTED_MANIFEST)) == sorted(
+        f"{Config.AUGMENTED_DIR.name}/{path.name}" for path in outputs)
+
+    # Yarıda kesilmiş çalışma: dosyalar yazılmış ama manifest'in son satırları yok
+    lines = Config.AUGMENTED_MANIFEST.read_text(encoding="utf-8").splitlines(keepends=True)
+    Config.AUGMENTED_MANIFEST.write_text("".join(lines[:1]), encoding="utf-8")
+    mtimes = {path.name: path.stat().st_mtime_ns for path in outputs}
+
+    second = AugmentationEngine(["gain", "noise"], workers=1).run(transcripts)
+
+    assert (second["written"], second["skipped"]) == (0, 4)
+    assert {path.name: path.stat().st_mtime_ns for path in outputs} == mtimes
+    listed = manifest_names(Config.AUGMENTED_MANIFEST)
+    assert len(listed) == 4 and len(set(listed)) == 4
+    entry = json.loads(Config.AUGMENTED_MANIFEST.read_text(encoding="utf-8").splitlines()[-1])
+    assert entry["duration_measured"] and entry["text"] in ("av", "mal") and "seed" in entry["augmentation"]
+
+
+def test_augmentation_is_deterministic_per_file_and_option(dataset_dir, tmp_path):
+    write_takes(["000001_av_normal.wav"])
+    transcripts = {"000001_av_normal.wav": "av"}
+
+    outputs = []
+    for run in ("yek", "du"):
+        engine = AugmentationEngine(["noise"], output_dir=tmp_path / run, manifest_path=tmp_path / f"{run}.jsonl", workers=1)
+        engine.run(transcripts)
+        outputs.append({path.name: path.read_bytes() for path in (tmp_path / run).glob("*.wav")})
+
+    assert outputs[0] == outputs[1] and len(outputs[0]) == 1
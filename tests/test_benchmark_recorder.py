@@ -0,0 +1,43 @@
+import json
+
+import pytest
+
+import benchmark_recorder
+from kurmanji_core import Config
+
+
+@pytest.fixture
+def keep_base_dir():
+    """run() Config'i geçici klasöre çevirir; testten sonra geri al"""
+    original = Config.BASE_DIR
+    yield
+    Config.use_base_dir(original)
+
+
+def test_selected_cases_are_written_with_run_metadata(tmp_path, keep_base_dir):
+    output = tmp_path / "after.json"
+    assert benchmark_recorder.main(["--only", "is_sentence", "add_words", "--sizes", "200",
+                                    "--repeat", "2", "--output", str(output)]) == 0
+
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert report["repeat"] == 2 and report["seed"] == 1234
+    assert {"python", "numpy", "platform", "commit"} <= set(report)
+    assert [row["id"] for row in report["results"]] == ["is_sentence[items=200]", "add_words[items=200,batch=100]"]
+    for row in report["results"]:
+        assert row["runs"] == 2
+        assert 0 <= row["min_s"] <= row["median_s"]
+
+
+def test_compare_fails_only_when_a_case_slows_down_past_the_tolerance(tmp_path, keep_base_dir):
+    def baseline(median_s):
+        path = tmp_path / f"before_{median_s}.json"
+        rows = [{"id": "is_sentence[items=100]", "median_s": median_s},
+                {"id": "kaldırıldı[items=100]", "median_s": 1.0}]
+        path.write_text(json.dumps({"results": rows}), encoding="utf-8")
+        return str(path)
+
+    arguments = ["--only", "is_sentence", "--sizes", "100", "--repeat", "1", "--output", str(tmp_path / "out.json")]
+    assert benchmark_recorder.main(arguments + ["--compare", baseline(1e-12)]) == 1
+    assert benchmark_recorder.main(arguments + ["--compare", baseline(60.0)]) == 0
+    # Baseline median 0 ise oran hesaplanamaz: "yeni" sayılır, gerileme değil
+    assert benchmark_recorder.main(arguments + ["--compare", baseline(0.0)]) == 0
@@ -0,0 +1,45 @@
+import pytest
+
+from kurmanji_core import Config, WordManager
+from kurmanji_core.cli import build_parser, main
+
+
+@pytest.fixture
+def keep_base_dir():
+    original = Config.BASE_DIR
+    yield
+    Config.use_base_dir(original)
+
+
+def test_subcommand_is_required():
+    with pytest.raises(SystemExit):
+        build_parser().parse_args([])
+
+
+def test_import_and_status_use_the_given_base_dir(tmp_path, keep_base_dir, capsys):
+    base_dir = tmp_path / "veri" / "kurmanji_dataset"
+    corpus = tmp_path / "corpus.txt"
+    corpus.write_text("mal av dar\nmal çav\n", encoding="utf-8")
+
+    main(["--base-dir", str(base_dir), "import", str(corpus)])
+    assert Config.BASE_DIR == base_dir and Config.AUDIO_DIR.is_dir()
+    assert "yeni öğe eklendi" in capsys.readouterr().out
+    assert set(WordManager().words) == {"mal", "av", "dar", "çav"}
+
+    main(["--base-dir", str(base_dir), "status"])
+    out = capsys.readouterr().out
+    assert str(base_dir) in out and "Kelime: 4" in out and "Ses dosyası: 0" in out
+
+
+def test_frequency_import_respects_min_count_and_limit(tmp_path, keep_base_dir):
+    corpus = tmp_path / "corpus.txt"
+    corpus.write_text("mal mal mal av av dar\n", encoding="utf-8")
+
+    main(["--base-dir", str(tmp_path / "kurmanji_dataset"), "import", str(corpus),
+          "--mode", "frequency", "--min-count", "2", "--limit", "1"])
+    assert WordManager().words == ["mal"]
+
+
+def test_export_without_manifest_reports_missing_shards_source(tmp_path, keep_base_dir, capsys):
+    main(["--base-dir", str(tmp_path / "kurmanji_dataset"), "export", str(tmp_path / "out"), "--format", "shards"])
+    assert "Manifest bulunamadı" in capsys.readouterr().out
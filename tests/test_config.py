@@ -0,0 +1,13 @@
+from kurmanji_core import Config
+
+
+def test_ensure_dirs_creates_missing_parents_of_a_nested_base_dir(tmp_path):
+    original = Config.BASE_DIR
+    base_dir = tmp_path / "projeler" / "kurmanji" / "kurmanji_dataset"
+    try:
+        Config.use_base_dir(base_dir)
+        Config.ensure_dirs()
+        assert Config.AUDIO_DIR == base_dir / "audio"
+        assert Config.AUDIO_DIR.is_dir() and Config.DOCS_DIR.is_dir()
+    finally:
+        Config.use_base_dir(original)
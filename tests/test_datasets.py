@@ -0,0 +1,106 @@
+import json
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from kurmanji_core import Config, DatasetMerger, IncrementalExporter, ShardedTarExporter
+
+
+def make_dataset(count):
+    with open(Config.WHISPER_MANIFEST, "w", encoding="utf-8") as f:
+        for i in range(count):
+            name = f"{i + 1:06d}_peyv{i}_normal.wav"
+            sf.write(Config.AUDIO_DIR / name, np.zeros(4000, dtype=np.float32), 16000)
+            f.write(json.dumps({"audio_filepath": f"audio/{name}", "text": f"peyv{i}", "duration": 0.25}) + "\n")
+
+
+def test_sharded_export_resumes_after_interruption(dataset_dir, tmp_path, monkeypatch):
+    make_dataset(12)
+    output = tmp_path / "shards"
+    shard_bytes = (Config.AUDIO_DIR / "000001_peyv0_normal.wav").stat().st_size + 1024
+
+    exporter = ShardedTarExporter(output, max_shard_bytes=shard_bytes, workers=1)
+    original_write = ShardedTarExporter._write_shard
+    written = []
+
+    def interrupted_write(self, shard_name, samples):
+        if len(written) == 3:
+            raise KeyboardInterrupt
+        written.append(shard_name)
+        return original_write(self, shard_name, samples)
+
+    monkeypatch.setattr(ShardedTarExporter, "_write_shard", interrupted_write)
+    with pytest.raises(KeyboardInterrupt):
+        exporter.run()
+    monkeypatch.undo()
+
+    index = json.loads((output / Config.SHARD_INDEX_NAME).read_text(encoding="utf-8"))
+    assert not index["complete"]
+    assert [shard["name"] for shard in index["shards"]] == written
+
+    summary = ShardedTarExporter(output, max_shard_bytes=shard_bytes, workers=1).run()
+    assert summary == {"shards": 12, "written": 9, "samples": 12}
+    index = json.loads((output / Config.SHARD_INDEX_NAME).read_text(encoding="utf-8"))
+    assert index["complete"] and len(index["shards"]) == 12
+
+    assert ShardedTarExporter(output, max_shard_bytes=shard_bytes, workers=1).run()["written"] == 0
+
+
+def write_source(root, files, manifest):
+    audio = root / "audio"
+    audio.mkdir(parents=True)
+    for name, value in files.items():
+        sf.write(audio / name, np.full(1600, value, dtype=np.float32), 16000)
+    with open(root / "whisper_manifest.jsonl", "w", encoding="utf-8") as f:
+        for entry in manifest:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+def test_merge_skips_duplicates_and_renumbers(tmp_path):
+    first, second, target = tmp_path / "yek", tmp_path / "du", tmp_path / "merged"
+    write_source(first, {"000001_av_normal.wav": 0.1, "000002_mal_normal.wav": 0.2},
+                 [{"audio_filepath": "audio/000001_av_normal.wav", "text": "Av", "speaker_id": "ali"}])
+    # 000007_mal: birinci kaynaktaki 000002 ile bayt bayt aynı
+    write_source(second, {"000007_mal_normal.wav": 0.2, "000009_roj_fast.wav": 0.3}, [])
+
+    summary = DatasetMerger([first, second], target, workers=2).run()
+
+    assert (summary["merged"], summary["duplicates"]) == (3, 1)
+    entries = [json.loads(line) for line in (target / "whisper_manifest.jsonl").read_text(encoding="utf-8").splitlines()]
+    assert [entry["audio_filepath"] for entry in entries] == [
+        "audio/000001_av_normal_speaker1.wav",
+        "audio/000002_mal_normal_speaker1.wav",
+        "audio/000003_roj_fast_speaker2.wav",
+    ]
+    # Manifest metni ve konuşmacı taşınır; yoksa dosya adından
+    assert [entry["text"] for entry in entries] == ["Av", "000002_mal_normal", "000009_roj_fast"]
+    assert [entry["speaker_id"] for entry in entries] == ["ali", "speaker1", "speaker2"]
+    assert all(entry["duration_measured"] and entry["duration"] == 0.1 for entry in entries)
+    assert sorted(path.name for path in (target / "audio").iterdir()) == [
+        "000001_av_normal_speaker1.wav", "000002_mal_normal_speaker1.wav", "000003_roj_fast_speaker2.wav",
+    ]
+
+
+def test_incremental_export_links_once_then_skips_and_unlinks(dataset_dir, tmp_path):
+    make_dataset(3)
+    target = tmp_path / "export"
+    exporter = IncrementalExporter(target_dir=target, workers=2)
+
+    first = exporter.run()
+    assert (first["linked"], first["copied"], first["unchanged"], first["removed"]) == (3, 0, 0, 0)
+    source = Config.AUDIO_DIR / "000001_peyv0_normal.wav"
+    assert (target / "audio" / source.name).stat().st_ino == source.stat().st_ino
+
+    second = exporter.run()
+    assert (second["linked"], second["unchanged"], second["removed"]) == (0, 3, 0)
+
+    # Biri yeniden kaydedildi, biri silindi
+    sf.write(source, np.ones(8000, dtype=np.float32) * 0.1, 16000)
+    (Config.AUDIO_DIR / "000002_peyv1_normal.wav").unlink()
+    third = exporter.run()
+
+    assert (third["linked"] + third["copied"], third["unchanged"], third["removed"], third["total"]) == (1, 1, 1, 2)
+    assert sorted(path.name for path in (target / "audio").iterdir()) == ["000001_peyv0_normal.wav", "000003_peyv2_normal.wav"]
+    manifest = json.loads((target / Config.EXPORT_MANIFEST_NAME).read_text(encoding="utf-8"))
+    assert manifest["files"][source.name]["sha256"] == IncrementalExporter.file_checksum(source)
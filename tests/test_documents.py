@@ -0,0 +1,35 @@
+from kurmanji_core import CorpusTokenCounter
+
+
+def test_reimporting_an_edited_document_replaces_its_counts(dataset_dir):
+    document = dataset_dir / "nivîs.txt"
+    other = dataset_dir / "din.txt"
+    document.write_text("Av av mal\nbav\n", encoding="utf-8")
+    other.write_text("av dar\n", encoding="utf-8")
+
+    counter = CorpusTokenCounter(dataset_dir / "token_counts.json")
+    counter.update_file(document)
+    counter.update_file(other)
+    assert counter.counts == {"av": 3, "mal": 1, "bav": 1, "dar": 1}
+
+    document.write_text("av dar dar roj\n", encoding="utf-8")
+    counter.update_file(document)
+    counter.save()
+
+    expected = {"av": 2, "dar": 3, "roj": 1}
+    assert counter.counts == expected
+    assert "mal" not in counter.display_forms
+    # Kaydedilmiş sayımdan yeniden yükleyince de aynı; değişmeyen belge tekrar sayılmaz
+    reloaded = CorpusTokenCounter(dataset_dir / "token_counts.json")
+    assert reloaded.update_file(document) == 0
+    assert reloaded.counts == expected
+
+
+def test_unchanged_document_is_not_recounted(dataset_dir):
+    document = dataset_dir / "nivîs.txt"
+    document.write_text("Ez diçim malê\n", encoding="utf-8")
+    counter = CorpusTokenCounter(dataset_dir / "token_counts.json")
+
+    assert counter.update_file(document) == 3
+    assert counter.update_file(document) == 0
+    assert counter.counts["malê"] == 1
@@ -0,0 +1,78 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+import kurmanji_recorder_clean as app
+from kurmanji_core import Config
+from kurmanji_core.audio import LevelMeter
+
+Recorder = app.SimplifiedRecorderApp
+
+
+class Widget:
+    def __init__(self):
+        self.calls = []
+
+    def set(self, value):
+        self.calls.append(value)
+
+    def configure(self, **kwargs):
+        self.calls.append(kwargs)
+
+
+def fake_recorder(now):
+    meter = LevelMeter()
+    recorder = SimpleNamespace(
+        is_recording=True,
+        audio_manager=SimpleNamespace(meter=meter, selected_is_bluetooth=True),
+        audio_level_bar=Widget(),
+        status_label=Widget(),
+        root=SimpleNamespace(after=lambda ms, callback: None),
+        _meter_seq=None,
+        _meter_seq_time=now,
+        _meter_drawn=0.0,
+        _low_level_since=None,
+        _bluetooth_warning=False,
+    )
+    recorder.check_bluetooth_level = lambda level, since=None: Recorder.check_bluetooth_level(recorder, level, since)
+    recorder.monitor_audio_level = lambda: Recorder.monitor_audio_level(recorder)
+    return recorder
+
+
+def test_stalled_bluetooth_stream_raises_low_level_warning(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(app.time, "monotonic", lambda: clock[0])
+    recorder = fake_recorder(clock[0])
+    loud = np.full(512, 8000, dtype=np.int16)
+    recorder.audio_manager.meter.publish(loud)
+
+    recorder.monitor_audio_level()
+    assert not recorder._bluetooth_warning
+
+    # Akış durdu: seq değişmiyor, yeni blok yok
+    clock[0] += Config.METER_LOW_LEVEL_SECONDS / 2
+    recorder.monitor_audio_level()
+    assert not recorder._bluetooth_warning
+
+    clock[0] += Config.METER_LOW_LEVEL_SECONDS
+    recorder.monitor_audio_level()
+    assert recorder._bluetooth_warning
+    assert "very low" in recorder.status_label.calls[-1]["text"]
+
+    # Ses geri gelince uyarı kalkar
+    recorder.audio_manager.meter.publish(loud)
+    recorder.monitor_audio_level()
+    assert not recorder._bluetooth_warning
+
+
+def test_stall_is_ignored_for_non_bluetooth_devices(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(app.time, "monotonic", lambda: clock[0])
+    recorder = fake_recorder(clock[0])
+    recorder.audio_manager.selected_is_bluetooth = False
+
+    clock[0] += Config.METER_LOW_LEVEL_SECONDS * 3
+    recorder.monitor_audio_level()
+
+    assert not recorder._bluetooth_warning
+    assert recorder.status_label.calls == []
@@ -0,0 +1,62 @@
+from kurmanji_core import KurmanjiSentenceSegmenter
+
+# ~13 karakter/sn: kısa aralıklar testleri okunur tutar
+SENTENCES = (0.5, 3.0)
+PARAGRAPHS = (4.0, 8.0)
+
+
+def segment(text):
+    return list(KurmanjiSentenceSegmenter().segment(text.split("\n"), SENTENCES, PARAGRAPHS))
+
+
+def test_abbreviations_initials_and_ordinals_do_not_split():
+    segmenter = KurmanjiSentenceSegmenter()
+    text = "Dr. Ehmed hat. M. Xanî nivîsî. Di 3. rojê de çû. Bnr. rûpel 4 bixwîne."
+
+    assert segmenter.segment_paragraph(text) == [
+        "Dr. Ehmed hat.", "M. Xanî nivîsî.", "Di 3. rojê de çû.", "Bnr. rûpel 4 bixwîne.",
+    ]
+
+
+def test_quotes_and_lowercase_continuations():
+    segmenter = KurmanjiSentenceSegmenter()
+    text = 'Wî got: «Ez têm.» Paşê çû. "Tu kî yî?" wê pirsî. Erê!'
+
+    assert segmenter.segment_paragraph(text) == ['Wî got: «Ez têm.»', 'Paşê çû.', '"Tu kî yî?" wê pirsî.', 'Erê!']
+
+
+def test_each_sentence_lands_in_exactly_one_list():
+    long_paragraph = "Ez diçim malê. Tu li vir î. Ew pir baş e. Em hevdu dibînin."
+    short_paragraph = "Baran dibare. Roj derket."
+
+    items = segment(long_paragraph + "\n\n" + short_paragraph)
+
+    assert items == [
+        ("paragraph", long_paragraph),
+        ("sentence", "Baran dibare."),
+        ("sentence", "Roj derket."),
+    ]
+
+
+def test_too_long_sentence_breaks_the_chunk():
+    too_long = "Ev hevok " + "pir " * 40 + "dirêj e."
+    before = "Ez diçim malê. Tu li vir î."
+    after = "Em hevdu dibînin. Baran dibare. Roj derket bi germî."
+
+    items = segment(f"{before} {too_long} {after}")
+
+    # Hevokên li du aliyên hevoka dirêj nayên girêdan
+    assert items == [
+        ("sentence", "Ez diçim malê."),
+        ("sentence", "Tu li vir î."),
+        ("paragraph", after),
+    ]
+
+
+def test_short_chunk_at_mid_paragraph_flush_is_kept_as_sentences():
+    short = "Ez diçim malê."
+    long_sentence = "Ew " + "gelek " * 11 + "dûr e, lê em ê herin."  # ~7 sn: tenê paragraf
+
+    items = segment(f"{short} {long_sentence}")
+
+    assert items == [("sentence", short), ("paragraph", long_sentence)]
@@ -0,0 +1,25 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+HEAVY_MODULES = ["librosa", "requests", "docx", "PyPDF2", "sounddevice", "customtkinter", "torch"]
+IMPORT_BUDGET_S = 3.0
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import kurmanji_recorder_clean
+elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "loaded": [m for m in %r if m in sys.modules]}))
+""" % (HEAVY_MODULES,)
+
+
+def test_app_import_stays_light_and_fast():
+    # Temiz bir yorumlayıcıda: pytest'in yüklediği modüller sonucu bozmasın
+    result = subprocess.run([sys.executable, "-c", PROBE], cwd=ROOT, capture_output=True, text=True, check=True)
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+
+    assert report["loaded"] == []
+    assert report["elapsed"] < IMPORT_BUDGET_S
@@ -0,0 +1,118 @@
+import threading
+import time
+
+import pytest
+
+from kurmanji_core import TaskCancelled, TaskRunner
+
+
+def poll_until(runner, task, timeout=5.0):
+    """UI döngüsü gibi poll() çağır, görev bitene kadar"""
+    deadline = time.monotonic() + timeout
+    finished = []
+    while task.active and time.monotonic() < deadline:
+        finished += runner.poll()
+        time.sleep(0.01)
+    return finished
+
+
+def test_done_and_error_callbacks_are_delivered_by_poll():
+    runner = TaskRunner(max_workers=2)
+    results, errors = [], []
+    try:
+        def job(progress):
+            progress(1, 2, "yarısı")
+            progress(2)
+            return "tamam"
+
+        task = runner.submit("iş", job, on_done=results.append)
+        assert poll_until(runner, task) == [task]
+        assert task.status == "done" and task.result == "tamam"
+        assert (task.done, task.total, task.message) == (2, 2, "yarısı")
+        assert task.fraction() == 1.0 and results == ["tamam"]
+
+        def broken(progress):
+            raise ValueError("bozuk")
+
+        failed = runner.submit("hata", broken, on_error=errors.append)
+        poll_until(runner, failed)
+        assert failed.status == "error" and isinstance(failed.error, ValueError)
+        assert errors == [failed.error]
+    finally:
+        runner.shutdown()
+
+
+def test_cancel_unwinds_a_running_task_at_its_next_progress_call():
+    runner = TaskRunner(max_workers=1)
+    started, release = threading.Event(), threading.Event()
+    reached, results, errors = [], [], []
+    try:
+        def job(progress):
+            progress(0, 3)
+            started.set()
+            release.wait(5)
+            progress(1)
+            reached.append(1)
+            return "bitmemeli"
+
+        task = runner.submit("uzun", job, on_done=results.append, on_error=errors.append)
+        assert started.wait(5)
+        assert task.status == "running"
+        task.cancel()
+        release.set()
+        poll_until(runner, task)
+        assert task.status == "cancelled"
+        assert reached == [] and results == [] and errors == []
+        assert task.finished is not None
+    finally:
+        runner.shutdown()
+
+
+def test_task_cancelled_before_it_starts_never_runs():
+    runner = TaskRunner(max_workers=1)
+    release = threading.Event()
+    calls = []
+    try:
+        blocker = runner.submit("meşgul", lambda progress: release.wait(5))
+        queued = runner.submit("sırada", lambda progress: calls.append(1))
+        assert queued.status == "queued"
+        queued.cancel()
+        release.set()
+        poll_until(runner, blocker)
+        poll_until(runner, queued)
+        assert queued.status == "cancelled" and queued.started is None
+        assert calls == []
+        runner.clear_finished()
+        assert runner.tasks == {}
+    finally:
+        runner.shutdown()
+
+
+def test_shutdown_cancels_running_tasks():
+    runner = TaskRunner(max_workers=1)
+    started, release = threading.Event(), threading.Event()
+
+    def job(progress):
+        started.set()
+        release.wait(5)
+        progress(1, 1)
+
+    task = runner.submit("uzun", job)
+    assert started.wait(5)
+    runner.shutdown()
+    assert task.cancelled
+    release.set()
+    poll_until(runner, task)
+    assert task.status == "cancelled"
+
+
+def test_progress_raises_once_cancelled():
+    runner = TaskRunner(max_workers=1)
+    try:
+        task = runner.submit("boş", lambda progress: None)
+        poll_until(runner, task)
+        task.cancel()
+        with pytest.raises(TaskCancelled):
+            task.progress(1)
+    finally:
+        runner.shutdown()
@@ -0,0 +1,102 @@
+import threading
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from kurmanji_core import UrlFetcher
+
+BODY = "<html><body><p>Ez diçim malê.</p><script>skip()</script></body></html>".encode("utf-8")
+ETAG = '"v1"'
+LAST_MODIFIED = formatdate(0, usegmt=True)
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, havuz yeniden kullanılabilsin
+
+    def do_GET(self):
+        self.server.requests.append((self.path, dict(self.headers), self.client_address[1]))
+        validators = self.path != "/no-validators"
+        if validators and (self.headers.get("If-None-Match") == ETAG
+                           or self.headers.get("If-Modified-Since") == LAST_MODIFIED):
+            self.send_response(304)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(BODY)))
+        if validators:
+            self.send_header("ETag", ETAG)
+            self.send_header("Last-Modified", LAST_MODIFIED)
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    httpd.requests = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def url(server, path="/page"):
+    return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+
+def test_200_is_cached_and_304_served_from_cache(server, tmp_path):
+    fetcher = UrlFetcher(cache_dir=tmp_path / "cache", max_workers=2)
+
+    first = fetcher.fetch(url(server))
+    assert first["error"] is None
+    assert first["status"] == 200 and not first["cached"]
+    assert "Ez diçim malê." in first["text"] and "skip" not in first["text"]
+    assert len(list((tmp_path / "cache").glob("*.txt"))) == 1
+
+    second = fetcher.fetch(url(server))
+    assert second["status"] == 304 and second["cached"]
+    assert second["text"] == first["text"]
+
+    _, headers, _ = server.requests[-1]
+    assert headers.get("If-None-Match") == ETAG
+    assert headers.get("If-Modified-Since") == LAST_MODIFIED
+
+
+def test_cache_survives_new_fetcher(server, tmp_path):
+    UrlFetcher(cache_dir=tmp_path / "cache").fetch(url(server))
+    result = UrlFetcher(cache_dir=tmp_path / "cache").fetch(url(server))
+    assert result["cached"]
+
+
+def test_no_validators_means_plain_refetch(server, tmp_path):
+    fetcher = UrlFetcher(cache_dir=tmp_path / "cache")
+    fetcher.fetch(url(server, "/no-validators"))
+    result = fetcher.fetch(url(server, "/no-validators"))
+    assert result["status"] == 200 and not result["cached"]
+    assert "If-None-Match" not in server.requests[-1][1]
+
+
+def test_pooled_session_is_reused(server, tmp_path):
+    fetcher = UrlFetcher(cache_dir=tmp_path / "cache", max_workers=1)
+    session = fetcher.session
+    for _ in range(3):
+        fetcher.fetch(url(server))
+    assert fetcher.session is session
+    # Aynı istemci portu: tek keep-alive bağlantısı havuzdan tekrar kullanıldı
+    assert len({port for _, _, port in server.requests}) == 1
+
+
+def test_fetch_many_keeps_input_order(server, tmp_path):
+    fetcher = UrlFetcher(cache_dir=tmp_path / "cache", max_workers=4)
+    urls = [url(server, f"/page{i}") for i in range(6)]
+    progress = []
+    results = fetcher.fetch_many(urls, lambda done, total: progress.append((done, total)))
+    assert [result["url"] for result in results] == urls
+    assert progress[-1] == (6, 6)
@@ -0,0 +1,29 @@
+import numpy as np
+
+from kurmanji_core import TakeVerifier, character_error_rate, edit_distance
+
+
+def test_split_windows_keeps_long_takes_whole():
+    rate = 16000
+    audio = np.arange(int(70.5 * rate), dtype=np.float32)
+
+    windows = TakeVerifier.split_windows(audio, rate, window_seconds=30)
+
+    assert [len(window) for window in windows] == [30 * rate, 30 * rate, int(10.5 * rate)]
+    assert np.array_equal(np.concatenate(windows), audio)
+
+
+def test_split_windows_short_take_is_single_window():
+    audio = np.zeros(16000 * 12, dtype=np.float32)
+
+    windows = TakeVerifier.split_windows(audio, 16000, window_seconds=30)
+
+    assert len(windows) == 1 and windows[0] is audio
+
+
+def test_character_error_rate_shares_evaluation_edit_distance():
+    assert edit_distance(list("berdar"), list("berdan")) == 1
+    assert edit_distance("", "av") == 2
+    # Büyük/küçük harf, boşluk ve noktalama yok sayılır
+    assert character_error_rate("Ez diçim mal.", "ez diçim mal") == 0.0
+    assert character_error_rate("mal", "mel") == 1 / 3
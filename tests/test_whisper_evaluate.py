@@ -0,0 +1,27 @@
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "kurmanji_dataset"))
+
+from whisper_evaluate import ContentTypeIndex  # noqa: E402
+
+
+def test_content_type_from_recorder_lists(tmp_path):
+    (tmp_path / "wordlist.json").write_text(json.dumps({"words": ["av", "xwendekar"]}), encoding="utf-8")
+    (tmp_path / "sentencelist.json").write_text(json.dumps({"sentences": ["Ez diçim malê."]}), encoding="utf-8")
+    long_paragraph = " ".join(["Ez"] * 5)
+    (tmp_path / "paragraphlist.json").write_text(json.dumps({"paragraphs": [long_paragraph]}), encoding="utf-8")
+    content_type = ContentTypeIndex(tmp_path)
+
+    # Kelime sayısı değil, liste belirler
+    assert content_type("xwendekar") == "word"
+    assert content_type("Ez diçim malê. ") == "sentence"
+    assert content_type(long_paragraph) == "paragraph"
+
+
+def test_content_type_fallback_uses_is_sentence_rules(tmp_path):
+    content_type = ContentTypeIndex(tmp_path)
+    assert content_type("mal") == "word"
+    assert content_type("Tu çawa yî?") == "sentence"
+    assert content_type("Ez hatim. Tu çûyî.") == "paragraph"
@@ -0,0 +1,63 @@
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+for module in ("torch", "transformers", "datasets", "librosa"):
+    pytest.importorskip(module)
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "kurmanji_dataset"))
+
+import whisper_evaluate  # noqa: E402
+import whisper_export  # noqa: E402
+from whisper_training import ManifestStreamingDataset  # noqa: E402
+
+
+def heldout_dataset(root, count):
+    """Test ayrımına düşen `count` kayıtlık manifest"""
+    audio = root / "audio"
+    audio.mkdir()
+    names = []
+    i = 0
+    while len(names) < count:
+        name = f"{i:06d}_peyv{i}_normal.wav"
+        if ManifestStreamingDataset.is_test(name):
+            sf.write(audio / name, np.zeros(16000, dtype=np.float32), 16000)
+            names.append(name)
+        i += 1
+    with open(root / "whisper_manifest.jsonl", "w", encoding="utf-8") as f:
+        for name in names:
+            f.write(json.dumps({"audio_filepath": f"audio/{name}", "text": "ez diçim"}) + "\n")
+    return root / "whisper_manifest.jsonl", audio
+
+
+def test_benchmark_reports_rtf_and_wer_per_exported_model(tmp_path, monkeypatch):
+    manifest, audio = heldout_dataset(tmp_path, 3)
+    processor = SimpleNamespace(feature_extractor=SimpleNamespace(sampling_rate=16000))
+    loaded = []
+    # fp32 her şeyi doğru, int8 ikinci kelimeyi yanlış çözer
+    outputs = {"fp32": "ez diçim", "int8": "ez diçin"}
+
+    def fake_load(model_dir, threads=None):
+        loaded.append(model_dir)
+        return SimpleNamespace(label=model_dir), processor
+
+    def fake_transcribe(model, processor, arrays):
+        assert all(array.size == 16000 for array in arrays)
+        return [outputs[model.label]] * len(arrays)
+
+    monkeypatch.setattr(whisper_export, "load_cpu_model", fake_load)
+    monkeypatch.setattr(whisper_evaluate, "transcribe_arrays", fake_transcribe)
+
+    results = whisper_export.benchmark({"fp32": "fp32", "int8": "int8", "onnx": None}, str(manifest), str(audio), batch_size=2)
+
+    # Dışa aktarılmamış (None) model atlanır
+    assert loaded == ["fp32", "int8"]
+    assert set(results) == {"fp32", "int8"}
+    assert results["fp32"]["wer"] == 0.0
+    assert results["int8"]["wer"] == pytest.approx(50.0)
+    assert all(result["rtf"] >= 0.0 and result["seconds"] >= 0.0 for result in results.values())
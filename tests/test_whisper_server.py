@@ -0,0 +1,110 @@
+import asyncio
+import io
+import json
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import soundfile as sf
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "kurmanji_dataset"))
+
+import whisper_server  # noqa: E402
+
+
+class FakeBatcher:
+    def __init__(self):
+        self.processor = SimpleNamespace(feature_extractor=SimpleNamespace(sampling_rate=16000))
+
+    async def submit(self, array):
+        return {"text": "av", "samples": int(array.size)}
+
+
+def test_wav_is_decoded_off_the_event_loop(monkeypatch):
+    decode_threads = []
+    original_decode = whisper_server.decode_wav
+
+    def recording_decode(data, sampling_rate):
+        decode_threads.append(threading.current_thread().name)
+        return original_decode(data, sampling_rate)
+
+    monkeypatch.setattr(whisper_server, "decode_wav", recording_decode)
+    buffer = io.BytesIO()
+    sf.write(buffer, np.zeros(1600, dtype=np.float32), 16000, format="WAV")
+    body = buffer.getvalue()
+
+    async def scenario():
+        server = whisper_server.TranscriptionServer(FakeBatcher())
+        tcp_server = await asyncio.start_server(server.handle, "127.0.0.1", 0)
+        port = tcp_server.sockets[0].getsockname()[1]
+        async with tcp_server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(f"POST /transcribe HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n".encode("latin-1") + body)
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+        server.decode_executor.shutdown()
+        return response, threading.current_thread().name
+
+    response, loop_thread = asyncio.run(scenario())
+    assert response.startswith(b"HTTP/1.1 200")
+    assert json.loads(response.split(b"\r\n\r\n", 1)[1]) == {"text": "av", "samples": 1600}
+    assert decode_threads and decode_threads[0] != loop_thread
+    assert decode_threads[0].startswith("decode")
+
+
+def request(body, headers):
+    async def scenario():
+        server = whisper_server.TranscriptionServer(FakeBatcher())
+        tcp_server = await asyncio.start_server(server.handle, "127.0.0.1", 0)
+        port = tcp_server.sockets[0].getsockname()[1]
+        async with tcp_server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(f"POST /transcribe HTTP/1.1\r\n{headers}\r\n".encode("latin-1") + body)
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+        server.decode_executor.shutdown()
+        return response
+
+    return asyncio.run(scenario())
+
+
+def test_non_numeric_content_length_is_a_bad_request():
+    response = request(b"RIFF", "Content-Length: çar\r\n")
+
+    assert response.startswith(b"HTTP/1.1 400")
+    assert "error" in json.loads(response.split(b"\r\n\r\n", 1)[1])
+
+
+def test_long_clips_are_transcribed_in_30_second_windows(monkeypatch):
+    import whisper_evaluate
+
+    rate = 16000
+    calls = []
+
+    def fake_transcribe(model, processor, arrays):
+        calls.append([array.size / rate for array in arrays])
+        return [f" {array.size // rate}s " for array in arrays]
+
+    monkeypatch.setattr(whisper_evaluate, "transcribe_arrays", fake_transcribe)
+    processor = SimpleNamespace(feature_extractor=SimpleNamespace(sampling_rate=rate))
+
+    async def scenario():
+        batcher = whisper_server.DynamicBatcher(None, processor, max_batch_size=2, max_wait_ms=200)
+        task = asyncio.create_task(batcher.run())
+        results = await asyncio.gather(
+            batcher.submit(np.zeros(45 * rate, dtype=np.float32)),
+            batcher.submit(np.zeros(5 * rate, dtype=np.float32)),
+        )
+        task.cancel()
+        return results
+
+    long_result, short_result = asyncio.run(scenario())
+    # Tek generate çağrısı: uzun klibin iki penceresi + kısa klip
+    assert calls == [[30.0, 15.0, 5.0]]
+    assert long_result["text"] == "30s 15s"
+    assert short_result["text"] == "5s"
+    assert long_result["batch_size"] == 2
@@ -0,0 +1,120 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+for module in ("torch", "transformers", "datasets", "librosa"):
+    pytest.importorskip(module)
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "kurmanji_dataset"))
+
+import whisper_training  # noqa: E402
+
+
+class FakeFeatureExtractor:
+    """Log-mel yerine sinyal ortalamasından sabit şekilli özellik"""
+
+    sampling_rate = 16000
+    feature_size = 4
+    hop_length = 160
+    chunk_length = 30
+    n_fft = 400
+    n_samples = 480000
+    padding_value = 0.0
+
+    def __init__(self):
+        self.calls = 0
+        self.invocations = 0
+
+    def __call__(self, arrays, sampling_rate, return_tensors="np"):
+        arrays = arrays if isinstance(arrays, list) else [arrays]
+        self.calls += len(arrays)
+        self.invocations += 1
+        features = np.stack([np.full((self.feature_size, 6), float(np.mean(array)), dtype=np.float32) for array in arrays])
+        return SimpleNamespace(input_features=features)
+
+
+def write_wav(path, value):
+    sf.write(path, np.full(1600, value, dtype=np.float32), 16000)
+    return str(path)
+
+
+def test_feature_cache_computes_only_new_files_and_reads_float16(tmp_path):
+    first = write_wav(tmp_path / "000001_av_normal.wav", 0.25)
+    second = write_wav(tmp_path / "000002_mal_normal.wav", 0.5)
+    extractor = FakeFeatureExtractor()
+
+    cache = whisper_training.FeatureCache(tmp_path / "cache", extractor)
+    keys = cache.build([first, second])
+    assert extractor.calls == 2
+
+    third = write_wav(tmp_path / "000003_roj_normal.wav", 0.125)
+    reopened = whisper_training.FeatureCache(tmp_path / "cache", extractor)
+    assert reopened.build([first, second, third])[:2] == keys
+    assert extractor.calls == 3
+
+    features = reopened.get(keys[1])
+    assert features.dtype == np.float16 and features.shape == (4, 6)
+    assert np.allclose(features, 0.5, atol=1e-3)
+
+
+def test_feature_cache_is_keyed_by_extractor_settings(tmp_path):
+    audio = write_wav(tmp_path / "000001_av_normal.wav", 0.25)
+    extractor = FakeFeatureExtractor()
+    whisper_training.FeatureCache(tmp_path / "cache", extractor).build([audio])
+
+    extractor.hop_length = 320
+    changed = whisper_training.FeatureCache(tmp_path / "cache", extractor)
+    changed.build([audio])
+
+    # Ayar değişti: ayrı klasör, yeniden hesaplandı
+    assert extractor.calls == 2
+    assert len(list((tmp_path / "cache").iterdir())) == 2
+
+
+def test_feature_cache_drops_entries_past_a_truncated_data_file(tmp_path):
+    files = [write_wav(tmp_path / f"00000{i}_av_normal.wav", 0.1 * i) for i in (1, 2)]
+    cache = whisper_training.FeatureCache(tmp_path / "cache", FakeFeatureExtractor())
+    keys = cache.build(files)
+
+    # Yarım kalmış yazım: ikinci kaydın baytları eksik
+    with open(cache.data_path, "r+b") as f:
+        f.truncate(4 * 6 * 2 + 10)
+    reopened = whisper_training.FeatureCache(tmp_path / "cache", FakeFeatureExtractor())
+
+    assert keys[0] in reopened.index["features"]
+    assert keys[1] not in reopened.index["features"]
+
+
+class FakeTokenizer:
+    def __init__(self):
+        self.tokenized = []
+
+    def __call__(self, texts):
+        self.tokenized.extend(texts)
+        return SimpleNamespace(input_ids=[[len(text), ord(text[0])] for text in texts])
+
+
+def test_batched_preparation_extracts_once_and_tokenizes_repeats_once(monkeypatch):
+    monkeypatch.setattr(whisper_training, "_LABEL_CACHE", {})
+    processor = SimpleNamespace(feature_extractor=FakeFeatureExtractor(), tokenizer=FakeTokenizer())
+    batch = {
+        "audio": [{"array": np.full(1600, value, dtype=np.float32), "sampling_rate": 16000} for value in (0.1, 0.2, 0.3)],
+        # Aynı kelimenin yavaş/normal kaydı
+        "transcription": ["berdar", "av", "berdar"],
+    }
+
+    prepared = whisper_training.prepare_dataset_batched(batch, processor)
+
+    # Tüm batch için tek feature extractor çağrısı
+    assert (processor.feature_extractor.invocations, processor.feature_extractor.calls) == (1, 3)
+    assert sorted(processor.tokenizer.tokenized) == ["av", "berdar"]
+    assert prepared["labels"] == [[6, ord("b")], [2, ord("a")], [6, ord("b")]]
+    assert [float(features[0, 0]) for features in prepared["input_features"]] == pytest.approx([0.1, 0.2, 0.3])
+
+    # Sonraki batch'te önbellekteki transkriptler yeniden tokenize edilmez
+    whisper_training.prepare_dataset_batched({"audio": batch["audio"][:1], "transcription": ["av"]}, processor)
+    assert sorted(processor.tokenizer.tokenized) == ["av", "berdar"]
@@ -0,0 +1,51 @@
+import json
+
+from kurmanji_core import Config, WordManager
+
+
+def test_coverage_next_word_walks_whole_schedule(dataset_dir):
+    manager = WordManager()
+    manager.add_words(["mal", "ber", "dar", "av", "çav", "roj"])
+    manager.set_schedule_mode("coverage")
+    schedule = manager.get_coverage_schedule()
+    manager.current_index = schedule[0]
+
+    visited = [manager.current_index]
+    for _ in range(len(schedule) - 1):
+        manager.next_word()
+        visited.append(manager.current_index)
+
+    assert visited == schedule
+    # Sonda başa dön
+    manager.next_word()
+    assert manager.current_index == schedule[0]
+
+
+def test_coverage_next_word_skips_recorded(dataset_dir):
+    manager = WordManager()
+    manager.add_words(["mal", "ber", "dar", "av"])
+    manager.set_schedule_mode("coverage")
+    schedule = manager.get_coverage_schedule()
+    manager.current_index = schedule[0]
+    manager.recorded_words.add(manager.words[schedule[1]])
+
+    manager.next_word()
+    assert manager.current_index == schedule[2]
+
+
+def test_add_words_skips_duplicates(dataset_dir):
+    manager = WordManager()
+    assert manager.add_words(["av", "av", "mal", "ez diçim."]) == 3
+    assert manager.add_words(["mal", "ez diçim."]) == 0
+    assert manager.words == ["av", "mal"]
+    assert manager.sentences == ["ez diçim."]
+
+
+def test_update_manifest_duration_marks_measured(dataset_dir):
+    manager = WordManager()
+    manager.update_whisper_files("av", "000001_av_normal.wav")
+    manager.update_manifest_duration("000001_av_normal.wav", 7.456)
+
+    entry = json.loads(Config.WHISPER_MANIFEST.read_text(encoding="utf-8").splitlines()[-1])
+    assert entry["duration"] == 7.46
+    assert entry["duration_measured"] is True